@@ -0,0 +1,302 @@
+# AST en arena (arrays planos)
+# Para programas muy grandes: en vez de un objeto de Python por nodo, todo el
+# árbol vive en unos pocos arrays de enteros. Cada nodo es un índice; su tipo
+# (kind de astNodes), su posición y sus campos se leen de los arrays.
+#
+# Cada campo se guarda como un entero con la clase de valor en los 2 bits
+# bajos:  nodo (índice de nodo), lista (índice de lista), literal (índice en
+# `literals`, donde cada valor distinto aparece una sola vez) o None.
+#
+# Para recorrerlo hay dos formas:
+#   - arena.walk(): generador que va entregando (índice, kind, profundidad)
+#     sin crear ningún objeto por nodo.
+#   - arena.view(i): una vista de corta vida con los mismos atributos que el
+#     nodo de astNodes (view.tag, view.left, ...); las vistas no se guardan,
+#     el árbol sigue en los arrays.
+# semanticAnalyzer recorre la arena con vistas, con los mismos handlers que
+# usa para los nodos.
+#
+# Cada estructura de tipo se copia una sola vez (los nodos de tipo se buscan
+# por estructura, como en syntaxAnalyzer._shared_type) y todos los campos que
+# la usan apuntan al mismo índice. `type_nodes` guarda el nodo original de
+# cada uno y las vistas lo devuelven en vez de una vista del tipo, así el
+# análisis semántico resuelve el tipo una vez (astNodes.Type.resolved).
+
+from array import array
+
+import astNodes
+
+_NODE, _LIST, _LITERAL, _NONE = 0, 1, 2, 3
+
+FIELD_COUNTS = tuple(len(cls.fields) for cls in astNodes.NODE_CLASSES)
+
+# kinds con el slot `resolved` (los nodos de tipo, ver astNodes)
+_TYPE_KINDS = frozenset(cls.kind for cls in astNodes.NODE_CLASSES if 'resolved' in cls.__slots__)
+
+
+class AstArena:
+    """Árbol completo en arrays planos; `roots` son las sentencias de nivel superior."""
+    __slots__ = ('kinds', 'lexpos', 'endlexpos', 'field_start', 'fields',
+                 'list_start', 'list_items', 'literals', '_literal_ids', 'roots',
+                 'type_nodes', '_type_codes')
+
+    def __init__(self):
+        self.kinds = array('B')          # kind de cada nodo (astNodes.NODE_CLASSES)
+        self.lexpos = array('i')         # posición del primer token
+        self.endlexpos = array('i')      # posición del último token
+        self.field_start = array('I')    # dónde empiezan sus campos en `fields`
+        self.fields = array('i')         # campos codificados de todos los nodos
+        self.list_start = array('I')     # inicio de cada lista en `list_items`
+        self.list_items = array('i')     # elementos codificados de todas las listas
+        self.literals = []               # valores literales (nombres, números, ...)
+        self._literal_ids = {}
+        self.roots = array('i')          # nodos de las sentencias de nivel superior
+        self.type_nodes = {}             # {índice de un nodo de tipo: el nodo de astNodes}
+        self._type_codes = {}            # {nodo de tipo (por estructura): su código}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    # ---------------- Construcción ----------------
+
+    def _literal(self, value):
+        key = (type(value), value)
+        index = self._literal_ids.get(key)
+        if index is None:
+            index = self._literal_ids[key] = len(self.literals)
+            self.literals.append(value)
+        return (index << 2) | _LITERAL
+
+    def add(self, value):
+        """
+        Copia un valor del AST de nodos (nodo, lista o literal) a la arena y
+        devuelve su código. Recorre el árbol con una pila propia, así
+        funciona con expresiones muy anidadas.
+        """
+        # Pila de tareas: (valor, None) = visitar; (valor, n) = armar con los
+        # últimos n códigos de `done`
+        done = []
+        stack = [(value, None)]
+        while stack:
+            item, count = stack.pop()
+            if count is None:
+                if isinstance(item, astNodes.Node):
+                    if item.kind in _TYPE_KINDS:
+                        code = self._type_codes.get(item)
+                        if code is not None:
+                            # Tipo ya copiado: mismo índice
+                            done.append(code)
+                            continue
+                    children = item.values()
+                elif isinstance(item, list):
+                    children = item
+                elif item is None:
+                    done.append(_NONE)
+                    continue
+                else:
+                    done.append(self._literal(item))
+                    continue
+                stack.append((item, len(children)))
+                for child in reversed(children):
+                    stack.append((child, None))
+                continue
+
+            codes = done[len(done) - count:] if count else []
+            del done[len(done) - count:]
+            if isinstance(item, list):
+                index = len(self.list_start)
+                self.list_start.append(len(self.list_items))
+                self.list_items.extend(codes)
+                done.append((index << 2) | _LIST)
+            else:
+                index = len(self.kinds)
+                self.kinds.append(item.kind)
+                self.lexpos.append(item.lexpos)
+                self.endlexpos.append(item.endlexpos)
+                self.field_start.append(len(self.fields))
+                self.fields.extend(codes)
+                done.append((index << 2) | _NODE)
+                if item.kind in _TYPE_KINDS:
+                    self.type_nodes[index] = item
+                    self._type_codes[item] = (index << 2) | _NODE
+        return done[0]
+
+    def add_statement(self, node):
+        """Agrega una sentencia de nivel superior."""
+        self.roots.append(self.add(node) >> 2)
+
+    @classmethod
+    def from_nodes(cls, statements):
+        """Arma una arena a partir de la lista de sentencias de nodos."""
+        arena = cls()
+        for statement in statements:
+            arena.add_statement(statement)
+        return arena
+
+    # ---------------- Lectura ----------------
+
+    def kind(self, index):
+        return self.kinds[index]
+
+    def tag(self, index):
+        return astNodes.NODE_CLASSES[self.kinds[index]].tag
+
+    def field_code(self, index, k):
+        """Código del campo k del nodo (ver _decode)."""
+        return self.fields[self.field_start[index] + k]
+
+    def list_span(self, list_index):
+        """(inicio, fin) de los elementos de la lista en `list_items`."""
+        start = self.list_start[list_index]
+        end = self.list_start[list_index + 1] if list_index + 1 < len(self.list_start) else len(self.list_items)
+        return start, end
+
+    def list_codes(self, list_index):
+        start, end = self.list_span(list_index)
+        return self.list_items[start:end]
+
+    def _decode(self, code):
+        """Código de campo -> vista (el nodo original si es un tipo), lista de valores, literal o None."""
+        what = code & 3
+        if what == _NODE:
+            index = code >> 2
+            kind = self.kinds[index]
+            if kind in _TYPE_KINDS:
+                return self.type_nodes[index]
+            return VIEW_CLASSES[kind](self, index)
+        if what == _LITERAL:
+            return self.literals[code >> 2]
+        if what == _LIST:
+            return [self._decode(c) for c in self.list_codes(code >> 2)]
+        return None
+
+    def view(self, index):
+        return VIEW_CLASSES[self.kinds[index]](self, index)
+
+    def statements(self):
+        """Vistas de las sentencias de nivel superior, una por una."""
+        for index in self.roots:
+            yield self.view(index)
+
+    def walk(self):
+        """
+        Recorrido en preorden de todos los nodos: entrega (índice, kind,
+        profundidad) sin crear objetos por nodo. Un tipo compartido aparece
+        una vez por cada campo que lo usa.
+        """
+        fields, field_start, kinds = self.fields, self.field_start, self.kinds
+        stack = [(index, 0) for index in reversed(self.roots)]
+        while stack:
+            index, depth = stack.pop()
+            kind = kinds[index]
+            yield index, kind, depth
+            start = field_start[index]
+            children = []
+            for code in fields[start:start + FIELD_COUNTS[kind]]:
+                what = code & 3
+                if what == _NODE:
+                    children.append(code >> 2)
+                elif what == _LIST:
+                    children.extend(c >> 2 for c in self.list_codes(code >> 2) if c & 3 == _NODE)
+            for child in reversed(children):
+                stack.append((child, depth + 1))
+
+    def to_nodes(self):
+        """Vuelve a armar la lista de sentencias con nodos de astNodes."""
+        return [self._to_node(index) for index in self.roots]
+
+    def _to_node(self, index):
+        cls = astNodes.NODE_CLASSES[self.kinds[index]]
+        start = self.field_start[index]
+        values = [self._code_to_node(c) for c in self.fields[start:start + len(cls.fields)]]
+        return cls(*values, lexpos=self.lexpos[index], endlexpos=self.endlexpos[index])
+
+    def _code_to_node(self, code):
+        what = code & 3
+        if what == _NODE:
+            return self._to_node(code >> 2)
+        if what == _LIST:
+            return [self._code_to_node(c) for c in self.list_codes(code >> 2)]
+        if what == _LITERAL:
+            return self.literals[code >> 2]
+        return None
+
+    def to_tuple(self):
+        """AST en el formato viejo de tuplas."""
+        return astNodes.to_tuple(self.to_nodes())
+
+
+class NodeView:
+    """
+    Vista de un nodo de la arena con la misma interfaz que los nodos de
+    astNodes: tag, kind, campos por nombre, lexpos/endlexpos e indexación
+    tipo tupla. Las subclases (una por kind) se generan abajo.
+    """
+    __slots__ = ('_arena', '_index')
+    kind = -1
+    tag = None
+    fields = ()
+
+    def __init__(self, arena, index):
+        self._arena = arena
+        self._index = index
+
+    @property
+    def lexpos(self):
+        return self._arena.lexpos[self._index]
+
+    @property
+    def endlexpos(self):
+        return self._arena.endlexpos[self._index]
+
+    def values(self):
+        arena = self._arena
+        start = arena.field_start[self._index]
+        return tuple(arena._decode(c) for c in arena.fields[start:start + len(self.fields)])
+
+    def __len__(self):
+        return len(self.fields) + 1
+
+    def __getitem__(self, i):
+        return ((self.tag,) + self.values())[i]
+
+    def __iter__(self):
+        yield self.tag
+        yield from self.values()
+
+    def to_node(self):
+        return self._arena._to_node(self._index)
+
+    def to_tuple(self):
+        return astNodes.to_tuple(self.to_node())
+
+    def __repr__(self):
+        return f"{type(self).__name__}(#{self._index})"
+
+
+def _field_property(k):
+    # Los nodos y los literales (los campos más leídos) sin pasar por _decode
+    def get(self):
+        arena = self._arena
+        code = arena.fields[arena.field_start[self._index] + k]
+        what = code & 3
+        if what == _LITERAL:
+            return arena.literals[code >> 2]
+        if what == _NODE:
+            index = code >> 2
+            kind = arena.kinds[index]
+            if kind not in _TYPE_KINDS:
+                return VIEW_CLASSES[kind](arena, index)
+        return arena._decode(code)
+    return property(get)
+
+
+def _make_view_class(node_cls):
+    attrs = {'__slots__': (), 'kind': node_cls.kind, 'tag': node_cls.tag, 'fields': node_cls.fields}
+    for k, name in enumerate(node_cls.fields):
+        attrs[name] = _field_property(k)
+    return type(node_cls.__name__ + "View", (NodeView,), attrs)
+
+
+# Una clase de vista por kind, en el mismo orden que astNodes.NODE_CLASSES
+VIEW_CLASSES = tuple(_make_view_class(cls) for cls in astNodes.NODE_CLASSES)
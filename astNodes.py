@@ -0,0 +1,195 @@
+# Nodos del AST
+# Cada tipo de nodo es una clase con __slots__ (sin __dict__ por objeto) y un
+# código entero `kind`. Los campos tienen nombre (op.left, let.init, ...) y
+# cada nodo guarda su posición en el código: `lexpos` (primer token) y
+# `endlexpos` (último token), igual que p.lexspan() de PLY; -1 si no se sabe.
+#
+# Antes el parser armaba tuplas como ("op", "+", izq, der). Los nodos siguen
+# siendo compatibles: node[0] es la etiqueta, node[1:] los campos, y
+# to_tuple()/from_tuple() convierten entre los dos formatos.
+
+__all__ = ['Node', 'NODE_CLASSES', 'KIND_BY_TAG', 'to_tuple', 'from_tuple']
+
+# (etiqueta de la tupla vieja, campos en el mismo orden que en la tupla)
+_SPEC = (
+    # Impresión y HashMap
+    ("println",              ("text",)),
+    ("println_expr",         ("expr",)),
+    ("println_format",       ("fmt", "args")),
+    ("hashmap_insert",       ("target", "key", "value")),
+    ("hashmap_get",          ("target", "key")),
+    ("hashmap_new",          ("args",)),
+    # Llamadas
+    ("call",                 ("target", "method", "args")),
+    ("path_call",            ("path", "name", "args")),
+    ("fn_call",              ("name", "args")),
+    # Closures
+    ("param",                ("name", "type")),
+    ("closure",              ("params", "ret_type", "body")),
+    ("expr_body",            ("expr",)),
+    ("block_body",           ("statements", "expr")),
+    # Expresiones
+    ("op",                   ("op", "left", "right")),
+    ("rel",                  ("op", "left", "right")),
+    ("logic",                ("op", "left", "right")),
+    ("range",                ("low", "high", "inclusive")),
+    ("not",                  ("expr",)),
+    ("uminus",               ("expr",)),
+    ("num",                  ("value",)),
+    ("lit",                  ("value",)),
+    ("id",                   ("name",)),
+    ("ref",                  ("expr",)),
+    ("ref_mut",              ("expr",)),
+    ("cast",                 ("expr", "type")),
+    # Arrays, vectores y tuplas
+    ("array",                ("elements",)),
+    ("array_repeat",         ("value", "count")),
+    ("index",                ("target", "index")),
+    ("slice",                ("target", "low", "high", "inclusive")),
+    ("vec_macro",            ("name", "elements")),
+    ("tuple_literal",        ("elements",)),
+    ("tuple_access",         ("target", "index")),
+    # Tipos
+    ("type",                 ("name",)),
+    ("type_array",           ("elem",)),
+    ("type_array_len",       ("elem", "length")),
+    ("type_ref",             ("target",)),
+    ("type_ref_mut",         ("target",)),
+    ("type_tuple",           ("elems",)),
+    # Sentencias
+    ("expr_stmt",            ("expr",)),
+    ("assignment",           ("name", "expr")),
+    ("let_mut_typed_assign", ("name", "type", "init")),
+    ("let_typed_assign",     ("name", "type", "init")),
+    ("let_mut_typed_decl",   ("name", "type")),
+    ("let_typed_decl",       ("name", "type")),
+    ("let_mut_assign",       ("name", "init")),
+    ("let_assign",           ("name", "init")),
+    ("let_decl",             ("name",)),
+    ("init",                 ("expr",)),
+    ("const_decl",           ("name", "type", "value")),
+    ("if",                   ("cond", "body")),
+    ("if_else",              ("cond", "body", "else_body")),
+    ("while",                ("cond", "body")),
+    ("for",                  ("var", "iterable", "body")),
+    # Funciones
+    ("fn",                   ("name", "params", "body")),
+    ("fn_ret",               ("name", "params", "ret_type", "body")),
+    ("async_fn",             ("name", "params", "body")),
+    ("async_fn_ret",         ("name", "params", "ret_type", "body")),
+    ("body",                 ("statements", "expr")),
+    ("return",               ("expr",)),
+)
+
+
+# Los nodos de tipo tienen además `resolved`: el término que calculó
+# semanticAnalyzer.resolve_type para ese tipo, None hasta entonces. No es un
+# campo: no entra en values(), ni en ==, ni en to_tuple().
+_TYPE_TAGS = frozenset(("type", "type_array", "type_array_len",
+                        "type_ref", "type_ref_mut", "type_tuple"))
+
+
+class Node:
+    """Clase base de los nodos. Las subclases se generan a partir de _SPEC."""
+    __slots__ = ('lexpos', 'endlexpos')
+    kind = -1
+    tag = None
+    fields = ()
+
+    def values(self):
+        """Valores de los campos, en orden."""
+        return tuple(getattr(self, name) for name in self.fields)
+
+    # --- compatibilidad con las tuplas viejas: ("tag", campo1, campo2, ...) ---
+    def __len__(self):
+        return len(self.fields) + 1
+
+    def __getitem__(self, i):
+        return ((self.tag,) + self.values())[i]
+
+    def __iter__(self):
+        yield self.tag
+        yield from self.values()
+
+    def to_tuple(self):
+        return to_tuple(self)
+
+    def __eq__(self, other):
+        if isinstance(other, Node):
+            return type(self) is type(other) and self.values() == other.values()
+        if isinstance(other, tuple):
+            return to_tuple(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(_hash_key(self))
+
+    def __repr__(self):
+        campos = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({campos})"
+
+
+def _make_node_class(kind, tag, fields):
+    """
+    Crea la clase del nodo. El __init__ se arma como código (igual que hace
+    collections.namedtuple) para que asigne los slots directamente, sin
+    recorrer los campos en cada construcción.
+    """
+    name = "".join(part.capitalize() for part in tag.split("_"))
+    args = "".join(f"{field}, " for field in fields)
+    body = "".join(f"    self.{field} = {field}\n" for field in fields)
+    slots = fields
+    if tag in _TYPE_TAGS:
+        slots = fields + ('resolved',)
+        body += "    self.resolved = None\n"
+    source = (f"def __init__(self, {args}lexpos=-1, endlexpos=-1):\n{body}"
+              f"    self.lexpos = lexpos\n"
+              f"    self.endlexpos = endlexpos\n")
+    namespace = {}
+    exec(source, namespace)
+    return type(name, (Node,), {
+        '__slots__': slots,
+        '__init__': namespace['__init__'],
+        'kind': kind,
+        'tag': tag,
+        'fields': fields,
+    })
+
+
+NODE_CLASSES = tuple(_make_node_class(kind, tag, fields)
+                     for kind, (tag, fields) in enumerate(_SPEC))
+KIND_BY_TAG = {cls.tag: cls.kind for cls in NODE_CLASSES}
+_CLASS_BY_TAG = {cls.tag: cls for cls in NODE_CLASSES}
+
+# Las clases quedan como nombres del módulo: astNodes.Op, astNodes.LetDecl, ...
+for _cls in NODE_CLASSES:
+    globals()[_cls.__name__] = _cls
+    __all__.append(_cls.__name__)
+del _cls
+
+
+def to_tuple(value):
+    """Convierte nodos (y listas de nodos) al formato viejo de tuplas."""
+    if isinstance(value, Node):
+        return (value.tag,) + tuple(to_tuple(v) for v in value.values())
+    if isinstance(value, list):
+        return [to_tuple(v) for v in value]
+    return value
+
+
+def _hash_key(value):
+    """Como to_tuple, pero con las listas como tuplas para poder hashearlo."""
+    if isinstance(value, Node):
+        return (value.tag,) + tuple(_hash_key(v) for v in value.values())
+    if isinstance(value, list):
+        return tuple(_hash_key(v) for v in value)
+    return value
+
+
+def from_tuple(value):
+    """Convierte un AST de tuplas (formato viejo) a nodos."""
+    if isinstance(value, tuple) and value and value[0] in _CLASS_BY_TAG:
+        return _CLASS_BY_TAG[value[0]](*(from_tuple(v) for v in value[1:]))
+    if isinstance(value, list):
+        return [from_tuple(v) for v in value]
+    return value
@@ -0,0 +1,200 @@
+# Analizador por lotes
+# Recorre directorios, archivos o patrones glob de archivos .rs y corre el
+# análisis léxico, sintáctico o semántico repartiendo los archivos entre
+# varios procesos (ProcessPoolExecutor).
+#
+# Uso:
+#   python batchAnalyzer.py algoritmos_prueba/
+#   python batchAnalyzer.py --mode lex --workers 8 --order completion "tests/**/*.rs"
+
+import argparse
+import contextlib
+import glob
+import io
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import lexicalAnalyzer
+import syntaxAnalyzer
+import semanticAnalyzer
+from astArena import AstArena
+
+MODES = ("lex", "syn", "sem")
+
+
+# ============== TABLAS PRECARGADAS ==============
+
+def preload_tables(mode):
+    """
+    Construye el lexer y (si hace falta) el parser una sola vez por proceso.
+    Si se llama en el proceso padre antes de crear el pool con 'fork', los
+    hijos heredan las tablas ya construidas y no repiten el trabajo.
+    """
+    lexicalAnalyzer.get_lexer()
+    if mode != "lex":
+        # Crear una sesión carga lo que use el driver: generatedParser o las
+        # tablas de ply.yacc
+        syntaxAnalyzer.SyntaxSession()
+
+
+# ============== TRABAJO DE CADA PROCESO ==============
+
+def analyze_source(code, mode, arena=False):
+    """
+    Analiza un código y devuelve la lista de errores encontrados. Con
+    arena=True el AST se guarda en una AstArena (menos memoria por archivo).
+    """
+    if mode == "lex":
+        return list(lexicalAnalyzer.tokenizar(code).errors)
+
+    if mode == "syn":
+        session = syntaxAnalyzer.SyntaxSession()
+        try:
+            session.parse(code)
+        except Exception as e:
+            session.errors.append(f"[ERROR] Excepción del parser: {e}")
+        return session.lex_errors + session.errors
+
+    session = semanticAnalyzer.SemanticSession()
+    try:
+        ast = session.parse(code, AstArena() if arena else None)
+    except Exception as e:
+        return [f"[ERROR] Excepción del parser: {e}"]
+    if session.syntax_errors:
+        return session.syntax.lex_errors + session.syntax_errors
+    session.analyze_ast(ast)
+    return session.syntax.lex_errors + session.errors
+
+
+def analyze_batch(paths, mode, arena=False):
+    """
+    Analiza un grupo de archivos en el proceso actual. Devuelve una lista de
+    tuplas (ruta, errores). Los mensajes que imprimen t_error/p_error se
+    descartan: ya quedan en la lista de errores.
+    """
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    code = f.read()
+                errors = analyze_source(code, mode, arena)
+            except OSError as e:
+                errors = [f"[ERROR] No se pudo leer el archivo: {e}"]
+            results.append((path, errors))
+    return results
+
+
+# ============== DESCUBRIMIENTO DE ARCHIVOS ==============
+
+def collect_files(targets):
+    """Expande directorios (recursivo), archivos y patrones glob a rutas .rs."""
+    files = []
+    seen = set()
+    for target in targets:
+        if os.path.isdir(target):
+            found = sorted(glob.glob(os.path.join(target, "**", "*.rs"), recursive=True))
+        elif os.path.isfile(target):
+            found = [target]
+        else:
+            found = sorted(glob.glob(target, recursive=True))
+        for path in found:
+            if path not in seen:
+                seen.add(path)
+                files.append(path)
+    return files
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def run_batch(files, mode="sem", workers=None, order="submission", chunk_size=32, arena=False):
+    """
+    Generador que reparte los archivos entre `workers` procesos y entrega
+    (ruta, errores) por cada archivo, en orden de envío ("submission") o a
+    medida que terminan ("completion"). Con workers=1 todo corre en el
+    proceso actual.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Modo desconocido {mode!r}; use uno de {MODES}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers debe ser mayor que 0, no {workers}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size debe ser mayor que 0, no {chunk_size}")
+
+    preload_tables(mode)
+
+    if workers == 1:
+        for batch in _chunks(files, chunk_size):
+            yield from analyze_batch(batch, mode, arena)
+        return
+
+    # Con 'fork' los hijos heredan las tablas que se acaban de precargar
+    if "fork" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("fork")
+    else:
+        ctx = multiprocessing.get_context()
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=preload_tables, initargs=(mode,)) as pool:
+        futures = [pool.submit(analyze_batch, batch, mode, arena) for batch in _chunks(files, chunk_size)]
+        pending = futures if order == "submission" else as_completed(futures)
+        for future in pending:
+            yield from future.result()
+
+
+# ============== CLI ==============
+
+def _positive_int(text):
+    """Tipo de argparse: entero mayor que 0."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"se esperaba un entero, no {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"debe ser mayor que 0, no {value}")
+    return value
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Análisis por lotes de archivos .rs")
+    ap.add_argument("targets", nargs="+", help="directorios, archivos o patrones glob")
+    ap.add_argument("--mode", choices=MODES, default="sem",
+                    help="lex = léxico, syn = sintáctico, sem = semántico (por defecto)")
+    ap.add_argument("--workers", type=_positive_int, default=None,
+                    help="cantidad de procesos (por defecto, uno por núcleo)")
+    ap.add_argument("--order", choices=("submission", "completion"), default="submission",
+                    help="orden en que se muestran los resultados")
+    ap.add_argument("--chunk-size", type=_positive_int, default=32,
+                    help="archivos por tarea enviada a cada proceso")
+    ap.add_argument("--arena", action="store_true",
+                    help="en modo sem, guardar el AST en arrays planos (astArena)")
+    ap.add_argument("--quiet", action="store_true", help="solo mostrar archivos con errores")
+    args = ap.parse_args(argv)
+
+    files = collect_files(args.targets)
+    if not files:
+        print("No se encontraron archivos .rs")
+        return 1
+
+    failed = 0
+    for path, errors in run_batch(files, args.mode, args.workers, args.order,
+                                  args.chunk_size, args.arena):
+        if errors:
+            failed += 1
+            print(f"❌ {path}: {len(errors)} error(es)")
+            for error in errors:
+                print(f"   - {error}")
+        elif not args.quiet:
+            print(f"✅ {path}")
+
+    print(f"\n{len(files)} archivo(s) analizados, {failed} con errores.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+# Benchmark de arranque (import-time)
+# Mide, cada vez en un proceso nuevo, cuánto tarda en abrirse la interfaz y en
+# correr analizar_lexico, y comprueba que en ese camino nunca se llama a
+# ply.yacc.yacc() ni se generan tablas LALR.
+#
+# Uso:  python benchmarks/bench_import.py [--runs N]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Código que corre en el proceso hijo. Envuelve yacc() y LRTable para contar
+# cuántas veces se llaman.
+CHILD = r'''
+import json, sys, time
+t0 = time.perf_counter()
+
+import ply.yacc as yacc
+calls = {"yacc": 0, "lrtable": 0}
+_yacc, _init = yacc.yacc, yacc.LRTable.__init__
+def yacc_spy(*a, **k):
+    calls["yacc"] += 1
+    return _yacc(*a, **k)
+def init_spy(self, *a, **k):
+    calls["lrtable"] += 1
+    return _init(self, *a, **k)
+yacc.yacc = yacc_spy
+yacc.LRTable.__init__ = init_spy
+t_spy = time.perf_counter()
+
+import tkinter as tk
+import main
+t_import = time.perf_counter()
+
+gui = None
+try:
+    root = tk.Tk()
+    root.withdraw()
+    gui = main.RustAnalyzerGUI(root)
+    root.update_idletasks()
+except tk.TclError:
+    root = None
+t_gui = time.perf_counter()
+
+code = "fn main() { let mut x: i32 = 5; /* comentario */ println!(\"{}\", x); }\n"
+if gui is not None:
+    gui.editor.insert(tk.END, code)
+    gui.run_lex()
+else:
+    from lexicalAnalyzer import analizar_lexico
+    analizar_lexico(code)
+t_lex = time.perf_counter()
+
+if root is not None:
+    root.destroy()
+
+print(json.dumps({
+    "import_main": t_import - t_spy,
+    "open_gui": t_gui - t_import,
+    "first_lex": t_lex - t_gui,
+    "total": t_lex - t0 - (t_spy - t0),
+    "gui": gui is not None,
+    "yacc_calls": calls["yacc"],
+    "lrtable_calls": calls["lrtable"],
+    "parser_imported": "syntaxAnalyzer" in sys.modules,
+}))
+'''
+
+
+def run_once():
+    """Ejecuta el código hijo en un intérprete nuevo y devuelve sus medidas."""
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark de arranque de la interfaz y del análisis léxico")
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    results = [run_once() for _ in range(args.runs)]
+
+    def best(key):
+        return min(r[key] for r in results) * 1000
+
+    print(f"Corridas: {args.runs} (mejor tiempo, ms)")
+    print(f"  import main        : {best('import_main'):8.2f}")
+    print(f"  abrir interfaz     : {best('open_gui'):8.2f}" +
+          ("" if results[0]["gui"] else "  (sin display, se omitió Tk)"))
+    print(f"  primer léxico      : {best('first_lex'):8.2f}")
+    print(f"  total              : {best('total'):8.2f}")
+
+    ok = all(r["yacc_calls"] == 0 and r["lrtable_calls"] == 0 and not r["parser_imported"]
+             for r in results)
+    if ok:
+        print("OK: no se construyó el parser ni se generaron tablas LALR.")
+    else:
+        print("FALLO: el camino léxico construyó el parser:", results[0])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+# Benchmark del lexer
+# Compara, sobre el mismo código:
+#   - Lexer.token() de ply.lex (un LexToken por token, como el lexer del módulo)
+#   - tokenizar() con las expresiones maestras de ply.lex (LEX_DRIVER = "ply")
+#   - tokenizar() con el DFA de generatedLexer.py (LEX_DRIVER = "generated")
+# y verifica que los tres den los mismos tokens.
+#
+# Uso:  python benchmarks/bench_lexer.py [--copies N] [--runs N]
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import lexicalAnalyzer
+
+
+def programa(copies):
+    """Concatena los algoritmos de prueba."""
+    partes = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "algoritmos_prueba", "*.rs"))):
+        with open(path, encoding="utf-8") as f:
+            partes.append(f.read())
+    return "\n".join(partes) * copies
+
+
+def con_token(codigo):
+    lexer = lexicalAnalyzer.nuevo_lexer()
+    lexer.input(codigo)
+    codes = lexicalAnalyzer.TOKEN_CODES
+    return [(codes[tok.type], tok.lexpos, tok.lineno) for tok in iter(lexer.token, None)]
+
+
+def con_tokenizar(driver):
+    def run(codigo):
+        lexicalAnalyzer.LEX_DRIVER = driver
+        stream = lexicalAnalyzer.tokenizar(codigo)
+        return list(zip(stream.types, stream.starts, stream.lines))
+    return run
+
+
+def mejor_tiempo(funcion, codigo, runs):
+    best, result = None, None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = funcion(codigo)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark de Lexer.token() vs el lexer DFA generado")
+    ap.add_argument("--copies", type=int, default=100)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    if lexicalAnalyzer.get_generated_lexer() is None:
+        print("generatedLexer.py no existe o está viejo: python lexerGenerator.py")
+        return 1
+
+    codigo = programa(args.copies)
+    token, toks_a = mejor_tiempo(con_token, codigo, args.runs)
+    ply, toks_b = mejor_tiempo(con_tokenizar("ply"), codigo, args.runs)
+    dfa, toks_c = mejor_tiempo(con_tokenizar("generated"), codigo, args.runs)
+    lexicalAnalyzer.LEX_DRIVER = "generated"
+    if not toks_a == toks_b == toks_c:
+        print("FALLO: los lexers devolvieron tokens distintos")
+        return 1
+
+    n = len(toks_a)
+    print(f"Tokens: {n}  ({len(codigo)} caracteres, mejor de {args.runs} corridas)")
+    print(f"  Lexer.token()          : {token * 1000:9.1f} ms  ({token / n * 1e6:.2f} µs/token)")
+    print(f"  tokenizar() con ply    : {ply * 1000:9.1f} ms  ({ply / n * 1e6:.2f} µs/token)"
+          f"  {token / ply:.2f}x")
+    print(f"  tokenizar() con el DFA : {dfa * 1000:9.1f} ms  ({dfa / n * 1e6:.2f} µs/token)"
+          f"  {token / dfa:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+# Benchmark de listas largas en la gramática
+# Parsea programas con muchas sentencias y literales vec![...] con muchos
+# elementos, en tres tamaños (N/4, N/2 y N). Si armar las listas es lineal,
+# el tiempo por elemento se mantiene parecido al crecer N; si fuera
+# cuadrático (p[1] + [p[2]]), se duplicaría con cada tamaño.
+#
+# Uso:  python benchmarks/bench_lists.py [--statements N] [--elements N]
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import lexicalAnalyzer
+import syntaxAnalyzer
+
+
+def programa_sentencias(n):
+    return "".join(f"let x{i} = {i} + 1;\n" for i in range(n))
+
+
+def programa_vec(n):
+    return "let v = vec![" + ", ".join(str(i % 1000) for i in range(n)) + "];\n"
+
+
+def medir(codigo):
+    """Devuelve (segundos tokenizando, segundos parseando, AST)."""
+    session = syntaxAnalyzer.SyntaxSession()
+    t0 = time.perf_counter()
+    tokens_stream = lexicalAnalyzer.tokenizar(codigo)
+    t1 = time.perf_counter()
+    ast = session.parser.parse(lexer=tokens_stream.lexer())
+    t2 = time.perf_counter()
+    if session.errors:
+        raise SystemExit(f"Errores de sintaxis en el benchmark: {session.errors[:3]}")
+    return t1 - t0, t2 - t1, ast
+
+
+def correr(nombre, generar, n, contar):
+    print(f"{nombre}")
+    print(f"  {'N':>9} | {'léxico (s)':>10} | {'parseo (s)':>10} | {'µs/elemento':>11}")
+    for size in (n // 4, n // 2, n):
+        lex_t, parse_t, ast = medir(generar(size))
+        assert contar(ast) == size
+        print(f"  {size:>9} | {lex_t:>10.2f} | {parse_t:>10.2f} | {parse_t / size * 1e6:>11.2f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark de listas largas (programa y vec![...])")
+    ap.add_argument("--statements", type=int, default=100_000)
+    ap.add_argument("--elements", type=int, default=1_000_000)
+    args = ap.parse_args()
+
+    syntaxAnalyzer.get_parser()
+    correr("Programa con N sentencias", programa_sentencias, args.statements, len)
+    correr("vec![...] con N elementos", programa_vec, args.elements, lambda ast: len(ast[0].init.elements))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+# Benchmark del driver LR
+# Compara LRParser.parse() (el loop genérico, con ramas de debug y tracking),
+# LRParser.parseopt_notrack() (sin esas ramas, tablas de diccionarios) y
+# LRParser.parseopt_dense() (tablas de enteros compactadas) y el parser de
+# generatedParser.py (parserGenerator.py, el que usan las sesiones de
+# syntaxAnalyzer) sobre el mismo flujo de tokens, ya tokenizado, para medir
+# solo el parser. Verifica que todos devuelvan el mismo AST y muestra cuánta
+# memoria ocupan las tablas de ply.yacc en cada forma. Mide además los
+# drivers de ply.yacc con acciones vacías: el costo por token del driver
+# (tablas, pilas y tokens) sin el de armar el AST.
+#
+# Uso:  python benchmarks/bench_parser.py [--copies N] [--runs N]
+
+import argparse
+import contextlib
+import copy
+import gc
+import glob
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import lexicalAnalyzer
+import syntaxAnalyzer
+
+
+def programa(copies):
+    """Concatena los algoritmos de prueba sin errores de sintaxis."""
+    partes = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "algoritmos_prueba", "*.rs"))):
+        with open(path, encoding="utf-8") as f:
+            codigo = f.read()
+        session = syntaxAnalyzer.SyntaxSession()
+        with contextlib.redirect_stdout(io.StringIO()):
+            session.parse(codigo)
+        if not session.errors:
+            partes.append(codigo)
+    return "\n".join(partes) * copies
+
+
+def mejor_tiempos(parsers, tokens_stream, runs):
+    """
+    Mejor tiempo y resultado de cada parser. Las corridas se intercalan (una
+    de cada parser por vuelta) para que el ruido de la máquina les toque a
+    todos por igual. Como en timeit, el recolector de basura no corre
+    mientras se mide: si no, cada parser pagaría por los ASTs que siguen
+    vivos de los anteriores.
+    """
+    best = [None] * len(parsers)
+    results = [None] * len(parsers)
+    for _ in range(runs):
+        for k, parse in enumerate(parsers):
+            results[k] = None
+            gc.collect()
+            gc.disable()
+            try:
+                t0 = time.perf_counter()
+                results[k] = parse(lexer=tokens_stream.lexer())
+                elapsed = time.perf_counter() - t0
+            finally:
+                gc.enable()
+            best[k] = elapsed if best[k] is None else min(best[k], elapsed)
+    return best, results
+
+
+def _accion_vacia(p):
+    pass
+
+
+def sin_acciones(parser):
+    """Copia del parser con todas las acciones vacías (las tablas se comparten)."""
+    copia = copy.copy(parser)
+    copia.productions = [copy.copy(prod) for prod in parser.productions]
+    for prod in copia.productions:
+        prod.callable = _accion_vacia
+    return copia
+
+
+def memoria_tablas(parser):
+    """Bytes que ocupan las tablas de diccionarios y las tablas densas."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    action = {state: dict(row) for state, row in parser.action.items()}
+    goto = {state: dict(row) for state, row in parser.goto.items()}
+    dicts = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del action, goto
+    return dicts, parser.dense.nbytes()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark de los drivers LR de ply.yacc")
+    ap.add_argument("--copies", type=int, default=200)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    codigo = programa(args.copies)
+    tokens_stream = lexicalAnalyzer.tokenizar(codigo)
+    parser = syntaxAnalyzer.SyntaxSession(driver="dense").parser
+
+    parsers = [parser.parse, parser.parseopt_notrack, parser.parseopt_dense]
+    generated = syntaxAnalyzer.get_generated_parser()
+    if generated is not None:
+        parsers.append(generated.Parser(parser.errorfunc).parse)
+    times, asts = mejor_tiempos(parsers, tokens_stream, args.runs)
+    generico, rapido, denso = times[:3]
+    generado = times[3] if generated is not None else None
+    if any(ast != asts[0] for ast in asts[1:]):
+        print("FALLO: los drivers devolvieron ASTs distintos")
+        return 1
+
+    n = len(tokens_stream)
+    print(f"Tokens: {n}  (mejor de {args.runs} corridas)")
+    print(f"  parse()            : {generico * 1000:9.1f} ms  ({generico / n * 1e6:.2f} µs/token)")
+    print(f"  parseopt_notrack() : {rapido * 1000:9.1f} ms  ({rapido / n * 1e6:.2f} µs/token)"
+          f"  {generico / rapido:.2f}x")
+    print(f"  parseopt_dense()   : {denso * 1000:9.1f} ms  ({denso / n * 1e6:.2f} µs/token)"
+          f"  {generico / denso:.2f}x")
+    if generado is None:
+        print("  generatedParser    :  no existe o está viejo (python parserGenerator.py)")
+    else:
+        print(f"  generatedParser    : {generado * 1000:9.1f} ms  ({generado / n * 1e6:.2f} µs/token)"
+              f"  {generico / generado:.2f}x")
+
+    vacio = sin_acciones(parser)
+    (generico, rapido, denso), _ = mejor_tiempos(
+        [vacio.parse, vacio.parseopt_notrack, vacio.parseopt_dense], tokens_stream, args.runs)
+    print("Solo el driver (acciones vacías)")
+    print(f"  parse()            : {generico * 1000:9.1f} ms  ({generico / n * 1e6:.2f} µs/token)")
+    print(f"  parseopt_notrack() : {rapido * 1000:9.1f} ms  ({rapido / n * 1e6:.2f} µs/token)"
+          f"  {generico / rapido:.2f}x")
+    print(f"  parseopt_dense()   : {denso * 1000:9.1f} ms  ({denso / n * 1e6:.2f} µs/token)"
+          f"  {generico / denso:.2f}x")
+
+    dicts, dense = memoria_tablas(parser)
+    print(f"Tablas action/goto ({len(parser.action)} estados)")
+    print(f"  diccionarios       : {dicts / 1024:9.1f} KB")
+    print(f"  densas (array)     : {dense / 1024:9.1f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
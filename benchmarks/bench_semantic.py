@@ -0,0 +1,72 @@
+# Benchmark del análisis semántico
+# Parsea una vez los algoritmos de prueba (repetidos --copies veces) y mide
+# solo analyze_ast. Con --profile muestra además cuántos nodos de cada tipo
+# se analizaron y el tiempo propio de cada tipo (SemanticSession(profile=True)).
+#
+# Uso:  python benchmarks/bench_semantic.py [--copies N] [--runs N] [--profile]
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import semanticAnalyzer
+import syntaxAnalyzer
+
+
+def programa(copies):
+    """Concatena los algoritmos de prueba sin errores de sintaxis."""
+    partes = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "algoritmos_prueba", "*.rs"))):
+        with open(path, encoding="utf-8") as f:
+            codigo = f.read()
+        session = syntaxAnalyzer.SyntaxSession()
+        with contextlib.redirect_stdout(io.StringIO()):
+            session.parse(codigo)
+        if not session.errors:
+            partes.append(codigo)
+    return "\n".join(partes) * copies
+
+
+def mejor_tiempo(ast, runs, profile=False):
+    best, session = None, None
+    for _ in range(runs):
+        session = semanticAnalyzer.SemanticSession(profile=profile)
+        t0 = time.perf_counter()
+        session.analyze_ast(ast)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, session
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark del análisis semántico")
+    ap.add_argument("--copies", type=int, default=50)
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--profile", action="store_true", help="mostrar el tiempo por tipo de nodo")
+    args = ap.parse_args()
+
+    codigo = programa(args.copies)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = syntaxAnalyzer.SyntaxSession().parse(codigo)
+
+    elapsed, session = mejor_tiempo(ast, args.runs)
+    print(f"Sentencias: {len(ast)}  (mejor de {args.runs} corridas)")
+    print(f"  analyze_ast        : {elapsed * 1000:9.1f} ms  ({len(session.errors)} errores)")
+
+    if args.profile:
+        elapsed, session = mejor_tiempo(ast, args.runs, profile=True)
+        print(f"  con profile        : {elapsed * 1000:9.1f} ms")
+        print("Tiempo propio por tipo de nodo")
+        print("\n".join(session.profile.report()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
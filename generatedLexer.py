@@ -0,0 +1,282 @@
+# Lexer DFA generado por lexerGenerator.py a partir de las reglas t_* de
+# lexicalAnalyzer. NO EDITAR A MANO: si cambian las reglas, volver a correr
+#     python lexerGenerator.py
+# Mientras la firma (SIGNATURE, la misma de lextab.py) no coincida,
+# lexicalAnalyzer no lo usa.
+#
+# TRANS[s][clase] = estado siguiente (-1 = no hay), ASCII_CLASS[ord(c)] = clase
+# de un carácter ASCII; los no ASCII son NONASCII_DIGIT o NONASCII_OTHER.
+# ACCEPT[s] = regla que acepta en s (-1 ninguna, -2 hay que mirar el
+# (?!...) de las reglas de ACCEPTS[s]). RULES[r] = (nombre, tipo de token,
+# función o None, texto del (?!...) o None).
+
+import re
+
+from ply.lex import LexError
+
+from lexicalAnalyzer import (
+    t_BLOCKCOMMENT_start,
+    t_CHAR,
+    t_CLOSURE_PIPE,
+    t_COMMENT_LINE,
+    t_DOC_COMMENT_INNER,
+    t_DOC_COMMENT_OUTER,
+    t_FLOAT,
+    t_IDENTIFIER,
+    t_INTEGER,
+    t_STRING,
+    t_blockcomment_content,
+    t_blockcomment_end,
+    t_blockcomment_newline,
+    t_blockcomment_single,
+    t_blockcomment_start,
+    t_newline,
+)
+
+SIGNATURE = '431f167fc32bb6ce5821eb548a5bb736854912460e07fed9d259fede86b08203'
+
+START = {'INITIAL': 0, 'blockcomment': 1}
+
+ASCII_CLASS = (
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 2, 3, 0, 0, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,
+    16, 17, 18, 19, 20, 0, 0, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21,
+    21, 21, 21, 21, 21, 21, 21, 21, 21, 22, 23, 24, 0, 21, 0, 21, 21, 21, 21, 21, 21, 21, 21, 21,
+    21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 25, 26, 27, 0, 0,
+)
+NONASCII_DIGIT = 28
+NONASCII_OTHER = 0
+
+# 62 estados x 29 clases
+TRANS = (
+    (-1, 29, 21, 26, 18, 24, 22, 11, 12, 33, 32, 25, 13, 31, 8, 28, 10, 9, 19, 23, 20, 27, 16, -1, 17, 14, 30, 15, 28),  # 0
+    (2, 5, 2, 2, 2, 2, 2, 2, 2, 4, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),  # 1
+    (2, -1, 2, 2, 2, 2, 2, 2, 2, -1, 2, 2, 2, 2, -1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),  # 2
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, 7, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 3
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 6, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 4
+    (-1, 5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 5
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 6
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 7
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, 56, -1, -1, -1, -1, 55, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 8
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 9
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 54, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 10
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 11
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 12
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 53, -1, -1, -1, -1, -1, -1, -1, -1),  # 13
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 14
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 15
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 16
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 17
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 18
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 52, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 19
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 51, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 20
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 50, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 21
+    (46, -1, 46, 46, 46, 46, -1, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 47, 46, 46, 46, 46, 46),  # 22
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 45, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 23
+    (-1, -1, -1, -1, -1, 44, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 24
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 25
+    (40, -1, 40, 41, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 42, 40, 40, 40, 40, 40),  # 26
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 39, -1, -1, -1, -1, -1, 39, -1, -1, -1, -1, -1, -1, -1),  # 27
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 37, -1, 28, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 28),  # 28
+    (-1, 29, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 29
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 36, -1, -1),  # 30
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 34, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 31
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 32
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 33
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 35, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 34
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 35
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 36
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 38, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 38),  # 37
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 38, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 38),  # 38
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 39, -1, -1, -1, -1, -1, 39, -1, -1, -1, -1, -1, -1, -1),  # 39
+    (40, -1, 40, 41, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 42, 40, 40, 40, 40, 40),  # 40
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 41
+    (43, -1, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43),  # 42
+    (40, -1, 40, 41, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 42, 40, 40, 40, 40, 40),  # 43
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 44
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 45
+    (-1, -1, -1, -1, -1, -1, 49, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 46
+    (48, -1, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48),  # 47
+    (-1, -1, -1, -1, -1, -1, 49, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 48
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 49
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 50
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 51
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 52
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 53
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 54
+    (59, -1, 58, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 57, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59),  # 55
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # 56
+    (61, -1, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61),  # 57
+    (60, -1, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60),  # 58
+    (59, -1, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59),  # 59
+    (60, -1, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60),  # 60
+    (61, -1, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61),  # 61
+)
+
+ACCEPT = (
+    -1, -1, 44, 45, 45, 43, 42, 41, 33, 23, 24, 25, 26, 32, 28, 29, 30, 31, 34, 35, 36, 37, -1, 38,
+    39, 40, -1, 6, 8, 9, -2, 21, 14, 15, 13, 11, 12, -1, 7, 6, -1, 5, -1, -1, 20, 16, -1, -1, -1,
+    4, 17, 19, 18, 27, 22, 2, 3, 0, 1, 2, 1, 0,
+)
+ACCEPTS = {30: (10,)}
+
+RULES = (
+    ('t_DOC_COMMENT_OUTER', 'DOC_COMMENT_OUTER', t_DOC_COMMENT_OUTER, None),  # 0: INITIAL
+    ('t_DOC_COMMENT_INNER', 'DOC_COMMENT_INNER', t_DOC_COMMENT_INNER, None),  # 1: INITIAL
+    ('t_COMMENT_LINE', 'COMMENT_LINE', t_COMMENT_LINE, None),  # 2: INITIAL
+    ('t_BLOCKCOMMENT_start', 'BLOCKCOMMENT_start', t_BLOCKCOMMENT_start, None),  # 3: INITIAL
+    ('t_CHAR', 'CHAR', t_CHAR, None),  # 4: INITIAL
+    ('t_STRING', 'STRING', t_STRING, None),  # 5: INITIAL
+    ('t_IDENTIFIER', 'IDENTIFIER', t_IDENTIFIER, None),  # 6: INITIAL
+    ('t_FLOAT', 'FLOAT', t_FLOAT, None),  # 7: INITIAL
+    ('t_INTEGER', 'INTEGER', t_INTEGER, None),  # 8: INITIAL
+    ('t_newline', 'newline', t_newline, None),  # 9: INITIAL
+    ('t_CLOSURE_PIPE', 'CLOSURE_PIPE', t_CLOSURE_PIPE, '\\|'),  # 10: INITIAL
+    ('t_RANGE_INCLUSIVE', 'RANGE_INCLUSIVE', None, None),  # 11: INITIAL
+    ('t_DISJUNCTION', 'DISJUNCTION', None, None),  # 12: INITIAL
+    ('t_RANGE', 'RANGE', None, None),  # 13: INITIAL
+    ('t_PLUS', 'PLUS', None, None),  # 14: INITIAL
+    ('t_TIMES', 'TIMES', None, None),  # 15: INITIAL
+    ('t_EQUAL_TO', 'EQUAL_TO', None, None),  # 16: INITIAL
+    ('t_NOT_EQUAL', 'NOT_EQUAL', None, None),  # 17: INITIAL
+    ('t_LESS_THAN_OR_EQUAL_TO', 'LESS_THAN_OR_EQUAL_TO', None, None),  # 18: INITIAL
+    ('t_GREATER_THAN_OR_EQUAL_TO', 'GREATER_THAN_OR_EQUAL_TO', None, None),  # 19: INITIAL
+    ('t_CONJUNCTION', 'CONJUNCTION', None, None),  # 20: INITIAL
+    ('t_DOT', 'DOT', None, None),  # 21: INITIAL
+    ('t_DOUBLE_COLON', 'DOUBLE_COLON', None, None),  # 22: INITIAL
+    ('t_SEMICOLON', 'SEMICOLON', None, None),  # 23: INITIAL
+    ('t_COLON', 'COLON', None, None),  # 24: INITIAL
+    ('t_LPAREN', 'LPAREN', None, None),  # 25: INITIAL
+    ('t_RPAREN', 'RPAREN', None, None),  # 26: INITIAL
+    ('t_ARROW', 'ARROW', None, None),  # 27: INITIAL
+    ('t_LBRACE', 'LBRACE', None, None),  # 28: INITIAL
+    ('t_RBRACE', 'RBRACE', None, None),  # 29: INITIAL
+    ('t_LBRACKET', 'LBRACKET', None, None),  # 30: INITIAL
+    ('t_RBRACKET', 'RBRACKET', None, None),  # 31: INITIAL
+    ('t_MINUS', 'MINUS', None, None),  # 32: INITIAL
+    ('t_DIVIDE', 'DIVIDE', None, None),  # 33: INITIAL
+    ('t_MOD', 'MOD', None, None),  # 34: INITIAL
+    ('t_LESS_THAN', 'LESS_THAN', None, None),  # 35: INITIAL
+    ('t_GREATER_THAN', 'GREATER_THAN', None, None),  # 36: INITIAL
+    ('t_NOT', 'NOT', None, None),  # 37: INITIAL
+    ('t_ASIGNED_TO', 'ASIGNED_TO', None, None),  # 38: INITIAL
+    ('t_BIT_AND', 'BIT_AND', None, None),  # 39: INITIAL
+    ('t_COMMA', 'COMMA', None, None),  # 40: INITIAL
+    ('t_blockcomment_start', 'start', t_blockcomment_start, None),  # 41: blockcomment
+    ('t_blockcomment_end', 'end', t_blockcomment_end, None),  # 42: blockcomment
+    ('t_blockcomment_newline', 'newline', t_blockcomment_newline, None),  # 43: blockcomment
+    ('t_blockcomment_content', 'content', t_blockcomment_content, None),  # 44: blockcomment
+    ('t_blockcomment_single', 'single', t_blockcomment_single, None),  # 45: blockcomment
+)
+
+
+# ---- Tablas de trabajo (se arman una vez al importar) ----
+# STATES[s] = (fila, no ASCII, lazo, acepta, final):
+#   fila: dict carácter ASCII -> estado siguiente
+#   no ASCII: (destino si es dígito, destino si no), -1 = no hay
+#   lazo: si s vuelve a sí mismo con algunos caracteres, el match de `re`
+#         que los salta todos de una vez (identificadores, dígitos, el
+#         interior de un comentario...); None si no
+#   acepta: ACCEPT[s]
+#   final: s no tiene transiciones, el token termina ahí
+
+def _tablas():
+    states = []
+    for s, row in enumerate(TRANS):
+        chars = {chr(c): row[k] for c, k in enumerate(ASCII_CLASS) if row[k] >= 0}
+        nonascii = (row[NONASCII_DIGIT], row[NONASCII_OTHER])
+        loop = ''.join(re.escape(chr(c)) for c, k in enumerate(ASCII_CLASS) if row[k] == s)
+        if nonascii == (s, s):
+            loop += '\\u0080-\\U0010ffff'
+        run = re.compile(f'[{loop}]*').match if loop and ACCEPT[s] != -2 else None
+        final = not chars and nonascii == (-1, -1)
+        states.append((chars, nonascii, run, ACCEPT[s], final))
+    return tuple(states)
+
+STATES = _tablas()
+LOOKAHEAD = tuple(re.compile(look).match if look is not None else None for _, _, _, look in RULES)
+
+
+def escanear(lexer, tok, data, pos, endpos):
+    """
+    Igual que lexicalAnalyzer._escanear (entrega (tipo, inicio, fin, línea)
+    y deja el estado del lexer como terminó), pero buscando cada token con
+    el DFA en lugar de las expresiones de ply.lex.
+    """
+    lexer.input(data)
+    start = STATES[START[lexer.lexstate]]
+    ignore = lexer.lexignore
+    while pos < endpos:
+        c = data[pos]
+        if c in ignore:
+            pos += 1
+            continue
+
+        # Match más largo desde pos
+        row, nonascii, run, a, final = start
+        i = pos
+        rule = -1
+        end = pos
+        while i < endpos:
+            c = data[i]
+            t = row.get(c)
+            if t is None:
+                if c < '\x80':
+                    break
+                t = nonascii[0 if c.isdecimal() else 1]
+                if t < 0:
+                    break
+            row, nonascii, run, a, final = STATES[t]
+            i += 1
+            if run is not None:
+                i = run(data, i, endpos).end()
+            if a >= 0:
+                rule = a
+                end = i
+                if final:
+                    break
+            elif a == -2:
+                for r in ACCEPTS[t]:
+                    look = LOOKAHEAD[r]
+                    if look is None or not look(data, i, endpos):
+                        rule = r
+                        end = i
+                        break
+
+        if rule < 0:
+            # Ningún patrón coincide: regla t_error del estado actual
+            if not lexer.lexerrorf:
+                raise LexError(f"Illegal character {data[pos]!r} at index {pos}", data[pos:endpos])
+            tok.type = 'error'
+            tok.value = data[pos:endpos]
+            tok.lineno = lexer.lineno
+            tok.lexpos = lexer.lexpos = pos
+            lexer.lexerrorf(tok)
+            if lexer.lexpos == pos:
+                raise LexError(f"Scanning error. Illegal character {data[pos]!r}", data[pos:endpos])
+            pos = lexer.lexpos
+            start = STATES[START[lexer.lexstate]]
+            ignore = lexer.lexignore
+            continue
+
+        _, ttype, func, _ = RULES[rule]
+        if func is None:
+            # Regla definida como cadena: se entrega sin llamar a nada
+            if ttype:
+                yield ttype, pos, end, lexer.lineno
+            pos = end
+            continue
+
+        tok.type = ttype
+        tok.value = data[pos:end]
+        tok.lineno = lexer.lineno
+        tok.lexpos = pos
+        lexer.lexmatch = None
+        lexer.lexpos = end
+        newtok = func(tok)
+        if newtok:
+            yield newtok.type, pos, end, newtok.lineno
+        pos = lexer.lexpos
+        # La regla puede haber cambiado de estado (comentarios de bloque)
+        start = STATES[START[lexer.lexstate]]
+        ignore = lexer.lexignore
@@ -0,0 +1,1959 @@
+# Parser generado por parserGenerator.py a partir de la gramática de
+# syntaxAnalyzer. NO EDITAR A MANO: si cambia la gramática, volver a correr
+#     python parserGenerator.py
+# Mientras la firma (GRAMMAR_SIGNATURE) no coincida, syntaxAnalyzer no lo usa.
+#
+# ACTION[estado][terminal]: > 0 desplazar a ese estado, < 0 reducir por esa
+# producción, 0 aceptar, None error. Los terminales se numeran igual que
+# lexicalAnalyzer.TOKEN_NAMES, así el código de tipo de cada token es su
+# columna. PRODUCTIONS[n] = (acción, no terminal, largo, ir-a por estado).
+
+import sys
+
+from syntaxAnalyzer import (
+    p_argument_list,
+    p_arguments_opt,
+    p_array_literal,
+    p_array_repeat,
+    p_assignment,
+    p_call_method,
+    p_cast_as,
+    p_closure_block_content_expr,
+    p_closure_block_content_stmts,
+    p_closure_block_content_stmts_expr,
+    p_closure_body_block,
+    p_closure_body_expr,
+    p_closure_params_empty,
+    p_closure_params_multiple,
+    p_closure_params_multiple_typed,
+    p_closure_params_single,
+    p_closure_params_single_typed,
+    p_const_decl,
+    p_element_list,
+    p_empty,
+    p_error_block,
+    p_exp_binary,
+    p_exp_ident,
+    p_exp_literal_num,
+    p_exp_literal_str_char_bool,
+    p_exp_logic,
+    p_exp_paren,
+    p_exp_range,
+    p_exp_relational,
+    p_exp_tuple_access,
+    p_exp_tuple_literal,
+    p_exp_unary_minus,
+    p_exp_unary_not,
+    p_expr_stmt,
+    p_expression_closure,
+    p_expression_closure_ret,
+    p_for_loop,
+    p_function_body_statements,
+    p_function_body_with_return,
+    p_function_call,
+    p_function_name_ident,
+    p_function_name_main,
+    p_function_with_return,
+    p_function_with_return_async,
+    p_function_without_return,
+    p_function_without_return_async,
+    p_hashmap_get,
+    p_hashmap_insert,
+    p_if_else,
+    p_if_simple,
+    p_index,
+    p_let_decl,
+    p_maybe_init,
+    p_maybe_mut,
+    p_maybe_pub,
+    p_maybe_type,
+    p_param,
+    p_param_list,
+    p_param_list_opt,
+    p_path_call_noargs,
+    p_println_expr,
+    p_println_format,
+    p_println_string,
+    p_program,
+    p_program_opt,
+    p_program_opt_error,
+    p_ref_mut_ident,
+    p_ref_unary,
+    p_return,
+    p_slice_inclusive,
+    p_slice_open,
+    p_statement_const,
+    p_statement_error,
+    p_statement_let,
+    p_tuple_type_list,
+    p_tuple_value_list,
+    p_type_array_len,
+    p_type_array_rec,
+    p_type_base,
+    p_type_ref_mut_rec,
+    p_type_ref_rec,
+    p_type_tuple,
+    p_vec_macro,
+    p_while,
+)
+
+GRAMMAR_SIGNATURE = 'a8b2f1ba37f5aed44e9545c2ca64ee42'
+
+ERROR_COUNT = 3
+
+TERMINALS = ('PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'MOD', 'EQUAL_TO', 'NOT_EQUAL', 'LESS_THAN', 'GREATER_THAN', 'LESS_THAN_OR_EQUAL_TO', 'GREATER_THAN_OR_EQUAL_TO', 'CONJUNCTION', 'DISJUNCTION', 'NOT', 'ASIGNED_TO', 'BIT_AND', 'IDENTIFIER', 'SEMICOLON', 'COLON', 'STRING', 'COMMA', 'CHAR', 'LPAREN', 'RPAREN', 'INTEGER', 'FLOAT', 'CLOSURE_PIPE', 'ARROW', 'LBRACE', 'RBRACE', 'LBRACKET', 'RBRACKET', 'DOT', 'RANGE', 'RANGE_INCLUSIVE', 'DOUBLE_COLON', 'AS', 'CONST', 'LET', 'MUT', 'IF', 'ELSE', 'WHILE', 'RETURN', 'MAIN', 'PRINTLN', 'FN', 'FOR', 'IN', 'ASYNC', 'TYPE_I32', 'TYPE_U8', 'TYPE_U16', 'TYPE_U32', 'TYPE_U64', 'TYPE_F64', 'TYPE_CHAR', 'TYPE_STRING', 'TYPE_STR', 'TYPE_BOOL', 'TYPE_TUPLE', 'BOOLEAN', 'error', '$end')
+_TERM_INDEX = {name: i for i, name in enumerate(TERMINALS)}
+_END = 63
+_ERROR = 62
+
+
+# Filas de acciones distintas (índice = código de terminal)
+_A0 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 9,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, None, None, None, 26, None, None, None, None,
+    None, None, 28, 27, None, 8, None, 10, 16, None, 3, -5, 14, None, 11, None, None, None, None,
+    None, None, None, None, None, None, None, 24, 17, None,
+)
+_A1 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 9,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, None, None, None, 26, None, None, None, None,
+    None, None, 28, 27, None, 8, None, 10, 16, None, 3, -5, 14, None, 11, None, None, None, None,
+    None, None, None, None, None, None, None, 24, 17, 0,
+)
+_A2 = (
+    None, -2, None, None, None, None, None, None, None, None, None, None, None, -2, None, -2, -2,
+    None, None, -2, None, -2, -2, None, -2, -2, -2, None, None, -2, -2, None, None, None, None,
+    None, None, -2, -2, None, -2, None, -2, -2, None, -2, -2, -2, None, -2, None, None, None, None,
+    None, None, None, None, None, None, None, -2, -2, -2,
+)
+_A3 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 31, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A4 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 33,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, None, None, None, 26, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, 24, None, None,
+)
+_A5 = (
+    -50, -50, -50, -50, -50, -50, -50, -50, -50, -50, -50, -50, -50, None, None, None, None, -50,
+    None, None, -50, None, None, -50, None, None, None, None, -50, -50, None, -50, -50, -50, -50,
+    None, -50, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A6 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, 36, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A7 = (
+    -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, 59, 55, None, None, -53, None,
+    None, None, None, 57, None, None, None, None, None, None, None, 58, None, -53, -53, -53, 56,
+    -53, None, None, None, None, None, None, None, None, None, -112, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A8 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, 61, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A9 = (
+    None, -78, None, None, None, None, None, None, None, None, None, None, None, -78, None, -78,
+    -78, None, None, -78, None, -78, -78, None, -78, -78, -78, None, None, -78, -78, None, None,
+    None, None, None, None, -78, -78, None, -78, None, -78, -78, None, -78, -78, -78, None, -78,
+    None, None, None, None, None, None, None, None, None, None, None, -78, -78, -78,
+)
+_A10 = (
+    None, -94, None, None, None, None, None, None, None, None, None, None, None, -94, None, -94,
+    -94, None, None, -94, None, -94, -94, None, -94, -94, -94, None, None, -94, -94, None, None,
+    None, None, None, None, -94, -94, None, -94, None, -94, -94, None, -94, -94, -94, None, -94,
+    None, None, None, None, None, None, None, None, None, None, None, -94, -94, -94,
+)
+_A11 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    62, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A12 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, 63, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A13 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 65, None, None, None, None, None, None, None, None, None, None, 66, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A14 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 9,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, None, None, -5, 26, None, None, None, None, None,
+    None, 28, 27, None, 8, None, 10, 16, None, 3, -5, 14, None, 11, None, None, None, None, None,
+    None, None, None, None, None, None, 24, 70, None,
+)
+_A15 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    72, None, None, None, None, None, None, None, None, None, -18, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A16 = (
+    -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, None, None, None, None, -48,
+    None, None, -48, None, None, -48, None, None, None, None, -48, -48, None, -48, -48, -48, -48,
+    None, -48, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A17 = (
+    -49, -49, -49, -49, -49, -49, -49, -49, -49, -49, -49, -49, -49, None, None, None, None, -49,
+    None, None, -49, None, None, -49, None, None, None, None, -49, -49, None, -49, -49, -49, -49,
+    None, -49, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A18 = (
+    -51, -51, -51, -51, -51, -51, -51, -51, -51, -51, -51, -51, -51, None, None, None, None, -51,
+    None, None, -51, None, None, -51, None, None, None, None, -51, -51, None, -51, -51, -51, -51,
+    None, -51, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A19 = (
+    -52, -52, -52, -52, -52, -52, -52, -52, -52, -52, -52, -52, -52, None, None, None, None, -52,
+    None, None, -52, None, None, -52, None, None, None, None, -52, -52, None, -52, -52, -52, -52,
+    None, -52, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A20 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 33,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, None, None, None, 26, None, None, None, None,
+    None, None, None, None, 75, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, 24, None, None,
+)
+_A21 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    -5, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 79, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A22 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    81, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A23 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, -113, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A24 = (
+    None, -1, None, None, None, None, None, None, None, None, None, None, None, -1, None, -1, -1,
+    None, None, -1, None, -1, -1, None, -1, -1, -1, None, None, -1, -1, None, None, None, None,
+    None, None, -1, -1, None, -1, None, -1, -1, None, -1, -1, -1, None, -1, None, None, None, None,
+    None, None, None, None, None, None, None, -1, -1, -1,
+)
+_A25 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, 82, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A26 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, -46, -46, None, None, None, None, -46, None, None,
+    -46, None, None, -46, None, None, None, None, -46, -46, None, -46, -46, 43, 44, None, 53, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None,
+)
+_A27 = (
+    -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, 59, None, None, None, -53,
+    None, None, -53, None, 57, -53, None, None, None, None, -53, -53, 58, -53, -53, -53, -53, 56,
+    -53, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A28 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    84, None, None, 83, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None,
+)
+_A29 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 85, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A30 = (
+    None, -12, None, None, None, None, None, None, None, None, None, None, None, -12, None, -12,
+    -12, None, None, -12, None, -12, -12, None, -12, -12, -12, None, None, -12, -12, None, None,
+    None, None, None, None, -12, -12, None, -12, None, -12, -12, None, -12, -12, -12, None, -12,
+    None, None, None, None, None, None, None, None, None, None, None, -12, -12, -12,
+)
+_A31 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    86, None, None, None, None, None, None, None, 87, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A32 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 116,
+    None, None, None, None, None, None, 117, None, None, None, None, None, None, None, 115, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, None, None, None,
+)
+_A33 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, 118, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A34 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    120, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A35 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 33,
+    None, None, 6, None, 23, 5, -5, 21, 22, 19, None, None, None, 26, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, 24, None, None,
+)
+_A36 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 33,
+    None, None, 6, None, 23, 5, None, 126, 22, 19, None, None, None, 26, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, 24, None, None,
+)
+_A37 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, 127, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A38 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, 128, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A39 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    130, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, 131, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A40 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    132, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A41 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, 134, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A42 = (
+    None, -120, None, None, None, None, None, None, None, None, None, None, None, -120, None, -120,
+    -120, None, None, -120, None, -120, -120, None, -120, -120, -120, None, None, -120, -120, None,
+    None, None, None, None, None, -120, -120, None, -120, None, -120, -120, None, -120, -120, -120,
+    None, -120, None, None, None, None, None, None, None, None, None, None, None, -120, -120, -120,
+)
+_A43 = (
+    None, -122, None, None, None, None, None, None, None, None, None, None, None, -122, None, -122,
+    -122, None, None, -122, None, -122, -122, None, -122, -122, -122, None, None, -122, -122, None,
+    None, None, None, None, None, -122, -122, None, -122, None, -122, -122, None, -122, -122, -122,
+    None, -122, None, None, None, None, None, None, None, None, None, None, None, -122, -122, None,
+)
+_A44 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 135, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A45 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 9,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, None, None, -3, 26, None, None, None, None, None,
+    None, 28, 27, None, 8, None, 10, 16, None, 3, -5, 14, None, 11, None, None, None, None, None,
+    None, None, None, None, None, None, 24, 136, None,
+)
+_A46 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, -4, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, -113, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A47 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 65, None, None, None, None, None, None, None, None, None, None, 66, -124, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A48 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, 137, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A49 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, 138, None, 139, None, None, None, None, None, -19, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A50 = (
+    -47, -47, -47, -47, -47, -47, -47, -47, -47, -47, -47, -47, -47, None, None, None, None, -47,
+    None, None, -47, None, None, -47, None, None, None, None, -47, -47, None, -47, -47, -47, -47,
+    None, -47, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A51 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, -54, None, None,
+    -54, None, None, -54, None, None, None, None, -54, -54, None, -54, 37, 43, 44, None, 53, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None,
+)
+_A52 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    140, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A53 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 142, None, None, None, None, None, None, None, None, None, None, 141,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A54 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, 143, None, None,
+    -87, None, None, None, None, None, None, None, None, None, None, -87, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A55 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    144, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A56 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    -80, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A57 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    -81, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A58 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, 145, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A59 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 33,
+    None, None, 146, None, 23, 5, None, 21, 22, 19, None, None, None, 26, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, 24, None, None,
+)
+_A60 = (
+    -30, -30, -30, -30, -30, -30, -30, -30, -30, -30, -30, -30, -30, None, None, None, None, -30,
+    None, None, -30, None, None, -30, None, None, None, None, -30, -30, None, -30, -30, -30, -30,
+    None, -30, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A61 = (
+    -99, -99, -99, -99, -99, -99, -99, -99, -99, -99, -99, -99, -99, None, None, None, None, -99,
+    None, None, -99, None, None, -99, None, None, None, None, -99, -99, None, -99, -99, -99, -99,
+    None, -99, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A62 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, 150, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A63 = (
+    -102, -102, -102, -102, -102, -102, -102, -102, -102, -102, -102, -102, -102, None, None, None,
+    None, -102, None, None, -102, None, None, -102, None, None, None, None, -102, -102, None, -102,
+    -102, -102, -102, None, -102, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A64 = (
+    -31, -31, 40, 41, 42, -31, -31, -31, -31, -31, -31, -31, -31, None, None, None, None, -31,
+    None, None, -31, None, None, -31, None, None, None, None, -31, -31, None, -31, -31, -31, -31,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A65 = (
+    -32, -32, 40, 41, 42, -32, -32, -32, -32, -32, -32, -32, -32, None, None, None, None, -32,
+    None, None, -32, None, None, -32, None, None, None, None, -32, -32, None, -32, -32, -32, -32,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A66 = (
+    -33, -33, -33, -33, -33, -33, -33, -33, -33, -33, -33, -33, -33, None, None, None, None, -33,
+    None, None, -33, None, None, -33, None, None, None, None, -33, -33, None, -33, -33, -33, -33,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A67 = (
+    -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, None, None, None, None, -34,
+    None, None, -34, None, None, -34, None, None, None, None, -34, -34, None, -34, -34, -34, -34,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A68 = (
+    -35, -35, -35, -35, -35, -35, -35, -35, -35, -35, -35, -35, -35, None, None, None, None, -35,
+    None, None, -35, None, None, -35, None, None, None, None, -35, -35, None, -35, -35, -35, -35,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A69 = (
+    38, 39, 40, 41, 42, -36, -36, -36, -36, -36, -36, -36, -36, None, None, None, None, -36, None,
+    None, -36, None, None, -36, None, None, None, None, -36, -36, None, -36, -36, None, None, None,
+    53, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A70 = (
+    38, 39, 40, 41, 42, -37, -37, -37, -37, -37, -37, -37, -37, None, None, None, None, -37, None,
+    None, -37, None, None, -37, None, None, None, None, -37, -37, None, -37, -37, None, None, None,
+    53, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A71 = (
+    38, 39, 40, 41, 42, None, None, None, None, None, None, -38, -38, None, None, None, None, -38,
+    None, None, -38, None, None, -38, None, None, None, None, -38, -38, None, -38, -38, 43, 44,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A72 = (
+    38, 39, 40, 41, 42, None, None, None, None, None, None, -39, -39, None, None, None, None, -39,
+    None, None, -39, None, None, -39, None, None, None, None, -39, -39, None, -39, -39, 43, 44,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A73 = (
+    38, 39, 40, 41, 42, None, None, None, None, None, None, -40, -40, None, None, None, None, -40,
+    None, None, -40, None, None, -40, None, None, None, None, -40, -40, None, -40, -40, 43, 44,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A74 = (
+    38, 39, 40, 41, 42, None, None, None, None, None, None, -41, -41, None, None, None, None, -41,
+    None, None, -41, None, None, -41, None, None, None, None, -41, -41, None, -41, -41, 43, 44,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A75 = (
+    38, 39, 40, 41, 42, None, None, None, None, None, None, -42, -42, None, None, None, None, -42,
+    None, None, -42, None, None, -42, None, None, None, None, -42, -42, None, -42, -42, 43, 44,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A76 = (
+    38, 39, 40, 41, 42, None, None, None, None, None, None, -43, -43, None, None, None, None, -43,
+    None, None, -43, None, None, -43, None, None, None, None, -43, -43, None, -43, -43, 43, 44,
+    None, 53, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A77 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, -44, -44, None, None, None, None, -44, None, None,
+    -44, None, None, -44, None, None, None, None, -44, -44, None, -44, -44, 43, 44, None, 53, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None,
+)
+_A78 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, -45, None, None, None, None, -45, None, None,
+    -45, None, None, -45, None, None, None, None, -45, -45, None, -45, -45, 43, 44, None, 53, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None,
+)
+_A79 = (
+    -56, -56, -56, -56, -56, -56, -56, -56, -56, -56, -56, -56, -56, None, None, None, None, -56,
+    None, None, -56, None, None, -56, None, None, None, None, -56, -56, None, -56, -56, -56, -56,
+    None, -56, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A80 = (
+    -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, None,
+    -63, -63, -63, -63, -63, -63, -63, -63, None, -63, -63, -63, -63, -63, -63, -63, None, -63,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -63, None, None,
+)
+_A81 = (
+    -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, None,
+    -64, -64, -64, -64, -64, -64, -64, -64, None, -64, -64, -64, -64, -64, -64, -64, None, -64,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -64, None, None,
+)
+_A82 = (
+    -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, None,
+    -65, -65, -65, -65, -65, -65, -65, -65, None, -65, -65, -65, -65, -65, -65, -65, None, -65,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -65, None, None,
+)
+_A83 = (
+    -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, None,
+    -66, -66, -66, -66, -66, -66, -66, -66, None, -66, -66, -66, -66, -66, -66, -66, None, -66,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -66, None, None,
+)
+_A84 = (
+    -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, None,
+    -67, -67, -67, -67, -67, -67, -67, -67, None, -67, -67, -67, -67, -67, -67, -67, None, -67,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -67, None, None,
+)
+_A85 = (
+    -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, None,
+    -68, -68, -68, -68, -68, -68, -68, -68, None, -68, -68, -68, -68, -68, -68, -68, None, -68,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -68, None, None,
+)
+_A86 = (
+    -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, None,
+    -69, -69, -69, -69, -69, -69, -69, -69, None, -69, -69, -69, -69, -69, -69, -69, None, -69,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -69, None, None,
+)
+_A87 = (
+    -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, None,
+    -70, -70, -70, -70, -70, -70, -70, -70, None, -70, -70, -70, -70, -70, -70, -70, None, -70,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -70, None, None,
+)
+_A88 = (
+    -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, None,
+    -71, -71, -71, -71, -71, -71, -71, -71, None, -71, -71, -71, -71, -71, -71, -71, None, -71,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -71, None, None,
+)
+_A89 = (
+    -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, None,
+    -72, -72, -72, -72, -72, -72, -72, -72, None, -72, -72, -72, -72, -72, -72, -72, None, -72,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -72, None, None,
+)
+_A90 = (
+    -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, None,
+    -73, -73, -73, -73, -73, -73, -73, -73, None, -73, -73, -73, -73, -73, -73, -73, None, -73,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -73, None, None,
+)
+_A91 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 116,
+    None, None, None, None, None, None, 117, None, None, None, None, None, None, None, 115, None,
+    None, None, None, None, None, None, None, 153, None, None, None, None, None, None, None, None,
+    None, None, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, None, None, None,
+)
+_A92 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, 157, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A93 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, 158, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A94 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 159, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A95 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 160, None, None, -14, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A96 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, -15, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A97 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    -17, None, None, -17, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A98 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 161, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A99 = (
+    -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, -48, -48, 162,
+    163, None, -48, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A100 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, 167, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A101 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, -114, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A102 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, -115, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A103 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, 169, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A104 = (
+    None, -118, None, None, None, None, None, None, None, None, None, None, None, -118, None, -118,
+    -118, None, None, -118, None, -118, -118, None, -118, -118, -118, None, None, -118, -118, None,
+    None, None, None, None, None, -118, -118, None, -118, None, -118, -118, None, -118, -118, -118,
+    None, -118, None, None, None, None, None, None, None, None, None, None, None, -118, -118, -118,
+)
+_A105 = (
+    None, -121, None, None, None, None, None, None, None, None, None, None, None, -121, None, -121,
+    -121, None, None, -121, None, -121, -121, None, -121, -121, -121, None, None, -121, -121, None,
+    None, None, None, None, None, -121, -121, None, -121, None, -121, -121, None, -121, -121, -121,
+    None, -121, None, None, None, None, None, None, None, None, None, None, None, -121, -121, -121,
+)
+_A106 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 65, None, None, None, None, None, None, None, None, None, None, 66, -123, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A107 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 33,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, 171, 173, None, 26, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, 24, None, None,
+)
+_A108 = (
+    -55, -55, -55, -55, -55, -55, -55, -55, -55, -55, -55, -55, -55, None, None, None, None, -55,
+    None, None, -55, None, None, -55, None, None, None, None, -55, -55, None, -55, -55, -55, -55,
+    None, -55, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A109 = (
+    -88, -88, -88, -88, -88, -88, -88, -88, -88, -88, -88, -88, -88, None, None, None, None, -88,
+    None, None, -88, None, None, -88, None, None, None, None, -88, -88, None, -88, -88, -88, -88,
+    None, -88, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A110 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, 177, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A111 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, -5, None,
+    None, -5, 179, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A112 = (
+    -50, -50, -50, -50, -50, -50, -50, -50, -50, -50, -50, -50, -50, None, None, None, None, None,
+    None, None, 183, None, None, 182, None, None, None, None, None, None, None, None, -50, -50,
+    -50, None, -50, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A113 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    None, None, None, 184, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A114 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    84, None, None, -100, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A115 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, -101, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A116 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 188, None, None, None, None, None, None, None, None, None, None, 187,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A117 = (
+    -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, None,
+    -76, -76, -76, -76, -76, -76, -76, -76, None, -76, -76, -76, -76, -76, -76, -76, None, -76,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -76, None, None,
+)
+_A118 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 190, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A119 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 191, None, None, -97, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A120 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 192, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A121 = (
+    None, -59, None, None, None, None, None, None, None, None, None, None, None, -59, None, -59,
+    -59, None, None, -59, None, -59, -59, None, -59, -59, -59, None, None, -59, -59, None, None,
+    None, None, None, None, -59, -59, None, -59, None, -59, -59, None, -59, -59, -59, None, -59,
+    None, None, None, None, None, None, None, None, None, None, None, -59, -59, -59,
+)
+_A122 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 193, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A123 = (
+    -119, -119, -119, -119, -119, -119, -119, -119, -119, -119, -119, -119, -119, None, None, None,
+    None, -119, None, None, -119, None, None, -119, None, None, None, None, -119, -119, None, -119,
+    -119, -119, -119, None, -119, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A124 = (
+    -90, -90, -90, -90, -90, -90, -90, -90, -90, -90, -90, -90, -90, None, None, None, None, -90,
+    None, None, -90, None, None, -90, None, None, None, None, -90, -90, None, -90, -90, -90, -90,
+    None, -90, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A125 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, 195, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A126 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, 196, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A127 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 142, None, None, None, None, None, None, None, None, None, None, 197,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A128 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    -87, None, None, None, None, None, None, None, None, None, None, -87, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A129 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 198, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A130 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    203, None, None, None, None, None, None, -5, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A131 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, 204, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A132 = (
+    -28, -28, -28, -28, -28, -28, -28, -28, -28, -28, -28, -28, -28, None, None, None, None, -28,
+    None, None, -28, None, None, -28, None, None, None, None, -28, -28, None, -28, -28, -28, -28,
+    None, -28, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A133 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, -23, None, None,
+    -23, None, None, -23, None, None, None, None, -23, -23, None, -23, 37, 43, 44, None, 53, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None,
+)
+_A134 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 211,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, None, None, -5, 26, None, None, None, None, None,
+    None, 28, 27, None, 8, None, 10, 16, None, 3, -5, 14, None, 11, None, None, None, None, None,
+    None, None, None, None, None, None, 24, 70, None,
+)
+_A135 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 212, None, None, None, None, None, -20, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A136 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, -21, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A137 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    -86, None, None, None, None, None, None, None, None, None, None, -86, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A138 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 213,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A139 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, 215, None,
+    None, -5, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A140 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, -83, None,
+    None, -83, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A141 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, 218, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A142 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 219, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A143 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 221, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A144 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    222, None, None, 223, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A145 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 224, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A146 = (
+    -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, None,
+    -74, -74, -74, -74, -74, -74, -74, -74, None, -74, -74, -74, -74, -74, -74, -74, None, -74,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -74, None, None,
+)
+_A147 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, 225, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A148 = (
+    -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, None,
+    -77, -77, -77, -77, -77, -77, -77, -77, None, -77, -77, -77, -77, -77, -77, -77, None, -77,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -77, None, None,
+)
+_A149 = (
+    -96, -96, -96, -96, -96, -96, -96, -96, -96, -96, -96, -96, -96, -96, -96, -96, -96, -96, None,
+    -96, -96, -96, -96, -96, -96, -96, -96, None, -96, -96, -96, -96, -96, -96, -96, None, -96,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -96, None, None,
+)
+_A150 = (
+    None, -57, None, None, None, None, None, None, None, None, None, None, None, -57, None, -57,
+    -57, None, None, -57, None, -57, -57, None, -57, -57, -57, None, None, -57, -57, None, None,
+    None, None, None, None, -57, -57, None, -57, 227, -57, -57, None, -57, -57, -57, None, -57,
+    None, None, None, None, None, None, None, None, None, None, None, -57, -57, -57,
+)
+_A151 = (
+    -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, None, None, None, None, -11,
+    None, None, -11, None, None, -11, None, None, None, None, -11, -11, None, -11, -11, -11, -11,
+    None, -11, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A152 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    -16, None, None, -16, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A153 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 228,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A154 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 229,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A155 = (
+    -93, -93, -93, -93, -93, -93, -93, -93, -93, -93, -93, -93, -93, None, None, None, None, -93,
+    None, None, -93, None, None, -93, None, None, None, None, -93, -93, None, -93, -93, -93, -93,
+    None, -93, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A156 = (
+    None, -60, None, None, None, None, None, None, None, None, None, None, None, -60, None, -60,
+    -60, None, None, -60, None, -60, -60, None, -60, -60, -60, None, None, -60, -60, None, None,
+    None, None, None, None, -60, -60, None, -60, None, -60, -60, None, -60, -60, -60, None, -60,
+    None, None, None, None, None, None, None, None, None, None, None, -60, -60, -60,
+)
+_A157 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 230, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A158 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 231, None, None, -104, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A159 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, -105, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A160 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, -107, None, None, -107, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A161 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, 232, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A162 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 234, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A163 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 33,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, None, 173, None, 26, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, 24, None, None,
+)
+_A164 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 236, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A165 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, 36, None, None,
+    None, None, None, None, None, None, None, None, None, -25, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A166 = (
+    None, 20, None, None, None, None, None, None, None, None, None, None, None, 4, None, 25, 211,
+    None, None, 6, None, 23, 5, None, 21, 22, 19, None, None, -3, 26, None, None, None, None, None,
+    None, 28, 27, None, 8, None, 10, 16, None, 3, -5, 14, None, 11, None, None, None, None, None,
+    None, None, None, None, None, None, 24, 136, None,
+)
+_A167 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, -27, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A168 = (
+    -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, -53, 59, 55, None, None, -53, None,
+    None, None, None, 57, None, None, None, None, None, None, -53, 58, None, -53, -53, -53, 56,
+    -53, None, None, None, None, None, None, None, None, None, -112, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A169 = (
+    -89, -89, -89, -89, -89, -89, -89, -89, -89, -89, -89, -89, -89, None, None, None, None, -89,
+    None, None, -89, None, None, -89, None, None, None, None, -89, -89, None, -89, -89, -89, -89,
+    None, -89, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A170 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 239, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A171 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, -85, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A172 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, -82, None,
+    None, -82, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A173 = (
+    None, -6, None, None, None, None, None, None, None, None, None, None, None, -6, None, -6, -6,
+    None, None, -6, None, -6, -6, None, -6, -6, -6, None, None, -6, -6, None, None, None, None,
+    None, None, -6, -6, None, -6, None, -6, -6, None, -6, -6, -6, None, -6, None, None, None, None,
+    None, None, None, None, None, None, None, -6, -6, -6,
+)
+_A174 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 160, None, None, 242, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A175 = (
+    None, -7, None, None, None, None, None, None, None, None, None, None, None, -7, None, -7, -7,
+    None, None, -7, None, -7, -7, None, -7, -7, -7, None, None, -7, -7, None, None, None, None,
+    None, None, -7, -7, None, -7, None, -7, -7, None, -7, -7, -7, None, -7, None, None, None, None,
+    None, None, None, None, None, None, None, -7, -7, -7,
+)
+_A176 = (
+    -10, -10, -10, -10, -10, -10, -10, -10, -10, -10, -10, -10, -10, None, None, None, None, -10,
+    None, None, -10, None, None, -10, None, None, None, None, -10, -10, None, -10, -10, -10, -10,
+    None, -10, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A177 = (
+    -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, None, None, None, None, -13,
+    None, None, -13, None, None, -13, None, None, None, None, -13, -13, None, -13, -13, -13, -13,
+    None, -13, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A178 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 244,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A179 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, -98, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A180 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, 245, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A181 = (
+    -91, -91, -91, -91, -91, -91, -91, -91, -91, -91, -91, -91, -91, None, None, None, None, -91,
+    None, None, -91, None, None, -91, None, None, None, None, -91, -91, None, -91, -91, -91, -91,
+    None, -91, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A182 = (
+    -92, -92, -92, -92, -92, -92, -92, -92, -92, -92, -92, -92, -92, None, None, None, None, -92,
+    None, None, -92, None, None, -92, None, None, None, None, -92, -92, None, -92, -92, -92, -92,
+    None, -92, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A183 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 246, 247, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A184 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    203, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A185 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 250, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A186 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, 251, 252, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A187 = (
+    -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, None, None, None, None, -29,
+    None, None, -29, None, None, -29, None, None, None, None, -29, -29, None, -29, -29, -29, -29,
+    None, -29, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A188 = (
+    -24, -24, -24, -24, -24, -24, -24, -24, -24, -24, -24, -24, -24, None, None, None, None, -24,
+    None, None, -24, None, None, -24, None, None, None, None, -24, -24, None, -24, -24, -24, -24,
+    None, -24, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A189 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, 36, None, None,
+    None, None, None, None, None, None, None, None, None, -26, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A190 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, -22, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A191 = (
+    None, -79, None, None, None, None, None, None, None, None, None, None, None, -79, None, -79,
+    -79, None, None, -79, None, -79, -79, None, -79, -79, -79, None, None, -79, -79, None, None,
+    None, None, None, None, -79, -79, None, -79, None, -79, -79, None, -79, -79, -79, None, -79,
+    None, None, None, None, None, None, None, None, None, None, None, -79, -79, -79,
+)
+_A192 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, -84, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A193 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, 253, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A194 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 254, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A195 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, None, None, None,
+    None, None, None, 255, None, None, None, None, None, None, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A196 = (
+    -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, None,
+    -75, -75, -75, -75, -75, -75, -75, -75, None, -75, -75, -75, -75, -75, -75, -75, None, -75,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, -75, None, None,
+)
+_A197 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, -106, None, None, -106, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A198 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, -108, None, None, -108, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A199 = (
+    None, -103, None, None, None, None, None, None, None, None, None, None, None, -103, None, -103,
+    -103, None, None, -103, None, -103, -103, None, -103, -103, -103, None, None, -103, -103, None,
+    None, None, None, None, None, -103, -103, None, -103, None, -103, -103, None, -103, -103, -103,
+    None, -103, None, None, None, None, None, None, None, None, None, None, None, -103, -103, -103,
+)
+_A200 = (
+    None, -95, None, None, None, None, None, None, None, None, None, None, None, -95, None, -95,
+    -95, None, None, -95, None, -95, -95, None, -95, -95, -95, None, None, -95, -95, None, None,
+    None, None, None, None, -95, -95, None, -95, None, -95, -95, None, -95, -95, -95, None, -95,
+    None, None, None, None, None, None, None, None, None, None, None, -95, -95, -95,
+)
+_A201 = (
+    None, -8, None, None, None, None, None, None, None, None, None, None, None, -8, None, -8, -8,
+    None, None, -8, None, -8, -8, None, -8, -8, -8, None, None, -8, -8, None, None, None, None,
+    None, None, -8, -8, None, -8, None, -8, -8, None, -8, -8, -8, None, -8, None, None, None, None,
+    None, None, None, None, None, None, None, -8, -8, -8,
+)
+_A202 = (
+    -9, -9, -9, -9, -9, -9, -9, -9, -9, -9, -9, -9, -9, None, None, None, None, -9, None, None, -9,
+    None, None, -9, None, None, None, None, -9, -9, None, -9, -9, -9, -9, None, -9, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None,
+)
+_A203 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 261, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A204 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, 262, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A205 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 263, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A206 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, 264, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A207 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 265, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A208 = (
+    None, -58, None, None, None, None, None, None, None, None, None, None, None, -58, None, -58,
+    -58, None, None, -58, None, -58, -58, None, -58, -58, -58, None, None, -58, -58, None, None,
+    None, None, None, None, -58, -58, None, -58, None, -58, -58, None, -58, -58, -58, None, -58,
+    None, None, None, None, None, None, None, None, None, None, None, -58, -58, -58,
+)
+_A209 = (
+    None, -62, None, None, None, None, None, None, None, None, None, None, None, -62, None, -62,
+    -62, None, None, -62, None, -62, -62, None, -62, -62, -62, None, None, -62, -62, None, None,
+    None, None, None, None, -62, -62, None, -62, None, -62, -62, None, -62, -62, -62, None, -62,
+    None, None, None, None, None, None, None, None, None, None, None, -62, -62, -62,
+)
+_A210 = (
+    None, -117, None, None, None, None, None, None, None, None, None, None, None, -117, None, -117,
+    -117, None, None, -117, None, -117, -117, None, -117, -117, -117, None, None, -117, -117, None,
+    None, None, None, None, None, -117, -117, None, -117, None, -117, -117, None, -117, -117, -117,
+    None, -117, None, None, None, None, None, None, None, None, None, None, None, -117, -117, -117,
+)
+_A211 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 271, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A212 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, 36, None, None,
+    None, None, None, None, None, None, None, None, None, -110, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A213 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, -111, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A214 = (
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, 273, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+)
+_A215 = (
+    None, -61, None, None, None, None, None, None, None, None, None, None, None, -61, None, -61,
+    -61, None, None, -61, None, -61, -61, None, -61, -61, -61, None, None, -61, -61, None, None,
+    None, None, None, None, -61, -61, None, -61, None, -61, -61, None, -61, -61, -61, None, -61,
+    None, None, None, None, None, None, None, None, None, None, None, -61, -61, -61,
+)
+_A216 = (
+    38, 39, 40, 41, 42, 45, 46, 47, 48, 49, 50, 51, 52, None, None, None, None, 36, None, None,
+    None, None, None, None, None, None, None, None, None, -109, None, None, 37, 43, 44, None, 53,
+    None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None,
+)
+_A217 = (
+    None, -116, None, None, None, None, None, None, None, None, None, None, None, -116, None, -116,
+    -116, None, None, -116, None, -116, -116, None, -116, -116, -116, None, None, -116, -116, None,
+    None, None, None, None, None, -116, -116, None, -116, None, -116, -116, None, -116, -116, -116,
+    None, -116, None, None, None, None, None, None, None, None, None, None, None, -116, -116, -116,
+)
+
+ACTION = (
+    _A0, _A1, _A2, _A3, _A4, _A4, _A5, _A6, _A4, _A7, _A4, _A8, _A9, _A10, _A11, _A12, _A4, _A13,
+    _A14, _A15, _A4, _A16, _A17, _A18, _A19, _A20, _A4, _A21, _A22, _A23, _A24, _A25, _A26, _A27,
+    _A28, _A29, _A30, _A31, _A4, _A4, _A4, _A4, _A4, _A4, _A4, _A4, _A4, _A4, _A4, _A4, _A4, _A4,
+    _A4, _A32, _A33, _A4, _A34, _A35, _A36, _A37, _A38, _A39, _A40, _A39, _A41, _A42, _A43, _A44,
+    _A45, _A46, _A47, _A48, _A49, _A50, _A51, _A52, _A53, _A54, _A55, _A56, _A57, _A58, _A59, _A60,
+    _A4, _A61, _A62, _A63, _A64, _A65, _A66, _A67, _A68, _A69, _A70, _A71, _A72, _A73, _A74, _A75,
+    _A76, _A77, _A78, _A79, _A80, _A81, _A82, _A83, _A84, _A85, _A86, _A87, _A88, _A89, _A90, _A32,
+    _A91, _A32, _A14, _A92, _A93, _A94, _A95, _A96, _A97, _A98, _A99, _A4, _A14, _A100, _A101,
+    _A102, _A4, _A103, _A104, _A105, _A106, _A107, _A32, _A15, _A108, _A109, _A4, _A110, _A111,
+    _A32, _A112, _A113, _A114, _A115, _A35, _A116, _A117, _A32, _A118, _A119, _A120, _A121, _A122,
+    _A123, _A4, _A124, _A125, _A126, _A127, _A128, _A129, _A130, _A131, _A130, _A132, _A32, _A133,
+    _A134, _A135, _A136, _A137, _A138, _A139, _A32, _A140, _A141, _A142, _A4, _A143, _A144, _A145,
+    _A146, _A147, _A148, _A149, _A32, _A150, _A151, _A152, _A153, _A154, _A155, _A156, _A157,
+    _A158, _A159, _A160, _A161, _A14, _A162, _A163, _A164, _A165, _A166, _A167, _A168, _A15, _A169,
+    _A170, _A4, _A171, _A172, _A4, _A173, _A174, _A175, _A4, _A176, _A177, _A178, _A179, _A180,
+    _A181, _A182, _A183, _A184, _A32, _A185, _A186, _A187, _A188, _A189, _A190, _A191, _A192,
+    _A193, _A194, _A195, _A196, _A14, _A32, _A14, _A197, _A198, _A199, _A32, _A14, _A200, _A201,
+    _A202, _A203, _A204, _A205, _A206, _A207, _A208, _A134, _A209, _A134, _A210, _A211, _A166,
+    _A212, _A213, _A214, _A215, _A216, _A217,
+)
+
+# Reducción por defecto de cada estado (0 = hay que mirar el lookahead)
+DEFAULT = (
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -113, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -80, -81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -15,
+    0, 0, 0, 0, 0, 0, -114, -115, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -101, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -21, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -105, 0, 0, 0, 0, 0, 0, 0, 0, -27, 0, 0, 0,
+    0, 0, -85, 0, 0, 0, 0, 0, 0, 0, 0, 0, -98, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -22, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -111, 0, 0, 0, 0,
+)
+
+# Ir-a de cada no terminal: estado de abajo -> estado nuevo
+_G1 = {  # program
+    0: 1, 18: 68, 118: 68, 128: 68, 173: 209, 204: 68, 245: 68, 247: 68, 252: 68, 262: 267,
+    264: 267,
+}
+_G2 = {  # program_opt
+    18: 67, 118: 156, 128: 166, 173: 210, 204: 233, 245: 256, 247: 258, 252: 260, 262: 269,
+    264: 269,
+}
+_G3 = {  # empty
+    0: 29, 1: 29, 18: 69, 27: 80, 57: 123, 68: 29, 118: 69, 128: 69, 144: 180, 150: 123, 167: 201,
+    169: 201, 173: 69, 178: 216, 204: 69, 209: 29, 245: 69, 247: 69, 252: 69, 262: 69, 264: 69,
+    267: 29,
+}
+_G4 = {  # statement
+    0: 2, 1: 30, 18: 2, 68: 30, 118: 2, 128: 2, 173: 2, 204: 2, 209: 30, 245: 2, 247: 2, 252: 2,
+    262: 2, 264: 2, 267: 30,
+}
+_G5 = {  # expression
+    0: 7, 1: 7, 4: 32, 5: 34, 8: 54, 10: 60, 16: 64, 18: 7, 20: 73, 25: 74, 26: 77, 38: 88, 39: 89,
+    40: 90, 41: 91, 42: 92, 43: 93, 44: 94, 45: 95, 46: 96, 47: 97, 48: 98, 49: 99, 50: 100,
+    51: 101, 52: 102, 55: 119, 57: 124, 58: 125, 68: 7, 82: 147, 84: 148, 118: 7, 127: 165, 128: 7,
+    132: 168, 137: 172, 142: 176, 150: 185, 160: 194, 173: 208, 183: 124, 204: 7, 206: 172,
+    209: 237, 215: 240, 218: 241, 222: 243, 245: 7, 247: 7, 252: 7, 262: 268, 264: 268, 267: 272,
+}
+_G6 = {  # arguments_opt
+    57: 121, 150: 186,
+}
+_G7 = {  # argument_list
+    57: 122, 150: 122, 183: 220,
+}
+_G8 = {  # closure_params
+    19: 71, 139: 175, 212: 238,
+}
+_G9 = {  # closure_body
+    137: 170, 206: 235,
+}
+_G10 = {  # closure_block_content
+    173: 207,
+}
+_G11 = {  # type
+    53: 103, 115: 151, 116: 152, 117: 155, 138: 174, 145: 181, 153: 189, 171: 206, 179: 217,
+    191: 155, 232: 249, 246: 257, 251: 259,
+}
+_G12 = {  # let_decl
+    0: 12, 1: 12, 18: 12, 68: 12, 118: 12, 128: 12, 173: 12, 204: 12, 209: 12, 245: 12, 247: 12,
+    252: 12, 262: 12, 264: 12, 267: 12,
+}
+_G13 = {  # maybe_mut
+    27: 78,
+}
+_G14 = {  # maybe_type
+    144: 178,
+}
+_G15 = {  # maybe_init
+    178: 214,
+}
+_G16 = {  # element_list
+    26: 76, 127: 164,
+}
+_G17 = {  # const_decl
+    0: 13, 1: 13, 18: 13, 68: 13, 118: 13, 128: 13, 173: 13, 204: 13, 209: 13, 245: 13, 247: 13,
+    252: 13, 262: 13, 264: 13, 267: 13,
+}
+_G18 = {  # tuple_type_list
+    117: 154, 191: 226,
+}
+_G19 = {  # tuple_value_list
+    5: 35, 84: 149,
+}
+_G20 = {  # param_list_opt
+    167: 199, 169: 205,
+}
+_G21 = {  # param_list
+    167: 200, 169: 200,
+}
+_G22 = {  # param
+    167: 202, 169: 202, 231: 248,
+}
+_G23 = {  # function_body
+    262: 266, 264: 270,
+}
+_G24 = {  # maybe_pub
+    0: 15, 1: 15, 18: 15, 68: 15, 118: 15, 128: 15, 173: 15, 204: 15, 209: 15, 245: 15, 247: 15,
+    252: 15, 262: 15, 264: 15, 267: 15,
+}
+_G25 = {  # function_name
+    61: 129, 63: 133,
+}
+_G26 = {  # error_block
+    0: 18, 1: 18, 18: 18, 68: 18, 118: 18, 128: 18, 173: 18, 204: 18, 209: 18, 245: 18, 247: 18,
+    252: 18, 262: 18, 264: 18, 267: 18,
+}
+
+PRODUCTIONS = (
+    None,  # S' -> program
+    (p_program, 'program', 2, _G1),  # program -> program statement
+    (p_program, 'program', 1, _G1),  # program -> statement
+    (p_program_opt, 'program_opt', 1, _G2),  # program_opt -> program
+    (p_program_opt, 'program_opt', 1, _G2),  # program_opt -> empty
+    (p_empty, 'empty', 0, _G3),  # empty -> <empty>
+    (p_println_string, 'statement', 6, _G4),  # statement -> PRINTLN NOT LPAREN STRING RPAREN SEMICOLON
+    (p_println_expr, 'statement', 6, _G4),  # statement -> PRINTLN NOT LPAREN expression RPAREN SEMICOLON
+    (p_println_format, 'statement', 8, _G4),  # statement -> PRINTLN NOT LPAREN STRING COMMA argument_list RPAREN SEMICOLON
+    (p_hashmap_insert, 'expression', 8, _G5),  # expression -> expression DOT IDENTIFIER LPAREN expression COMMA expression RPAREN
+    (p_hashmap_get, 'expression', 6, _G5),  # expression -> expression DOT IDENTIFIER LPAREN expression RPAREN
+    (p_path_call_noargs, 'expression', 5, _G5),  # expression -> IDENTIFIER DOUBLE_COLON IDENTIFIER LPAREN RPAREN
+    (p_expr_stmt, 'statement', 2, _G4),  # statement -> expression SEMICOLON
+    (p_call_method, 'expression', 6, _G5),  # expression -> expression DOT IDENTIFIER LPAREN arguments_opt RPAREN
+    (p_arguments_opt, 'arguments_opt', 1, _G6),  # arguments_opt -> argument_list
+    (p_arguments_opt, 'arguments_opt', 1, _G6),  # arguments_opt -> empty
+    (p_argument_list, 'argument_list', 3, _G7),  # argument_list -> argument_list COMMA expression
+    (p_argument_list, 'argument_list', 1, _G7),  # argument_list -> expression
+    (p_closure_params_empty, 'closure_params', 0, _G8),  # closure_params -> <empty>
+    (p_closure_params_single, 'closure_params', 1, _G8),  # closure_params -> IDENTIFIER
+    (p_closure_params_single_typed, 'closure_params', 3, _G8),  # closure_params -> IDENTIFIER COLON type
+    (p_closure_params_multiple, 'closure_params', 3, _G8),  # closure_params -> IDENTIFIER COMMA closure_params
+    (p_closure_params_multiple_typed, 'closure_params', 5, _G8),  # closure_params -> IDENTIFIER COLON type COMMA closure_params
+    (p_closure_body_expr, 'closure_body', 1, _G9),  # closure_body -> expression
+    (p_closure_body_block, 'closure_body', 3, _G9),  # closure_body -> LBRACE closure_block_content RBRACE
+    (p_closure_block_content_expr, 'closure_block_content', 1, _G10),  # closure_block_content -> expression
+    (p_closure_block_content_stmts_expr, 'closure_block_content', 2, _G10),  # closure_block_content -> program expression
+    (p_closure_block_content_stmts, 'closure_block_content', 1, _G10),  # closure_block_content -> program_opt
+    (p_expression_closure, 'expression', 4, _G5),  # expression -> CLOSURE_PIPE closure_params CLOSURE_PIPE closure_body
+    (p_expression_closure_ret, 'expression', 6, _G5),  # expression -> CLOSURE_PIPE closure_params CLOSURE_PIPE ARROW type closure_body
+    (p_exp_paren, 'expression', 3, _G5),  # expression -> LPAREN expression RPAREN
+    (p_exp_binary, 'expression', 3, _G5),  # expression -> expression PLUS expression
+    (p_exp_binary, 'expression', 3, _G5),  # expression -> expression MINUS expression
+    (p_exp_binary, 'expression', 3, _G5),  # expression -> expression TIMES expression
+    (p_exp_binary, 'expression', 3, _G5),  # expression -> expression DIVIDE expression
+    (p_exp_binary, 'expression', 3, _G5),  # expression -> expression MOD expression
+    (p_exp_range, 'expression', 3, _G5),  # expression -> expression RANGE expression
+    (p_exp_range, 'expression', 3, _G5),  # expression -> expression RANGE_INCLUSIVE expression
+    (p_exp_relational, 'expression', 3, _G5),  # expression -> expression EQUAL_TO expression
+    (p_exp_relational, 'expression', 3, _G5),  # expression -> expression NOT_EQUAL expression
+    (p_exp_relational, 'expression', 3, _G5),  # expression -> expression LESS_THAN expression
+    (p_exp_relational, 'expression', 3, _G5),  # expression -> expression GREATER_THAN expression
+    (p_exp_relational, 'expression', 3, _G5),  # expression -> expression LESS_THAN_OR_EQUAL_TO expression
+    (p_exp_relational, 'expression', 3, _G5),  # expression -> expression GREATER_THAN_OR_EQUAL_TO expression
+    (p_exp_logic, 'expression', 3, _G5),  # expression -> expression CONJUNCTION expression
+    (p_exp_logic, 'expression', 3, _G5),  # expression -> expression DISJUNCTION expression
+    (p_exp_unary_not, 'expression', 2, _G5),  # expression -> NOT expression
+    (p_exp_unary_minus, 'expression', 2, _G5),  # expression -> MINUS expression
+    (p_exp_literal_num, 'expression', 1, _G5),  # expression -> INTEGER
+    (p_exp_literal_num, 'expression', 1, _G5),  # expression -> FLOAT
+    (p_exp_literal_str_char_bool, 'expression', 1, _G5),  # expression -> STRING
+    (p_exp_literal_str_char_bool, 'expression', 1, _G5),  # expression -> CHAR
+    (p_exp_literal_str_char_bool, 'expression', 1, _G5),  # expression -> BOOLEAN
+    (p_exp_ident, 'expression', 1, _G5),  # expression -> IDENTIFIER
+    (p_ref_unary, 'expression', 2, _G5),  # expression -> BIT_AND expression
+    (p_ref_mut_ident, 'expression', 3, _G5),  # expression -> BIT_AND MUT IDENTIFIER
+    (p_cast_as, 'expression', 3, _G5),  # expression -> expression AS type
+    (p_if_simple, 'statement', 5, _G4),  # statement -> IF expression LBRACE program_opt RBRACE
+    (p_if_else, 'statement', 9, _G4),  # statement -> IF expression LBRACE program_opt RBRACE ELSE LBRACE program_opt RBRACE
+    (p_assignment, 'statement', 4, _G4),  # statement -> IDENTIFIER ASIGNED_TO expression SEMICOLON
+    (p_while, 'statement', 5, _G4),  # statement -> WHILE expression LBRACE program_opt RBRACE
+    (p_function_with_return_async, 'statement', 11, _G4),  # statement -> ASYNC FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACE
+    (p_function_without_return_async, 'statement', 9, _G4),  # statement -> ASYNC FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACE
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_I32
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_U8
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_U16
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_U32
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_U64
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_F64
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_CHAR
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_STRING
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_STR
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_BOOL
+    (p_type_base, 'type', 1, _G11),  # type -> TYPE_TUPLE
+    (p_type_array_rec, 'type', 3, _G11),  # type -> LBRACKET type RBRACKET
+    (p_type_array_len, 'type', 5, _G11),  # type -> LBRACKET type COMMA INTEGER RBRACKET
+    (p_type_ref_rec, 'type', 2, _G11),  # type -> BIT_AND type
+    (p_type_ref_mut_rec, 'type', 3, _G11),  # type -> BIT_AND MUT type
+    (p_statement_let, 'statement', 1, _G4),  # statement -> let_decl
+    (p_let_decl, 'let_decl', 6, _G12),  # let_decl -> LET maybe_mut IDENTIFIER maybe_type maybe_init SEMICOLON
+    (p_maybe_mut, 'maybe_mut', 1, _G13),  # maybe_mut -> MUT
+    (p_maybe_mut, 'maybe_mut', 1, _G13),  # maybe_mut -> empty
+    (p_maybe_type, 'maybe_type', 2, _G14),  # maybe_type -> COLON type
+    (p_maybe_type, 'maybe_type', 1, _G14),  # maybe_type -> empty
+    (p_maybe_init, 'maybe_init', 2, _G15),  # maybe_init -> ASIGNED_TO expression
+    (p_maybe_init, 'maybe_init', 1, _G15),  # maybe_init -> empty
+    (p_element_list, 'element_list', 3, _G16),  # element_list -> element_list COMMA expression
+    (p_element_list, 'element_list', 1, _G16),  # element_list -> expression
+    (p_array_literal, 'expression', 3, _G5),  # expression -> LBRACKET element_list RBRACKET
+    (p_array_repeat, 'expression', 5, _G5),  # expression -> LBRACKET expression SEMICOLON INTEGER RBRACKET
+    (p_index, 'expression', 4, _G5),  # expression -> IDENTIFIER LBRACKET expression RBRACKET
+    (p_slice_open, 'expression', 6, _G5),  # expression -> IDENTIFIER LBRACKET INTEGER RANGE INTEGER RBRACKET
+    (p_slice_inclusive, 'expression', 6, _G5),  # expression -> IDENTIFIER LBRACKET INTEGER RANGE_INCLUSIVE INTEGER RBRACKET
+    (p_vec_macro, 'expression', 5, _G5),  # expression -> IDENTIFIER NOT LBRACKET element_list RBRACKET
+    (p_statement_const, 'statement', 1, _G4),  # statement -> const_decl
+    (p_const_decl, 'const_decl', 7, _G17),  # const_decl -> CONST IDENTIFIER COLON type ASIGNED_TO expression SEMICOLON
+    (p_type_tuple, 'type', 3, _G11),  # type -> LPAREN tuple_type_list RPAREN
+    (p_tuple_type_list, 'tuple_type_list', 1, _G18),  # tuple_type_list -> type
+    (p_tuple_type_list, 'tuple_type_list', 3, _G18),  # tuple_type_list -> type COMMA tuple_type_list
+    (p_exp_tuple_literal, 'expression', 3, _G5),  # expression -> LPAREN tuple_value_list RPAREN
+    (p_tuple_value_list, 'tuple_value_list', 1, _G19),  # tuple_value_list -> expression
+    (p_tuple_value_list, 'tuple_value_list', 3, _G19),  # tuple_value_list -> expression COMMA tuple_value_list
+    (p_exp_tuple_access, 'expression', 3, _G5),  # expression -> expression DOT INTEGER
+    (p_for_loop, 'statement', 7, _G4),  # statement -> FOR IDENTIFIER IN expression LBRACE program_opt RBRACE
+    (p_param_list_opt, 'param_list_opt', 1, _G20),  # param_list_opt -> param_list
+    (p_param_list_opt, 'param_list_opt', 1, _G20),  # param_list_opt -> empty
+    (p_param_list, 'param_list', 3, _G21),  # param_list -> param_list COMMA param
+    (p_param_list, 'param_list', 1, _G21),  # param_list -> param
+    (p_param, 'param', 3, _G22),  # param -> IDENTIFIER COLON type
+    (p_function_body_with_return, 'function_body', 2, _G23),  # function_body -> program expression
+    (p_function_body_with_return, 'function_body', 1, _G23),  # function_body -> expression
+    (p_function_body_statements, 'function_body', 1, _G23),  # function_body -> program_opt
+    (p_maybe_pub, 'maybe_pub', 1, _G24),  # maybe_pub -> IDENTIFIER
+    (p_maybe_pub, 'maybe_pub', 1, _G24),  # maybe_pub -> empty
+    (p_function_name_ident, 'function_name', 1, _G25),  # function_name -> IDENTIFIER
+    (p_function_name_main, 'function_name', 1, _G25),  # function_name -> MAIN
+    (p_function_with_return, 'statement', 11, _G4),  # statement -> maybe_pub FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACE
+    (p_function_without_return, 'statement', 9, _G4),  # statement -> maybe_pub FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACE
+    (p_return, 'statement', 3, _G4),  # statement -> RETURN expression SEMICOLON
+    (p_function_call, 'expression', 4, _G5),  # expression -> IDENTIFIER LPAREN arguments_opt RPAREN
+    (p_statement_error, 'statement', 2, _G4),  # statement -> error SEMICOLON
+    (p_statement_error, 'statement', 3, _G4),  # statement -> error_block program_opt RBRACE
+    (p_error_block, 'error_block', 2, _G26),  # error_block -> error LBRACE
+    (p_program_opt_error, 'program_opt', 2, _G2),  # program_opt -> program error
+    (p_program_opt_error, 'program_opt', 1, _G2),  # program_opt -> error
+)
+
+
+class Symbol:
+    # Sin __init__: en cada reducción se crea uno y se le asignan type y value
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlineno', 'endlexpos', 'lexer')
+
+    def __str__(self):
+        return self.type
+
+    def __repr__(self):
+        return str(self)
+
+
+class Production:
+    """El objeto `p` que reciben las acciones (misma interfaz que ply.yacc.YaccProduction)."""
+
+    def __init__(self):
+        self.slice = None
+        self.stack = None
+        self.lexer = None
+        self.parser = None
+
+    def __getitem__(self, n):
+        if isinstance(n, slice):
+            return [s.value for s in self.slice[n]]
+        if n >= 0:
+            return self.slice[n].value
+        return self.stack[n].value
+
+    def __setitem__(self, n, v):
+        self.slice[n].value = v
+
+    def __len__(self):
+        return len(self.slice)
+
+    def lineno(self, n):
+        return getattr(self.slice[n], 'lineno', 0)
+
+    def set_lineno(self, n, lineno):
+        self.slice[n].lineno = lineno
+
+    def linespan(self, n):
+        startline = getattr(self.slice[n], 'lineno', 0)
+        return startline, getattr(self.slice[n], 'endlineno', startline)
+
+    def lexpos(self, n):
+        return getattr(self.slice[n], 'lexpos', 0)
+
+    def set_lexpos(self, n, lexpos):
+        self.slice[n].lexpos = lexpos
+
+    def lexspan(self, n):
+        startpos = getattr(self.slice[n], 'lexpos', 0)
+        return startpos, getattr(self.slice[n], 'endlexpos', startpos)
+
+    def error(self):
+        raise SyntaxError
+
+
+class Parser:
+    """
+    Parser LR con las tablas de este módulo. Se usa como ply.yacc.LRParser:
+    parse(lexer=...) devuelve el valor de `program`, errorfunc recibe los
+    tokens con error y errok() sale del modo de recuperación (errok(n), después
+    de desplazar n tokens más). skip_limit acota los tokens que descarta la
+    recuperación, como en ply.yacc.
+    """
+
+    def __init__(self, errorfunc=None):
+        self.errorfunc = errorfunc
+        self.errorok = True
+        self.errok_shifts = 0
+        self.skip_limit = None
+        self.statestack = []
+        self.symstack = []
+        self.state = 0
+
+    def errok(self, shifts=0):
+        if shifts:
+            self.errok_shifts = shifts
+        else:
+            self.errorok = True
+
+    def restart(self):
+        del self.statestack[:]
+        del self.symstack[:]
+        sym = Symbol()
+        sym.type = '$end'
+        self.symstack.append(sym)
+        self.statestack.append(0)
+
+    def parse(self, input=None, lexer=None):
+        lookahead = None                 # símbolo de lookahead
+        code = -1                        # su número de terminal
+        lookaheadstack = []
+        pslice = Production()
+        errorcount = 0
+        skipped = 0
+        self.errok_shifts = 0
+
+        pslice.lexer = lexer
+        pslice.parser = self
+        if input is not None:
+            lexer.input(input)
+
+        get_token = self.token = lexer.token
+        names = getattr(lexer, 'token_names', None)
+        if names is not None and tuple(names) == TERMINALS[:len(names)]:
+            next_token = lexer.token_and_code
+        else:
+            def next_token():
+                tok = get_token()
+                return tok, (_TERM_INDEX.get(tok.type, -1) if tok else _END)
+
+        statestack = self.statestack = []
+        symstack = self.symstack = []
+        pslice.stack = symstack
+        push_state = statestack.append
+        push_symbol = symstack.append
+        errtoken = None
+
+        push_state(0)
+        sym = Symbol()
+        sym.type = '$end'
+        push_symbol(sym)
+        state = 0
+        while True:
+            t = DEFAULT[state]
+            if not t:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead, code = next_token()
+                    else:
+                        lookahead = lookaheadstack.pop()
+                        code = _TERM_INDEX.get(lookahead.type, -1) if lookahead else _END
+                    if not lookahead:
+                        lookahead = Symbol()
+                        lookahead.type = '$end'
+                        code = _END
+                t = ACTION[state][code] if code >= 0 else None
+
+            if t is not None:
+                if t > 0:
+                    push_state(t)
+                    state = t
+                    push_symbol(lookahead)
+                    lookahead = None
+                    if errorcount:
+                        errorcount -= 1
+                        skipped = 0
+                        if self.errok_shifts:
+                            if symstack[-1].type == 'error':
+                                # Un símbolo error nuevo empieza otra recuperación,
+                                # cuya regla de sincronización vuelve a llamar a errok()
+                                self.errok_shifts = 0
+                            else:
+                                self.errok_shifts -= 1
+                                errorcount = self.errok_shifts
+                    continue
+
+                if t < 0:
+                    action, name, plen, goto = PRODUCTIONS[-t]
+                    sym = Symbol()
+                    sym.type = name
+                    sym.value = None
+
+                    if plen:
+                        targ = symstack[-plen-1:]
+                        targ[0] = sym
+                        pslice.slice = targ
+                        try:
+                            del symstack[-plen:]
+                            self.state = state
+                            action(pslice)
+                            del statestack[-plen:]
+                            push_symbol(sym)
+                            state = goto[statestack[-1]]
+                            push_state(state)
+                        except SyntaxError:
+                            lookaheadstack.append(lookahead)
+                            symstack.extend(targ[1:-1])
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            code = _ERROR
+                            errorcount = ERROR_COUNT
+                            self.errorok = False
+                        continue
+
+                    targ = [sym]
+                    pslice.slice = targ
+                    try:
+                        self.state = state
+                        action(pslice)
+                        push_symbol(sym)
+                        state = goto[statestack[-1]]
+                        push_state(state)
+                    except SyntaxError:
+                        lookaheadstack.append(lookahead)
+                        statestack.pop()
+                        state = statestack[-1]
+                        sym.type = 'error'
+                        sym.value = 'error'
+                        lookahead = sym
+                        code = _ERROR
+                        errorcount = ERROR_COUNT
+                        self.errorok = False
+                    continue
+
+                if t == 0:
+                    return getattr(symstack[-1], 'value', None)
+
+            # Error de sintaxis: misma recuperación que ply.yacc
+            self.errok_shifts = 0
+            if errorcount == 0 or self.errorok:
+                errorcount = ERROR_COUNT
+                self.errorok = False
+                errtoken = lookahead
+                if errtoken.type == '$end':
+                    errtoken = None
+                if self.errorfunc:
+                    if errtoken and not hasattr(errtoken, 'lexer'):
+                        errtoken.lexer = lexer
+                    self.state = state
+                    tok = self.errorfunc(errtoken)
+                    if self.errorok:
+                        lookahead = tok
+                        if tok:
+                            code = _TERM_INDEX.get(tok.type, -1)
+                        errtoken = None
+                        continue
+                else:
+                    if errtoken:
+                        lineno = getattr(errtoken, 'lineno', 0)
+                        if lineno:
+                            sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                        else:
+                            sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                    else:
+                        sys.stderr.write('yacc: Parse error in input. EOF\n')
+                        return
+            else:
+                errorcount = ERROR_COUNT
+
+            if len(statestack) <= 1 and lookahead.type != '$end':
+                lookahead = None
+                errtoken = None
+                state = 0
+                del lookaheadstack[:]
+                continue
+
+            if lookahead.type == '$end':
+                return
+
+            if lookahead.type != 'error':
+                if symstack[-1].type == 'error':
+                    skipped += 1
+                    if self.skip_limit is not None and skipped > self.skip_limit:
+                        # Demasiados tokens descartados: se saca el símbolo
+                        # error y se reintenta este token como un comienzo nuevo
+                        symstack.pop()
+                        statestack.pop()
+                        state = statestack[-1]
+                        skipped = 0
+                        self.errok_shifts = 1
+                        continue
+                    lookahead = None
+                    continue
+                t = Symbol()
+                t.type = 'error'
+                t.value = lookahead
+                if hasattr(lookahead, 'lineno'):
+                    t.lineno = t.endlineno = lookahead.lineno
+                if hasattr(lookahead, 'lexpos'):
+                    t.lexpos = t.endlexpos = lookahead.lexpos
+                lookaheadstack.append(lookahead)
+                lookahead = t
+                code = _ERROR
+            else:
+                symstack.pop()
+                statestack.pop()
+                state = statestack[-1]
@@ -0,0 +1,639 @@
+# Generador del lexer DFA
+# Lee las reglas t_* y los estados (`states`) de lexicalAnalyzer con el mismo
+# orden que usa ply.lex y arma un solo autómata determinista por estado del
+# lexer: expresión regular -> NFA -> DFA (construcción de subconjuntos). El
+# resultado se escribe en generatedLexer.py: tablas de transición por clase
+# de carácter y una función escanear() con el mismo contrato que
+# lexicalAnalyzer._escanear, que recorre el texto una sola vez sin
+# backtracking.
+#
+# Semántica: gana el match más largo; si dos reglas aceptan el mismo largo,
+# gana la que ply.lex prueba primero (funciones por línea, después cadenas
+# por largo de la expresión). Para estas reglas da los mismos tokens que el
+# "primer match" de ply.lex. Además:
+#   - Una regla con cuantificador perezoso (*?, +?, ??) termina en el primer
+#     punto donde acepta (como "\"...\"" con *?: hasta la primera comilla).
+#   - Un (?!...) al final de la expresión se comprueba con `re` solo en el
+#     momento de aceptar esa regla.
+#
+# Uso:  python lexerGenerator.py [-o generatedLexer.py]
+#
+# Hay que volver a correrlo cada vez que cambian las reglas; mientras tanto
+# lexicalAnalyzer nota que la firma no coincide y usa ply.lex.
+
+import argparse
+import os
+import re
+import sys
+
+from ply import lex
+
+import lexicalAnalyzer
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generatedLexer.py")
+
+# ============== ALFABETO ==============
+# Cada carácter ASCII es un símbolo (0..127). Los no ASCII se agrupan en dos
+# símbolos: dígitos decimales (los que acepta \d de Python) y el resto.
+NONASCII_DIGIT = 128
+NONASCII_OTHER = 129
+ALL = frozenset(range(130))
+DIGITS = frozenset(range(ord('0'), ord('9') + 1)) | {NONASCII_DIGIT}
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'f': '\f', 'v': '\v', '0': '\0'}
+_VERBOSE_SPACE = ' \t\n\r\f\v'
+
+
+class RegexError(Exception):
+    """La expresión usa algo que el generador no sabe convertir a DFA."""
+
+
+class _RegexParser:
+    """
+    Convierte una expresión de `re` al árbol que usa el generador:
+    ('set', símbolos), ('cat', [..]), ('alt', [..]), ('star'|'plus'|'opt', nodo).
+    Soporta lo que usan las reglas del lexer: literales, escapes, clases
+    [..] con rangos y negación, '.', \\d, grupos, alternativas y los
+    cuantificadores * + ? (también perezosos). Con verbose=True ignora los
+    espacios y comentarios # fuera de las clases, igual que re.VERBOSE.
+    """
+
+    def __init__(self, pattern, verbose=True):
+        self.pattern = pattern
+        self.verbose = verbose
+        self.i = 0
+        self.lazy = False
+        self.lookahead = None
+
+    def parse(self):
+        node = self._alt(top=True)
+        if self.i < len(self.pattern):
+            raise RegexError(f"')' sin abrir en {self.pattern!r}")
+        return node
+
+    def _peek(self):
+        self._skip_verbose()
+        return self.pattern[self.i] if self.i < len(self.pattern) else None
+
+    def _skip_verbose(self):
+        if not self.verbose:
+            return
+        p = self.pattern
+        while self.i < len(p):
+            if p[self.i] in _VERBOSE_SPACE:
+                self.i += 1
+            elif p[self.i] == '#':
+                while self.i < len(p) and p[self.i] != '\n':
+                    self.i += 1
+            else:
+                break
+
+    def _alt(self, top=False):
+        options = [self._cat(top)]
+        while self._peek() == '|':
+            self.i += 1
+            options.append(self._cat(top))
+        if len(options) > 1 and top and self.lookahead is not None:
+            raise RegexError(f"(?!...) solo se admite al final de la expresión: {self.pattern!r}")
+        return options[0] if len(options) == 1 else ('alt', options)
+
+    def _cat(self, top):
+        items = []
+        while True:
+            c = self._peek()
+            if c is None or c in '|)':
+                break
+            if self.lookahead is not None:
+                raise RegexError(f"(?!...) solo se admite al final de la expresión: {self.pattern!r}")
+            if self.pattern.startswith('(?!', self.i):
+                if not top:
+                    raise RegexError(f"(?!...) dentro de un grupo: {self.pattern!r}")
+                self.lookahead = self._lookahead_text()
+                continue
+            items.append(self._item())
+        return items[0] if len(items) == 1 else ('cat', items)
+
+    def _lookahead_text(self):
+        # Texto de X en (?!X), para compilarlo con `re`
+        start = self.i + 3
+        depth, i = 1, start
+        p = self.pattern
+        while i < len(p) and depth:
+            if p[i] == '\\':
+                i += 2
+                continue
+            if p[i] == '[':
+                i = self._class_end(i)
+                continue
+            if p[i] == '(':
+                depth += 1
+            elif p[i] == ')':
+                depth -= 1
+            i += 1
+        if depth:
+            raise RegexError(f"(?! sin cerrar en {self.pattern!r}")
+        self.i = i
+        return p[start:i - 1]
+
+    def _class_end(self, i):
+        p = self.pattern
+        i += 1
+        if i < len(p) and p[i] == '^':
+            i += 1
+        if i < len(p) and p[i] == ']':
+            i += 1
+        while i < len(p) and p[i] != ']':
+            i += 2 if p[i] == '\\' else 1
+        return i + 1
+
+    def _item(self):
+        node = self._atom()
+        c = self._peek()
+        if c is not None and c in '*+?':
+            self.i += 1
+            kind = {'*': 'star', '+': 'plus', '?': 'opt'}[c]
+            if self.i < len(self.pattern) and self.pattern[self.i] == '?':
+                self.i += 1
+                self.lazy = True
+            node = (kind, node)
+            if self._peek() is not None and self._peek() in '*+?{':
+                raise RegexError(f"cuantificador repetido en {self.pattern!r}")
+        elif c == '{':
+            raise RegexError(f"repeticiones {{m,n}} no soportadas: {self.pattern!r}")
+        return node
+
+    def _atom(self):
+        p = self.pattern
+        c = p[self.i]
+        if c == '(':
+            if p.startswith('(?:', self.i):
+                self.i += 3
+            elif p.startswith('(?', self.i):
+                raise RegexError(f"grupo {p[self.i:self.i + 3]!r} no soportado: {p!r}")
+            else:
+                self.i += 1
+            node = self._alt()
+            if self._peek() != ')':
+                raise RegexError(f"'(' sin cerrar en {p!r}")
+            self.i += 1
+            return node
+        if c == '[':
+            return ('set', self._class())
+        if c == '.':
+            self.i += 1
+            return ('set', ALL - {ord('\n')})
+        if c == '\\':
+            return ('set', self._escape(in_class=False))
+        if c in '^$':
+            raise RegexError(f"anclas ^ y $ no soportadas: {p!r}")
+        self.i += 1
+        return ('set', _literal(c, p))
+
+    def _escape(self, in_class):
+        p = self.pattern
+        if self.i + 1 >= len(p):
+            raise RegexError(f"'\\' al final de {p!r}")
+        c = p[self.i + 1]
+        self.i += 2
+        if c == 'd':
+            return DIGITS
+        if c == 'D':
+            return ALL - DIGITS
+        if c in _ESCAPES:
+            return _literal(_ESCAPES[c], p)
+        if c.isalnum():
+            raise RegexError(f"escape \\{c} no soportado: {p!r}")
+        return _literal(c, p)
+
+    def _class(self):
+        p = self.pattern
+        self.i += 1
+        negate = self.i < len(p) and p[self.i] == '^'
+        if negate:
+            self.i += 1
+        symbols = set()
+        first = True
+        while True:
+            if self.i >= len(p):
+                raise RegexError(f"'[' sin cerrar en {p!r}")
+            c = p[self.i]
+            if c == ']' and not first:
+                self.i += 1
+                break
+            first = False
+            if c == '\\':
+                low = self._escape(in_class=True)
+            else:
+                self.i += 1
+                low = _literal(c, p)
+            # Rango a-z
+            if (len(low) == 1 and self.i + 1 < len(p)
+                    and p[self.i] == '-' and p[self.i + 1] != ']'):
+                self.i += 1
+                if p[self.i] == '\\':
+                    high = self._escape(in_class=True)
+                else:
+                    high = _literal(p[self.i], p)
+                    self.i += 1
+                if len(high) != 1:
+                    raise RegexError(f"rango inválido en {p!r}")
+                (a,), (b,) = low, high
+                symbols.update(range(a, b + 1))
+            else:
+                symbols |= low
+        return ALL - symbols if negate else frozenset(symbols)
+
+
+def _literal(c, pattern):
+    if ord(c) >= 128:
+        raise RegexError(f"caracteres no ASCII en la expresión no soportados: {pattern!r}")
+    return frozenset((ord(c),))
+
+
+# ============== NFA ==============
+
+class _NFA:
+    """NFA de Thompson: por estado, transiciones (símbolos, destino) y épsilon."""
+
+    def __init__(self):
+        self.moves = []      # por estado: lista de (frozenset de símbolos, destino)
+        self.eps = []        # por estado: lista de destinos épsilon
+        self.rule = []       # regla a la que pertenece cada estado
+        self.accept = {}     # estado de aceptación -> regla
+
+    def state(self, rule):
+        self.moves.append([])
+        self.eps.append([])
+        self.rule.append(rule)
+        return len(self.moves) - 1
+
+    def build(self, node, rule):
+        """Agrega el fragmento del nodo; devuelve (inicio, fin)."""
+        kind = node[0]
+        if kind == 'set':
+            a, b = self.state(rule), self.state(rule)
+            self.moves[a].append((node[1], b))
+            return a, b
+        if kind == 'cat':
+            start, end = self.build(node[1][0], rule)
+            for child in node[1][1:]:
+                s, e = self.build(child, rule)
+                self.eps[end].append(s)
+                end = e
+            return start, end
+        if kind == 'alt':
+            a, b = self.state(rule), self.state(rule)
+            for child in node[1]:
+                s, e = self.build(child, rule)
+                self.eps[a].append(s)
+                self.eps[e].append(b)
+            return a, b
+        s, e = self.build(node[1], rule)
+        a, b = self.state(rule), self.state(rule)
+        self.eps[a].append(s)
+        self.eps[e].append(b)
+        if kind in ('star', 'opt'):
+            self.eps[a].append(b)
+        if kind in ('star', 'plus'):
+            self.eps[e].append(s)
+        return a, b
+
+    def closure(self, states):
+        stack = list(states)
+        seen = set(states)
+        while stack:
+            for t in self.eps[stack.pop()]:
+                if t not in seen:
+                    seen.add(t)
+                    stack.append(t)
+        return frozenset(seen)
+
+
+# ============== REGLAS ==============
+
+def collect_rules(ldict=None):
+    """
+    Reglas de cada estado del lexer en el orden de ply.lex. Devuelve
+    (reflect, rules, by_state) donde rules es una lista de dicts con name,
+    type, func, pattern y state, y by_state[estado] la lista de índices.
+    """
+    if ldict is None:
+        ldict = vars(lexicalAnalyzer)
+    reflect = lex.LexerReflect(ldict, reflags=int(re.VERBOSE))
+    reflect.get_all()
+    rules = []
+    by_state = {}
+    for state in reflect.stateinfo:
+        entries = [(fname, f, lex._get_regex(f)) for fname, f in reflect.funcsym[state]]
+        entries += [(name, None, r) for name, r in reflect.strsym[state]]
+        if reflect.stateinfo[state] == 'inclusive' and state != 'INITIAL':
+            entries += [(fname, f, lex._get_regex(f)) for fname, f in reflect.funcsym['INITIAL']]
+            entries += [(name, None, r) for name, r in reflect.strsym['INITIAL']]
+        indexes = []
+        for name, func, pattern in entries:
+            tokname = reflect.toknames[name]
+            if func is None and tokname.startswith('ignore_'):
+                ttype = None
+            else:
+                ttype = tokname
+            indexes.append(len(rules))
+            rules.append({'name': name, 'type': ttype, 'func': func, 'pattern': pattern, 'state': state})
+        by_state[state] = indexes
+    return reflect, rules, by_state
+
+
+def build_dfa(rules, by_state):
+    """
+    Construye el DFA. Devuelve (start, trans, accepts, lookaheads):
+    start[estado del lexer] = estado inicial del DFA, trans[s] = dict
+    símbolo -> estado, accepts[s] = reglas que aceptan en s (por prioridad),
+    lookaheads[regla] = texto del (?!...) o None.
+    """
+    nfa = _NFA()
+    lazy = []
+    lookaheads = []
+    rule_start = []
+    for index, rule in enumerate(rules):
+        parser = _RegexParser(rule['pattern'])
+        try:
+            node = parser.parse()
+        except RegexError as e:
+            raise RegexError(f"{rule['name']}: {e}") from None
+        s, e = nfa.build(node, index)
+        nfa.accept[e] = index
+        rule_start.append(s)
+        lazy.append(parser.lazy)
+        lookaheads.append(parser.lookahead)
+
+    dfa_ids = {}
+    trans = []
+    accepts = []
+    start = {}
+    pending = []
+
+    def add(states):
+        key = states
+        if key not in dfa_ids:
+            dfa_ids[key] = len(trans)
+            trans.append(None)
+            accepted = sorted({nfa.accept[s] for s in states if s in nfa.accept})
+            accepts.append(tuple(accepted))
+            pending.append(key)
+        return dfa_ids[key]
+
+    for state, indexes in by_state.items():
+        start[state] = add(nfa.closure([rule_start[i] for i in indexes]))
+
+    while pending:
+        states = pending.pop()
+        sid = dfa_ids[states]
+        # Una regla perezosa que ya aceptó no sigue consumiendo
+        done = {r for r in accepts[sid] if lazy[r]}
+        if done:
+            states = frozenset(s for s in states if nfa.rule[s] not in done)
+        targets = {}
+        for s in states:
+            for symbols, t in nfa.moves[s]:
+                for sym in symbols:
+                    targets.setdefault(sym, set()).add(t)
+        row = {}
+        cache = {}
+        for sym, nxt in targets.items():
+            key = frozenset(nxt)
+            if key not in cache:
+                cache[key] = add(nfa.closure(key))
+            row[sym] = cache[key]
+        trans[sid] = row
+    return start, trans, accepts, lookaheads
+
+
+def symbol_classes(trans):
+    """Agrupa los símbolos con la misma columna de transiciones en clases."""
+    columns = {}
+    class_of = [0] * len(ALL)
+    for sym in sorted(ALL):
+        column = tuple(row.get(sym, -1) for row in trans)
+        class_of[sym] = columns.setdefault(column, len(columns))
+    return class_of, len(columns)
+
+
+# ============== CÓDIGO GENERADO ==============
+
+HEADER = '''\
+# Lexer DFA generado por lexerGenerator.py a partir de las reglas t_* de
+# lexicalAnalyzer. NO EDITAR A MANO: si cambian las reglas, volver a correr
+#     python lexerGenerator.py
+# Mientras la firma (SIGNATURE, la misma de lextab.py) no coincida,
+# lexicalAnalyzer no lo usa.
+#
+# TRANS[s][clase] = estado siguiente (-1 = no hay), ASCII_CLASS[ord(c)] = clase
+# de un carácter ASCII; los no ASCII son NONASCII_DIGIT o NONASCII_OTHER.
+# ACCEPT[s] = regla que acepta en s (-1 ninguna, -2 hay que mirar el
+# (?!...) de las reglas de ACCEPTS[s]). RULES[r] = (nombre, tipo de token,
+# función o None, texto del (?!...) o None).
+
+import re
+
+from ply.lex import LexError
+
+from lexicalAnalyzer import (
+{imports}
+)
+
+SIGNATURE = {signature!r}
+
+START = {start!r}
+'''
+
+SCANNER = r'''
+
+# ---- Tablas de trabajo (se arman una vez al importar) ----
+# STATES[s] = (fila, no ASCII, lazo, acepta, final):
+#   fila: dict carácter ASCII -> estado siguiente
+#   no ASCII: (destino si es dígito, destino si no), -1 = no hay
+#   lazo: si s vuelve a sí mismo con algunos caracteres, el match de `re`
+#         que los salta todos de una vez (identificadores, dígitos, el
+#         interior de un comentario...); None si no
+#   acepta: ACCEPT[s]
+#   final: s no tiene transiciones, el token termina ahí
+
+def _tablas():
+    states = []
+    for s, row in enumerate(TRANS):
+        chars = {chr(c): row[k] for c, k in enumerate(ASCII_CLASS) if row[k] >= 0}
+        nonascii = (row[NONASCII_DIGIT], row[NONASCII_OTHER])
+        loop = ''.join(re.escape(chr(c)) for c, k in enumerate(ASCII_CLASS) if row[k] == s)
+        if nonascii == (s, s):
+            loop += '\\u0080-\\U0010ffff'
+        run = re.compile(f'[{loop}]*').match if loop and ACCEPT[s] != -2 else None
+        final = not chars and nonascii == (-1, -1)
+        states.append((chars, nonascii, run, ACCEPT[s], final))
+    return tuple(states)
+
+STATES = _tablas()
+LOOKAHEAD = tuple(re.compile(look).match if look is not None else None for _, _, _, look in RULES)
+
+
+def escanear(lexer, tok, data, pos, endpos):
+    """
+    Igual que lexicalAnalyzer._escanear (entrega (tipo, inicio, fin, línea)
+    y deja el estado del lexer como terminó), pero buscando cada token con
+    el DFA en lugar de las expresiones de ply.lex.
+    """
+    lexer.input(data)
+    start = STATES[START[lexer.lexstate]]
+    ignore = lexer.lexignore
+    while pos < endpos:
+        c = data[pos]
+        if c in ignore:
+            pos += 1
+            continue
+
+        # Match más largo desde pos
+        row, nonascii, run, a, final = start
+        i = pos
+        rule = -1
+        end = pos
+        while i < endpos:
+            c = data[i]
+            t = row.get(c)
+            if t is None:
+                if c < '\x80':
+                    break
+                t = nonascii[0 if c.isdecimal() else 1]
+                if t < 0:
+                    break
+            row, nonascii, run, a, final = STATES[t]
+            i += 1
+            if run is not None:
+                i = run(data, i, endpos).end()
+            if a >= 0:
+                rule = a
+                end = i
+                if final:
+                    break
+            elif a == -2:
+                for r in ACCEPTS[t]:
+                    look = LOOKAHEAD[r]
+                    if look is None or not look(data, i, endpos):
+                        rule = r
+                        end = i
+                        break
+
+        if rule < 0:
+            # Ningún patrón coincide: regla t_error del estado actual
+            if not lexer.lexerrorf:
+                raise LexError(f"Illegal character {data[pos]!r} at index {pos}", data[pos:endpos])
+            tok.type = 'error'
+            tok.value = data[pos:endpos]
+            tok.lineno = lexer.lineno
+            tok.lexpos = lexer.lexpos = pos
+            lexer.lexerrorf(tok)
+            if lexer.lexpos == pos:
+                raise LexError(f"Scanning error. Illegal character {data[pos]!r}", data[pos:endpos])
+            pos = lexer.lexpos
+            start = STATES[START[lexer.lexstate]]
+            ignore = lexer.lexignore
+            continue
+
+        _, ttype, func, _ = RULES[rule]
+        if func is None:
+            # Regla definida como cadena: se entrega sin llamar a nada
+            if ttype:
+                yield ttype, pos, end, lexer.lineno
+            pos = end
+            continue
+
+        tok.type = ttype
+        tok.value = data[pos:end]
+        tok.lineno = lexer.lineno
+        tok.lexpos = pos
+        lexer.lexmatch = None
+        lexer.lexpos = end
+        newtok = func(tok)
+        if newtok:
+            yield newtok.type, pos, end, newtok.lineno
+        pos = lexer.lexpos
+        # La regla puede haber cambiado de estado (comentarios de bloque)
+        start = STATES[START[lexer.lexstate]]
+        ignore = lexer.lexignore
+'''
+
+
+def _wrap(values, indent="    ", width=100):
+    """Lista de valores repartida en líneas de hasta `width` caracteres."""
+    lines, line = [], indent
+    for value in values:
+        item = f"{value!r}, "
+        if len(line) + len(item) > width and line.strip():
+            lines.append(line.rstrip())
+            line = indent
+        line += item
+    if line.strip():
+        lines.append(line.rstrip())
+    return "\n".join(lines)
+
+
+def generate():
+    """Devuelve el código de generatedLexer.py para las reglas de lexicalAnalyzer."""
+    reflect, rules, by_state = collect_rules()
+    start, trans, accepts, lookaheads = build_dfa(rules, by_state)
+    class_of, nclasses = symbol_classes(trans)
+
+    table = []
+    for row in trans:
+        cells = [-1] * nclasses
+        for sym, target in row.items():
+            cells[class_of[sym]] = target
+        table.append(tuple(cells))
+
+    accept = []
+    extra = {}
+    for s, rs in enumerate(accepts):
+        if not rs:
+            accept.append(-1)
+        elif lookaheads[rs[0]] is None:
+            accept.append(rs[0])
+        else:
+            accept.append(-2)
+            extra[s] = rs
+
+    functions = sorted({r['func'].__name__ for r in rules if r['func'] is not None})
+    out = [HEADER.format(
+        imports="\n".join(f"    {name}," for name in functions),
+        signature=reflect.signature(),
+        start=start,
+    )]
+    out.append(f"ASCII_CLASS = (\n{_wrap(class_of[:128])}\n)")
+    out.append(f"NONASCII_DIGIT = {class_of[NONASCII_DIGIT]}")
+    out.append(f"NONASCII_OTHER = {class_of[NONASCII_OTHER]}")
+    out.append(f"\n# {len(trans)} estados x {nclasses} clases")
+    out.append("TRANS = (")
+    for s, row in enumerate(table):
+        out.append(f"    {row!r},  # {s}")
+    out.append(")")
+    out.append(f"\nACCEPT = (\n{_wrap(accept)}\n)")
+    out.append(f"ACCEPTS = {extra!r}")
+    out.append("\nRULES = (")
+    for index, (rule, look) in enumerate(zip(rules, lookaheads)):
+        func = rule['func'].__name__ if rule['func'] is not None else 'None'
+        out.append(f"    ({rule['name']!r}, {rule['type']!r}, {func}, {look!r}),  # {index}: {rule['state']}")
+    out.append(")")
+    out.append(SCANNER)
+    return "\n".join(out)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Genera generatedLexer.py a partir de las reglas de lexicalAnalyzer")
+    ap.add_argument("-o", "--output", default=OUTPUT, help="archivo de salida")
+    args = ap.parse_args(argv)
+
+    source = generate()
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(source)
+    print(f"Lexer generado en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,13 @@
 from ply import lex
+from array import array
+import bisect
+import codecs
 import datetime
+import mmap
 import os
-LEX_ERRORS = []  # aquí guardamos los errores léxicos para mostrarlos en la GUI
+import re
+import threading
+LEX_ERRORS = []  # errores léxicos del último input() del lexer compartido (get_lexer())
 
 reserved = {
     # AVANCE DE PALABRAS RESERVADAS: Nicolas Sierra - INICIO
@@ -18,8 +24,25 @@ reserved = {
     'fn':'FN',        
     'for':'FOR',
     'in':'IN',
-    'async':'ASYNC'
+    'async':'ASYNC',
     # AVANCE DE PALABRAS RESERVADAS: Nicolas Sierra - FIN
+
+    # Tipos de datos y booleanos: se reconocen con la misma regla de
+    # identificadores y se clasifican aquí, así 'u8val' o 'strength' siguen
+    # siendo identificadores completos.
+    'i32': 'TYPE_I32',
+    'u8': 'TYPE_U8',
+    'u16': 'TYPE_U16',
+    'u32': 'TYPE_U32',
+    'u64': 'TYPE_U64',
+    'f64': 'TYPE_F64',
+    'char': 'TYPE_CHAR',
+    'String': 'TYPE_STRING',
+    'str': 'TYPE_STR',
+    'bool': 'TYPE_BOOL',
+    'tuple': 'TYPE_TUPLE',
+    'true': 'BOOLEAN',
+    'false': 'BOOLEAN',
 }
 
 tokens = (
@@ -43,17 +66,6 @@ tokens = (
 
     # AVANCE DE TOKENS PARA VARIABLES: Carlos Flores - INICIO
     'IDENTIFIER',    
-    'TYPE_I32',
-    'TYPE_U8',
-    'TYPE_U16',
-    'TYPE_U32',
-    'TYPE_U64',
-    'TYPE_F64',
-    'TYPE_CHAR',
-    'TYPE_STRING',
-    'TYPE_STR',
-    'TYPE_BOOL',
-    'TYPE_TUPLE',
     'SEMICOLON',
     'COLON',
     'STRING',
@@ -61,7 +73,6 @@ tokens = (
     'CHAR',
     'LPAREN',
     'RPAREN',
-    'BOOLEAN',
     'INTEGER',
     'FLOAT',    
     'CLOSURE_PIPE',
@@ -76,7 +87,7 @@ tokens = (
     'RANGE', 'RANGE_INCLUSIVE', 'DOUBLE_COLON',
     # AVANCE DELIMITADORES ARRAYS: Carlos Tingo - fin
 
-)+tuple(reserved.values())
+)+tuple(dict.fromkeys(reserved.values()))  # TYPE_*, BOOLEAN y palabras reservadas
 
 # ============== ESTADOS PARA COMENTARIOS ==============
 states = (
@@ -85,8 +96,9 @@ states = (
 
 t_blockcomment_ignore = ''
 
-# Variable global para comentarios anidados
-comment_depth = 0
+# La profundidad de comentarios anidados (comment_depth) y la lista de errores
+# (errors) son atributos de cada lexer, no variables globales: así varios
+# lexers pueden trabajar a la vez sin pisarse. Ver nuevo_lexer().
 
 # ============== COMENTARIOS ==============
 # IMPORTANTE: El orden de estas reglas es crítico
@@ -109,22 +121,19 @@ def t_COMMENT_LINE(t):
 # Inicio de comentario de bloque: /*
 def t_BLOCKCOMMENT_start(t):
     r'/\*'
-    global comment_depth
-    comment_depth = 1
+    t.lexer.comment_depth = 1
     t.lexer.push_state('blockcomment')
 
 # Dentro del comentario de bloque: encontrar otro /*
 def t_blockcomment_start(t):
     r'/\*'
-    global comment_depth
-    comment_depth += 1
+    t.lexer.comment_depth += 1
 
 # Dentro del comentario de bloque: encontrar */
 def t_blockcomment_end(t):
     r'\*/'
-    global comment_depth
-    comment_depth -= 1
-    if comment_depth == 0:
+    t.lexer.comment_depth -= 1
+    if t.lexer.comment_depth == 0:
         t.lexer.pop_state()
 
 # Dentro del comentario de bloque: contar saltos de línea
@@ -199,14 +208,9 @@ t_ignore = ' \t'
 
 # ============== LITERALES ==============
 
-# Booleanos: true y false
-def t_BOOLEAN(t):
-    r'true|false'
-    return t
-
 # Caracteres: 'a', '\n', etc.
 def t_CHAR(t):
-    r"'(\\.|[^\\'])'"
+    r"'(\\.|[^\\'\n])'"
     t.value = t.value[1:-1]
     return t
 
@@ -216,53 +220,9 @@ def t_STRING(t):
     t.value = t.value.strip('"')
     return t
 
-# ============== TIPOS DE DATOS ==============
-
-def t_TYPE_I32(t):
-    r'i32'
-    return t
-
-def t_TYPE_U8(t):
-    r'u8'
-    return t
-
-def t_TYPE_U16(t):
-    r'u16'
-    return t
-
-def t_TYPE_U32(t):
-    r'u32'
-    return t
-
-def t_TYPE_U64(t):
-    r'u64'
-    return t
-
-def t_TYPE_F64(t):
-    r'f64'
-    return t
-
-def t_TYPE_CHAR(t):
-    r'char'
-    return t
-
-def t_TYPE_STRING(t):
-    r'String'
-    return t
-
-def t_TYPE_STR(t):
-    r'str'
-    return t
-
-def t_TYPE_BOOL(t):
-    r'bool'
-    return t
-
-def t_TYPE_TUPLE(t):
-    r'tuple'
-    return t
-
-# ============== IDENTIFICADORES Y PALABRAS RESERVADAS ==============
+# ============== IDENTIFICADORES, TIPOS Y PALABRAS RESERVADAS ==============
+# Una sola regla para todo lo que parece identificador; el tipo del token
+# (palabra reservada, tipo de dato, booleano o IDENTIFIER) sale de `reserved`.
 
 def t_IDENTIFIER(t):
     r'[a-zA-Z_][a-zA-Z0-9_]*'
@@ -300,42 +260,682 @@ def t_CLOSURE_PIPE(t):
 def t_error(t):
     msg = f"Componente léxico '{t.value[0]}' no existe en Rust (línea {t.lexer.lineno})"
     print(msg)
-    LEX_ERRORS.append(msg)
+    t.lexer.errors.append(msg)
     t.lexer.skip(1)
 
+# ============== FLUJO COMPACTO DE TOKENS ==============
+# Para archivos grandes no conviene tener un LexToken por token. tokenizar()
+# guarda los tokens en columnas (arrays de enteros) y el valor de cada token se
+# saca del código fuente solo cuando se pide.
+
+TOKEN_NAMES = tuple(tokens)
+TOKEN_CODES = {name: code for code, name in enumerate(TOKEN_NAMES)}
+
+# Cómo obtener el valor de un token a partir de su texto (lo mismo que hacen
+# las reglas t_*). Los tipos que no aparecen aquí usan el texto tal cual.
+_VALUE_FROM_TEXT = {
+    'INTEGER': int,
+    'FLOAT': float,
+    'STRING': lambda text: text.strip('"'),
+    'CHAR': lambda text: text[1:-1],
+}
+# Lo mismo indexado por código de tipo (None = el texto tal cual)
+_VALUE_BY_CODE = tuple(_VALUE_FROM_TEXT.get(name) for name in TOKEN_NAMES)
+
+
+class TokenStream:
+    """
+    Tokens en columnas paralelas: `types` (array('H') con el código de
+    TOKEN_NAMES), `starts`/`ends` (array('I') con las posiciones en `source`)
+    y `lines` (array('I') con el número de línea).
+
+    IncrementalLexer corrige el flujo en el lugar después de cada edición.
+    Para no tocar los tokens que siguen a la zona editada, los últimos `_tail`
+    tokens guardan la posición y la línea contadas desde el final del código
+    (len(source) - pos y _last_line - línea), que no cambian al editar más
+    arriba. starts/ends/lines las pasan a absolutas cuando se piden.
+    """
+    __slots__ = ('source', 'types', '_starts', '_ends', '_lines', 'errors',
+                 '_tail', '_last_line')
+
+    def __init__(self, source):
+        self.source = source
+        self.errors = []
+        self.types = array('H')
+        self._starts = array('I')
+        self._ends = array('I')
+        self._lines = array('I')
+        self._tail = 0           # tokens del final contados desde el final del código
+        self._last_line = 1      # número de la última línea de `source`
+
+    @property
+    def starts(self):
+        self._absolute(len(self.types))
+        return self._starts
+
+    @property
+    def ends(self):
+        self._absolute(len(self.types))
+        return self._ends
+
+    @property
+    def lines(self):
+        self._absolute(len(self.types))
+        return self._lines
+
+    def _absolute(self, index):
+        """Deja con posiciones absolutas al menos los tokens antes de `index`."""
+        if len(self.types) - self._tail < index:
+            self._move_gap(index)
+
+    def _move_gap(self, index):
+        """Tokens antes de `index` con posiciones absolutas; los demás, desde el final."""
+        gap = len(self.types) - self._tail
+        lo, hi = (gap, index) if gap < index else (index, gap)
+        if lo < hi:
+            # x -> total - x pasa de absoluta a contada desde el final y al revés
+            size = len(self.source).__sub__
+            self._starts[lo:hi] = array('I', map(size, self._starts[lo:hi]))
+            self._ends[lo:hi] = array('I', map(size, self._ends[lo:hi]))
+            self._lines[lo:hi] = array('I', map(self._last_line.__sub__, self._lines[lo:hi]))
+        self._tail = len(self.types) - index
+
+    def _replace(self, start, end, tokens, last_line):
+        """
+        Cambia los tokens [start, end) por los de `tokens`, un TokenStream con
+        posiciones absolutas en su código, que pasa a ser el de este flujo.
+        Los tokens que siguen a `end` no cambian y quedan contados desde el final.
+        """
+        gap = len(self.types) - self._tail
+        if gap < start:
+            self._move_gap(start)
+        elif gap > end:
+            self._move_gap(end)
+        tail = len(self.types) - end
+        self.types[start:end] = tokens.types
+        self._starts[start:end] = tokens._starts
+        self._ends[start:end] = tokens._ends
+        self._lines[start:end] = tokens._lines
+        self.source = tokens.source
+        self._last_line = last_line
+        self._tail = tail
+
+    def __len__(self):
+        return len(self.types)
+
+    def type(self, i):
+        return TOKEN_NAMES[self.types[i]]
+
+    def line(self, i):
+        if i >= len(self.types) - self._tail:
+            return self._last_line - self._lines[i]
+        return self._lines[i]
+
+    def bounds(self, i):
+        """(inicio, fin) del token i en `source`."""
+        start, end = self._starts[i], self._ends[i]
+        if i >= len(self.types) - self._tail:
+            size = len(self.source)
+            return size - start, size - end
+        return start, end
+
+    def text(self, i):
+        start, end = self.bounds(i)
+        return self.source[start:end]
+
+    def value(self, i):
+        text = self.text(i)
+        convert = _VALUE_FROM_TEXT.get(TOKEN_NAMES[self.types[i]])
+        return convert(text) if convert else text
+
+    def first_at_line(self, lineno, lo=0, hi=None):
+        """Índice del primer token en la línea `lineno` o después (búsqueda binaria)."""
+        hi = len(self.types) if hi is None else hi
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.line(mid) < lineno:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def first_at(self, pos, lo, hi):
+        """Índice del primer token de [lo, hi) que empieza en `pos` o después."""
+        self._absolute(hi)
+        return bisect.bisect_left(self._starts, pos, lo, hi)
+
+    def __iter__(self):
+        """Recorre los tokens como tuplas (tipo, valor, línea, posición)."""
+        lines, starts = self.lines, self.starts
+        for i in range(len(self.types)):
+            yield self.type(i), self.value(i), lines[i], starts[i]
+
+    def lexer(self, start=0, end=None):
+        """
+        Devuelve un objeto con token() para pasarlo a parser.parse(lexer=...).
+        Con start/end entrega solo los tokens de ese rango.
+        """
+        return TokenStreamLexer(self, start, end)
+
+
+class TokenStreamLexer:
+    """
+    Adaptador con la interfaz de lexer que usa ply.yacc. Crea cada LexToken
+    solo cuando el parser lo pide, así nunca existen todos a la vez.
+    """
+
+    def __init__(self, stream, start=0, end=None):
+        self.stream = stream
+        self.index = start
+        self.end = len(stream.types) if end is None else end
+        self.lineno = 1
+        self.lexpos = 0
+        # Solo hacen falta absolutas las posiciones del rango
+        stream._absolute(self.end)
+
+    def input(self, data):
+        raise ValueError("TokenStreamLexer ya tiene sus tokens; usa tokenizar() con el nuevo código")
+
+    def token(self):
+        i = self.index
+        stream = self.stream
+        if i >= self.end:
+            return None
+        self.index = i + 1
+        tok = lex.LexToken()
+        tok.type = TOKEN_NAMES[stream.types[i]]
+        start = stream._starts[i]
+        text = stream.source[start:stream._ends[i]]
+        convert = _VALUE_FROM_TEXT.get(tok.type)
+        tok.value = convert(text) if convert else text
+        tok.lineno = self.lineno = stream._lines[i]
+        tok.lexpos = self.lexpos = start
+        return tok
+
+    # ply.yacc.LRParser.parseopt_dense usa token_and_code() si la tabla numera
+    # los terminales igual que token_names
+    token_names = TOKEN_NAMES
+
+    def token_and_code(self):
+        """Como token(), pero devuelve (token, código de tipo); (None, -1) al final."""
+        i = self.index
+        stream = self.stream
+        if i >= self.end:
+            return None, -1
+        self.index = i + 1
+        code = stream.types[i]
+        start = stream._starts[i]
+        # El valor como en stream.value(i), sin la llamada ni buscar por nombre
+        text = stream.source[start:stream._ends[i]]
+        convert = _VALUE_BY_CODE[code]
+        tok = lex.LexToken()
+        tok.type = TOKEN_NAMES[code]
+        tok.value = convert(text) if convert else text
+        tok.lineno = self.lineno = stream._lines[i]
+        tok.lexpos = self.lexpos = start
+        return tok, code
+
+
+class LineIndex:
+    """
+    Línea y columna (desde 1) de una posición (lexpos) del código. Los nodos
+    del AST solo guardan lexpos; la tabla con el inicio de cada línea se arma
+    en la primera consulta, así un análisis sin errores no la paga.
+    """
+    __slots__ = ('source', '_starts')
+
+    def __init__(self, source):
+        self.source = source
+        self._starts = None
+
+    def position(self, lexpos):
+        """Devuelve (línea, columna) de la posición dada."""
+        starts = self._starts
+        if starts is None:
+            starts = self._starts = array('I', [0])
+            source = self.source
+            i = source.find('\n')
+            while i >= 0:
+                starts.append(i + 1)
+                i = source.find('\n', i + 1)
+        line = bisect.bisect_right(starts, lexpos)
+        return line, lexpos - starts[line - 1] + 1
+
+
+def nuevo_lexer():
+    """
+    Devuelve un lexer independiente para una sesión de análisis: estado
+    INITIAL, línea 1, profundidad de comentario 0 y su propia lista de
+    errores (lexer.errors). Las expresiones regulares se comparten con el
+    lexer del módulo, que no se modifica.
+    """
+    lexer = get_lexer().clone()
+    lexer.lexstatestack = []
+    lexer.begin('INITIAL')
+    lexer.lineno = 1
+    lexer.comment_depth = 0
+    lexer.errors = []
+    return lexer
+
+
+# Cómo se buscan los tokens:
+#   "generated" -> el DFA de generatedLexer.py (ver lexerGenerator.py). Si el
+#                  módulo no existe o sus reglas quedaron viejas se usa "ply".
+#   "ply"       -> las expresiones maestras de ply.lex, como antes.
+LEX_DRIVER = "generated"
+
+_generated = None
+
+def get_generated_lexer():
+    """
+    Devuelve el módulo generatedLexer si existe y corresponde a las reglas
+    actuales (misma firma que lextab.py); si no, None.
+    """
+    global _generated
+    if _generated is None:
+        try:
+            import generatedLexer
+        except ImportError:
+            generatedLexer = None
+        if generatedLexer is not None:
+            reflect = lex.LexerReflect(globals(), reflags=int(re.VERBOSE))
+            reflect.get_all()
+            if generatedLexer.SIGNATURE != reflect.signature():
+                generatedLexer = None
+        _generated = generatedLexer or False
+    return _generated or None
+
+
+def _escanear(lexer, tok, data, pos, endpos):
+    """
+    Aplica las reglas t_* sobre data[pos:endpos] y va entregando tuplas
+    (tipo, inicio, fin, línea). `tok` es un LexToken que se reutiliza en
+    todas las llamadas a las reglas. El estado del lexer (pila de estados,
+    línea) queda como terminó, para poder continuar con más texto.
+    """
+    generated = get_generated_lexer() if LEX_DRIVER == "generated" else None
+    if generated is not None:
+        return generated.escanear(lexer, tok, data, pos, endpos)
+    return _escanear_ply(lexer, tok, data, pos, endpos)
+
+
+def _escanear_ply(lexer, tok, data, pos, endpos):
+    """_escanear() con las expresiones maestras de ply.lex."""
+    lexer.input(data)
+    while pos < endpos:
+        if data[pos] in lexer.lexignore:
+            pos += 1
+            continue
+
+        for lexre, lexindexfunc in lexer.lexre:
+            m = lexre.match(data, pos, endpos)
+            if m:
+                break
+        else:
+            # Ningún patrón coincide: regla t_error del estado actual
+            if not lexer.lexerrorf:
+                raise lex.LexError(f"Illegal character {data[pos]!r} at index {pos}", data[pos:endpos])
+            tok.type = 'error'
+            tok.value = data[pos:endpos]
+            tok.lineno = lexer.lineno
+            tok.lexpos = lexer.lexpos = pos
+            lexer.lexerrorf(tok)
+            if lexer.lexpos == pos:
+                raise lex.LexError(f"Scanning error. Illegal character {data[pos]!r}", data[pos:endpos])
+            pos = lexer.lexpos
+            continue
+
+        end = m.end()
+        func, ttype = lexindexfunc[m.lastindex]
+        if func is None:
+            # Regla definida como cadena: se entrega sin llamar a nada
+            if ttype:
+                yield ttype, pos, end, lexer.lineno
+            pos = end
+            continue
+
+        tok.type = ttype
+        tok.value = m.group()
+        tok.lineno = lexer.lineno
+        tok.lexpos = pos
+        lexer.lexmatch = m
+        lexer.lexpos = end
+        newtok = func(tok)
+        if newtok:
+            yield newtok.type, pos, end, newtok.lineno
+        pos = lexer.lexpos
+
+
+def tokenizar(codigo: str) -> TokenStream:
+    """
+    Tokeniza todo el código de una vez y devuelve un TokenStream.
+    Usa las mismas reglas t_* que el lexer, pero con un único LexToken
+    reutilizado en vez de crear uno por token.
+    """
+    lexer = nuevo_lexer()
+    tok = lex.LexToken()
+    tok.lexer = lexer
+
+    stream = TokenStream(codigo)
+    stream.errors = lexer.errors
+    types, starts, ends, lines = stream.types, stream.starts, stream.ends, stream.lines
+    codes = TOKEN_CODES
+    for ttype, start, end, lineno in _escanear(lexer, tok, codigo, 0, len(codigo)):
+        types.append(codes[ttype])
+        starts.append(start)
+        ends.append(end)
+        lines.append(lineno)
+    return stream
+
+# ============== TOKENIZACIÓN POR BLOQUES (ARCHIVOS GRANDES) ==============
+
+def _bloques_de_texto(fuente, chunk_size):
+    """
+    Convierte la fuente en bloques de texto de ~chunk_size caracteres.
+    Acepta una ruta, un archivo abierto (texto o binario) o un objeto tipo
+    bytes (bytes, memoryview, mmap.mmap) que se decodifica como UTF-8 por
+    partes, sin copiarlo entero a memoria.
+    """
+    if isinstance(fuente, (str, os.PathLike)):
+        with open(fuente, "r", encoding="utf-8") as f:
+            yield from _bloques_de_texto(f, chunk_size)
+        return
+
+    if hasattr(fuente, "read") and not isinstance(fuente, mmap.mmap):
+        decoder = None
+        while True:
+            bloque = fuente.read(chunk_size)
+            if not bloque:
+                break
+            if isinstance(bloque, bytes):
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+                bloque = decoder.decode(bloque)
+            yield bloque
+        if decoder is not None:
+            resto = decoder.decode(b"", final=True)
+            if resto:
+                yield resto
+        return
+
+    # bytes, memoryview o mmap: se recorre por rebanadas
+    vista = memoryview(fuente)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for inicio in range(0, len(vista), chunk_size):
+        yield decoder.decode(vista[inicio:inicio + chunk_size])
+    resto = decoder.decode(b"", final=True)
+    if resto:
+        yield resto
+
+
+def tokenizar_flujo(fuente, chunk_size=1 << 16):
+    """
+    Generador que tokeniza un archivo grande por bloques y entrega tuplas
+    (tipo, valor, línea, posición), igual que iterar un TokenStream.
+
+    Cada bloque se analiza solo hasta su último salto de línea (ningún token
+    cruza un salto de línea, salvo los comentarios de bloque, que se manejan
+    con el estado 'blockcomment'); el resto se junta con el bloque siguiente.
+    El mismo lexer se usa para todos los bloques, así el estado de
+    comentario, su profundidad y el número de línea continúan entre bloques.
+    La memoria usada depende del tamaño del bloque y de la línea más larga,
+    no del tamaño del archivo.
+    """
+    lexer = nuevo_lexer()
+    tok = lex.LexToken()
+    tok.lexer = lexer
+
+    pendiente = []    # trozos sin '\n' que todavía no se analizaron
+    base = 0          # posición en el archivo del primer carácter pendiente
+    for bloque in _bloques_de_texto(fuente, chunk_size):
+        corte = bloque.rfind("\n") + 1
+        if corte == 0:
+            # Sin salto de línea: se guarda el trozo, sin volver a copiar lo anterior
+            pendiente.append(bloque)
+            continue
+        if pendiente:
+            pendiente.append(bloque)
+            data = "".join(pendiente)
+            corte += len(data) - len(bloque)
+        else:
+            data = bloque
+        for ttype, start, end, lineno in _escanear(lexer, tok, data, 0, corte):
+            text = data[start:end]
+            convert = _VALUE_FROM_TEXT.get(ttype)
+            yield ttype, convert(text) if convert else text, lineno, base + start
+        pendiente = [data[corte:]] if corte < len(data) else []
+        base += corte
+
+    if pendiente:
+        data = "".join(pendiente)
+        for ttype, start, end, lineno in _escanear(lexer, tok, data, 0, len(data)):
+            text = data[start:end]
+            convert = _VALUE_FROM_TEXT.get(ttype)
+            yield ttype, convert(text) if convert else text, lineno, base + start
+
 # ============== FUNCIÓN PARA LA INTERFAZ GRÁFICA ==============
 
+
+# ============== RE-LEXING INCREMENTAL (EDITOR) ==============
+# Para el editor: se guarda el estado del lexer al comenzar cada línea
+# (profundidad de comentario de bloque; 0 = estado INITIAL). Después de una
+# edición solo se vuelve a analizar desde la primera línea cambiada, y se para
+# en cuanto el estado al inicio de una línea coincide con el que tenía antes:
+# desde ahí los tokens viejos siguen valiendo, solo se desplazan. El
+# TokenStream se corrige en el lugar (ver TokenStream._replace), así que una
+# edición cuesta según lo que cambió y no según el largo del archivo.
+# Igual que en tokenizar_flujo(), ningún token cruza un salto de línea salvo
+# los comentarios de bloque, que se siguen con el estado guardado. Solo '\n'
+# corta líneas, igual que en tokenizar(): str.splitlines() también corta en
+# '\r', '\x0c', '\u2028', ... y esos caracteres quedarían partiendo tokens.
+
+def _largo_comun(iguales, limit):
+    """
+    Mayor n <= limit con iguales(0, n). Compara bloques que se duplican y
+    después parte a la mitad el bloque distinto, así cada comparación la hace
+    str en C y en Python solo hay O(log n) pasos.
+    """
+    lo, step = 0, 256
+    while lo < limit:
+        hi = min(lo + step, limit)
+        if not iguales(lo, hi):
+            break
+        lo = hi
+        step *= 2
+    else:
+        return limit
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if iguales(lo, mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def _extremos_comunes(old, new):
+    """Largo del principio y del final iguales entre old y new, sin solaparse."""
+    limit = min(len(old), len(new))
+    prefix = _largo_comun(lambda i, j: old[i:j] == new[i:j], limit)
+    a, b = len(old), len(new)
+    suffix = _largo_comun(lambda i, j: old[a - j:a - i] == new[b - j:b - i], limit - prefix)
+    return prefix, suffix
+
+
+class IncrementalLexer:
+    """
+    Lexer que conserva el resultado anterior y re-analiza solo lo que cambió.
+    Uso: stream = lexico.update(codigo) en cada edición; devuelve siempre el
+    mismo TokenStream, corregido en el lugar.
+    """
+
+    def __init__(self):
+        self.source = ""
+        self.states = []         # comment_depth al inicio de cada línea
+        self.errors = []         # (línea, inicio, mensajes) de cada línea con errores, en orden
+        self.end_state = 0       # comment_depth al terminar la última línea
+        self.relexed = 0         # líneas analizadas en el último update()
+        # Tokens que cambió el último update(): los [0, w0) quedaron igual,
+        # los viejos [w0, w1) pasaron a ser los nuevos [w0, w2) y los que
+        # siguen son los mismos, corridos `chars` caracteres.
+        self.window = (0, 0, 0)
+        self.chars = 0
+        self._stream = TokenStream("")
+        self._lexer = None
+        self._tok = None
+
+    def _lexer_en(self, index, depth):
+        """Deja el lexer listo para empezar la línea `index` con `depth`."""
+        if self._lexer is None:
+            self._lexer = nuevo_lexer()
+            self._tok = lex.LexToken()
+            self._tok.lexer = self._lexer
+        lexer = self._lexer
+        lexer.lexstatestack = []
+        lexer.begin('INITIAL')
+        if depth:
+            lexer.push_state('blockcomment')
+        lexer.comment_depth = depth
+        lexer.lineno = index + 1
+        lexer.errors = []
+        return lexer
+
+    def _lexear_linea(self, index, text, depth):
+        """Analiza una línea; devuelve (tokens, errores, depth al terminar)."""
+        lexer = self._lexer_en(index, depth)
+        codes = TOKEN_CODES
+        toks = []
+        for ttype, start, end, lineno in _escanear(lexer, self._tok, text, 0, len(text)):
+            toks += (codes[ttype], start, end)
+        self.relexed += 1
+        return tuple(toks), tuple(lexer.errors), lexer.comment_depth
+
+    def update(self, codigo: str) -> TokenStream:
+        """Actualiza el análisis con el nuevo texto y devuelve el TokenStream."""
+        old = self.source
+        stream = self._stream
+        states = self.states
+        self.relexed = 0
+
+        # Principio y final iguales, en caracteres. `first` es la línea donde
+        # empieza el cambio; desde `changed_end` las líneas nuevas están
+        # enteras (con el '\n' anterior) dentro del final común.
+        prefix, suffix = _extremos_comunes(old, codigo)
+        rest = len(codigo) - suffix
+        first = old.count('\n', 0, prefix)
+        added = codigo.count('\n', prefix, rest)
+        newlines = stream._last_line - 1 - old.count('\n', prefix, len(old) - suffix) + added
+        n_lines = newlines + (1 if codigo[-1:] not in ('', '\n') else 0)
+        changed_end = min(first + added + 1, n_lines)
+        delta = n_lines - len(states)
+
+        # Se re-analiza desde `first` hasta volver a sincronizar con el estado viejo
+        middle = TokenStream(codigo)
+        types, starts, ends, lines = middle.types, middle._starts, middle._ends, middle._lines
+        new_states = []
+        new_errors = []
+        depth = states[first] if first < len(states) else self.end_state
+        pos = codigo.rfind('\n', 0, prefix) + 1
+        index = first
+        while index < n_lines:
+            old_index = index - delta
+            if (index >= changed_end
+                    and old_index < len(states)
+                    and states[old_index] == depth):
+                break
+            new_states.append(depth)
+            end = codigo.find('\n', pos) + 1 or len(codigo)
+            toks, errs, depth = self._lexear_linea(index, codigo[pos:end], depth)
+            for k in range(0, len(toks), 3):
+                types.append(toks[k])
+                starts.append(pos + toks[k + 1])
+                ends.append(pos + toks[k + 2])
+                lines.append(index + 1)
+            if errs:
+                new_errors.append((index, pos, errs))
+            pos = end
+            index += 1
+        if index == n_lines:
+            self.end_state = depth
+        stop = index - delta     # primera línea vieja que se reutiliza
+
+        # Tokens de las líneas viejas [first, stop) -> los recién analizados,
+        # sin contar los del principio y del final que quedaron iguales
+        w0 = stream.first_at_line(first + 1)
+        w1 = stream.first_at_line(stop + 1, w0)
+        chars = len(codigo) - len(old)
+        same = 0
+        limit = min(len(middle), w1 - w0)
+        while (same < limit and ends[same] <= prefix
+               and types[same] == stream.types[w0 + same]
+               and (starts[same], ends[same]) == stream.bounds(w0 + same)):
+            same += 1
+        kept = 0
+        limit -= same
+        while kept < limit:
+            start, end = stream.bounds(w1 - kept - 1)
+            if not (starts[-kept - 1] >= rest
+                    and types[-kept - 1] == stream.types[w1 - kept - 1]
+                    and (starts[-kept - 1], ends[-kept - 1]) == (start + chars, end + chars)):
+                break
+            kept += 1
+        for column in (types, starts, ends, lines):
+            del column[len(column) - kept:]
+            del column[:same]
+        w0 += same
+        w1 -= kept
+        stream._replace(w0, w1, middle, newlines + 1)
+        states[first:stop] = new_states
+
+        # Los mensajes de error llevan el número de línea, así que las líneas
+        # con errores que se corrieron se re-analizan
+        errors = [e for e in self.errors if e[0] < first] + new_errors
+        for line, start, errs in self.errors:
+            if line >= stop:
+                line += delta
+                start += chars
+                if delta:
+                    end = codigo.find('\n', start) + 1 or len(codigo)
+                    errs = self._lexear_linea(line, codigo[start:end], states[line])[1]
+                errors.append((line, start, errs))
+        self.errors = errors
+        stream.errors = [msg for _, _, errs in errors for msg in errs]
+
+        self.source = codigo
+        self.window = (w0, w1, w0 + len(middle))
+        self.chars = chars
+        return stream
+
+    def stream(self) -> TokenStream:
+        """El TokenStream del último update()."""
+        return self._stream
+
+
 def analizar_lexico(codigo: str) -> str:
     """
     Ejecuta el analizador léxico sobre el código recibido y
     devuelve un texto con los tokens encontrados y/o errores léxicos.
     Esta función es la que usará main.py.
     """
-    # limpiar errores previos
-    LEX_ERRORS.clear()
+    return formatear_tokens(tokenizar(codigo))
 
-    # reiniciar lexer
-    lexer.lineno = 1
-    lexer.input(codigo)
 
+def formatear_tokens(tokens_stream: TokenStream) -> str:
+    """Texto con los tokens de un TokenStream y sus errores léxicos."""
     salida = []
 
-    while True:
-        tok = lexer.token()
-        if not tok:
-            break
-
+    for tipo, valor, linea_num, posicion in tokens_stream:
         linea = (
-            f"[TOKEN] Tipo: {tok.type:<15} | "
-            f"Valor: {str(tok.value):<15} | "
-            f"Línea: {tok.lineno:<3} | Posición: {tok.lexpos}"
+            f"[TOKEN] Tipo: {tipo:<15} | "
+            f"Valor: {str(valor):<15} | "
+            f"Línea: {linea_num:<3} | Posición: {posicion}"
         )
         salida.append(linea)
 
     # si hubo errores léxicos, los agregamos al final
-    if LEX_ERRORS:
+    if tokens_stream.errors:
         salida.append("\n=== ERRORES LÉXICOS ===")
-        salida.extend(LEX_ERRORS)
+        salida.extend(tokens_stream.errors)
 
     if not salida:
         return "No se encontraron tokens.\n"
@@ -349,8 +949,46 @@ files = {
     "Carlos Tingo": ["algoritmoVectoresArreglos.rs"]
 }
 
-# Build the lexer
-lexer = lex.lex()
+# ============== CONSTRUCCIÓN DEL LEXER ==============
+# El lexer se construye la primera vez que se usa, no al importar el módulo.
+# Las expresiones maestras se guardan en lextab.py con un hash de las reglas;
+# si el hash coincide el lexer se reconstruye desde ahí.
+_lexer = None
+_lexer_lock = threading.Lock()
+
+class _SharedLexer(lex.Lexer):
+    """Lexer del módulo: cada input() empieza con LEX_ERRORS vacío."""
+
+    def __init__(self, base):
+        # Copia el estado del lexer que armó lex.lex(), como Lexer.clone()
+        self.__dict__.update(base.__dict__)
+        self.comment_depth = 0
+        self.errors = LEX_ERRORS
+
+    def input(self, s):
+        # Los clones de nuevo_lexer() tienen su propia lista y no se tocan
+        if self.errors is LEX_ERRORS:
+            LEX_ERRORS.clear()
+        super().input(s)
+
+def get_lexer():
+    """
+    Devuelve el lexer compartido del módulo, construyéndolo en el primer uso.
+    Sus errores van a LEX_ERRORS, que se vacía en cada input(): solo quedan
+    los del último código. Para analizar en paralelo usa nuevo_lexer().
+    """
+    global _lexer
+    if _lexer is None:
+        with _lexer_lock:
+            if _lexer is None:
+                _lexer = _SharedLexer(lex.lex(lextab='lextab'))
+    return _lexer
+
+# Compatibilidad: `lexicalAnalyzer.lexer` sigue funcionando como antes
+def __getattr__(name):
+    if name == 'lexer':
+        return get_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ============== EJECUCIÓN ==============
 if __name__ == "__main__":
@@ -368,19 +1006,21 @@ if __name__ == "__main__":
                 if not os.path.exists(file):
                     print(f"ALERT: The file '{file}' does not exist.")
                 else:
-                    with open(file, "r", encoding="utf-8") as f:
-                        for line_num, line in enumerate(f, start=1):
-                            print(f"\nLine {line_num}: {line.strip()}")
-                            log.write(f"\nLine {line_num}: {line.strip()}\n")
-                            lexer.input(line)
-                            while True:
-                                tok = lexer.token()
-                                if not tok:
-                                    break
-                                log_line = (
-                                    f"[TOKEN] Type: {tok.type:<15} | "
-                                    f"Value: {str(tok.value):<15} | "
-                                    f"Line: {line_num:<3} | Position: {tok.lexpos}\n"
-                                )
-                                print(log_line.strip())
-                                log.write(log_line)
+                    # Se tokeniza el archivo por bloques: los comentarios de
+                    # bloque y las posiciones siguen bien entre líneas
+                    with open(file, "rb") as f:
+                        # mmap no acepta archivos vacíos: esos se leen directo
+                        if os.fstat(f.fileno()).st_size:
+                            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                        else:
+                            data = f
+                        for tok_type, tok_value, line_num, pos in tokenizar_flujo(data):
+                            log_line = (
+                                f"[TOKEN] Type: {tok_type:<15} | "
+                                f"Value: {str(tok_value):<15} | "
+                                f"Line: {line_num:<3} | Position: {pos}\n"
+                            )
+                            print(log_line.strip())
+                            log.write(log_line)
+                        if data is not f:
+                            data.close()
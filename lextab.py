@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY. Don't edit!
+_tabversion   = '3.10'
+_lexsignature = '431f167fc32bb6ce5821eb548a5bb736854912460e07fed9d259fede86b08203'
+_lextokens    = set(('ARROW', 'AS', 'ASIGNED_TO', 'ASYNC', 'BIT_AND', 'BOOLEAN', 'CHAR', 'CLOSURE_PIPE', 'COLON', 'COMMA', 'CONJUNCTION', 'CONST', 'DISJUNCTION', 'DIVIDE', 'DOT', 'DOUBLE_COLON', 'ELSE', 'EQUAL_TO', 'FLOAT', 'FN', 'FOR', 'GREATER_THAN', 'GREATER_THAN_OR_EQUAL_TO', 'IDENTIFIER', 'IF', 'IN', 'INTEGER', 'LBRACE', 'LBRACKET', 'LESS_THAN', 'LESS_THAN_OR_EQUAL_TO', 'LET', 'LPAREN', 'MAIN', 'MINUS', 'MOD', 'MUT', 'NOT', 'NOT_EQUAL', 'PLUS', 'PRINTLN', 'RANGE', 'RANGE_INCLUSIVE', 'RBRACE', 'RBRACKET', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING', 'TIMES', 'TYPE_BOOL', 'TYPE_CHAR', 'TYPE_F64', 'TYPE_I32', 'TYPE_STR', 'TYPE_STRING', 'TYPE_TUPLE', 'TYPE_U16', 'TYPE_U32', 'TYPE_U64', 'TYPE_U8', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'blockcomment': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_DOC_COMMENT_OUTER>///[^\\n]*)|(?P<t_DOC_COMMENT_INNER>//![^\\n]*)|(?P<t_COMMENT_LINE>//[^\\n]*)|(?P<t_BLOCKCOMMENT_start>/\\*)|(?P<t_CHAR>\'(\\\\.|[^\\\\\'\\n])\')|(?P<t_STRING>\\"([^\\\\\\n]|(\\\\.))*?\\")|(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_FLOAT>\\d+\\.\\d+)|(?P<t_INTEGER>\\d+)|(?P<t_newline>\\n+)|(?P<t_CLOSURE_PIPE>\\|(?!\\|))|(?P<t_RANGE_INCLUSIVE>\\.\\.=)|(?P<t_DISJUNCTION>\\|\\|)|(?P<t_RANGE>\\.\\.)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_EQUAL_TO>==)|(?P<t_NOT_EQUAL>!=)|(?P<t_LESS_THAN_OR_EQUAL_TO><=)|(?P<t_GREATER_THAN_OR_EQUAL_TO>>=)|(?P<t_CONJUNCTION>&&)|(?P<t_DOT>\\.)|(?P<t_DOUBLE_COLON>::)|(?P<t_SEMICOLON>\\;)|(?P<t_COLON>\\:)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_ARROW>->)|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_MOD>%)|(?P<t_LESS_THAN><)|(?P<t_GREATER_THAN>>)|(?P<t_NOT>!)|(?P<t_ASIGNED_TO>=)|(?P<t_BIT_AND>&)|(?P<t_COMMA>,)', [None, ('t_DOC_COMMENT_OUTER', 'DOC_COMMENT_OUTER'), ('t_DOC_COMMENT_INNER', 'DOC_COMMENT_INNER'), ('t_COMMENT_LINE', 'COMMENT_LINE'), ('t_BLOCKCOMMENT_start', 'BLOCKCOMMENT_start'), ('t_CHAR', 'CHAR'), None, ('t_STRING', 'STRING'), None, None, ('t_IDENTIFIER', 'IDENTIFIER'), ('t_FLOAT', 'FLOAT'), ('t_INTEGER', 'INTEGER'), ('t_newline', 'newline'), ('t_CLOSURE_PIPE', 'CLOSURE_PIPE'), (None, 'RANGE_INCLUSIVE'), (None, 'DISJUNCTION'), (None, 'RANGE'), (None, 'PLUS'), (None, 'TIMES'), (None, 'EQUAL_TO'), (None, 'NOT_EQUAL'), (None, 'LESS_THAN_OR_EQUAL_TO'), (None, 'GREATER_THAN_OR_EQUAL_TO'), (None, 'CONJUNCTION'), (None, 'DOT'), (None, 'DOUBLE_COLON'), (None, 'SEMICOLON'), (None, 'COLON'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'ARROW'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'LBRACKET'), (None, 'RBRACKET'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'MOD'), (None, 'LESS_THAN'), (None, 'GREATER_THAN'), (None, 'NOT'), (None, 'ASIGNED_TO'), (None, 'BIT_AND'), (None, 'COMMA')])], 'blockcomment': [('(?P<t_blockcomment_start>/\\*)|(?P<t_blockcomment_end>\\*/)|(?P<t_blockcomment_newline>\\n+)|(?P<t_blockcomment_content>[^/*\\n]+)|(?P<t_blockcomment_single>[/*])', [None, ('t_blockcomment_start', 'start'), ('t_blockcomment_end', 'end'), ('t_blockcomment_newline', 'newline'), ('t_blockcomment_content', 'content'), ('t_blockcomment_single', 'single')])]}
+_lexstateignore = {'blockcomment': '', 'INITIAL': ' \t'}
+_lexstateerrorf = {'blockcomment': 't_blockcomment_error', 'INITIAL': 't_error'}
+_lexstateeoff = {}
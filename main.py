@@ -1,8 +1,9 @@
 import tkinter as tk
 from tkinter import filedialog
-from lexicalAnalyzer import analizar_lexico
-from syntaxAnalyzer import analizar_sintactico
-from semanticAnalyzer import analizar_semantico
+
+# Los analizadores se importan dentro de cada acción: así la ventana se abre
+# sin construir el lexer ni el parser, y un análisis léxico nunca genera las
+# tablas LALR.
 
 # ================== Editor con numeración ==================
 class LineNumberedText(tk.Frame):
@@ -50,6 +51,8 @@ class RustAnalyzerGUI:
         self.root.title("Rust Analyzer")
         self.root.geometry("1100x650")
         self.root.configure(bg="#1e1e1e")
+        self.incremental_lexer = None
+        self.syntax_session = None
 
         self.build_ui()
 
@@ -130,18 +133,33 @@ class RustAnalyzerGUI:
 
     # ================== Acciones de los analizadores ==================
     def run_lex(self):
+        # El lexer incremental guarda el análisis anterior y solo re-analiza
+        # las líneas que cambiaron desde el último click.
+        from lexicalAnalyzer import IncrementalLexer, formatear_tokens
+        if self.incremental_lexer is None:
+            self.incremental_lexer = IncrementalLexer()
         code = self.editor.get("1.0", tk.END)
-        out = analizar_lexico(code)
+        out = formatear_tokens(self.incremental_lexer.update(code))
         self.print_console(out)
 
+    def get_syntax_session(self):
+        # Una sola sesión incremental para el editor: entre clicks solo se
+        # vuelven a parsear las sentencias que cambiaron
+        from syntaxAnalyzer import IncrementalSyntaxSession
+        if self.syntax_session is None:
+            self.syntax_session = IncrementalSyntaxSession()
+        return self.syntax_session
+
     def run_syn(self):
+        from syntaxAnalyzer import analizar_sintactico
         code = self.editor.get("1.0", tk.END)
-        out = analizar_sintactico(code)
+        out = analizar_sintactico(code, self.get_syntax_session())
         self.print_console(out)
 
     def run_sem(self):
+        from semanticAnalyzer import analizar_semantico
         code = self.editor.get("1.0", tk.END)
-        out = analizar_semantico(code)
+        out = analizar_semantico(code, syntax=self.get_syntax_session())
         self.print_console(out)
 
 
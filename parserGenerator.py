@@ -0,0 +1,434 @@
+# Generador del parser independiente
+# Lee las tablas LALR que PLY arma para la gramática de syntaxAnalyzer (las
+# mismas de parsetab.py) y escribe generatedParser.py: un módulo con las
+# filas de acciones como literales, una entrada por producción con su acción
+# ya enlazada (la función p_* de syntaxAnalyzer), su largo y su tabla de
+# ir-a, y el loop LR con la misma recuperación de errores que ply.yacc.
+# El módulo generado no importa ply.yacc: cargarlo es solo leer constantes.
+#
+# Uso:  python parserGenerator.py [-o generatedParser.py]
+#
+# Hay que volver a correrlo cada vez que cambia la gramática; mientras tanto
+# syntaxAnalyzer nota que la firma no coincide y usa las tablas de PLY.
+
+import argparse
+import os
+import sys
+
+import syntaxAnalyzer
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generatedParser.py")
+
+# Cantidad de símbolos que hay que desplazar para salir del modo de
+# recuperación (ply.yacc.error_count)
+ERROR_COUNT = 3
+
+HEADER = '''\
+# Parser generado por parserGenerator.py a partir de la gramática de
+# syntaxAnalyzer. NO EDITAR A MANO: si cambia la gramática, volver a correr
+#     python parserGenerator.py
+# Mientras la firma (GRAMMAR_SIGNATURE) no coincida, syntaxAnalyzer no lo usa.
+#
+# ACTION[estado][terminal]: > 0 desplazar a ese estado, < 0 reducir por esa
+# producción, 0 aceptar, None error. Los terminales se numeran igual que
+# lexicalAnalyzer.TOKEN_NAMES, así el código de tipo de cada token es su
+# columna. PRODUCTIONS[n] = (acción, no terminal, largo, ir-a por estado).
+
+import sys
+
+from syntaxAnalyzer import (
+{imports}
+)
+
+GRAMMAR_SIGNATURE = {signature!r}
+
+ERROR_COUNT = {error_count}
+
+TERMINALS = {terminals!r}
+_TERM_INDEX = {{name: i for i, name in enumerate(TERMINALS)}}
+_END = {end}
+_ERROR = {error}
+'''
+
+# Loop LR. Es el de ply.yacc LRParser.parseopt_dense, con las tablas como
+# constantes del módulo y símbolos con __slots__.
+DRIVER = r'''
+
+class Symbol:
+    # Sin __init__: en cada reducción se crea uno y se le asignan type y value
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlineno', 'endlexpos', 'lexer')
+
+    def __str__(self):
+        return self.type
+
+    def __repr__(self):
+        return str(self)
+
+
+class Production:
+    """El objeto `p` que reciben las acciones (misma interfaz que ply.yacc.YaccProduction)."""
+
+    def __init__(self):
+        self.slice = None
+        self.stack = None
+        self.lexer = None
+        self.parser = None
+
+    def __getitem__(self, n):
+        if isinstance(n, slice):
+            return [s.value for s in self.slice[n]]
+        if n >= 0:
+            return self.slice[n].value
+        return self.stack[n].value
+
+    def __setitem__(self, n, v):
+        self.slice[n].value = v
+
+    def __len__(self):
+        return len(self.slice)
+
+    def lineno(self, n):
+        return getattr(self.slice[n], 'lineno', 0)
+
+    def set_lineno(self, n, lineno):
+        self.slice[n].lineno = lineno
+
+    def linespan(self, n):
+        startline = getattr(self.slice[n], 'lineno', 0)
+        return startline, getattr(self.slice[n], 'endlineno', startline)
+
+    def lexpos(self, n):
+        return getattr(self.slice[n], 'lexpos', 0)
+
+    def set_lexpos(self, n, lexpos):
+        self.slice[n].lexpos = lexpos
+
+    def lexspan(self, n):
+        startpos = getattr(self.slice[n], 'lexpos', 0)
+        return startpos, getattr(self.slice[n], 'endlexpos', startpos)
+
+    def error(self):
+        raise SyntaxError
+
+
+class Parser:
+    """
+    Parser LR con las tablas de este módulo. Se usa como ply.yacc.LRParser:
+    parse(lexer=...) devuelve el valor de `program`, errorfunc recibe los
+    tokens con error y errok() sale del modo de recuperación (errok(n), después
+    de desplazar n tokens más). skip_limit acota los tokens que descarta la
+    recuperación, como en ply.yacc.
+    """
+
+    def __init__(self, errorfunc=None):
+        self.errorfunc = errorfunc
+        self.errorok = True
+        self.errok_shifts = 0
+        self.skip_limit = None
+        self.statestack = []
+        self.symstack = []
+        self.state = 0
+
+    def errok(self, shifts=0):
+        if shifts:
+            self.errok_shifts = shifts
+        else:
+            self.errorok = True
+
+    def restart(self):
+        del self.statestack[:]
+        del self.symstack[:]
+        sym = Symbol()
+        sym.type = '$end'
+        self.symstack.append(sym)
+        self.statestack.append(0)
+
+    def parse(self, input=None, lexer=None):
+        lookahead = None                 # símbolo de lookahead
+        code = -1                        # su número de terminal
+        lookaheadstack = []
+        pslice = Production()
+        errorcount = 0
+        skipped = 0
+        self.errok_shifts = 0
+
+        pslice.lexer = lexer
+        pslice.parser = self
+        if input is not None:
+            lexer.input(input)
+
+        get_token = self.token = lexer.token
+        names = getattr(lexer, 'token_names', None)
+        if names is not None and tuple(names) == TERMINALS[:len(names)]:
+            next_token = lexer.token_and_code
+        else:
+            def next_token():
+                tok = get_token()
+                return tok, (_TERM_INDEX.get(tok.type, -1) if tok else _END)
+
+        statestack = self.statestack = []
+        symstack = self.symstack = []
+        pslice.stack = symstack
+        push_state = statestack.append
+        push_symbol = symstack.append
+        errtoken = None
+
+        push_state(0)
+        sym = Symbol()
+        sym.type = '$end'
+        push_symbol(sym)
+        state = 0
+        while True:
+            t = DEFAULT[state]
+            if not t:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead, code = next_token()
+                    else:
+                        lookahead = lookaheadstack.pop()
+                        code = _TERM_INDEX.get(lookahead.type, -1) if lookahead else _END
+                    if not lookahead:
+                        lookahead = Symbol()
+                        lookahead.type = '$end'
+                        code = _END
+                t = ACTION[state][code] if code >= 0 else None
+
+            if t is not None:
+                if t > 0:
+                    push_state(t)
+                    state = t
+                    push_symbol(lookahead)
+                    lookahead = None
+                    if errorcount:
+                        errorcount -= 1
+                        skipped = 0
+                        if self.errok_shifts:
+                            if symstack[-1].type == 'error':
+                                # Un símbolo error nuevo empieza otra recuperación,
+                                # cuya regla de sincronización vuelve a llamar a errok()
+                                self.errok_shifts = 0
+                            else:
+                                self.errok_shifts -= 1
+                                errorcount = self.errok_shifts
+                    continue
+
+                if t < 0:
+                    action, name, plen, goto = PRODUCTIONS[-t]
+                    sym = Symbol()
+                    sym.type = name
+                    sym.value = None
+
+                    if plen:
+                        targ = symstack[-plen-1:]
+                        targ[0] = sym
+                        pslice.slice = targ
+                        try:
+                            del symstack[-plen:]
+                            self.state = state
+                            action(pslice)
+                            del statestack[-plen:]
+                            push_symbol(sym)
+                            state = goto[statestack[-1]]
+                            push_state(state)
+                        except SyntaxError:
+                            lookaheadstack.append(lookahead)
+                            symstack.extend(targ[1:-1])
+                            statestack.pop()
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            code = _ERROR
+                            errorcount = ERROR_COUNT
+                            self.errorok = False
+                        continue
+
+                    targ = [sym]
+                    pslice.slice = targ
+                    try:
+                        self.state = state
+                        action(pslice)
+                        push_symbol(sym)
+                        state = goto[statestack[-1]]
+                        push_state(state)
+                    except SyntaxError:
+                        lookaheadstack.append(lookahead)
+                        statestack.pop()
+                        state = statestack[-1]
+                        sym.type = 'error'
+                        sym.value = 'error'
+                        lookahead = sym
+                        code = _ERROR
+                        errorcount = ERROR_COUNT
+                        self.errorok = False
+                    continue
+
+                if t == 0:
+                    return getattr(symstack[-1], 'value', None)
+
+            # Error de sintaxis: misma recuperación que ply.yacc
+            self.errok_shifts = 0
+            if errorcount == 0 or self.errorok:
+                errorcount = ERROR_COUNT
+                self.errorok = False
+                errtoken = lookahead
+                if errtoken.type == '$end':
+                    errtoken = None
+                if self.errorfunc:
+                    if errtoken and not hasattr(errtoken, 'lexer'):
+                        errtoken.lexer = lexer
+                    self.state = state
+                    tok = self.errorfunc(errtoken)
+                    if self.errorok:
+                        lookahead = tok
+                        if tok:
+                            code = _TERM_INDEX.get(tok.type, -1)
+                        errtoken = None
+                        continue
+                else:
+                    if errtoken:
+                        lineno = getattr(errtoken, 'lineno', 0)
+                        if lineno:
+                            sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                        else:
+                            sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                    else:
+                        sys.stderr.write('yacc: Parse error in input. EOF\n')
+                        return
+            else:
+                errorcount = ERROR_COUNT
+
+            if len(statestack) <= 1 and lookahead.type != '$end':
+                lookahead = None
+                errtoken = None
+                state = 0
+                del lookaheadstack[:]
+                continue
+
+            if lookahead.type == '$end':
+                return
+
+            if lookahead.type != 'error':
+                if symstack[-1].type == 'error':
+                    skipped += 1
+                    if self.skip_limit is not None and skipped > self.skip_limit:
+                        # Demasiados tokens descartados: se saca el símbolo
+                        # error y se reintenta este token como un comienzo nuevo
+                        symstack.pop()
+                        statestack.pop()
+                        state = statestack[-1]
+                        skipped = 0
+                        self.errok_shifts = 1
+                        continue
+                    lookahead = None
+                    continue
+                t = Symbol()
+                t.type = 'error'
+                t.value = lookahead
+                if hasattr(lookahead, 'lineno'):
+                    t.lineno = t.endlineno = lookahead.lineno
+                if hasattr(lookahead, 'lexpos'):
+                    t.lexpos = t.endlexpos = lookahead.lexpos
+                lookaheadstack.append(lookahead)
+                lookahead = t
+                code = _ERROR
+            else:
+                symstack.pop()
+                statestack.pop()
+                state = statestack[-1]
+'''
+
+
+def _wrap(values, indent="    ", width=100):
+    """Lista de valores repartida en líneas de hasta `width` caracteres."""
+    lines, line = [], indent
+    for value in values:
+        item = f"{value!r}, "
+        if len(line) + len(item) > width and line.strip():
+            lines.append(line.rstrip())
+            line = indent
+        line += item
+    if line.strip():
+        lines.append(line.rstrip())
+    return "\n".join(lines)
+
+
+def generate(parser=None):
+    """Devuelve el código de generatedParser.py para el parser dado (o el de syntaxAnalyzer)."""
+    if parser is None:
+        parser = syntaxAnalyzer.get_parser()
+    table = parser.dense
+    terminals = table.terminals
+    nstates = len(table.default_action)
+
+    out = []
+    actions = sorted({p.callable.__name__ for p in parser.productions[1:]})
+    out.append(HEADER.format(
+        imports="\n".join(f"    {name}," for name in actions),
+        signature=syntaxAnalyzer.grammar_signature(),
+        error_count=ERROR_COUNT,
+        terminals=terminals,
+        end=table.term_index['$end'],
+        error=table.term_index['error'],
+    ))
+
+    # Filas de acciones: muchos estados tienen exactamente la misma fila
+    # (por ejemplo los que solo reducen), así que cada fila distinta se
+    # escribe una vez y ACTION apunta a ella
+    rows, row_ids, row_of_state = [], {}, []
+    for state in range(nstates):
+        row = tuple(table.action(state, name) for name in terminals)
+        if row not in row_ids:
+            row_ids[row] = len(rows)
+            rows.append(row)
+        row_of_state.append(row_ids[row])
+    out.append("\n# Filas de acciones distintas (índice = código de terminal)")
+    for i, row in enumerate(rows):
+        out.append(f"_A{i} = (\n{_wrap(row)}\n)")
+    out.append("\nACTION = (\n" + _wrap([_Name(f"_A{i}") for i in row_of_state]) + "\n)")
+
+    out.append("\n# Reducción por defecto de cada estado (0 = hay que mirar el lookahead)")
+    out.append("DEFAULT = (\n" + _wrap(list(table.default_action)) + "\n)")
+
+    out.append("\n# Ir-a de cada no terminal: estado de abajo -> estado nuevo")
+    goto_names = {}
+    for k, name in enumerate(table.nonterminals):
+        column = {state: row[name] for state, row in sorted(parser.goto.items()) if name in row}
+        if not column:
+            continue
+        goto_names[name] = f"_G{k}"
+        out.append(f"_G{k} = {{  # {name}\n{_wrap_dict(column)}\n}}")
+
+    out.append("\nPRODUCTIONS = (\n    None,  # " + str(parser.productions[0]))
+    for p in parser.productions[1:]:
+        out.append(f"    ({p.callable.__name__}, {p.name!r}, {p.len}, {goto_names[p.name]}),  # {p}")
+    out.append(")")
+
+    out.append(DRIVER)
+    return "\n".join(out)
+
+
+class _Name(str):
+    """Nombre que se escribe tal cual en el código generado (sin comillas)."""
+    def __repr__(self):
+        return str(self)
+
+
+def _wrap_dict(column):
+    return _wrap([_Name(f"{state}: {target}") for state, target in column.items()])
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Genera generatedParser.py a partir de la gramática de syntaxAnalyzer")
+    ap.add_argument("-o", "--output", default=OUTPUT, help="archivo de salida")
+    args = ap.parse_args(argv)
+
+    source = generate()
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(source)
+    print(f"Parser generado en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
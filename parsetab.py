@@ -1,4 +1,3 @@
-
 # parsetab.py
 # This file is automatically generated. Do not edit.
 # pylint: disable=W,C,R
@@ -6,9 +5,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'programleftDISJUNCTIONleftCONJUNCTIONrightNOTnonassocEQUAL_TONOT_EQUALLESS_THANLESS_THAN_OR_EQUAL_TOGREATER_THANGREATER_THAN_OR_EQUAL_TOnonassocRANGERANGE_INCLUSIVEleftPLUSMINUSleftTIMESDIVIDEMODrightASrightUMINUSARROW AS ASIGNED_TO ASYNC BIT_AND BOOLEAN CHAR CLOSURE_PIPE COLON COMMA CONJUNCTION CONST DISJUNCTION DIVIDE DOT DOUBLE_COLON ELSE EQUAL_TO FLOAT FN FOR GREATER_THAN GREATER_THAN_OR_EQUAL_TO IDENTIFIER IF IN INTEGER LBRACE LBRACKET LESS_THAN LESS_THAN_OR_EQUAL_TO LET LPAREN MAIN MINUS MOD MUT NOT NOT_EQUAL PLUS PRINTLN RANGE RANGE_INCLUSIVE RBRACE RBRACKET RETURN RPAREN SEMICOLON STRING TIMES TYPE_BOOL TYPE_CHAR TYPE_F64 TYPE_I32 TYPE_STR TYPE_STRING TYPE_TUPLE TYPE_U16 TYPE_U32 TYPE_U64 TYPE_U8 WHILEprogram : program statement\n| statementprogram_opt : program\n| emptyempty :statement : PRINTLN NOT LPAREN STRING RPAREN SEMICOLONstatement : PRINTLN NOT LPAREN expression RPAREN SEMICOLONstatement : PRINTLN NOT LPAREN STRING COMMA argument_list RPAREN SEMICOLONexpression : expression DOT IDENTIFIER LPAREN expression COMMA expression RPARENexpression : expression DOT IDENTIFIER LPAREN expression RPARENexpression : IDENTIFIER DOUBLE_COLON IDENTIFIER LPAREN RPARENstatement : expression SEMICOLONexpression : expression DOT IDENTIFIER LPAREN arguments_opt RPARENarguments_opt : argument_list\n| emptyargument_list : argument_list COMMA expression\n| expressionclosure_params : closure_params : IDENTIFIERclosure_params : IDENTIFIER COLON typeclosure_params : IDENTIFIER COMMA closure_paramsclosure_params : IDENTIFIER COLON type COMMA closure_paramsclosure_body : expressionclosure_body : LBRACE closure_block_content RBRACEclosure_block_content : expressionclosure_block_content : program expressionclosure_block_content : program_optexpression : CLOSURE_PIPE closure_params CLOSURE_PIPE closure_bodyexpression : CLOSURE_PIPE closure_params CLOSURE_PIPE ARROW type closure_bodyexpression : LPAREN expression RPARENexpression : expression PLUS expression\n| expression MINUS expression\n| expression TIMES expression\n| expression DIVIDE expression\n| expression MOD expressionexpression : expression RANGE expression\n| expression RANGE_INCLUSIVE expressionexpression : expression EQUAL_TO expression\n| expression NOT_EQUAL expression\n| expression LESS_THAN expression\n| expression GREATER_THAN expression\n| expression LESS_THAN_OR_EQUAL_TO expression\n| expression GREATER_THAN_OR_EQUAL_TO expressionexpression : expression CONJUNCTION expression\n| expression DISJUNCTION expressionexpression : NOT expressionexpression : MINUS expression %prec UMINUSexpression : INTEGER\n| FLOATexpression : STRING\n| CHAR\n| BOOLEANexpression : IDENTIFIERexpression : BIT_AND expressionexpression : BIT_AND MUT IDENTIFIERexpression : expression AS typestatement : IF expression LBRACE program_opt RBRACEstatement : IF expression LBRACE program_opt RBRACE ELSE LBRACE program_opt RBRACEstatement : IDENTIFIER ASIGNED_TO expression SEMICOLONstatement : WHILE expression LBRACE program_opt RBRACEstatement : ASYNC FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACEstatement : ASYNC FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACEtype : TYPE_I32\n| TYPE_U8\n| TYPE_U16\n| TYPE_U32\n| TYPE_U64\n| TYPE_F64\n| TYPE_CHAR\n| TYPE_STRING\n| TYPE_STR\n| TYPE_BOOL\n| TYPE_TUPLEtype : LBRACKET type RBRACKETtype : LBRACKET type COMMA INTEGER RBRACKETtype : BIT_AND typetype : BIT_AND MUT typestatement : let_decllet_decl : LET maybe_mut IDENTIFIER maybe_type maybe_init SEMICOLONmaybe_mut : MUT\n| emptymaybe_type : COLON type\n| emptymaybe_init : ASIGNED_TO expression\n| emptyelement_list : element_list COMMA expression\n| expressionexpression : LBRACKET element_list RBRACKETexpression : LBRACKET expression SEMICOLON INTEGER RBRACKETexpression : IDENTIFIER LBRACKET expression RBRACKETexpression : IDENTIFIER LBRACKET INTEGER RANGE INTEGER RBRACKETexpression : IDENTIFIER LBRACKET INTEGER RANGE_INCLUSIVE INTEGER RBRACKETexpression : IDENTIFIER NOT LBRACKET element_list RBRACKETstatement : const_declconst_decl : CONST IDENTIFIER COLON type ASIGNED_TO expression SEMICOLONtype : LPAREN tuple_type_list RPARENtuple_type_list : type\n| type COMMA tuple_type_listexpression : LPAREN tuple_value_list RPARENtuple_value_list : expression\n| expression COMMA tuple_value_listexpression : expression DOT INTEGERstatement : FOR IDENTIFIER IN expression LBRACE program_opt RBRACEparam_list_opt : param_list\n| emptyparam_list : param_list COMMA param\n| paramparam : IDENTIFIER COLON typefunction_body : program expression\n| expressionfunction_body : program_optmaybe_pub : IDENTIFIER\n| emptyfunction_name : IDENTIFIERfunction_name : MAINstatement : maybe_pub FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACEstatement : maybe_pub FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACEstatement : RETURN expression SEMICOLONexpression : IDENTIFIER LPAREN arguments_opt RPAREN'
+_lr_signature = 'programleftDISJUNCTIONleftCONJUNCTIONrightNOTnonassocEQUAL_TONOT_EQUALLESS_THANLESS_THAN_OR_EQUAL_TOGREATER_THANGREATER_THAN_OR_EQUAL_TOnonassocRANGERANGE_INCLUSIVEleftPLUSMINUSleftTIMESDIVIDEMODrightASrightUMINUSARROW AS ASIGNED_TO ASYNC BIT_AND BOOLEAN CHAR CLOSURE_PIPE COLON COMMA CONJUNCTION CONST DISJUNCTION DIVIDE DOT DOUBLE_COLON ELSE EQUAL_TO FLOAT FN FOR GREATER_THAN GREATER_THAN_OR_EQUAL_TO IDENTIFIER IF IN INTEGER LBRACE LBRACKET LESS_THAN LESS_THAN_OR_EQUAL_TO LET LPAREN MAIN MINUS MOD MUT NOT NOT_EQUAL PLUS PRINTLN RANGE RANGE_INCLUSIVE RBRACE RBRACKET RETURN RPAREN SEMICOLON STRING TIMES TYPE_BOOL TYPE_CHAR TYPE_F64 TYPE_I32 TYPE_STR TYPE_STRING TYPE_TUPLE TYPE_U16 TYPE_U32 TYPE_U64 TYPE_U8 WHILEprogram : program statement\n               | statementprogram_opt : program\n                   | emptyempty :statement : PRINTLN NOT LPAREN STRING RPAREN SEMICOLONstatement : PRINTLN NOT LPAREN expression RPAREN SEMICOLONstatement : PRINTLN NOT LPAREN STRING COMMA argument_list RPAREN SEMICOLONexpression : expression DOT IDENTIFIER LPAREN expression COMMA expression RPARENexpression : expression DOT IDENTIFIER LPAREN expression RPARENexpression : IDENTIFIER DOUBLE_COLON IDENTIFIER LPAREN RPARENstatement : expression SEMICOLONexpression : expression DOT IDENTIFIER LPAREN arguments_opt RPARENarguments_opt : argument_list\n                      | emptyargument_list : argument_list COMMA expression\n                        | expressionclosure_params : closure_params : IDENTIFIERclosure_params : IDENTIFIER COLON typeclosure_params : IDENTIFIER COMMA closure_paramsclosure_params : IDENTIFIER COLON type COMMA closure_paramsclosure_body : expressionclosure_body : LBRACE closure_block_content RBRACEclosure_block_content : expressionclosure_block_content : program expressionclosure_block_content : program_optexpression : CLOSURE_PIPE closure_params CLOSURE_PIPE closure_bodyexpression : CLOSURE_PIPE closure_params CLOSURE_PIPE ARROW type closure_bodyexpression : LPAREN expression RPARENexpression : expression PLUS expression\n                 | expression MINUS expression\n                 | expression TIMES expression\n                 | expression DIVIDE expression\n                 | expression MOD expressionexpression : expression RANGE expression\n                  | expression RANGE_INCLUSIVE expressionexpression : expression EQUAL_TO expression\n                  | expression NOT_EQUAL expression\n                  | expression LESS_THAN expression\n                  | expression GREATER_THAN expression\n                  | expression LESS_THAN_OR_EQUAL_TO expression\n                  | expression GREATER_THAN_OR_EQUAL_TO expressionexpression : expression CONJUNCTION expression\n                  | expression DISJUNCTION expressionexpression : NOT expressionexpression : MINUS expression %prec UMINUSexpression : INTEGER\n                 | FLOATexpression : STRING\n                 | CHAR\n                 | BOOLEANexpression : IDENTIFIERexpression : BIT_AND expressionexpression : BIT_AND MUT IDENTIFIERexpression : expression AS typestatement : IF expression LBRACE program_opt RBRACEstatement : IF expression LBRACE program_opt RBRACE ELSE LBRACE program_opt RBRACEstatement : IDENTIFIER ASIGNED_TO expression SEMICOLONstatement : WHILE expression LBRACE program_opt RBRACEstatement : ASYNC FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACEstatement : ASYNC FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACEtype : TYPE_I32\n            | TYPE_U8\n            | TYPE_U16\n            | TYPE_U32\n            | TYPE_U64\n            | TYPE_F64\n            | TYPE_CHAR\n            | TYPE_STRING\n            | TYPE_STR\n            | TYPE_BOOL\n            | TYPE_TUPLEtype : LBRACKET type RBRACKETtype : LBRACKET type COMMA INTEGER RBRACKETtype : BIT_AND typetype : BIT_AND MUT typestatement : let_decllet_decl : LET maybe_mut IDENTIFIER maybe_type maybe_init SEMICOLONmaybe_mut : MUT\n                 | emptymaybe_type : COLON type\n                  | emptymaybe_init : ASIGNED_TO expression\n                  | emptyelement_list : element_list COMMA expression\n                       | expressionexpression : LBRACKET element_list RBRACKETexpression : LBRACKET expression SEMICOLON INTEGER RBRACKETexpression : IDENTIFIER LBRACKET expression RBRACKETexpression : IDENTIFIER LBRACKET INTEGER RANGE INTEGER RBRACKETexpression : IDENTIFIER LBRACKET INTEGER RANGE_INCLUSIVE INTEGER RBRACKETexpression : IDENTIFIER NOT LBRACKET element_list RBRACKETstatement : const_declconst_decl : CONST IDENTIFIER COLON type ASIGNED_TO expression SEMICOLONtype : LPAREN tuple_type_list RPARENtuple_type_list : type\n                         | type COMMA tuple_type_listexpression : LPAREN tuple_value_list RPARENtuple_value_list : expression\n                           | expression COMMA tuple_value_listexpression : expression DOT INTEGERstatement : FOR IDENTIFIER IN expression LBRACE program_opt RBRACEparam_list_opt : param_list\n                      | emptyparam_list : param_list COMMA param\n                  | paramparam : IDENTIFIER COLON typefunction_body : program expression\n                     | expressionfunction_body : program_optmaybe_pub : IDENTIFIER\n                 | emptyfunction_name : IDENTIFIERfunction_name : MAINstatement : maybe_pub FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACEstatement : maybe_pub FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACEstatement : RETURN expression SEMICOLONexpression : IDENTIFIER LPAREN arguments_opt RPARENstatement : error SEMICOLON\n                 | error_block program_opt RBRACEerror_block : error LBRACEprogram_opt : program error\n                   | error'
     
-_lr_action_items = {'PRINTLN':([0,1,2,12,13,28,34,110,120,126,147,149,165,184,190,196,201,211,213,231,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[3,3,-2,-78,-94,-1,-12,3,3,-118,3,-59,3,-57,-60,3,3,-6,-7,-79,3,3,-103,3,-95,-8,-58,3,-62,3,-117,3,-61,-116,]),'IF':([0,1,2,12,13,28,34,110,120,126,147,149,165,184,190,196,201,211,213,231,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[8,8,-2,-78,-94,-1,-12,8,8,-118,8,-59,8,-57,-60,8,8,-6,-7,-79,8,8,-103,8,-95,-8,-58,8,-62,8,-117,8,-61,-116,]),'IDENTIFIER':([0,1,2,4,5,8,10,12,13,14,16,17,18,23,24,25,26,28,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,53,54,55,56,59,61,67,70,71,72,74,76,96,97,98,99,100,101,102,103,104,105,106,110,119,120,124,126,127,129,132,140,142,147,149,152,159,161,165,175,179,181,182,184,190,196,198,201,204,207,210,211,213,214,223,231,236,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[9,9,-2,31,31,31,31,-78,-94,60,31,64,31,31,31,-5,73,-1,-12,78,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,112,31,31,122,122,130,134,-80,-81,31,31,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,9,31,9,31,-118,31,64,31,31,-76,9,-59,31,195,195,203,31,-74,-77,-96,-57,-60,9,31,203,64,31,31,-6,-7,31,195,-79,-75,9,9,-103,9,-95,-8,-58,203,-62,203,-117,203,-61,-116,]),'WHILE':([0,1,2,12,13,28,34,110,120,126,147,149,165,184,190,196,201,211,213,231,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[10,10,-2,-78,-94,-1,-12,10,10,-118,10,-59,10,-57,-60,10,10,-6,-7,-79,10,10,-103,10,-95,-8,-58,10,-62,10,-117,10,-61,-116,]),'ASYNC':([0,1,2,12,13,28,34,110,120,126,147,149,165,184,190,196,201,211,213,231,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[11,11,-2,-78,-94,-1,-12,11,11,-118,11,-59,11,-57,-60,11,11,-6,-7,-79,11,11,-103,11,-95,-8,-58,11,-62,11,-117,11,-61,-116,]),'FOR':([0,1,2,12,13,28,34,110,120,126,147,149,165,184,190,196,201,211,213,231,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[14,14,-2,-78,-94,-1,-12,14,14,-118,14,-59,14,-57,-60,14,14,-6,-7,-79,14,14,-103,14,-95,-8,-58,14,-62,14,-117,14,-61,-116,]),'RETURN':([0,1,2,12,13,28,34,110,120,126,147,149,165,184,190,196,201,211,213,231,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[16,16,-2,-78,-94,-1,-12,16,16,-118,16,-59,16,-57,-60,16,16,-6,-7,-79,16,16,-103,16,-95,-8,-58,16,-62,16,-117,16,-61,-116,]),'CLOSURE_PIPE':([0,1,2,4,5,8,10,12,13,16,17,18,23,24,28,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,53,55,56,63,64,74,76,96,97,98,99,100,101,102,103,104,105,106,110,119,120,124,126,127,129,132,140,142,147,149,152,165,166,167,175,179,181,182,184,190,196,198,201,204,207,210,211,213,214,230,231,236,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[17,17,-2,17,17,17,17,-78,-94,17,-18,17,17,17,-1,-12,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,127,-19,17,17,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,17,17,17,17,-118,17,-18,17,17,-76,17,-59,17,17,-20,-21,17,-74,-77,-96,-57,-60,17,17,17,-18,17,17,-6,-7,17,-22,-79,-75,17,17,-103,17,-95,-8,-58,17,-62,17,-117,17,-61,-116,]),'LPAREN':([0,1,2,4,5,8,9,10,12,13,16,18,23,24,28,29,31,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,53,55,56,74,76,78,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,119,120,121,122,123,124,125,126,127,128,132,135,140,142,143,147,149,152,163,165,171,175,179,181,182,183,184,190,196,198,201,203,207,210,211,213,214,224,231,236,237,238,239,242,243,244,245,246,253,254,255,256,257,259,263,265,],[5,5,-2,5,5,5,55,5,-78,-94,5,5,5,5,-1,74,55,-12,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,109,5,5,5,5,5,140,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,109,109,109,5,150,5,5,159,-114,-115,5,161,-118,5,109,5,109,5,-76,109,5,-59,5,109,5,109,5,-74,-77,-96,109,-57,-60,5,5,5,55,5,5,-6,-7,5,109,-79,-75,5,109,5,-103,109,5,-95,-8,-58,5,-62,5,-117,5,-61,-116,]),'NOT':([0,1,2,3,4,5,8,9,10,12,13,16,18,23,24,28,31,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,53,55,56,74,76,96,97,98,99,100,101,102,103,104,105,106,110,119,120,124,126,127,132,140,142,147,149,152,165,175,179,181,182,184,190,196,198,201,203,207,210,211,213,214,231,236,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[4,4,-2,29,4,4,4,57,4,-78,-94,4,4,4,4,-1,57,-12,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,4,4,4,4,-118,4,4,4,-76,4,-59,4,4,4,-74,-77,-96,-57,-60,4,4,4,57,4,4,-6,-7,4,-79,-75,4,4,-103,4,-95,-8,-58,4,-62,4,-117,4,-61,-116,]),'MINUS':([0,1,2,4,5,6,7,8,9,10,12,13,16,18,19,20,21,22,23,24,28,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,52,53,55,56,58,62,65,66,69,74,75,76,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,111,116,117,118,119,120,124,126,127,130,131,132,136,137,138,140,142,147,149,151,152,153,157,160,162,164,165,168,175,177,179,181,182,184,185,186,189,190,196,198,200,201,203,205,207,210,211,213,214,215,216,220,221,227,228,229,231,232,233,235,236,237,239,242,244,245,246,247,253,254,255,256,257,259,260,263,264,265,],[18,18,-2,18,18,-50,37,18,-53,18,-78,-94,18,18,-48,-49,-51,-52,18,18,-1,37,-53,37,-12,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,37,18,18,18,37,37,-47,37,37,18,-30,18,-99,-102,-31,-32,-33,-34,-35,37,37,37,37,37,37,37,37,37,37,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,18,37,37,37,-48,18,18,18,-118,18,-55,-88,18,-50,37,37,18,-76,18,-59,-119,18,-90,37,37,-28,37,18,37,18,37,-74,-77,-96,-57,-11,37,-93,-60,18,18,37,18,-53,-89,18,18,-6,-7,18,-10,-13,-91,-92,-29,-24,37,-79,37,37,37,-75,18,18,-103,18,-95,-8,-9,-58,18,-62,18,-117,18,37,-61,37,-116,]),'INTEGER':([0,1,2,4,5,8,10,12,13,16,18,23,24,28,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,53,55,56,74,76,96,97,98,99,100,101,102,103,104,105,106,110,119,120,124,126,127,132,133,140,142,147,149,152,154,155,165,175,179,180,181,182,184,190,196,198,201,207,210,211,213,214,231,236,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[19,19,-2,19,19,19,19,-78,-94,19,19,19,19,-1,-12,79,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,118,19,19,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,19,19,19,19,-118,19,19,169,19,-76,19,-59,19,187,188,19,19,-74,217,-77,-96,-57,-60,19,19,19,19,19,-6,-7,19,-79,-75,19,19,-103,19,-95,-8,-58,19,-62,19,-117,19,-61,-116,]),'FLOAT':([0,1,2,4,5,8,10,12,13,16,18,23,24,28,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,53,55,56,74,76,96,97,98,99,100,101,102,103,104,105,106,110,119,120,124,126,127,132,140,142,147,149,152,165,175,179,181,182,184,190,196,198,201,207,210,211,213,214,231,236,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[20,20,-2,20,20,20,20,-78,-94,20,20,20,20,-1,-12,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,20,20,20,20,-118,20,20,20,-76,20,-59,20,20,20,-74,-77,-96,-57,-60,20,20,20,20,20,-6,-7,20,-79,-75,20,20,-103,20,-95,-8,-58,20,-62,20,-117,20,-61,-116,]),'STRING':([0,1,2,4,5,8,10,12,13,16,18,23,24,28,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,53,55,56,74,76,96,97,98,99,100,101,102,103,104,105,106,110,119,120,124,126,127,132,140,142,147,149,152,165,175,179,181,182,184,190,196,198,201,207,210,211,213,214,231,236,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[6,6,-2,6,6,6,6,-78,-94,6,6,6,6,-1,-12,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,136,6,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,6,6,6,6,-118,6,6,6,-76,6,-59,6,6,6,-74,-77,-96,-57,-60,6,6,6,6,6,-6,-7,6,-79,-75,6,6,-103,6,-95,-8,-58,6,-62,6,-117,6,-61,-116,]),'CHAR':([0,1,2,4,5,8,10,12,13,16,18,23,24,28,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,53,55,56,74,76,96,97,98,99,100,101,102,103,104,105,106,110,119,120,124,126,127,132,140,142,147,149,152,165,175,179,181,182,184,190,196,198,201,207,210,211,213,214,231,236,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[21,21,-2,21,21,21,21,-78,-94,21,21,21,21,-1,-12,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,21,21,21,21,-118,21,21,21,-76,21,-59,21,21,21,-74,-77,-96,-57,-60,21,21,21,21,21,-6,-7,21,-79,-75,21,21,-103,21,-95,-8,-58,21,-62,21,-117,21,-61,-116,]),'BOOLEAN':([0,1,2,4,5,8,10,12,13,16,18,23,24,28,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,53,55,56,74,76,96,97,98,99,100,101,102,103,104,105,106,110,119,120,124,126,127,132,140,142,147,149,152,165,175,179,181,182,184,190,196,198,201,207,210,211,213,214,231,236,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[22,22,-2,22,22,22,22,-78,-94,22,22,22,22,-1,-12,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,22,22,22,22,-118,22,22,22,-76,22,-59,22,22,22,-74,-77,-96,-57,-60,22,22,22,22,22,-6,-7,22,-79,-75,22,22,-103,22,-95,-8,-58,22,-62,22,-117,22,-61,-116,]),'BIT_AND':([0,1,2,4,5,8,10,12,13,16,18,23,24,28,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,53,55,56,74,76,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,119,120,124,126,127,128,132,135,140,142,143,147,149,152,163,165,171,175,179,181,182,183,184,190,196,198,201,207,210,211,213,214,224,231,236,237,238,239,242,243,244,245,246,253,254,255,256,257,259,263,265,],[23,23,-2,23,23,23,23,-78,-94,23,23,23,23,-1,-12,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,108,23,23,23,23,23,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,108,108,108,23,23,23,23,-118,23,108,23,108,23,-76,108,23,-59,23,108,23,108,23,-74,-77,-96,108,-57,-60,23,23,23,23,23,-6,-7,23,108,-79,-75,23,108,23,-103,108,23,-95,-8,-58,23,-62,23,-117,23,-61,-116,]),'LBRACKET':([0,1,2,4,5,8,9,10,12,13,16,18,23,24,28,31,34,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,53,55,56,57,74,76,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,119,120,124,126,127,128,132,135,140,142,143,147,149,152,163,165,171,175,179,181,182,183,184,190,196,198,201,203,207,210,211,213,214,224,231,236,237,238,239,242,243,244,245,246,253,254,255,256,257,259,263,265,],[24,24,-2,24,24,24,56,24,-78,-94,24,24,24,24,-1,56,-12,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,107,24,24,24,119,24,24,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,107,107,107,24,24,24,24,-118,24,107,24,107,24,-76,107,24,-59,24,107,24,107,24,-74,-77,-96,107,-57,-60,24,24,24,56,24,24,-6,-7,24,107,-79,-75,24,107,24,-103,107,24,-95,-8,-58,24,-62,24,-117,24,-61,-116,]),'LET':([0,1,2,12,13,28,34,110,120,126,147,149,165,184,190,196,201,211,213,231,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[25,25,-2,-78,-94,-1,-12,25,25,-118,25,-59,25,-57,-60,25,25,-6,-7,-79,25,25,-103,25,-95,-8,-58,25,-62,25,-117,25,-61,-116,]),'CONST':([0,1,2,12,13,28,34,110,120,126,147,149,165,184,190,196,201,211,213,231,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[26,26,-2,-78,-94,-1,-12,26,26,-118,26,-59,26,-57,-60,26,26,-6,-7,-79,26,26,-103,26,-95,-8,-58,26,-62,26,-117,26,-61,-116,]),'FN':([0,1,2,9,11,12,13,15,27,28,34,110,120,126,147,148,149,165,184,190,196,201,203,211,213,231,237,239,242,244,245,246,253,254,255,256,257,259,263,265,],[-5,-5,-2,-112,59,-78,-94,61,-113,-1,-12,-5,-5,-118,-5,-113,-59,-5,-57,-60,-5,-5,-112,-6,-7,-79,-5,-5,-103,-5,-95,-8,-58,-5,-62,-5,-117,-5,-61,-116,]),'$end':([1,2,12,13,28,34,126,149,184,190,211,213,231,242,245,246,253,255,257,263,265,],[0,-2,-78,-94,-1,-12,-118,-59,-57,-60,-6,-7,-79,-103,-95,-8,-58,-62,-117,-61,-116,]),'RBRACE':([2,6,12,13,19,20,21,22,28,30,31,34,65,66,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,120,126,130,131,142,146,147,148,149,151,153,158,162,164,165,179,181,182,184,185,189,190,196,199,200,201,202,203,205,211,213,215,216,220,221,225,227,228,229,231,236,237,239,242,244,245,246,247,248,250,252,253,254,255,256,257,258,259,260,261,262,263,264,265,],[-2,-50,-78,-94,-48,-49,-51,-52,-1,-46,-53,-12,-47,-54,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-5,-5,-118,-55,-88,-76,184,-3,-4,-59,-119,-90,190,-28,-23,-5,-74,-77,-96,-57,-11,-93,-60,-5,228,-25,-3,-27,-53,-89,-6,-7,-10,-13,-91,-92,242,-29,-24,-26,-79,-75,-5,-5,-103,-5,-95,-8,-9,253,255,257,-58,-5,-62,-5,-117,263,-3,-110,-111,265,-61,-109,-116,]),'SEMICOLON':([6,7,9,19,20,21,22,30,31,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,130,131,134,142,151,153,162,164,170,172,174,176,179,181,182,185,189,200,203,205,206,208,209,215,216,220,221,227,228,229,232,233,234,236,247,260,264,],[-50,34,-53,-48,-49,-51,-52,-46,-53,126,-47,-54,133,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,149,-55,-88,-5,-76,-119,-90,-28,-23,-5,-83,211,213,-74,-77,-96,-11,-93,34,-53,-89,231,-85,-82,-10,-13,-91,-92,-29,-24,34,-84,245,246,-75,-9,34,34,]),'DOT':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,35,-53,-48,-49,-51,-52,-46,-53,35,35,35,35,-47,35,35,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,35,35,35,-48,-55,-88,-50,35,35,-76,-119,-90,35,35,-28,35,35,35,-74,-77,-96,-11,35,-93,35,-53,-89,-10,-13,-91,-92,-29,-24,35,35,35,35,-75,-9,35,35,]),'PLUS':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,36,-53,-48,-49,-51,-52,36,-53,36,36,36,36,-47,36,36,-30,-99,-102,-31,-32,-33,-34,-35,36,36,36,36,36,36,36,36,36,36,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,36,36,36,-48,-55,-88,-50,36,36,-76,-119,-90,36,36,-28,36,36,36,-74,-77,-96,-11,36,-93,36,-53,-89,-10,-13,-91,-92,-29,-24,36,36,36,36,-75,-9,36,36,]),'TIMES':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,38,-53,-48,-49,-51,-52,38,-53,38,38,38,38,-47,38,38,-30,-99,-102,38,38,-33,-34,-35,38,38,38,38,38,38,38,38,38,38,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,38,38,38,-48,-55,-88,-50,38,38,-76,-119,-90,38,38,-28,38,38,38,-74,-77,-96,-11,38,-93,38,-53,-89,-10,-13,-91,-92,-29,-24,38,38,38,38,-75,-9,38,38,]),'DIVIDE':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,39,-53,-48,-49,-51,-52,39,-53,39,39,39,39,-47,39,39,-30,-99,-102,39,39,-33,-34,-35,39,39,39,39,39,39,39,39,39,39,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,39,39,39,-48,-55,-88,-50,39,39,-76,-119,-90,39,39,-28,39,39,39,-74,-77,-96,-11,39,-93,39,-53,-89,-10,-13,-91,-92,-29,-24,39,39,39,39,-75,-9,39,39,]),'MOD':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,40,-53,-48,-49,-51,-52,40,-53,40,40,40,40,-47,40,40,-30,-99,-102,40,40,-33,-34,-35,40,40,40,40,40,40,40,40,40,40,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,40,40,40,-48,-55,-88,-50,40,40,-76,-119,-90,40,40,-28,40,40,40,-74,-77,-96,-11,40,-93,40,-53,-89,-10,-13,-91,-92,-29,-24,40,40,40,40,-75,-9,40,40,]),'RANGE':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,41,-53,-48,-49,-51,-52,41,-53,41,41,41,41,-47,41,41,-30,-99,-102,-31,-32,-33,-34,-35,None,None,41,41,41,41,41,41,41,41,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,41,41,41,154,-55,-88,-50,41,41,-76,-119,-90,41,41,-28,41,41,41,-74,-77,-96,-11,41,-93,41,-53,-89,-10,-13,-91,-92,-29,-24,41,41,41,41,-75,-9,41,41,]),'RANGE_INCLUSIVE':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,42,-53,-48,-49,-51,-52,42,-53,42,42,42,42,-47,42,42,-30,-99,-102,-31,-32,-33,-34,-35,None,None,42,42,42,42,42,42,42,42,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,42,42,42,155,-55,-88,-50,42,42,-76,-119,-90,42,42,-28,42,42,42,-74,-77,-96,-11,42,-93,42,-53,-89,-10,-13,-91,-92,-29,-24,42,42,42,42,-75,-9,42,42,]),'EQUAL_TO':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,43,-53,-48,-49,-51,-52,43,-53,43,43,43,43,-47,43,43,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,43,43,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,43,43,43,-48,-55,-88,-50,43,43,-76,-119,-90,43,43,-28,43,43,43,-74,-77,-96,-11,43,-93,43,-53,-89,-10,-13,-91,-92,-29,-24,43,43,43,43,-75,-9,43,43,]),'NOT_EQUAL':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,44,-53,-48,-49,-51,-52,44,-53,44,44,44,44,-47,44,44,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,44,44,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,44,44,44,-48,-55,-88,-50,44,44,-76,-119,-90,44,44,-28,44,44,44,-74,-77,-96,-11,44,-93,44,-53,-89,-10,-13,-91,-92,-29,-24,44,44,44,44,-75,-9,44,44,]),'LESS_THAN':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,45,-53,-48,-49,-51,-52,45,-53,45,45,45,45,-47,45,45,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,45,45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,45,45,45,-48,-55,-88,-50,45,45,-76,-119,-90,45,45,-28,45,45,45,-74,-77,-96,-11,45,-93,45,-53,-89,-10,-13,-91,-92,-29,-24,45,45,45,45,-75,-9,45,45,]),'GREATER_THAN':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,46,-53,-48,-49,-51,-52,46,-53,46,46,46,46,-47,46,46,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,46,46,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,46,46,46,-48,-55,-88,-50,46,46,-76,-119,-90,46,46,-28,46,46,46,-74,-77,-96,-11,46,-93,46,-53,-89,-10,-13,-91,-92,-29,-24,46,46,46,46,-75,-9,46,46,]),'LESS_THAN_OR_EQUAL_TO':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,47,-53,-48,-49,-51,-52,47,-53,47,47,47,47,-47,47,47,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,47,47,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,47,47,47,-48,-55,-88,-50,47,47,-76,-119,-90,47,47,-28,47,47,47,-74,-77,-96,-11,47,-93,47,-53,-89,-10,-13,-91,-92,-29,-24,47,47,47,47,-75,-9,47,47,]),'GREATER_THAN_OR_EQUAL_TO':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,48,-53,-48,-49,-51,-52,48,-53,48,48,48,48,-47,48,48,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,48,48,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,48,48,48,-48,-55,-88,-50,48,48,-76,-119,-90,48,48,-28,48,48,48,-74,-77,-96,-11,48,-93,48,-53,-89,-10,-13,-91,-92,-29,-24,48,48,48,48,-75,-9,48,48,]),'CONJUNCTION':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,49,-53,-48,-49,-51,-52,-46,-53,49,49,49,49,-47,49,49,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,49,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,49,49,49,-48,-55,-88,-50,49,49,-76,-119,-90,49,49,-28,49,49,49,-74,-77,-96,-11,49,-93,49,-53,-89,-10,-13,-91,-92,-29,-24,49,49,49,49,-75,-9,49,49,]),'DISJUNCTION':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,50,-53,-48,-49,-51,-52,-46,-53,50,50,50,50,-47,50,50,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,50,50,50,-48,-55,-88,-50,50,50,-76,-119,-90,50,50,-28,50,50,50,-74,-77,-96,-11,50,-93,50,-53,-89,-10,-13,-91,-92,-29,-24,50,50,50,50,-75,-9,50,50,]),'AS':([6,7,9,19,20,21,22,30,31,32,52,58,62,65,66,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,111,116,117,118,130,131,136,137,138,142,151,153,157,160,162,164,168,177,179,181,182,185,186,189,200,203,205,215,216,220,221,227,228,229,232,233,235,236,247,260,264,],[-50,51,-53,-48,-49,-51,-52,51,-53,51,51,51,51,-47,51,51,-30,-99,-102,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,51,51,51,-48,-55,-88,-50,51,51,-76,-119,-90,51,51,-28,51,51,51,-74,-77,-96,-11,51,-93,51,-53,-89,-10,-13,-91,-92,-29,-24,51,51,51,51,-75,-9,51,51,]),'RPAREN':([6,19,20,21,22,30,31,32,33,55,65,66,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,113,114,115,116,130,131,136,137,138,139,140,142,144,145,150,151,153,159,161,162,164,177,178,179,181,182,185,186,189,191,192,193,194,197,205,212,215,216,218,220,221,227,228,235,236,240,241,247,],[-50,-48,-49,-51,-52,-46,-53,75,77,-5,-47,-54,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,151,-14,-15,-17,-55,-88,174,176,-100,-101,-5,-76,182,-97,185,-119,-90,-5,-5,-28,-23,215,216,-74,-77,-96,-11,-16,-93,222,-104,-105,-107,226,-89,234,-10,-13,-98,-91,-92,-29,-24,247,-75,-106,-108,-9,]),'COMMA':([6,19,20,21,22,30,31,32,64,65,66,68,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,114,116,130,131,136,138,141,142,145,151,153,156,157,162,164,166,168,177,179,181,182,185,186,189,192,194,205,212,215,216,220,221,227,228,236,240,241,247,],[-50,-48,-49,-51,-52,-46,-53,76,129,-47,-54,132,-87,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,152,-17,-55,-88,175,76,180,-76,183,-119,-90,132,-87,-28,-23,204,-86,214,-74,-77,-96,-11,-16,-93,223,-107,-89,152,-10,-13,-91,-92,-29,-24,-75,-106,-108,-9,]),'LBRACE':([6,19,20,21,22,30,31,52,58,65,66,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,127,130,131,142,151,153,160,162,164,179,181,182,185,189,198,205,215,216,219,220,221,222,226,227,228,236,247,249,251,],[-50,-48,-49,-51,-52,-46,-53,110,120,-47,-54,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,165,-55,-88,-76,-119,-90,196,-28,-23,-74,-77,-96,-11,-93,165,-89,-10,-13,237,-91,-92,239,244,-29,-24,-75,-9,254,256,]),'RBRACKET':([6,19,20,21,22,30,31,65,66,68,69,75,77,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,117,118,130,131,141,142,151,153,156,157,162,164,168,169,179,181,182,185,187,188,189,205,215,216,217,220,221,227,228,236,247,],[-50,-48,-49,-51,-52,-46,-53,-47,-54,131,-87,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,153,-48,-55,-88,179,-76,-119,-90,189,-87,-28,-23,-86,205,-74,-77,-96,-11,220,221,-93,-89,-10,-13,236,-91,-92,-29,-24,-75,-9,]),'ASIGNED_TO':([9,96,97,98,99,100,101,102,103,104,105,106,134,142,170,172,173,179,181,182,203,209,236,],[53,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-5,-76,207,-83,210,-74,-77,-96,53,-82,-75,]),'DOUBLE_COLON':([9,31,203,],[54,54,54,]),'MUT':([23,25,108,],[67,71,143,]),'TYPE_I32':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[96,96,96,96,96,96,96,96,96,96,96,96,96,]),'TYPE_U8':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[97,97,97,97,97,97,97,97,97,97,97,97,97,]),'TYPE_U16':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[98,98,98,98,98,98,98,98,98,98,98,98,98,]),'TYPE_U32':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[99,99,99,99,99,99,99,99,99,99,99,99,99,]),'TYPE_U64':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[100,100,100,100,100,100,100,100,100,100,100,100,100,]),'TYPE_F64':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[101,101,101,101,101,101,101,101,101,101,101,101,101,]),'TYPE_CHAR':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[102,102,102,102,102,102,102,102,102,102,102,102,102,]),'TYPE_STRING':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[103,103,103,103,103,103,103,103,103,103,103,103,103,]),'TYPE_STR':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[104,104,104,104,104,104,104,104,104,104,104,104,104,]),'TYPE_BOOL':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[105,105,105,105,105,105,105,105,105,105,105,105,105,]),'TYPE_TUPLE':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[106,106,106,106,106,106,106,106,106,106,106,106,106,]),'MAIN':([59,61,],[123,123,]),'IN':([60,],[124,]),'COLON':([64,73,134,195,],[128,135,171,224,]),'ARROW':([127,222,226,],[163,238,243,]),'ELSE':([184,],[219,]),}
+_lr_action_items = {'PRINTLN':([0,1,2,12,13,18,30,36,65,66,68,118,128,134,135,157,173,192,198,204,209,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[3,3,-2,-78,-94,3,-1,-12,-120,-122,3,3,3,-118,-121,-59,3,-57,-60,3,3,-6,-7,-79,3,3,-103,3,-95,-8,-58,3,-62,3,-117,3,-61,-116,]),'IF':([0,1,2,12,13,18,30,36,65,66,68,118,128,134,135,157,173,192,198,204,209,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[8,8,-2,-78,-94,8,-1,-12,-120,-122,8,8,8,-118,-121,-59,8,-57,-60,8,8,-6,-7,-79,8,8,-103,8,-95,-8,-58,8,-62,8,-117,8,-61,-116,]),'IDENTIFIER':([0,1,2,4,5,8,10,12,13,14,16,18,19,20,25,26,27,28,30,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,56,57,58,61,63,65,66,68,75,78,79,80,82,84,104,105,106,107,108,109,110,111,112,113,114,118,127,128,132,134,135,137,139,142,150,152,157,160,167,169,173,183,187,189,190,192,198,204,206,209,212,215,218,219,221,222,231,239,244,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[9,9,-2,33,33,33,33,-78,-94,62,33,9,72,33,33,33,-5,81,-1,-12,86,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,120,33,33,130,130,-120,-122,9,140,144,-80,-81,33,33,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,9,33,9,33,-118,-121,33,72,33,33,-76,-59,33,203,203,211,33,-74,-77,-96,-57,-60,9,33,211,72,33,33,-6,-7,33,203,-79,-75,9,9,-103,9,-95,-8,-58,211,-62,211,-117,211,-61,-116,]),'WHILE':([0,1,2,12,13,18,30,36,65,66,68,118,128,134,135,157,173,192,198,204,209,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[10,10,-2,-78,-94,10,-1,-12,-120,-122,10,10,10,-118,-121,-59,10,-57,-60,10,10,-6,-7,-79,10,10,-103,10,-95,-8,-58,10,-62,10,-117,10,-61,-116,]),'ASYNC':([0,1,2,12,13,18,30,36,65,66,68,118,128,134,135,157,173,192,198,204,209,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[11,11,-2,-78,-94,11,-1,-12,-120,-122,11,11,11,-118,-121,-59,11,-57,-60,11,11,-6,-7,-79,11,11,-103,11,-95,-8,-58,11,-62,11,-117,11,-61,-116,]),'FOR':([0,1,2,12,13,18,30,36,65,66,68,118,128,134,135,157,173,192,198,204,209,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[14,14,-2,-78,-94,14,-1,-12,-120,-122,14,14,14,-118,-121,-59,14,-57,-60,14,14,-6,-7,-79,14,14,-103,14,-95,-8,-58,14,-62,14,-117,14,-61,-116,]),'RETURN':([0,1,2,12,13,18,30,36,65,66,68,118,128,134,135,157,173,192,198,204,209,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[16,16,-2,-78,-94,16,-1,-12,-120,-122,16,16,16,-118,-121,-59,16,-57,-60,16,16,-6,-7,-79,16,16,-103,16,-95,-8,-58,16,-62,16,-117,16,-61,-116,]),'error':([0,1,2,12,13,18,30,36,65,66,68,118,128,134,135,157,173,192,198,204,209,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[17,17,-2,-78,-94,70,-1,-12,-120,-122,136,70,70,-118,-121,-59,70,-57,-60,70,136,-6,-7,-79,70,70,-103,70,-95,-8,-58,70,-62,70,-117,136,-61,-116,]),'CLOSURE_PIPE':([0,1,2,4,5,8,10,12,13,16,18,19,20,25,26,30,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,57,58,65,66,68,71,72,82,84,104,105,106,107,108,109,110,111,112,113,114,118,127,128,132,134,135,137,139,142,150,152,157,160,173,174,175,183,187,189,190,192,198,204,206,209,212,215,218,219,221,222,238,239,244,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[19,19,-2,19,19,19,19,-78,-94,19,19,-18,19,19,19,-1,-12,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-120,-122,19,137,-19,19,19,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,19,19,19,19,-118,-121,19,-18,19,19,-76,-59,19,19,-20,-21,19,-74,-77,-96,-57,-60,19,19,19,-18,19,19,-6,-7,19,-22,-79,-75,19,19,-103,19,-95,-8,-58,19,-62,19,-117,19,-61,-116,]),'LPAREN':([0,1,2,4,5,8,9,10,12,13,16,18,20,25,26,30,31,33,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,55,57,58,65,66,68,82,84,86,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,127,128,129,130,131,132,133,134,135,137,138,142,145,150,152,153,157,160,171,173,179,183,187,189,190,191,192,198,204,206,209,211,215,218,219,221,222,232,239,244,245,246,247,250,251,252,253,254,261,262,263,264,265,267,271,273,],[5,5,-2,5,5,5,57,5,-78,-94,5,5,5,5,5,-1,82,57,-12,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,117,5,5,5,-120,-122,5,5,5,150,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,117,117,117,5,158,5,5,167,-114,-115,5,169,-118,-121,5,117,5,117,5,-76,117,-59,5,117,5,117,5,-74,-77,-96,117,-57,-60,5,5,5,57,5,5,-6,-7,5,117,-79,-75,5,117,5,-103,117,5,-95,-8,-58,5,-62,5,-117,5,-61,-116,]),'NOT':([0,1,2,3,4,5,8,9,10,12,13,16,18,20,25,26,30,33,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,57,58,65,66,68,82,84,104,105,106,107,108,109,110,111,112,113,114,118,127,128,132,134,135,137,142,150,152,157,160,173,183,187,189,190,192,198,204,206,209,211,215,218,219,221,222,239,244,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[4,4,-2,31,4,4,4,59,4,-78,-94,4,4,4,4,4,-1,59,-12,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-120,-122,4,4,4,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,4,4,4,4,-118,-121,4,4,4,-76,-59,4,4,4,-74,-77,-96,-57,-60,4,4,4,59,4,4,-6,-7,4,-79,-75,4,4,-103,4,-95,-8,-58,4,-62,4,-117,4,-61,-116,]),'MINUS':([0,1,2,4,5,6,7,8,9,10,12,13,16,18,20,21,22,23,24,25,26,30,32,33,34,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,54,55,57,58,60,64,65,66,68,73,74,77,82,83,84,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,118,119,124,125,126,127,128,132,134,135,137,140,141,142,146,147,148,150,152,157,159,160,161,165,168,170,172,173,176,183,185,187,189,190,192,193,194,197,198,204,206,208,209,211,213,215,218,219,221,222,223,224,228,229,235,236,237,239,240,241,243,244,245,247,250,252,253,254,255,261,262,263,264,265,267,268,271,272,273,],[20,20,-2,20,20,-50,39,20,-53,20,-78,-94,20,20,20,-48,-49,-51,-52,20,20,-1,39,-53,39,-12,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,39,20,20,20,39,39,-120,-122,20,-47,39,39,20,-30,20,-99,-102,-31,-32,-33,-34,-35,39,39,39,39,39,39,39,39,39,39,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,20,39,39,39,-48,20,20,20,-118,-121,20,-55,-88,20,-50,39,39,20,-76,-59,-119,20,-90,39,39,-28,39,20,39,20,39,-74,-77,-96,-57,-11,39,-93,-60,20,20,39,20,-53,-89,20,20,-6,-7,20,-10,-13,-91,-92,-29,-24,39,-79,39,39,39,-75,20,20,-103,20,-95,-8,-9,-58,20,-62,20,-117,20,39,-61,39,-116,]),'INTEGER':([0,1,2,4,5,8,10,12,13,16,18,20,25,26,30,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,57,58,65,66,68,82,84,104,105,106,107,108,109,110,111,112,113,114,118,127,128,132,134,135,137,142,143,150,152,157,160,162,163,173,183,187,188,189,190,192,198,204,206,209,215,218,219,221,222,239,244,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[21,21,-2,21,21,21,21,-78,-94,21,21,21,21,21,-1,-12,87,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,126,-120,-122,21,21,21,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,21,21,21,21,-118,-121,21,21,177,21,-76,-59,21,195,196,21,21,-74,225,-77,-96,-57,-60,21,21,21,21,21,-6,-7,21,-79,-75,21,21,-103,21,-95,-8,-58,21,-62,21,-117,21,-61,-116,]),'FLOAT':([0,1,2,4,5,8,10,12,13,16,18,20,25,26,30,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,57,58,65,66,68,82,84,104,105,106,107,108,109,110,111,112,113,114,118,127,128,132,134,135,137,142,150,152,157,160,173,183,187,189,190,192,198,204,206,209,215,218,219,221,222,239,244,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[22,22,-2,22,22,22,22,-78,-94,22,22,22,22,22,-1,-12,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-120,-122,22,22,22,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,22,22,22,22,-118,-121,22,22,22,-76,-59,22,22,22,-74,-77,-96,-57,-60,22,22,22,22,22,-6,-7,22,-79,-75,22,22,-103,22,-95,-8,-58,22,-62,22,-117,22,-61,-116,]),'STRING':([0,1,2,4,5,8,10,12,13,16,18,20,25,26,30,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,57,58,65,66,68,82,84,104,105,106,107,108,109,110,111,112,113,114,118,127,128,132,134,135,137,142,150,152,157,160,173,183,187,189,190,192,198,204,206,209,215,218,219,221,222,239,244,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[6,6,-2,6,6,6,6,-78,-94,6,6,6,6,6,-1,-12,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,-120,-122,6,146,6,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,6,6,6,6,-118,-121,6,6,6,-76,-59,6,6,6,-74,-77,-96,-57,-60,6,6,6,6,6,-6,-7,6,-79,-75,6,6,-103,6,-95,-8,-58,6,-62,6,-117,6,-61,-116,]),'CHAR':([0,1,2,4,5,8,10,12,13,16,18,20,25,26,30,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,57,58,65,66,68,82,84,104,105,106,107,108,109,110,111,112,113,114,118,127,128,132,134,135,137,142,150,152,157,160,173,183,187,189,190,192,198,204,206,209,215,218,219,221,222,239,244,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[23,23,-2,23,23,23,23,-78,-94,23,23,23,23,23,-1,-12,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,-120,-122,23,23,23,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,23,23,23,23,-118,-121,23,23,23,-76,-59,23,23,23,-74,-77,-96,-57,-60,23,23,23,23,23,-6,-7,23,-79,-75,23,23,-103,23,-95,-8,-58,23,-62,23,-117,23,-61,-116,]),'BOOLEAN':([0,1,2,4,5,8,10,12,13,16,18,20,25,26,30,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,57,58,65,66,68,82,84,104,105,106,107,108,109,110,111,112,113,114,118,127,128,132,134,135,137,142,150,152,157,160,173,183,187,189,190,192,198,204,206,209,215,218,219,221,222,239,244,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[24,24,-2,24,24,24,24,-78,-94,24,24,24,24,24,-1,-12,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-120,-122,24,24,24,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,24,24,24,24,-118,-121,24,24,24,-76,-59,24,24,24,-74,-77,-96,-57,-60,24,24,24,24,24,-6,-7,24,-79,-75,24,24,-103,24,-95,-8,-58,24,-62,24,-117,24,-61,-116,]),'BIT_AND':([0,1,2,4,5,8,10,12,13,16,18,20,25,26,30,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,55,57,58,65,66,68,82,84,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,127,128,132,134,135,137,138,142,145,150,152,153,157,160,171,173,179,183,187,189,190,191,192,198,204,206,209,215,218,219,221,222,232,239,244,245,246,247,250,251,252,253,254,261,262,263,264,265,267,271,273,],[25,25,-2,25,25,25,25,-78,-94,25,25,25,25,25,-1,-12,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,116,25,25,25,-120,-122,25,25,25,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,116,116,116,25,25,25,25,-118,-121,25,116,25,116,25,-76,116,-59,25,116,25,116,25,-74,-77,-96,116,-57,-60,25,25,25,25,25,-6,-7,25,116,-79,-75,25,116,25,-103,116,25,-95,-8,-58,25,-62,25,-117,25,-61,-116,]),'LBRACKET':([0,1,2,4,5,8,9,10,12,13,16,18,20,25,26,30,33,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,55,57,58,59,65,66,68,82,84,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,127,128,132,134,135,137,138,142,145,150,152,153,157,160,171,173,179,183,187,189,190,191,192,198,204,206,209,211,215,218,219,221,222,232,239,244,245,246,247,250,251,252,253,254,261,262,263,264,265,267,271,273,],[26,26,-2,26,26,26,58,26,-78,-94,26,26,26,26,26,-1,58,-12,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,115,26,26,26,127,-120,-122,26,26,26,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,115,115,115,26,26,26,26,-118,-121,26,115,26,115,26,-76,115,-59,26,115,26,115,26,-74,-77,-96,115,-57,-60,26,26,26,58,26,26,-6,-7,26,115,-79,-75,26,115,26,-103,115,26,-95,-8,-58,26,-62,26,-117,26,-61,-116,]),'LET':([0,1,2,12,13,18,30,36,65,66,68,118,128,134,135,157,173,192,198,204,209,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[27,27,-2,-78,-94,27,-1,-12,-120,-122,27,27,27,-118,-121,-59,27,-57,-60,27,27,-6,-7,-79,27,27,-103,27,-95,-8,-58,27,-62,27,-117,27,-61,-116,]),'CONST':([0,1,2,12,13,18,30,36,65,66,68,118,128,134,135,157,173,192,198,204,209,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[28,28,-2,-78,-94,28,-1,-12,-120,-122,28,28,28,-118,-121,-59,28,-57,-60,28,28,-6,-7,-79,28,28,-103,28,-95,-8,-58,28,-62,28,-117,28,-61,-116,]),'FN':([0,1,2,9,11,12,13,15,18,29,30,36,65,66,68,69,118,128,134,135,157,173,192,198,204,209,211,219,221,239,245,247,250,252,253,254,261,262,263,264,265,267,271,273,],[-5,-5,-2,-112,61,-78,-94,63,-5,-113,-1,-12,-120,-122,-5,-113,-5,-5,-118,-121,-59,-5,-57,-60,-5,-5,-112,-6,-7,-79,-5,-5,-103,-5,-95,-8,-58,-5,-62,-5,-117,-5,-61,-116,]),'$end':([1,2,12,13,30,36,65,134,135,157,192,198,219,221,239,250,253,254,261,263,265,271,273,],[0,-2,-78,-94,-1,-12,-120,-118,-121,-59,-57,-60,-6,-7,-79,-103,-95,-8,-58,-62,-117,-61,-116,]),'RBRACE':([2,6,12,13,18,21,22,23,24,30,32,33,36,65,66,67,68,69,70,73,74,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,118,128,134,135,136,140,141,152,156,157,159,161,166,170,172,173,187,189,190,192,193,197,198,204,207,208,209,210,211,213,219,221,223,224,228,229,233,235,236,237,239,244,245,247,250,252,253,254,255,256,258,260,261,262,263,264,265,266,267,268,269,270,271,272,273,],[-2,-50,-78,-94,-5,-48,-49,-51,-52,-1,-46,-53,-12,-120,-122,135,-3,-4,-124,-47,-54,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-5,-5,-118,-121,-123,-55,-88,-76,192,-59,-119,-90,198,-28,-23,-5,-74,-77,-96,-57,-11,-93,-60,-5,236,-25,-3,-27,-53,-89,-6,-7,-10,-13,-91,-92,250,-29,-24,-26,-79,-75,-5,-5,-103,-5,-95,-8,-9,261,263,265,-58,-5,-62,-5,-117,271,-3,-110,-111,273,-61,-109,-116,]),'SEMICOLON':([6,7,9,17,21,22,23,24,32,33,64,70,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,136,140,141,144,152,159,161,170,172,178,180,182,184,187,189,190,193,197,208,211,213,214,216,217,223,224,228,229,235,236,237,240,241,242,244,255,268,272,],[-50,36,-53,65,-48,-49,-51,-52,-46,-53,134,65,-47,-54,143,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,157,65,-55,-88,-5,-76,-119,-90,-28,-23,-5,-83,219,221,-74,-77,-96,-11,-93,36,-53,-89,239,-85,-82,-10,-13,-91,-92,-29,-24,36,-84,253,254,-75,-9,36,36,]),'DOT':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,37,-53,-48,-49,-51,-52,-46,-53,37,37,37,37,-47,37,37,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,37,37,37,-48,-55,-88,-50,37,37,-76,-119,-90,37,37,-28,37,37,37,-74,-77,-96,-11,37,-93,37,-53,-89,-10,-13,-91,-92,-29,-24,37,37,37,37,-75,-9,37,37,]),'PLUS':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,38,-53,-48,-49,-51,-52,38,-53,38,38,38,38,-47,38,38,-30,-99,-102,-31,-32,-33,-34,-35,38,38,38,38,38,38,38,38,38,38,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,38,38,38,-48,-55,-88,-50,38,38,-76,-119,-90,38,38,-28,38,38,38,-74,-77,-96,-11,38,-93,38,-53,-89,-10,-13,-91,-92,-29,-24,38,38,38,38,-75,-9,38,38,]),'TIMES':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,40,-53,-48,-49,-51,-52,40,-53,40,40,40,40,-47,40,40,-30,-99,-102,40,40,-33,-34,-35,40,40,40,40,40,40,40,40,40,40,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,40,40,40,-48,-55,-88,-50,40,40,-76,-119,-90,40,40,-28,40,40,40,-74,-77,-96,-11,40,-93,40,-53,-89,-10,-13,-91,-92,-29,-24,40,40,40,40,-75,-9,40,40,]),'DIVIDE':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,41,-53,-48,-49,-51,-52,41,-53,41,41,41,41,-47,41,41,-30,-99,-102,41,41,-33,-34,-35,41,41,41,41,41,41,41,41,41,41,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,41,41,41,-48,-55,-88,-50,41,41,-76,-119,-90,41,41,-28,41,41,41,-74,-77,-96,-11,41,-93,41,-53,-89,-10,-13,-91,-92,-29,-24,41,41,41,41,-75,-9,41,41,]),'MOD':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,42,-53,-48,-49,-51,-52,42,-53,42,42,42,42,-47,42,42,-30,-99,-102,42,42,-33,-34,-35,42,42,42,42,42,42,42,42,42,42,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,42,42,42,-48,-55,-88,-50,42,42,-76,-119,-90,42,42,-28,42,42,42,-74,-77,-96,-11,42,-93,42,-53,-89,-10,-13,-91,-92,-29,-24,42,42,42,42,-75,-9,42,42,]),'RANGE':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,43,-53,-48,-49,-51,-52,43,-53,43,43,43,43,-47,43,43,-30,-99,-102,-31,-32,-33,-34,-35,None,None,43,43,43,43,43,43,43,43,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,43,43,43,162,-55,-88,-50,43,43,-76,-119,-90,43,43,-28,43,43,43,-74,-77,-96,-11,43,-93,43,-53,-89,-10,-13,-91,-92,-29,-24,43,43,43,43,-75,-9,43,43,]),'RANGE_INCLUSIVE':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,44,-53,-48,-49,-51,-52,44,-53,44,44,44,44,-47,44,44,-30,-99,-102,-31,-32,-33,-34,-35,None,None,44,44,44,44,44,44,44,44,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,44,44,44,163,-55,-88,-50,44,44,-76,-119,-90,44,44,-28,44,44,44,-74,-77,-96,-11,44,-93,44,-53,-89,-10,-13,-91,-92,-29,-24,44,44,44,44,-75,-9,44,44,]),'EQUAL_TO':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,45,-53,-48,-49,-51,-52,45,-53,45,45,45,45,-47,45,45,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,45,45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,45,45,45,-48,-55,-88,-50,45,45,-76,-119,-90,45,45,-28,45,45,45,-74,-77,-96,-11,45,-93,45,-53,-89,-10,-13,-91,-92,-29,-24,45,45,45,45,-75,-9,45,45,]),'NOT_EQUAL':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,46,-53,-48,-49,-51,-52,46,-53,46,46,46,46,-47,46,46,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,46,46,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,46,46,46,-48,-55,-88,-50,46,46,-76,-119,-90,46,46,-28,46,46,46,-74,-77,-96,-11,46,-93,46,-53,-89,-10,-13,-91,-92,-29,-24,46,46,46,46,-75,-9,46,46,]),'LESS_THAN':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,47,-53,-48,-49,-51,-52,47,-53,47,47,47,47,-47,47,47,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,47,47,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,47,47,47,-48,-55,-88,-50,47,47,-76,-119,-90,47,47,-28,47,47,47,-74,-77,-96,-11,47,-93,47,-53,-89,-10,-13,-91,-92,-29,-24,47,47,47,47,-75,-9,47,47,]),'GREATER_THAN':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,48,-53,-48,-49,-51,-52,48,-53,48,48,48,48,-47,48,48,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,48,48,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,48,48,48,-48,-55,-88,-50,48,48,-76,-119,-90,48,48,-28,48,48,48,-74,-77,-96,-11,48,-93,48,-53,-89,-10,-13,-91,-92,-29,-24,48,48,48,48,-75,-9,48,48,]),'LESS_THAN_OR_EQUAL_TO':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,49,-53,-48,-49,-51,-52,49,-53,49,49,49,49,-47,49,49,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,49,49,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,49,49,49,-48,-55,-88,-50,49,49,-76,-119,-90,49,49,-28,49,49,49,-74,-77,-96,-11,49,-93,49,-53,-89,-10,-13,-91,-92,-29,-24,49,49,49,49,-75,-9,49,49,]),'GREATER_THAN_OR_EQUAL_TO':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,50,-53,-48,-49,-51,-52,50,-53,50,50,50,50,-47,50,50,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,None,None,None,None,None,None,50,50,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,50,50,50,-48,-55,-88,-50,50,50,-76,-119,-90,50,50,-28,50,50,50,-74,-77,-96,-11,50,-93,50,-53,-89,-10,-13,-91,-92,-29,-24,50,50,50,50,-75,-9,50,50,]),'CONJUNCTION':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,51,-53,-48,-49,-51,-52,-46,-53,51,51,51,51,-47,51,51,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,51,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,51,51,51,-48,-55,-88,-50,51,51,-76,-119,-90,51,51,-28,51,51,51,-74,-77,-96,-11,51,-93,51,-53,-89,-10,-13,-91,-92,-29,-24,51,51,51,51,-75,-9,51,51,]),'DISJUNCTION':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,52,-53,-48,-49,-51,-52,-46,-53,52,52,52,52,-47,52,52,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,52,52,52,-48,-55,-88,-50,52,52,-76,-119,-90,52,52,-28,52,52,52,-74,-77,-96,-11,52,-93,52,-53,-89,-10,-13,-91,-92,-29,-24,52,52,52,52,-75,-9,52,52,]),'AS':([6,7,9,21,22,23,24,32,33,34,54,60,64,73,74,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,124,125,126,140,141,146,147,148,152,159,161,165,168,170,172,176,185,187,189,190,193,194,197,208,211,213,223,224,228,229,235,236,237,240,241,243,244,255,268,272,],[-50,53,-53,-48,-49,-51,-52,53,-53,53,53,53,53,-47,53,53,-30,-99,-102,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,53,53,53,-48,-55,-88,-50,53,53,-76,-119,-90,53,53,-28,53,53,53,-74,-77,-96,-11,53,-93,53,-53,-89,-10,-13,-91,-92,-29,-24,53,53,53,53,-75,-9,53,53,]),'RPAREN':([6,21,22,23,24,32,33,34,35,57,73,74,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,121,122,123,124,140,141,146,147,148,149,150,152,154,155,158,159,161,167,169,170,172,185,186,187,189,190,193,194,197,199,200,201,202,205,213,220,223,224,226,228,229,235,236,243,244,248,249,255,],[-50,-48,-49,-51,-52,-46,-53,83,85,-5,-47,-54,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,159,-14,-15,-17,-55,-88,182,184,-100,-101,-5,-76,190,-97,193,-119,-90,-5,-5,-28,-23,223,224,-74,-77,-96,-11,-16,-93,230,-104,-105,-107,234,-89,242,-10,-13,-98,-91,-92,-29,-24,255,-75,-106,-108,-9,]),'COMMA':([6,21,22,23,24,32,33,34,72,73,74,76,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,122,124,140,141,146,148,151,152,155,159,161,164,165,170,172,174,176,185,187,189,190,193,194,197,200,202,213,220,223,224,228,229,235,236,244,248,249,255,],[-50,-48,-49,-51,-52,-46,-53,84,139,-47,-54,142,-87,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,160,-17,-55,-88,183,84,188,-76,191,-119,-90,142,-87,-28,-23,212,-86,222,-74,-77,-96,-11,-16,-93,231,-107,-89,160,-10,-13,-91,-92,-29,-24,-75,-106,-108,-9,]),'LBRACE':([6,17,21,22,23,24,32,33,54,60,70,73,74,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,136,137,140,141,152,159,161,168,170,172,187,189,190,193,197,206,213,223,224,227,228,229,230,234,235,236,244,255,257,259,],[-50,66,-48,-49,-51,-52,-46,-53,118,128,66,-47,-54,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,66,173,-55,-88,-76,-119,-90,204,-28,-23,-74,-77,-96,-11,-93,173,-89,-10,-13,245,-91,-92,247,252,-29,-24,-75,-9,262,264,]),'RBRACKET':([6,21,22,23,24,32,33,73,74,76,77,83,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,125,126,140,141,151,152,159,161,164,165,170,172,176,177,187,189,190,193,195,196,197,213,223,224,225,228,229,235,236,244,255,],[-50,-48,-49,-51,-52,-46,-53,-47,-54,141,-87,-30,-99,-102,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-56,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,161,-48,-55,-88,187,-76,-119,-90,197,-87,-28,-23,-86,213,-74,-77,-96,-11,228,229,-93,-89,-10,-13,244,-91,-92,-29,-24,-75,-9,]),'ASIGNED_TO':([9,104,105,106,107,108,109,110,111,112,113,114,144,152,178,180,181,187,189,190,211,217,244,],[55,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-5,-76,215,-83,218,-74,-77,-96,55,-82,-75,]),'DOUBLE_COLON':([9,33,211,],[56,56,56,]),'MUT':([25,27,116,],[75,79,153,]),'TYPE_I32':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[104,104,104,104,104,104,104,104,104,104,104,104,104,]),'TYPE_U8':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[105,105,105,105,105,105,105,105,105,105,105,105,105,]),'TYPE_U16':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[106,106,106,106,106,106,106,106,106,106,106,106,106,]),'TYPE_U32':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[107,107,107,107,107,107,107,107,107,107,107,107,107,]),'TYPE_U64':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[108,108,108,108,108,108,108,108,108,108,108,108,108,]),'TYPE_F64':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[109,109,109,109,109,109,109,109,109,109,109,109,109,]),'TYPE_CHAR':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[110,110,110,110,110,110,110,110,110,110,110,110,110,]),'TYPE_STRING':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[111,111,111,111,111,111,111,111,111,111,111,111,111,]),'TYPE_STR':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[112,112,112,112,112,112,112,112,112,112,112,112,112,]),'TYPE_BOOL':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[113,113,113,113,113,113,113,113,113,113,113,113,113,]),'TYPE_TUPLE':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[114,114,114,114,114,114,114,114,114,114,114,114,114,]),'MAIN':([61,63,],[131,131,]),'IN':([62,],[132,]),'COLON':([72,81,144,203,],[138,145,179,232,]),'ARROW':([137,230,234,],[171,246,251,]),'ELSE':([192,],[227,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +16,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,110,120,165,196,237,239,244,254,256,],[1,147,147,201,147,147,147,147,259,259,]),'statement':([0,1,110,120,147,165,196,201,237,239,244,254,256,259,],[2,28,2,2,28,2,2,28,2,2,2,2,2,28,]),'expression':([0,1,4,5,8,10,16,18,23,24,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,53,55,56,74,76,110,119,120,124,127,132,140,147,152,165,175,196,198,201,207,210,214,237,239,244,254,256,259,],[7,7,30,32,52,58,62,65,66,69,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,111,116,117,137,138,7,157,7,160,164,168,177,7,186,200,116,7,164,229,232,233,235,7,7,7,260,260,264,]),'let_decl':([0,1,110,120,147,165,196,201,237,239,244,254,256,259,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'const_decl':([0,1,110,120,147,165,196,201,237,239,244,254,256,259,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'maybe_pub':([0,1,110,120,147,165,196,201,237,239,244,254,256,259,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'empty':([0,1,25,55,110,120,134,140,147,159,161,165,170,196,201,237,239,244,254,256,259,],[27,27,72,115,148,148,172,115,27,193,193,148,208,148,27,148,148,148,148,148,27,]),'tuple_value_list':([5,76,],[33,139,]),'closure_params':([17,129,204,],[63,167,230,]),'element_list':([24,119,],[68,156,]),'maybe_mut':([25,],[70,]),'type':([51,107,108,109,128,135,143,163,171,183,224,238,243,],[95,141,142,145,166,173,181,198,209,145,241,249,251,]),'arguments_opt':([55,140,],[113,178,]),'argument_list':([55,140,175,],[114,114,212,]),'function_name':([59,61,],[121,125,]),'tuple_type_list':([109,183,],[144,218,]),'program_opt':([110,120,165,196,237,239,244,254,256,],[146,158,202,225,248,250,252,261,261,]),'closure_body':([127,198,],[162,227,]),'maybe_type':([134,],[170,]),'param_list_opt':([159,161,],[191,197,]),'param_list':([159,161,],[192,192,]),'param':([159,161,223,],[194,194,240,]),'closure_block_content':([165,],[199,]),'maybe_init':([170,],[206,]),'function_body':([254,256,],[258,262,]),}
+_lr_goto_items = {'program':([0,18,118,128,173,204,245,247,252,262,264,],[1,68,68,68,209,68,68,68,68,267,267,]),'statement':([0,1,18,68,118,128,173,204,209,245,247,252,262,264,267,],[2,30,2,30,2,2,2,2,30,2,2,2,2,2,30,]),'expression':([0,1,4,5,8,10,16,18,20,25,26,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,57,58,68,82,84,118,127,128,132,137,142,150,160,173,183,204,206,209,215,218,222,245,247,252,262,264,267,],[7,7,32,34,54,60,64,7,73,74,77,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,119,124,125,7,147,148,7,165,7,168,172,176,185,194,208,124,7,172,237,240,241,243,7,7,7,268,268,272,]),'let_decl':([0,1,18,68,118,128,173,204,209,245,247,252,262,264,267,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'const_decl':([0,1,18,68,118,128,173,204,209,245,247,252,262,264,267,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'maybe_pub':([0,1,18,68,118,128,173,204,209,245,247,252,262,264,267,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'error_block':([0,1,18,68,118,128,173,204,209,245,247,252,262,264,267,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'empty':([0,1,18,27,57,68,118,128,144,150,167,169,173,178,204,209,245,247,252,262,264,267,],[29,29,69,80,123,29,69,69,180,123,201,201,69,216,69,29,69,69,69,69,69,29,]),'tuple_value_list':([5,84,],[35,149,]),'program_opt':([18,118,128,173,204,245,247,252,262,264,],[67,156,166,210,233,256,258,260,269,269,]),'closure_params':([19,139,212,],[71,175,238,]),'element_list':([26,127,],[76,164,]),'maybe_mut':([27,],[78,]),'type':([53,115,116,117,138,145,153,171,179,191,232,246,251,],[103,151,152,155,174,181,189,206,217,155,249,257,259,]),'arguments_opt':([57,150,],[121,186,]),'argument_list':([57,150,183,],[122,122,220,]),'function_name':([61,63,],[129,133,]),'tuple_type_list':([117,191,],[154,226,]),'closure_body':([137,206,],[170,235,]),'maybe_type':([144,],[178,]),'param_list_opt':([167,169,],[199,205,]),'param_list':([167,169,],[200,200,]),'param':([167,169,231,],[202,202,248,]),'closure_block_content':([173,],[207,]),'maybe_init':([178,],[214,]),'function_body':([262,264,],[266,270,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,123 +26,128 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> program statement','program',2,'p_program','syntaxAnalyzer.py',38),
-  ('program -> statement','program',1,'p_program','syntaxAnalyzer.py',39),
-  ('program_opt -> program','program_opt',1,'p_program_opt','syntaxAnalyzer.py',43),
-  ('program_opt -> empty','program_opt',1,'p_program_opt','syntaxAnalyzer.py',44),
-  ('empty -> <empty>','empty',0,'p_empty','syntaxAnalyzer.py',48),
-  ('statement -> PRINTLN NOT LPAREN STRING RPAREN SEMICOLON','statement',6,'p_println_string','syntaxAnalyzer.py',54),
-  ('statement -> PRINTLN NOT LPAREN expression RPAREN SEMICOLON','statement',6,'p_println_expr','syntaxAnalyzer.py',59),
-  ('statement -> PRINTLN NOT LPAREN STRING COMMA argument_list RPAREN SEMICOLON','statement',8,'p_println_format','syntaxAnalyzer.py',63),
-  ('expression -> expression DOT IDENTIFIER LPAREN expression COMMA expression RPAREN','expression',8,'p_hashmap_insert','syntaxAnalyzer.py',69),
-  ('expression -> expression DOT IDENTIFIER LPAREN expression RPAREN','expression',6,'p_hashmap_get','syntaxAnalyzer.py',77),
-  ('expression -> IDENTIFIER DOUBLE_COLON IDENTIFIER LPAREN RPAREN','expression',5,'p_path_call_noargs','syntaxAnalyzer.py',87),
-  ('statement -> expression SEMICOLON','statement',2,'p_expr_stmt','syntaxAnalyzer.py',96),
-  ('expression -> expression DOT IDENTIFIER LPAREN arguments_opt RPAREN','expression',6,'p_call_method','syntaxAnalyzer.py',101),
-  ('arguments_opt -> argument_list','arguments_opt',1,'p_arguments_opt','syntaxAnalyzer.py',105),
-  ('arguments_opt -> empty','arguments_opt',1,'p_arguments_opt','syntaxAnalyzer.py',106),
-  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','syntaxAnalyzer.py',110),
-  ('argument_list -> expression','argument_list',1,'p_argument_list','syntaxAnalyzer.py',111),
-  ('closure_params -> <empty>','closure_params',0,'p_closure_params_empty','syntaxAnalyzer.py',118),
-  ('closure_params -> IDENTIFIER','closure_params',1,'p_closure_params_single','syntaxAnalyzer.py',122),
-  ('closure_params -> IDENTIFIER COLON type','closure_params',3,'p_closure_params_single_typed','syntaxAnalyzer.py',126),
-  ('closure_params -> IDENTIFIER COMMA closure_params','closure_params',3,'p_closure_params_multiple','syntaxAnalyzer.py',130),
-  ('closure_params -> IDENTIFIER COLON type COMMA closure_params','closure_params',5,'p_closure_params_multiple_typed','syntaxAnalyzer.py',134),
-  ('closure_body -> expression','closure_body',1,'p_closure_body_expr','syntaxAnalyzer.py',139),
-  ('closure_body -> LBRACE closure_block_content RBRACE','closure_body',3,'p_closure_body_block','syntaxAnalyzer.py',144),
-  ('closure_block_content -> expression','closure_block_content',1,'p_closure_block_content_expr','syntaxAnalyzer.py',149),
-  ('closure_block_content -> program expression','closure_block_content',2,'p_closure_block_content_stmts_expr','syntaxAnalyzer.py',153),
-  ('closure_block_content -> program_opt','closure_block_content',1,'p_closure_block_content_stmts','syntaxAnalyzer.py',157),
-  ('expression -> CLOSURE_PIPE closure_params CLOSURE_PIPE closure_body','expression',4,'p_expression_closure','syntaxAnalyzer.py',162),
-  ('expression -> CLOSURE_PIPE closure_params CLOSURE_PIPE ARROW type closure_body','expression',6,'p_expression_closure_ret','syntaxAnalyzer.py',167),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_exp_paren','syntaxAnalyzer.py',172),
-  ('expression -> expression PLUS expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',176),
-  ('expression -> expression MINUS expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',177),
-  ('expression -> expression TIMES expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',178),
-  ('expression -> expression DIVIDE expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',179),
-  ('expression -> expression MOD expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',180),
-  ('expression -> expression RANGE expression','expression',3,'p_exp_range','syntaxAnalyzer.py',184),
-  ('expression -> expression RANGE_INCLUSIVE expression','expression',3,'p_exp_range','syntaxAnalyzer.py',185),
-  ('expression -> expression EQUAL_TO expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',190),
-  ('expression -> expression NOT_EQUAL expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',191),
-  ('expression -> expression LESS_THAN expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',192),
-  ('expression -> expression GREATER_THAN expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',193),
-  ('expression -> expression LESS_THAN_OR_EQUAL_TO expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',194),
-  ('expression -> expression GREATER_THAN_OR_EQUAL_TO expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',195),
-  ('expression -> expression CONJUNCTION expression','expression',3,'p_exp_logic','syntaxAnalyzer.py',199),
-  ('expression -> expression DISJUNCTION expression','expression',3,'p_exp_logic','syntaxAnalyzer.py',200),
-  ('expression -> NOT expression','expression',2,'p_exp_unary_not','syntaxAnalyzer.py',204),
-  ('expression -> MINUS expression','expression',2,'p_exp_unary_minus','syntaxAnalyzer.py',208),
-  ('expression -> INTEGER','expression',1,'p_exp_literal_num','syntaxAnalyzer.py',212),
-  ('expression -> FLOAT','expression',1,'p_exp_literal_num','syntaxAnalyzer.py',213),
-  ('expression -> STRING','expression',1,'p_exp_literal_str_char_bool','syntaxAnalyzer.py',217),
-  ('expression -> CHAR','expression',1,'p_exp_literal_str_char_bool','syntaxAnalyzer.py',218),
-  ('expression -> BOOLEAN','expression',1,'p_exp_literal_str_char_bool','syntaxAnalyzer.py',219),
-  ('expression -> IDENTIFIER','expression',1,'p_exp_ident','syntaxAnalyzer.py',223),
-  ('expression -> BIT_AND expression','expression',2,'p_ref_unary','syntaxAnalyzer.py',228),
-  ('expression -> BIT_AND MUT IDENTIFIER','expression',3,'p_ref_mut_ident','syntaxAnalyzer.py',233),
-  ('expression -> expression AS type','expression',3,'p_cast_as','syntaxAnalyzer.py',238),
-  ('statement -> IF expression LBRACE program_opt RBRACE','statement',5,'p_if_simple','syntaxAnalyzer.py',246),
-  ('statement -> IF expression LBRACE program_opt RBRACE ELSE LBRACE program_opt RBRACE','statement',9,'p_if_else','syntaxAnalyzer.py',250),
-  ('statement -> IDENTIFIER ASIGNED_TO expression SEMICOLON','statement',4,'p_assignment','syntaxAnalyzer.py',255),
-  ('statement -> WHILE expression LBRACE program_opt RBRACE','statement',5,'p_while','syntaxAnalyzer.py',260),
-  ('statement -> ASYNC FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACE','statement',11,'p_function_with_return_async','syntaxAnalyzer.py',265),
-  ('statement -> ASYNC FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACE','statement',9,'p_function_without_return_async','syntaxAnalyzer.py',269),
-  ('type -> TYPE_I32','type',1,'p_type_base','syntaxAnalyzer.py',274),
-  ('type -> TYPE_U8','type',1,'p_type_base','syntaxAnalyzer.py',275),
-  ('type -> TYPE_U16','type',1,'p_type_base','syntaxAnalyzer.py',276),
-  ('type -> TYPE_U32','type',1,'p_type_base','syntaxAnalyzer.py',277),
-  ('type -> TYPE_U64','type',1,'p_type_base','syntaxAnalyzer.py',278),
-  ('type -> TYPE_F64','type',1,'p_type_base','syntaxAnalyzer.py',279),
-  ('type -> TYPE_CHAR','type',1,'p_type_base','syntaxAnalyzer.py',280),
-  ('type -> TYPE_STRING','type',1,'p_type_base','syntaxAnalyzer.py',281),
-  ('type -> TYPE_STR','type',1,'p_type_base','syntaxAnalyzer.py',282),
-  ('type -> TYPE_BOOL','type',1,'p_type_base','syntaxAnalyzer.py',283),
-  ('type -> TYPE_TUPLE','type',1,'p_type_base','syntaxAnalyzer.py',284),
-  ('type -> LBRACKET type RBRACKET','type',3,'p_type_array_rec','syntaxAnalyzer.py',289),
-  ('type -> LBRACKET type COMMA INTEGER RBRACKET','type',5,'p_type_array_len','syntaxAnalyzer.py',294),
-  ('type -> BIT_AND type','type',2,'p_type_ref_rec','syntaxAnalyzer.py',299),
-  ('type -> BIT_AND MUT type','type',3,'p_type_ref_mut_rec','syntaxAnalyzer.py',304),
-  ('statement -> let_decl','statement',1,'p_statement_let','syntaxAnalyzer.py',309),
-  ('let_decl -> LET maybe_mut IDENTIFIER maybe_type maybe_init SEMICOLON','let_decl',6,'p_let_decl','syntaxAnalyzer.py',313),
-  ('maybe_mut -> MUT','maybe_mut',1,'p_maybe_mut','syntaxAnalyzer.py',329),
-  ('maybe_mut -> empty','maybe_mut',1,'p_maybe_mut','syntaxAnalyzer.py',330),
-  ('maybe_type -> COLON type','maybe_type',2,'p_maybe_type','syntaxAnalyzer.py',334),
-  ('maybe_type -> empty','maybe_type',1,'p_maybe_type','syntaxAnalyzer.py',335),
-  ('maybe_init -> ASIGNED_TO expression','maybe_init',2,'p_maybe_init','syntaxAnalyzer.py',339),
-  ('maybe_init -> empty','maybe_init',1,'p_maybe_init','syntaxAnalyzer.py',340),
-  ('element_list -> element_list COMMA expression','element_list',3,'p_element_list','syntaxAnalyzer.py',345),
-  ('element_list -> expression','element_list',1,'p_element_list','syntaxAnalyzer.py',346),
-  ('expression -> LBRACKET element_list RBRACKET','expression',3,'p_array_literal','syntaxAnalyzer.py',350),
-  ('expression -> LBRACKET expression SEMICOLON INTEGER RBRACKET','expression',5,'p_array_repeat','syntaxAnalyzer.py',354),
-  ('expression -> IDENTIFIER LBRACKET expression RBRACKET','expression',4,'p_index','syntaxAnalyzer.py',358),
-  ('expression -> IDENTIFIER LBRACKET INTEGER RANGE INTEGER RBRACKET','expression',6,'p_slice_open','syntaxAnalyzer.py',362),
-  ('expression -> IDENTIFIER LBRACKET INTEGER RANGE_INCLUSIVE INTEGER RBRACKET','expression',6,'p_slice_inclusive','syntaxAnalyzer.py',366),
-  ('expression -> IDENTIFIER NOT LBRACKET element_list RBRACKET','expression',5,'p_vec_macro','syntaxAnalyzer.py',370),
-  ('statement -> const_decl','statement',1,'p_statement_const','syntaxAnalyzer.py',375),
-  ('const_decl -> CONST IDENTIFIER COLON type ASIGNED_TO expression SEMICOLON','const_decl',7,'p_const_decl','syntaxAnalyzer.py',379),
-  ('type -> LPAREN tuple_type_list RPAREN','type',3,'p_type_tuple','syntaxAnalyzer.py',384),
-  ('tuple_type_list -> type','tuple_type_list',1,'p_tuple_type_list','syntaxAnalyzer.py',388),
-  ('tuple_type_list -> type COMMA tuple_type_list','tuple_type_list',3,'p_tuple_type_list','syntaxAnalyzer.py',389),
-  ('expression -> LPAREN tuple_value_list RPAREN','expression',3,'p_exp_tuple_literal','syntaxAnalyzer.py',396),
-  ('tuple_value_list -> expression','tuple_value_list',1,'p_tuple_value_list','syntaxAnalyzer.py',400),
-  ('tuple_value_list -> expression COMMA tuple_value_list','tuple_value_list',3,'p_tuple_value_list','syntaxAnalyzer.py',401),
-  ('expression -> expression DOT INTEGER','expression',3,'p_exp_tuple_access','syntaxAnalyzer.py',408),
-  ('statement -> FOR IDENTIFIER IN expression LBRACE program_opt RBRACE','statement',7,'p_for_loop','syntaxAnalyzer.py',413),
-  ('param_list_opt -> param_list','param_list_opt',1,'p_param_list_opt','syntaxAnalyzer.py',418),
-  ('param_list_opt -> empty','param_list_opt',1,'p_param_list_opt','syntaxAnalyzer.py',419),
-  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','syntaxAnalyzer.py',423),
-  ('param_list -> param','param_list',1,'p_param_list','syntaxAnalyzer.py',424),
-  ('param -> IDENTIFIER COLON type','param',3,'p_param','syntaxAnalyzer.py',428),
-  ('function_body -> program expression','function_body',2,'p_function_body_with_return','syntaxAnalyzer.py',433),
-  ('function_body -> expression','function_body',1,'p_function_body_with_return','syntaxAnalyzer.py',434),
-  ('function_body -> program_opt','function_body',1,'p_function_body_statements','syntaxAnalyzer.py',443),
-  ('maybe_pub -> IDENTIFIER','maybe_pub',1,'p_maybe_pub','syntaxAnalyzer.py',448),
-  ('maybe_pub -> empty','maybe_pub',1,'p_maybe_pub','syntaxAnalyzer.py',449),
-  ('function_name -> IDENTIFIER','function_name',1,'p_function_name_ident','syntaxAnalyzer.py',453),
-  ('function_name -> MAIN','function_name',1,'p_function_name_main','syntaxAnalyzer.py',457),
-  ('statement -> maybe_pub FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACE','statement',11,'p_function_with_return','syntaxAnalyzer.py',461),
-  ('statement -> maybe_pub FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACE','statement',9,'p_function_without_return','syntaxAnalyzer.py',465),
-  ('statement -> RETURN expression SEMICOLON','statement',3,'p_return','syntaxAnalyzer.py',469),
-  ('expression -> IDENTIFIER LPAREN arguments_opt RPAREN','expression',4,'p_function_call','syntaxAnalyzer.py',473),
+  ('program -> program statement','program',2,'p_program','syntaxAnalyzer.py',96),
+  ('program -> statement','program',1,'p_program','syntaxAnalyzer.py',97),
+  ('program_opt -> program','program_opt',1,'p_program_opt','syntaxAnalyzer.py',120),
+  ('program_opt -> empty','program_opt',1,'p_program_opt','syntaxAnalyzer.py',121),
+  ('empty -> <empty>','empty',0,'p_empty','syntaxAnalyzer.py',125),
+  ('statement -> PRINTLN NOT LPAREN STRING RPAREN SEMICOLON','statement',6,'p_println_string','syntaxAnalyzer.py',131),
+  ('statement -> PRINTLN NOT LPAREN expression RPAREN SEMICOLON','statement',6,'p_println_expr','syntaxAnalyzer.py',136),
+  ('statement -> PRINTLN NOT LPAREN STRING COMMA argument_list RPAREN SEMICOLON','statement',8,'p_println_format','syntaxAnalyzer.py',140),
+  ('expression -> expression DOT IDENTIFIER LPAREN expression COMMA expression RPAREN','expression',8,'p_hashmap_insert','syntaxAnalyzer.py',146),
+  ('expression -> expression DOT IDENTIFIER LPAREN expression RPAREN','expression',6,'p_hashmap_get','syntaxAnalyzer.py',154),
+  ('expression -> IDENTIFIER DOUBLE_COLON IDENTIFIER LPAREN RPAREN','expression',5,'p_path_call_noargs','syntaxAnalyzer.py',164),
+  ('statement -> expression SEMICOLON','statement',2,'p_expr_stmt','syntaxAnalyzer.py',173),
+  ('expression -> expression DOT IDENTIFIER LPAREN arguments_opt RPAREN','expression',6,'p_call_method','syntaxAnalyzer.py',178),
+  ('arguments_opt -> argument_list','arguments_opt',1,'p_arguments_opt','syntaxAnalyzer.py',182),
+  ('arguments_opt -> empty','arguments_opt',1,'p_arguments_opt','syntaxAnalyzer.py',183),
+  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','syntaxAnalyzer.py',187),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','syntaxAnalyzer.py',188),
+  ('closure_params -> <empty>','closure_params',0,'p_closure_params_empty','syntaxAnalyzer.py',197),
+  ('closure_params -> IDENTIFIER','closure_params',1,'p_closure_params_single','syntaxAnalyzer.py',201),
+  ('closure_params -> IDENTIFIER COLON type','closure_params',3,'p_closure_params_single_typed','syntaxAnalyzer.py',205),
+  ('closure_params -> IDENTIFIER COMMA closure_params','closure_params',3,'p_closure_params_multiple','syntaxAnalyzer.py',209),
+  ('closure_params -> IDENTIFIER COLON type COMMA closure_params','closure_params',5,'p_closure_params_multiple_typed','syntaxAnalyzer.py',213),
+  ('closure_body -> expression','closure_body',1,'p_closure_body_expr','syntaxAnalyzer.py',218),
+  ('closure_body -> LBRACE closure_block_content RBRACE','closure_body',3,'p_closure_body_block','syntaxAnalyzer.py',223),
+  ('closure_block_content -> expression','closure_block_content',1,'p_closure_block_content_expr','syntaxAnalyzer.py',228),
+  ('closure_block_content -> program expression','closure_block_content',2,'p_closure_block_content_stmts_expr','syntaxAnalyzer.py',232),
+  ('closure_block_content -> program_opt','closure_block_content',1,'p_closure_block_content_stmts','syntaxAnalyzer.py',236),
+  ('expression -> CLOSURE_PIPE closure_params CLOSURE_PIPE closure_body','expression',4,'p_expression_closure','syntaxAnalyzer.py',241),
+  ('expression -> CLOSURE_PIPE closure_params CLOSURE_PIPE ARROW type closure_body','expression',6,'p_expression_closure_ret','syntaxAnalyzer.py',246),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_exp_paren','syntaxAnalyzer.py',251),
+  ('expression -> expression PLUS expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',255),
+  ('expression -> expression MINUS expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',256),
+  ('expression -> expression TIMES expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',257),
+  ('expression -> expression DIVIDE expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',258),
+  ('expression -> expression MOD expression','expression',3,'p_exp_binary','syntaxAnalyzer.py',259),
+  ('expression -> expression RANGE expression','expression',3,'p_exp_range','syntaxAnalyzer.py',263),
+  ('expression -> expression RANGE_INCLUSIVE expression','expression',3,'p_exp_range','syntaxAnalyzer.py',264),
+  ('expression -> expression EQUAL_TO expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',269),
+  ('expression -> expression NOT_EQUAL expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',270),
+  ('expression -> expression LESS_THAN expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',271),
+  ('expression -> expression GREATER_THAN expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',272),
+  ('expression -> expression LESS_THAN_OR_EQUAL_TO expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',273),
+  ('expression -> expression GREATER_THAN_OR_EQUAL_TO expression','expression',3,'p_exp_relational','syntaxAnalyzer.py',274),
+  ('expression -> expression CONJUNCTION expression','expression',3,'p_exp_logic','syntaxAnalyzer.py',278),
+  ('expression -> expression DISJUNCTION expression','expression',3,'p_exp_logic','syntaxAnalyzer.py',279),
+  ('expression -> NOT expression','expression',2,'p_exp_unary_not','syntaxAnalyzer.py',283),
+  ('expression -> MINUS expression','expression',2,'p_exp_unary_minus','syntaxAnalyzer.py',287),
+  ('expression -> INTEGER','expression',1,'p_exp_literal_num','syntaxAnalyzer.py',291),
+  ('expression -> FLOAT','expression',1,'p_exp_literal_num','syntaxAnalyzer.py',292),
+  ('expression -> STRING','expression',1,'p_exp_literal_str_char_bool','syntaxAnalyzer.py',296),
+  ('expression -> CHAR','expression',1,'p_exp_literal_str_char_bool','syntaxAnalyzer.py',297),
+  ('expression -> BOOLEAN','expression',1,'p_exp_literal_str_char_bool','syntaxAnalyzer.py',298),
+  ('expression -> IDENTIFIER','expression',1,'p_exp_ident','syntaxAnalyzer.py',302),
+  ('expression -> BIT_AND expression','expression',2,'p_ref_unary','syntaxAnalyzer.py',307),
+  ('expression -> BIT_AND MUT IDENTIFIER','expression',3,'p_ref_mut_ident','syntaxAnalyzer.py',312),
+  ('expression -> expression AS type','expression',3,'p_cast_as','syntaxAnalyzer.py',317),
+  ('statement -> IF expression LBRACE program_opt RBRACE','statement',5,'p_if_simple','syntaxAnalyzer.py',325),
+  ('statement -> IF expression LBRACE program_opt RBRACE ELSE LBRACE program_opt RBRACE','statement',9,'p_if_else','syntaxAnalyzer.py',329),
+  ('statement -> IDENTIFIER ASIGNED_TO expression SEMICOLON','statement',4,'p_assignment','syntaxAnalyzer.py',334),
+  ('statement -> WHILE expression LBRACE program_opt RBRACE','statement',5,'p_while','syntaxAnalyzer.py',339),
+  ('statement -> ASYNC FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACE','statement',11,'p_function_with_return_async','syntaxAnalyzer.py',344),
+  ('statement -> ASYNC FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACE','statement',9,'p_function_without_return_async','syntaxAnalyzer.py',348),
+  ('type -> TYPE_I32','type',1,'p_type_base','syntaxAnalyzer.py',371),
+  ('type -> TYPE_U8','type',1,'p_type_base','syntaxAnalyzer.py',372),
+  ('type -> TYPE_U16','type',1,'p_type_base','syntaxAnalyzer.py',373),
+  ('type -> TYPE_U32','type',1,'p_type_base','syntaxAnalyzer.py',374),
+  ('type -> TYPE_U64','type',1,'p_type_base','syntaxAnalyzer.py',375),
+  ('type -> TYPE_F64','type',1,'p_type_base','syntaxAnalyzer.py',376),
+  ('type -> TYPE_CHAR','type',1,'p_type_base','syntaxAnalyzer.py',377),
+  ('type -> TYPE_STRING','type',1,'p_type_base','syntaxAnalyzer.py',378),
+  ('type -> TYPE_STR','type',1,'p_type_base','syntaxAnalyzer.py',379),
+  ('type -> TYPE_BOOL','type',1,'p_type_base','syntaxAnalyzer.py',380),
+  ('type -> TYPE_TUPLE','type',1,'p_type_base','syntaxAnalyzer.py',381),
+  ('type -> LBRACKET type RBRACKET','type',3,'p_type_array_rec','syntaxAnalyzer.py',386),
+  ('type -> LBRACKET type COMMA INTEGER RBRACKET','type',5,'p_type_array_len','syntaxAnalyzer.py',391),
+  ('type -> BIT_AND type','type',2,'p_type_ref_rec','syntaxAnalyzer.py',396),
+  ('type -> BIT_AND MUT type','type',3,'p_type_ref_mut_rec','syntaxAnalyzer.py',401),
+  ('statement -> let_decl','statement',1,'p_statement_let','syntaxAnalyzer.py',406),
+  ('let_decl -> LET maybe_mut IDENTIFIER maybe_type maybe_init SEMICOLON','let_decl',6,'p_let_decl','syntaxAnalyzer.py',410),
+  ('maybe_mut -> MUT','maybe_mut',1,'p_maybe_mut','syntaxAnalyzer.py',427),
+  ('maybe_mut -> empty','maybe_mut',1,'p_maybe_mut','syntaxAnalyzer.py',428),
+  ('maybe_type -> COLON type','maybe_type',2,'p_maybe_type','syntaxAnalyzer.py',432),
+  ('maybe_type -> empty','maybe_type',1,'p_maybe_type','syntaxAnalyzer.py',433),
+  ('maybe_init -> ASIGNED_TO expression','maybe_init',2,'p_maybe_init','syntaxAnalyzer.py',437),
+  ('maybe_init -> empty','maybe_init',1,'p_maybe_init','syntaxAnalyzer.py',438),
+  ('element_list -> element_list COMMA expression','element_list',3,'p_element_list','syntaxAnalyzer.py',443),
+  ('element_list -> expression','element_list',1,'p_element_list','syntaxAnalyzer.py',444),
+  ('expression -> LBRACKET element_list RBRACKET','expression',3,'p_array_literal','syntaxAnalyzer.py',448),
+  ('expression -> LBRACKET expression SEMICOLON INTEGER RBRACKET','expression',5,'p_array_repeat','syntaxAnalyzer.py',452),
+  ('expression -> IDENTIFIER LBRACKET expression RBRACKET','expression',4,'p_index','syntaxAnalyzer.py',456),
+  ('expression -> IDENTIFIER LBRACKET INTEGER RANGE INTEGER RBRACKET','expression',6,'p_slice_open','syntaxAnalyzer.py',460),
+  ('expression -> IDENTIFIER LBRACKET INTEGER RANGE_INCLUSIVE INTEGER RBRACKET','expression',6,'p_slice_inclusive','syntaxAnalyzer.py',464),
+  ('expression -> IDENTIFIER NOT LBRACKET element_list RBRACKET','expression',5,'p_vec_macro','syntaxAnalyzer.py',468),
+  ('statement -> const_decl','statement',1,'p_statement_const','syntaxAnalyzer.py',473),
+  ('const_decl -> CONST IDENTIFIER COLON type ASIGNED_TO expression SEMICOLON','const_decl',7,'p_const_decl','syntaxAnalyzer.py',477),
+  ('type -> LPAREN tuple_type_list RPAREN','type',3,'p_type_tuple','syntaxAnalyzer.py',482),
+  ('tuple_type_list -> type','tuple_type_list',1,'p_tuple_type_list','syntaxAnalyzer.py',488),
+  ('tuple_type_list -> type COMMA tuple_type_list','tuple_type_list',3,'p_tuple_type_list','syntaxAnalyzer.py',489),
+  ('expression -> LPAREN tuple_value_list RPAREN','expression',3,'p_exp_tuple_literal','syntaxAnalyzer.py',496),
+  ('tuple_value_list -> expression','tuple_value_list',1,'p_tuple_value_list','syntaxAnalyzer.py',501),
+  ('tuple_value_list -> expression COMMA tuple_value_list','tuple_value_list',3,'p_tuple_value_list','syntaxAnalyzer.py',502),
+  ('expression -> expression DOT INTEGER','expression',3,'p_exp_tuple_access','syntaxAnalyzer.py',509),
+  ('statement -> FOR IDENTIFIER IN expression LBRACE program_opt RBRACE','statement',7,'p_for_loop','syntaxAnalyzer.py',514),
+  ('param_list_opt -> param_list','param_list_opt',1,'p_param_list_opt','syntaxAnalyzer.py',519),
+  ('param_list_opt -> empty','param_list_opt',1,'p_param_list_opt','syntaxAnalyzer.py',520),
+  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','syntaxAnalyzer.py',524),
+  ('param_list -> param','param_list',1,'p_param_list','syntaxAnalyzer.py',525),
+  ('param -> IDENTIFIER COLON type','param',3,'p_param','syntaxAnalyzer.py',529),
+  ('function_body -> program expression','function_body',2,'p_function_body_with_return','syntaxAnalyzer.py',534),
+  ('function_body -> expression','function_body',1,'p_function_body_with_return','syntaxAnalyzer.py',535),
+  ('function_body -> program_opt','function_body',1,'p_function_body_statements','syntaxAnalyzer.py',544),
+  ('maybe_pub -> IDENTIFIER','maybe_pub',1,'p_maybe_pub','syntaxAnalyzer.py',549),
+  ('maybe_pub -> empty','maybe_pub',1,'p_maybe_pub','syntaxAnalyzer.py',550),
+  ('function_name -> IDENTIFIER','function_name',1,'p_function_name_ident','syntaxAnalyzer.py',554),
+  ('function_name -> MAIN','function_name',1,'p_function_name_main','syntaxAnalyzer.py',558),
+  ('statement -> maybe_pub FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACE','statement',11,'p_function_with_return','syntaxAnalyzer.py',562),
+  ('statement -> maybe_pub FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACE','statement',9,'p_function_without_return','syntaxAnalyzer.py',566),
+  ('statement -> RETURN expression SEMICOLON','statement',3,'p_return','syntaxAnalyzer.py',570),
+  ('expression -> IDENTIFIER LPAREN arguments_opt RPAREN','expression',4,'p_function_call','syntaxAnalyzer.py',574),
+  ('statement -> error SEMICOLON','statement',2,'p_statement_error','syntaxAnalyzer.py',595),
+  ('statement -> error_block program_opt RBRACE','statement',3,'p_statement_error','syntaxAnalyzer.py',596),
+  ('error_block -> error LBRACE','error_block',2,'p_error_block','syntaxAnalyzer.py',603),
+  ('program_opt -> program error','program_opt',2,'p_program_opt_error','syntaxAnalyzer.py',607),
+  ('program_opt -> error','program_opt',1,'p_program_opt_error','syntaxAnalyzer.py',608),
 ]
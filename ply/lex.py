@@ -39,6 +39,20 @@ import types
 import copy
 import os
 import inspect
+import hashlib
+import tempfile
+import importlib.util
+
+# Version of the table file format written by Lexer.writetab()
+__tabversion__ = '3.10'
+
+# Permission bits for a regenerated table file. tempfile.mkstemp() creates
+# files with mode 0600; the table gets the usual 0666 minus the umask, like
+# any file written with open(), so other users (and CI caches) can read it.
+def _table_file_mode():
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
 
 # This tuple contains acceptable string types
 StringTypes = (str, bytes)
@@ -146,6 +160,115 @@ class Lexer:
             c.lexmodule = object
         return c
 
+    # ------------------------------------------------------------
+    # writetab() - Write lexer information to a table file
+    #
+    # The master regular expressions are stored as text together with
+    # the names of the rule functions for every group, so readtab() can
+    # rebuild the lexer without reflecting or validating the rules.
+    # The file is written to a temporary name and then moved in place.
+    # ------------------------------------------------------------
+    def writetab(self, lextab, outputdir='', signature=''):
+        filename = os.path.join(outputdir, lextab + '.py')
+        tabre = {}
+        for statename, lre in self.lexstatere.items():
+            titem = []
+            for (pat, func), retext, renames in zip(lre, self.lexstateretext[statename], self.lexstaterenames[statename]):
+                titem.append((retext, _funcs_to_names(func, renames)))
+            tabre[statename] = titem
+
+        parts = []
+        parts.append(f'# {lextab}.py. This file automatically created by PLY. Don\'t edit!\n')
+        parts.append(f'_tabversion   = {__tabversion__!r}\n')
+        parts.append(f'_lexsignature = {signature!r}\n')
+        parts.append(f'_lextokens    = set({tuple(sorted(self.lextokens))!r})\n')
+        parts.append(f'_lexreflags   = {int(self.lexreflags)!r}\n')
+        parts.append(f'_lexliterals  = {self.lexliterals!r}\n')
+        parts.append(f'_lexstateinfo = {self.lexstateinfo!r}\n')
+        parts.append(f'_lexstatere   = {tabre!r}\n')
+        parts.append(f'_lexstateignore = {self.lexstateignore!r}\n')
+
+        taberr = {}
+        for statename, ef in self.lexstateerrorf.items():
+            taberr[statename] = ef.__name__ if ef else None
+        parts.append(f'_lexstateerrorf = {taberr!r}\n')
+
+        tabeof = {}
+        for statename, ef in self.lexstateeoff.items():
+            tabeof[statename] = ef.__name__ if ef else None
+        parts.append(f'_lexstateeoff = {tabeof!r}\n')
+
+        fd, tmpname = tempfile.mkstemp(prefix='.' + lextab, suffix='.tmp', dir=outputdir or None)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(''.join(parts))
+            os.chmod(tmpname, _table_file_mode())
+            os.replace(tmpname, filename)
+        except BaseException:
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+            raise
+
+    # ------------------------------------------------------------
+    # readtab() - Read lexer information from a table file
+    #
+    # Returns the stored signature.  Raises ImportError if the file is
+    # missing, has a different version, or names a rule that is not
+    # present in fdict.
+    # ------------------------------------------------------------
+    def readtab(self, filename, modulename, fdict):
+        if not os.path.exists(filename):
+            raise ImportError(f'No table file {filename!r}')
+
+        spec = importlib.util.spec_from_file_location(modulename, filename)
+        lextab = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(lextab)
+
+        if getattr(lextab, '_tabversion', '0.0') != __tabversion__:
+            raise ImportError('Inconsistent PLY version')
+
+        try:
+            lexstatere = {}
+            lexstateretext = {}
+            lexstaterenames = {}
+            for statename, lre in lextab._lexstatere.items():
+                titem = []
+                txtitem = []
+                nameitem = []
+                for pat, func_name in lre:
+                    titem.append((re.compile(pat, lextab._lexreflags), _names_to_funcs(func_name, fdict)))
+                    txtitem.append(pat)
+                    nameitem.append([n[0] if n else None for n in func_name])
+                lexstatere[statename] = titem
+                lexstateretext[statename] = txtitem
+                lexstaterenames[statename] = nameitem
+
+            lexstateerrorf = {}
+            for statename, ef in lextab._lexstateerrorf.items():
+                lexstateerrorf[statename] = fdict[ef] if ef else None
+
+            lexstateeoff = {}
+            for statename, ef in lextab._lexstateeoff.items():
+                lexstateeoff[statename] = fdict[ef] if ef else None
+        except KeyError as e:
+            raise ImportError(f'Rule {e.args[0]!r} in table file is not defined')
+
+        self.lextokens      = lextab._lextokens
+        self.lexreflags     = lextab._lexreflags
+        self.lexliterals    = lextab._lexliterals
+        self.lextokens_all  = self.lextokens | set(self.lexliterals)
+        self.lexstateinfo   = lextab._lexstateinfo
+        self.lexstateignore = lextab._lexstateignore
+        self.lexstatere     = lexstatere
+        self.lexstateretext = lexstateretext
+        self.lexstaterenames = lexstaterenames
+        self.lexstateerrorf = lexstateerrorf
+        self.lexstateeoff   = lexstateeoff
+        self.begin('INITIAL')
+        return lextab._lexsignature
+
     # ------------------------------------------------------------
     # input() - Push a new string into the lexer
     # ------------------------------------------------------------
@@ -329,6 +452,36 @@ class Lexer:
 def _get_regex(func):
     return getattr(func, 'regex', func.__doc__)
 
+# -----------------------------------------------------------------------------
+# _funcs_to_names()
+#
+# Given a list of regular expression functions, this converts it to a list
+# suitable for output to a table file
+# -----------------------------------------------------------------------------
+def _funcs_to_names(funclist, namelist):
+    result = []
+    for f, name in zip(funclist, namelist):
+        if f and f[0]:
+            result.append((name, f[1]))
+        else:
+            result.append(f)
+    return result
+
+# -----------------------------------------------------------------------------
+# _names_to_funcs()
+#
+# Given a list of regular expression function names, this converts it back to
+# functions.
+# -----------------------------------------------------------------------------
+def _names_to_funcs(namelist, fdict):
+    result = []
+    for n in namelist:
+        if n and n[0]:
+            result.append((fdict[n[0]], n[1]))
+        else:
+            result.append(n)
+    return result
+
 # -----------------------------------------------------------------------------
 # get_caller_module_dict()
 #
@@ -434,6 +587,26 @@ class LexerReflect(object):
         self.validate_rules()
         return self.error
 
+    # Compute a hash over the rule set.  Any change to the tokens, states,
+    # rule names, regular expressions or their order changes the result.
+    def signature(self):
+        parts = [repr(tuple(self.tokens)), repr(self.literals), repr(int(self.reflags)),
+                 repr(sorted(self.stateinfo.items()))]
+        try:
+            for state in sorted(self.stateinfo):
+                for fname, f in self.funcsym[state]:
+                    parts.append(f'{state}:{fname}:{_get_regex(f)}')
+                for name, r in self.strsym[state]:
+                    parts.append(f'{state}:{name}={r}')
+                parts.append(f'{state}:ignore={self.ignore.get(state)!r}')
+                ef = self.errorf.get(state)
+                parts.append(f'{state}:error={ef.__name__ if ef else None}')
+                ef = self.eoff.get(state)
+                parts.append(f'{state}:eof={ef.__name__ if ef else None}')
+        except (AttributeError, TypeError):
+            pass
+        return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
     # Get the tokens map
     def get_tokens(self):
         tokens = self.ldict.get('tokens', None)
@@ -715,7 +888,8 @@ class LexerReflect(object):
 # Build all of the regular expression rules from definitions in the supplied module
 # -----------------------------------------------------------------------------
 def lex(*, module=None, object=None, debug=False, 
-        reflags=int(re.VERBOSE), debuglog=None, errorlog=None):
+        reflags=int(re.VERBOSE), debuglog=None, errorlog=None,
+        lextab=None, outputdir=None):
 
     global lexer
 
@@ -745,9 +919,31 @@ def lex(*, module=None, object=None, debug=False,
     else:
         ldict = get_caller_module_dict(2)
 
+    # Determine where the table file lives.  By default it is written next
+    # to the file that defines the rules.
+    if outputdir is None:
+        srcfile = ldict.get('__file__')
+        outputdir = os.path.dirname(srcfile) if srcfile else ''
+
     # Collect parser information from the dictionary
     linfo = LexerReflect(ldict, log=errorlog, reflags=reflags)
     linfo.get_all()
+
+    # If a table file with the same rule signature exists, rebuild the
+    # lexer from it and skip validation and master regex construction.
+    signature = linfo.signature()
+    if lextab and not debug:
+        try:
+            read_signature = lexobj.readtab(os.path.join(outputdir, lextab + '.py'), lextab, ldict)
+        except Exception:
+            read_signature = None
+        if read_signature == signature:
+            token = lexobj.token
+            input = lexobj.input
+            lexer = lexobj
+            return lexobj
+        lexobj = Lexer()
+
     if linfo.validate_all():
         raise SyntaxError("Can't build lexer")
 
@@ -845,6 +1041,13 @@ def lex(*, module=None, object=None, debug=False,
             if s not in linfo.ignore:
                 linfo.ignore[s] = linfo.ignore.get('INITIAL', '')
 
+    # Write the table file for the next start-up
+    if lextab:
+        try:
+            lexobj.writetab(lextab, outputdir, signature)
+        except IOError as e:
+            errorlog.warning(f"Couldn't write lextab module {lextab!r}. {e}")
+
     # Create global versions of the token() and input() functions
     token = lexobj.token
     input = lexobj.input
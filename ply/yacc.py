@@ -64,7 +64,11 @@
 import re
 import types
 import sys
+import os
 import inspect
+import tempfile
+import importlib.util
+from array import array
 
 #-----------------------------------------------------------------------------
 #                     === User configurable parameters ===
@@ -76,11 +80,23 @@ yaccdebug   = False            # Debugging mode.  If set, yacc generates a
                                # a 'parser.out' file in the current directory
 
 debug_file  = 'parser.out'     # Default name of the debugging file
+tab_module  = 'parsetab'       # Default name of the table module
 error_count = 3                # Number of symbols that must be shifted to leave recovery mode
 resultlimit = 40               # Size limit of results when running in debug mode.
 
 MAXINT = sys.maxsize
 
+# Version of the table file format written by write_table()
+__tabversion__ = '3.10'
+
+# Permission bits for a regenerated table file. tempfile.mkstemp() creates
+# files with mode 0600; the table gets the usual 0666 minus the umask, like
+# any file written with open(), so other users (and CI caches) can read it.
+def _table_file_mode():
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
 # This object is a stand-in for a logging object created by the
 # logging module.   PLY will use this by default to create things
 # such as the parser.out file.  If a user wants more detailed
@@ -232,9 +248,22 @@ class LRParser:
         self.errorfunc = errorf
         self.set_defaulted_states()
         self.errorok = True
-
-    def errok(self):
-        self.errorok = True
+        self.errok_shifts = 0
+        self.skip_limit = None
+        self.dense = None
+
+    # errok() leaves error recovery mode right away; errok(n) leaves it after
+    # exactly n more tokens have been shifted (while recovering), so a rule
+    # that reduces on its sync token keeps quiet the errors of the token that
+    # follows it, instead of the usual error_count symbols.
+    # skip_limit bounds how many tokens recovery may discard: after that many,
+    # the error symbol is dropped and the current token is retried as if the
+    # parser had resynchronized on it.  None means no limit; it must be >= 1.
+    def errok(self, shifts=0):
+        if shifts:
+            self.errok_shifts = shifts
+        else:
+            self.errorok = True
 
     def restart(self):
         del self.statestack[:]
@@ -283,6 +312,8 @@ class LRParser:
         defaulted_states = self.defaulted_states # Local reference to defaulted states
         pslice  = YaccProduction(None)           # Production object passed to grammar rules
         errorcount = 0                           # Used during error recovery
+        skipped = 0                              # Tokens discarded during error recovery
+        self.errok_shifts = 0
 
         if debug:
             debug.info('PLY: PARSE DEBUG START')
@@ -361,6 +392,15 @@ class LRParser:
                     # Decrease error count on successful shift
                     if errorcount:
                         errorcount -= 1
+                        skipped = 0
+                        if self.errok_shifts:
+                            if symstack[-1].type == 'error':
+                                # A new error symbol starts another recovery
+                                # whose sync rule calls errok() again
+                                self.errok_shifts = 0
+                            else:
+                                self.errok_shifts -= 1
+                                errorcount = self.errok_shifts
                     continue
 
                 if t < 0:
@@ -490,6 +530,7 @@ class LRParser:
                 # the user defined p_error() function if this is the
                 # first syntax error.  This function is only called if
                 # errorcount == 0.
+                self.errok_shifts = 0
                 if errorcount == 0 or self.errorok:
                     errorcount = error_count
                     self.errorok = False
@@ -548,6 +589,16 @@ class LRParser:
                 if lookahead.type != 'error':
                     sym = symstack[-1]
                     if sym.type == 'error':
+                        skipped += 1
+                        if self.skip_limit is not None and skipped > self.skip_limit:
+                            # Skipped too many tokens: drop the error symbol
+                            # and retry this token as a fresh start
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            skipped = 0
+                            self.errok_shifts = 1
+                            continue
                         # Hmmm. Error is on top of stack, we'll just nuke input
                         # symbol and continue
                         if tracking:
@@ -580,6 +631,642 @@ class LRParser:
             # If we'r here, something really bad happened
             raise RuntimeError('yacc: internal parser error!!!\n')
 
+    # parseopt_notrack().
+    #
+    # Fast path for the common case: the same algorithm as parse() with
+    # debug=False and tracking=False, but with the debug and tracking
+    # branches removed, table lookups and stack methods bound to locals,
+    # and the defaulted-state table checked first so that default reductions
+    # never touch the lookahead.  Error handling and recovery behave exactly
+    # like parse().
+
+    def parseopt_notrack(self, input=None, lexer=None):
+        lookahead = None                         # Current lookahead symbol
+        lookaheadstack = []                      # Stack of lookahead symbols
+        actions = self.action                    # Local reference to action table
+        goto    = self.goto                      # Local reference to goto table
+        prod    = self.productions               # Local reference to production list
+        default_reduction = self.defaulted_states.get
+        pslice  = YaccProduction(None)           # Production object passed to grammar rules
+        errorcount = 0                           # Used during error recovery
+        skipped = 0                              # Tokens discarded during error recovery
+        self.errok_shifts = 0
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
+            lexer = lex.lexer
+
+        # Set up the lexer and parser objects on pslice
+        pslice.lexer = lexer
+        pslice.parser = self
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        # Set the token function
+        get_token = self.token = lexer.token
+
+        # Set up the state and symbol stacks
+        statestack = self.statestack = []
+        symstack = self.symstack = []
+        pslice.stack = symstack
+        push_state = statestack.append
+        push_symbol = symstack.append
+        errtoken   = None
+
+        # The start state is assumed to be (0,$end)
+        push_state(0)
+        sym = YaccSymbol()
+        sym.type = '$end'
+        push_symbol(sym)
+        state = 0
+        while True:
+            t = default_reduction(state)
+            if t is None:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead = get_token()     # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                    if not lookahead:
+                        lookahead = YaccSymbol()
+                        lookahead.type = '$end'
+
+                # Check the action table
+                t = actions[state].get(lookahead.type)
+
+            if t is not None:
+                if t > 0:
+                    # shift a symbol on the stack
+                    push_state(t)
+                    state = t
+                    push_symbol(lookahead)
+                    lookahead = None
+
+                    # Decrease error count on successful shift
+                    if errorcount:
+                        errorcount -= 1
+                        skipped = 0
+                        if self.errok_shifts:
+                            if symstack[-1].type == 'error':
+                                # A new error symbol starts another recovery
+                                # whose sync rule calls errok() again
+                                self.errok_shifts = 0
+                            else:
+                                self.errok_shifts -= 1
+                                errorcount = self.errok_shifts
+                    continue
+
+                if t < 0:
+                    # reduce a symbol on the stack, emit a production
+                    p = prod[-t]
+                    pname = p.name
+                    plen  = p.len
+
+                    sym = YaccSymbol()
+                    sym.type = pname       # Production name
+                    sym.value = None
+
+                    if plen:
+                        targ = symstack[-plen-1:]
+                        targ[0] = sym
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            del symstack[-plen:]
+                            self.state = state
+                            p.callable(pslice)
+                            del statestack[-plen:]
+                            push_symbol(sym)
+                            state = goto[statestack[-1]][pname]
+                            push_state(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)    # Save the current lookahead token
+                            symstack.extend(targ[1:-1])         # Put the production slice back on the stack
+                            statestack.pop()                    # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+
+                    else:
+                        targ = [sym]
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            self.state = state
+                            p.callable(pslice)
+                            push_symbol(sym)
+                            state = goto[statestack[-1]][pname]
+                            push_state(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)    # Save the current lookahead token
+                            statestack.pop()                    # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+
+                if t == 0:
+                    return getattr(symstack[-1], 'value', None)
+
+            if t is None:
+                # Syntax error: same recovery procedure as parse()
+                self.errok_shifts = 0
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == '$end':
+                        errtoken = None               # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, 'lexer'):
+                            errtoken.lexer = lexer
+                        self.state = state
+                        tok = self.errorfunc(errtoken)
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, 'lineno'):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                            else:
+                                sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                        else:
+                            sys.stderr.write('yacc: Parse error in input. EOF\n')
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # The statestack only has 1 entry: discard the token and keep going
+                if len(statestack) <= 1 and lookahead.type != '$end':
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    del lookaheadstack[:]
+                    continue
+
+                # At the end of the file with a non-empty stack: give up
+                if lookahead.type == '$end':
+                    return
+
+                if lookahead.type != 'error':
+                    sym = symstack[-1]
+                    if sym.type == 'error':
+                        skipped += 1
+                        if self.skip_limit is not None and skipped > self.skip_limit:
+                            # Skipped too many tokens: drop the error symbol
+                            # and retry this token as a fresh start
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            skipped = 0
+                            self.errok_shifts = 1
+                            continue
+                        # Error is on top of stack, nuke the input symbol
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol and make it the new lookahead symbol
+                    t = YaccSymbol()
+                    t.type = 'error'
+
+                    if hasattr(lookahead, 'lineno'):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, 'lexpos'):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                else:
+                    symstack.pop()
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # If we'r here, something really bad happened
+            raise RuntimeError('yacc: internal parser error!!!\n')
+
+    # Dense-table driver.
+    # Same algorithm as parseopt_notrack(), but reading the integer tables
+    # built by compile_dense() instead of the per-state dictionaries.  If the
+    # lexer has a token_and_code() method and its token_names agree with the
+    # table's terminal numbering, the token codes it returns are used as
+    # column indexes directly and the token type string is never hashed.
+
+    def compile_dense(self, terminals=()):
+        self.dense = DenseLRTable(self, terminals)
+        return self.dense
+
+    def parseopt_dense(self, input=None, lexer=None):
+        table = self.dense
+        if table is None:
+            table = self.compile_dense()
+        lookahead = None                         # Current lookahead symbol
+        code = -1                                # Terminal number of the lookahead
+        lookaheadstack = []                      # Stack of lookahead symbols
+        # List versions of the dense tables (built once, see DenseLRTable.lists)
+        (action_base, action_next, action_check, goto_base, goto_next,
+         default_action, prod_lhs, prod_len) = table.lists()
+        term_index = table.term_index
+        end_code = term_index['$end']
+        error_code = term_index['error']
+        prod    = self.productions               # Local reference to production list
+        prod_name = [p.name for p in prod]       # Per-production data, indexed by -t
+        prod_func = [p.callable for p in prod]
+        pslice  = YaccProduction(None)           # Production object passed to grammar rules
+        errorcount = 0                           # Used during error recovery
+        skipped = 0                              # Tokens discarded during error recovery
+        self.errok_shifts = 0
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
+            lexer = lex.lexer
+
+        # Set up the lexer and parser objects on pslice
+        pslice.lexer = lexer
+        pslice.parser = self
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        # Set the token function
+        get_token = self.token = lexer.token
+        names = getattr(lexer, 'token_names', None)
+        if names is not None and tuple(names) == table.terminals[:len(names)]:
+            next_token = lexer.token_and_code
+        else:
+            def next_token():
+                tok = get_token()
+                return tok, (term_index.get(tok.type, -1) if tok else end_code)
+
+        # Set up the state and symbol stacks
+        statestack = self.statestack = []
+        symstack = self.symstack = []
+        pslice.stack = symstack
+        push_state = statestack.append
+        push_symbol = symstack.append
+        errtoken   = None
+
+        # The start state is assumed to be (0,$end)
+        push_state(0)
+        sym = YaccSymbol()
+        sym.type = '$end'
+        push_symbol(sym)
+        state = 0
+        while True:
+            t = default_action[state]
+            if not t:
+                if lookahead is None:
+                    if not lookaheadstack:
+                        lookahead, code = next_token()  # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                        code = term_index.get(lookahead.type, -1) if lookahead else end_code
+                    if not lookahead:
+                        lookahead = YaccSymbol()
+                        lookahead.type = '$end'
+                        code = end_code
+
+                # Check the action table.  An unknown terminal (-1) never
+                # matches: slot base-1 can't belong to this state.
+                i = action_base[state] + code
+                if action_check[i] != state:
+                    t = None
+                else:
+                    t = action_next[i]
+                    if t > 0:
+                        # shift a symbol on the stack (the common case, tested
+                        # right here instead of after the None check)
+                        push_state(t)
+                        state = t
+                        push_symbol(lookahead)
+                        lookahead = None
+
+                        # Decrease error count on successful shift
+                        if errorcount:
+                            errorcount -= 1
+                            skipped = 0
+                            if self.errok_shifts:
+                                if symstack[-1].type == 'error':
+                                    # A new error symbol starts another recovery
+                                    # whose sync rule calls errok() again
+                                    self.errok_shifts = 0
+                                else:
+                                    self.errok_shifts -= 1
+                                    errorcount = self.errok_shifts
+                        continue
+
+            if t is not None:
+                if t < 0:
+                    # reduce a symbol on the stack, emit a production
+                    plen = prod_len[-t]
+
+                    sym = YaccSymbol()
+                    sym.type = prod_name[-t]   # Production name
+                    sym.value = None
+
+                    if plen:
+                        targ = symstack[-plen-1:]
+                        targ[0] = sym
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            del symstack[-plen:]
+                            self.state = state
+                            prod_func[-t](pslice)
+                            del statestack[-plen:]
+                            push_symbol(sym)
+                            state = goto_next[goto_base[statestack[-1]] + prod_lhs[-t]]
+                            push_state(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)    # Save the current lookahead token
+                            symstack.extend(targ[1:-1])         # Put the production slice back on the stack
+                            statestack.pop()                    # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            code = error_code
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+
+                    else:
+                        targ = [sym]
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            self.state = state
+                            prod_func[-t](pslice)
+                            push_symbol(sym)
+                            state = goto_next[goto_base[statestack[-1]] + prod_lhs[-t]]
+                            push_state(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)    # Save the current lookahead token
+                            statestack.pop()                    # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            code = error_code
+                            errorcount = error_count
+                            self.errorok = False
+                        continue
+
+                if t == 0:
+                    return getattr(symstack[-1], 'value', None)
+
+            if t is None:
+                # Syntax error: same recovery procedure as parse()
+                self.errok_shifts = 0
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == '$end':
+                        errtoken = None               # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, 'lexer'):
+                            errtoken.lexer = lexer
+                        self.state = state
+                        tok = self.errorfunc(errtoken)
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            if tok:
+                                code = term_index.get(tok.type, -1)
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, 'lineno'):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                            else:
+                                sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                        else:
+                            sys.stderr.write('yacc: Parse error in input. EOF\n')
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # The statestack only has 1 entry: discard the token and keep going
+                if len(statestack) <= 1 and lookahead.type != '$end':
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    del lookaheadstack[:]
+                    continue
+
+                # At the end of the file with a non-empty stack: give up
+                if lookahead.type == '$end':
+                    return
+
+                if lookahead.type != 'error':
+                    sym = symstack[-1]
+                    if sym.type == 'error':
+                        skipped += 1
+                        if self.skip_limit is not None and skipped > self.skip_limit:
+                            # Skipped too many tokens: drop the error symbol
+                            # and retry this token as a fresh start
+                            symstack.pop()
+                            statestack.pop()
+                            state = statestack[-1]
+                            skipped = 0
+                            self.errok_shifts = 1
+                            continue
+                        # Error is on top of stack, nuke the input symbol
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol and make it the new lookahead symbol
+                    t = YaccSymbol()
+                    t.type = 'error'
+
+                    if hasattr(lookahead, 'lineno'):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, 'lexpos'):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                    code = error_code
+                else:
+                    symstack.pop()
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # If we'r here, something really bad happened
+            raise RuntimeError('yacc: internal parser error!!!\n')
+
+# -----------------------------------------------------------------------------
+#                          === Dense parsing tables ===
+#
+# The dictionaries in LRParser.action/goto are keyed by symbol name, one dict
+# per state.  DenseLRTable numbers the terminals and nonterminals with small
+# integers and stores both tables as flat array('i') rows packed with row
+# displacement ("comb") compression: row s starts at base[s], the entry for
+# column c lives at slot base[s]+c, and check[slot] == s says the slot really
+# belongs to that row.  The arrays hold no Python objects, so after a fork()
+# the children share them without touching reference counts.
+# -----------------------------------------------------------------------------
+
+def _pack_rows(rows, width):
+    # First-fit packing, densest rows first.  Returns (base, next, check).
+    # Occupied slots are kept as the bits of one big integer, so testing a
+    # base is a shift and an AND instead of a loop over the row.
+    base = array('i', bytes(4 * len(rows)))
+    used = 0
+    size = 0
+    start = {}
+    for s in sorted(range(len(rows)), key=lambda s: -len(rows[s])):
+        row = rows[s]
+        if not row:
+            continue
+        mask = 0
+        for c, _ in row:
+            mask |= 1 << c
+        # Rows with the same columns are common; start after the last one
+        b = start.get(mask, 0)
+        first = row[0][0]
+        while (used >> b) & mask:
+            # Skip ahead to the next base where the lowest column is free
+            free = ~used >> (b + 1 + first)
+            b += (free & -free).bit_length()
+        base[s] = start[mask] = b
+        used |= mask << b
+        size = max(size, b + row[-1][0] + 1)
+
+    # One extra width of padding so base+column never runs off the end, and
+    # a trailing -1 so that column -1 (unknown terminal) with base 0 fails.
+    size += width + 1
+    nxt = array('i', bytes(4 * size))
+    check = array('i', [-1]) * size
+    for s, row in enumerate(rows):
+        b = base[s]
+        for c, value in row:
+            nxt[b + c] = value
+            check[b + c] = s
+    return base, nxt, check
+
+class DenseLRTable(object):
+    def __init__(self, parser, terminals=()):
+        # Terminal numbering: the given order first (so a lexer's own token
+        # codes can be used as is), then whatever else the table mentions.
+        names = list(terminals)
+        seen = set(names)
+        for row in parser.action.values():
+            for name in row:
+                if name not in seen:
+                    seen.add(name)
+                    names.append(name)
+        for name in ('$end', 'error'):
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+        self.terminals = tuple(names)
+        self.term_index = dict((name, i) for i, name in enumerate(names))
+
+        nonterminals = []
+        seen = set()
+        for p in parser.productions:
+            if p.name not in seen:
+                seen.add(p.name)
+                nonterminals.append(p.name)
+        self.nonterminals = tuple(nonterminals)
+        self.nonterm_index = dict((name, i) for i, name in enumerate(nonterminals))
+
+        nstates = max(parser.action) + 1 if parser.action else 0
+        action_rows = [[] for _ in range(nstates)]
+        for state, row in parser.action.items():
+            # None entries (nonassoc) are errors, same as a missing entry
+            action_rows[state] = sorted((self.term_index[name], t) for name, t in row.items()
+                                        if t is not None)
+        goto_rows = [[] for _ in range(nstates)]
+        for state, row in parser.goto.items():
+            goto_rows[state] = sorted((self.nonterm_index[name], g) for name, g in row.items())
+
+        self.action_base, self.action_next, self.action_check = _pack_rows(action_rows, len(names))
+        self.goto_base, self.goto_next, self.goto_check = _pack_rows(goto_rows, len(nonterminals))
+
+        # Defaulted reductions are always negative, so 0 means "none"
+        self.default_action = array('i', bytes(4 * nstates))
+        for state, t in parser.defaulted_states.items():
+            self.default_action[state] = t
+        self.prod_lhs = array('i', [self.nonterm_index[p.name] for p in parser.productions])
+        self.prod_len = array('i', [p.len for p in parser.productions])
+        self._lists = None
+
+    def action(self, state, terminal):
+        # Action for a terminal name, or None (same as LRParser.action[state].get())
+        code = self.term_index.get(terminal)
+        if code is None:
+            return None
+        i = self.action_base[state] + code
+        return self.action_next[i] if self.action_check[i] == state else None
+
+    def goto(self, state, nonterminal):
+        i = self.goto_base[state] + self.nonterm_index[nonterminal]
+        return self.goto_next[i] if self.goto_check[i] == state else None
+
+    def lists(self):
+        # The arrays parseopt_dense() reads, as lists.  Indexing an array('i')
+        # builds a new int object for every large value; a list of the same
+        # ints doesn't.  Converted once, on the first parse in this process,
+        # so fork()ed children keep sharing the arrays until they parse.
+        if self._lists is None:
+            self._lists = tuple(a.tolist() for a in (
+                self.action_base, self.action_next, self.action_check,
+                self.goto_base, self.goto_next, self.default_action,
+                self.prod_lhs, self.prod_len))
+        return self._lists
+
+    def nbytes(self):
+        # Bytes used by the integer arrays
+        return sum(a.itemsize * len(a) for a in (
+            self.action_base, self.action_next, self.action_check,
+            self.goto_base, self.goto_next, self.goto_check,
+            self.default_action, self.prod_lhs, self.prod_len))
+
+
 # -----------------------------------------------------------------------------
 #                          === Grammar Representation ===
 #
@@ -1300,6 +1987,83 @@ def traverse(x, N, stack, F, X, R, FP):
 class LALRError(YaccError):
     pass
 
+# -----------------------------------------------------------------------------
+# class MiniProduction:
+#
+# Stripped down version of Production used to represent productions that
+# were loaded from a table file.  No LR items or symbol sets are needed to
+# drive the parser, only the name, length, and action function.
+# -----------------------------------------------------------------------------
+
+class MiniProduction(object):
+    def __init__(self, str, name, len, func, file, line):
+        self.name     = name
+        self.len      = len
+        self.func     = func
+        self.callable = None
+        self.file     = file
+        self.line     = line
+        self.str      = str
+
+    def __str__(self):
+        return self.str
+
+    def __repr__(self):
+        return 'MiniProduction(%s)' % self.str
+
+    # Bind the production function name to a callable
+    def bind(self, pdict):
+        if self.func:
+            self.callable = pdict[self.func]
+
+# -----------------------------------------------------------------------------
+#                           == LRTableCache ==
+#
+# Parsing tables loaded from a table module written by LRTable.write_table().
+# Only the attributes needed by LRParser are provided.  Loading does not
+# touch the grammar at all.
+# -----------------------------------------------------------------------------
+
+class LRTableCache:
+    def __init__(self):
+        self.lr_action      = None
+        self.lr_goto        = None
+        self.lr_productions = None
+        self.lr_method      = None
+        self.signature      = None
+
+    # Load the tables from a Python module.  Returns the stored signature or
+    # raises ImportError if the module is missing or has a different version.
+    def read_table(self, filename, modulename):
+        if not os.path.exists(filename):
+            raise ImportError('No table file %r' % filename)
+
+        spec = importlib.util.spec_from_file_location(modulename, filename)
+        parsetab = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(parsetab)
+
+        if getattr(parsetab, '_tabversion', None) != __tabversion__:
+            raise ImportError('yacc table file version is out of date')
+
+        self.lr_action = parsetab._lr_action
+        self.lr_goto = parsetab._lr_goto
+        self.lr_productions = [MiniProduction(*p) for p in parsetab._lr_productions]
+        self.lr_method = parsetab._lr_method
+        self.signature = parsetab._lr_signature
+        return self.signature
+
+    # Check that every action function named in the table exists in pdict
+    def check_callables(self, pdict):
+        for p in self.lr_productions:
+            if p.func and not callable(pdict.get(p.func)):
+                return False
+        return True
+
+    # Bind all production function names to callable objects in pdict
+    def bind_callables(self, pdict):
+        for p in self.lr_productions:
+            p.bind(pdict)
+
 
 # -----------------------------------------------------------------------------
 #                             == LRTable ==
@@ -1922,6 +2686,113 @@ class LRTable:
             goto[st] = st_goto
             st += 1
 
+    # -----------------------------------------------------------------------------
+    # write_table()
+    #
+    # This function writes the LR parsing tables to a Python module that can be
+    # loaded later by LRTableCache.read_table().  The file is first written to a
+    # temporary file in the same directory and then moved into place, so a
+    # concurrent reader never sees a partially written table.
+    # -----------------------------------------------------------------------------
+
+    def write_table(self, tabmodule, outputdir='', signature=''):
+        filename = os.path.join(outputdir, tabmodule + '.py')
+        parts = []
+        parts.append('''# %s.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = %r
+
+_lr_method = %r
+
+_lr_signature = %r
+    ''' % (tabmodule, __tabversion__, 'LALR', signature))
+
+        # Factor out names to try and make smaller
+        items = {}
+        for s, nd in self.lr_action.items():
+            for name, v in nd.items():
+                i = items.get(name)
+                if not i:
+                    i = ([], [])
+                    items[name] = i
+                i[0].append(s)
+                i[1].append(v)
+
+        parts.append('\n_lr_action_items = {')
+        for k, v in items.items():
+            parts.append('%r:([' % k)
+            for i in v[0]:
+                parts.append('%r,' % i)
+            parts.append('],[')
+            for i in v[1]:
+                parts.append('%r,' % i)
+            parts.append(']),')
+        parts.append('}\n')
+
+        parts.append('''
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+''')
+
+        # Factor out names to try and make smaller
+        items = {}
+        for s, nd in self.lr_goto.items():
+            for name, v in nd.items():
+                i = items.get(name)
+                if not i:
+                    i = ([], [])
+                    items[name] = i
+                i[0].append(s)
+                i[1].append(v)
+
+        parts.append('\n_lr_goto_items = {')
+        for k, v in items.items():
+            parts.append('%r:([' % k)
+            for i in v[0]:
+                parts.append('%r,' % i)
+            parts.append('],[')
+            for i in v[1]:
+                parts.append('%r,' % i)
+            parts.append(']),')
+        parts.append('}\n')
+
+        parts.append('''
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+''')
+
+        # Write production table
+        parts.append('_lr_productions = [\n')
+        for p in self.lr_productions:
+            if p.func:
+                parts.append('  (%r,%r,%d,%r,%r,%d),\n' % (p.str, p.name, p.len,
+                                                         p.func, os.path.basename(p.file), p.line))
+            else:
+                parts.append('  (%r,%r,%d,None,None,None),\n' % (str(p), p.name, p.len))
+        parts.append(']\n')
+
+        fd, tmpname = tempfile.mkstemp(prefix='.' + tabmodule, suffix='.tmp', dir=outputdir or None)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(''.join(parts))
+            os.chmod(tmpname, _table_file_mode())
+            os.replace(tmpname, filename)
+        except BaseException:
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+            raise
+
 # -----------------------------------------------------------------------------
 #                            === INTROSPECTION ===
 #
@@ -2270,7 +3141,8 @@ class ParserReflect(object):
 
 def yacc(*, debug=yaccdebug, module=None, start=None,
          check_recursion=True, optimize=False, debugfile=debug_file,
-         debuglog=None, errorlog=None):
+         debuglog=None, errorlog=None, tabmodule=tab_module,
+         outputdir=None, write_tables=True):
 
     # Reference to the parsing method of the last built parser
     global parse
@@ -2292,6 +3164,12 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
     else:
         pdict = get_caller_module_dict(2)
 
+    # Determine where the table module lives.  By default it is written next
+    # to the file that defines the grammar.
+    if outputdir is None:
+        srcfile = pdict.get('__file__')
+        outputdir = os.path.dirname(srcfile) if srcfile else ''
+
     # Set start symbol if it's specified directly using an argument
     if start is not None:
         pdict['start'] = start
@@ -2303,6 +3181,22 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
     if pinfo.error:
         raise YaccError('Unable to build parser')
 
+    # Compute the grammar signature and try to reuse previously written tables.
+    # On a hit no Grammar object is created and no LR tables are generated.
+    signature = pinfo.signature()
+
+    if tabmodule and not debug:
+        lr = LRTableCache()
+        try:
+            read_signature = lr.read_table(os.path.join(outputdir, tabmodule + '.py'), tabmodule)
+        except Exception:
+            read_signature = None
+        if read_signature == signature and lr.check_callables(pinfo.pdict):
+            lr.bind_callables(pinfo.pdict)
+            parser = LRParser(lr, pinfo.error_func)
+            parse = parser.parse
+            return parser
+
     if debuglog is None:
         if debug:
             try:
@@ -2474,6 +3368,13 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
                 errorlog.warning('Rule (%s) is never reduced', rejected)
                 warned_never.append(rejected)
 
+    # Write the table file for the next start-up
+    if tabmodule and write_tables:
+        try:
+            lr.write_table(tabmodule, outputdir, signature)
+        except IOError as e:
+            errorlog.warning("Couldn't create %r. %s" % (tabmodule, e))
+
     # Build the parser
     lr.bind_callables(pinfo.pdict)
     parser = LRParser(lr, pinfo.error_func)
@@ -1,101 +1,253 @@
 # Analizador Semántico Simple para Rust
-# Sin clases, solo funciones para validar reglas semánticas
+# Funciones para validar reglas semánticas; el estado de cada análisis vive en
+# un SemanticState para poder analizar varios programas a la vez
 
+import contextvars
 import datetime
 import os
-from syntaxAnalyzer import parser, lexer, ERRORS as PARSER_ERRORS
+import time
+import weakref
+import astNodes
+import lexicalAnalyzer
+from astArena import AstArena, NodeView, VIEW_CLASSES
+from syntaxAnalyzer import SyntaxSession
+
+# Un nodo del AST puede ser un objeto de astNodes o una vista sobre una arena
+Node = (astNodes.Node, NodeView)
+
+
+# ============== TIPOS ==============
+# Cada tipo es un único SemType: sem_type("num") devuelve siempre el mismo
+# objeto, así que dos tipos se comparan con `is`. El texto del tipo es su
+# nombre ("num", "array<num>"...), el mismo que aparece en los mensajes.
+# Las tablas no mantienen vivos los tipos: un tipo sale de la tabla cuando ya
+# no lo usa nadie (los de abajo quedan vivos por ser globales del módulo), y
+# si vuelve a aparecer se crea otro que es igual de único mientras viva.
+
+class SemType:
+    """Un tipo del análisis semántico. Se crean solo con sem_type()/array_type()."""
+    __slots__ = ('name', 'elem', '__weakref__')
+
+    def __init__(self, name, elem=None):
+        self.name = name
+        self.elem = elem      # tipo de los elementos de un array<T>
+
+    def __str__(self):
+        return self.name
+
+    __repr__ = __str__
+
+_TYPES = weakref.WeakValueDictionary()
+
+def sem_type(name, elem=None):
+    """El SemType con ese nombre; lo crea la primera vez."""
+    t = _TYPES.get(name)
+    if t is None:
+        t = _TYPES.setdefault(name, SemType(name, elem))
+    return t
+
+_ARRAY_TYPES = weakref.WeakValueDictionary()
+
+def array_type(elem):
+    """array<elem>, también único para cada tipo de elemento."""
+    t = _ARRAY_TYPES.get(elem)
+    if t is None:
+        t = _ARRAY_TYPES.setdefault(elem, sem_type(f"array<{elem}>", elem))
+    return t
+
+# Desconocido: es compatible con cualquier otro tipo
+UNKNOWN = sem_type("unknown")
+NUM = sem_type("num")
+BOOL = sem_type("bool")
+STRING = sem_type("string")
+CHAR = sem_type("char")
+TUPLE = sem_type("tuple")
+HASHMAP = sem_type("hashmap")
+ARRAY = sem_type("array")
+VECTOR = sem_type("vector")
+RANGE = sem_type("range")
+
+
+class Symbol:
+    """Registro de una variable en la tabla de símbolos."""
+    __slots__ = ('mutable', 'initialized', 'type')
+
+    def __init__(self, mutable, initialized, type=UNKNOWN):
+        self.mutable = mutable
+        self.initialized = initialized
+        self.type = type
+
+    def __repr__(self):
+        return f"Symbol(mutable={self.mutable}, initialized={self.initialized}, type={self.type})"
+
+
+_UNBOUND = object()
+
+class SymbolTable(dict):
+    """
+    {nombre: registro} con scopes anidados. Es un solo dict con los símbolos
+    visibles más un registro para deshacer: enter_scope() anota dónde
+    empieza el scope y exit_scope() deshace lo que se declaró desde ahí
+    (borra los nombres nuevos y vuelve a los que habían quedado tapados).
+    Entrar cuesta O(1) y salir O(símbolos declarados adentro); buscar sigue
+    siendo una búsqueda en el dict. Los símbolos se declaran siempre con
+    table[nombre] = registro (update()/setdefault() no se registran).
+    `declared` guarda todo lo que se declaró, también en los scopes ya
+    cerrados (cuerpos de funciones, variables de los for...), con el último
+    registro de cada nombre: es lo que lista el reporte.
+    """
+    __slots__ = ('_undo', '_marks', 'declared')
+
+    def __init__(self):
+        super().__init__()
+        self._undo = []    # (nombre, registro anterior o _UNBOUND)
+        self._marks = []   # largo de _undo al entrar a cada scope abierto
+        self.declared = {} # {nombre: último registro declarado}, en orden de aparición
+
+    def __setitem__(self, name, record):
+        # En el scope global no hay nada que deshacer
+        if self._marks:
+            self._undo.append((name, dict.get(self, name, _UNBOUND)))
+        dict.__setitem__(self, name, record)
+        self.declared[name] = record
+
+    def enter_scope(self):
+        self._marks.append(len(self._undo))
+
+    def exit_scope(self):
+        undo = self._undo
+        mark = self._marks.pop()
+        while len(undo) > mark:
+            name, previous = undo.pop()
+            if previous is _UNBOUND:
+                dict.__delitem__(self, name)
+            else:
+                dict.__setitem__(self, name, previous)
+
+
+class SemanticState:
+    """
+    Tablas de un análisis semántico: errores, símbolos y pila de funciones.
+    `lines` (un lexicalAnalyzer.LineIndex del código) permite ubicar los
+    errores; `shifts`/`shift` corrigen el lexpos de las sentencias que una
+    IncrementalSyntaxSession reutilizó (ver statement_shifts()). `profile`
+    es un KindProfile si se pidió medir el tiempo por tipo de nodo.
+    """
+    __slots__ = ('errors', 'symbol_table', 'function_stack', 'lines', 'shifts', 'shift', 'profile')
+
+    def __init__(self):
+        self.errors = []
+        self.symbol_table = SymbolTable()  # {nombre: Symbol}
+        self.function_stack = [] # {'name' : str, 'ret_type' _ str[None, 'found_return': bool]}
+        self.lines = None
+        self.shifts = None
+        self.shift = 0
+        self.profile = None
+
+# Estado del análisis en curso. Cada hilo o tarea asyncio que usa una
+# SemanticSession ve su propio estado; el código que llama directo a las
+# funciones usa el estado por defecto, como antes.
+_current_state = contextvars.ContextVar('semantic_state', default=SemanticState())
+
+def current_state():
+    """Devuelve el SemanticState del análisis en curso."""
+    return _current_state.get()
+
+# Compatibilidad: `semanticAnalyzer.errors`, `.symbol_table` y
+# `.function_stack` devuelven las tablas del análisis en curso
+def __getattr__(name):
+    if name in SemanticState.__slots__:
+        return getattr(_current_state.get(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Variables globales para el análisis
-errors = []
-symbol_table = {}  # {nombre: {'mutable': bool, 'initialized': bool, 'type': 'num', 'bool', 'String (por incluir)','unknown'}}
-function_stack = [] # {'name' : str, 'ret_type' _ str[None, 'found_return': bool]}
 type_map = {
-    "i32":"num","u64":"num","f64":"num",
-    "u8":"num","u16":"num","u32":"num",
-    "bool":"bool","String":"string","str":"string",
-    "char":"char","tuple":"tuple","HashMap":"hashmap"
+    "i32":NUM,"u64":NUM,"f64":NUM,
+    "u8":NUM,"u16":NUM,"u32":NUM,
+    "bool":BOOL,"String":STRING,"str":STRING,
+    "char":CHAR,"tuple":TUPLE,"HashMap":HASHMAP
 }
 unsigned_tokens = {"u8","u16","u32","u64","u128","usize"}
 
 
-def add_error(msg):
-    """Agrega un error semántico"""
+def add_error(msg, node=None):
+    """
+    Agrega un error semántico. Si se pasa el nodo y se conoce el código, el
+    mensaje indica la línea y la columna donde empieza el nodo.
+    """
+    state = _current_state.get()
     error_msg = f"[SEMANTIC ERROR] {msg}"
-    errors.append(error_msg) 
+    if node is not None and state.lines is not None:
+        lexpos = node.lexpos
+        if lexpos >= 0:
+            line, column = state.lines.position(lexpos + state.shift)
+            error_msg = f"{error_msg} (line {line}, column {column})"
+    state.errors.append(error_msg)
 
 def reset_analyzer():
     """Reinicia el estado del analizador"""
-    global errors, symbol_table
-    errors = []
-    symbol_table = {}
+    state = _current_state.get()
+    state.errors = []
+    state.symbol_table = SymbolTable()
 
 
 # ============== REGLA 1: Variables deben estar inicializadas antes de usarse ==============
 
-def check_variable_initialized(var_name):
+def check_variable_initialized(var_name, node=None):
     """Verifica si una variable está inicializada antes de usarse"""
+    symbol_table = _current_state.get().symbol_table
     if var_name not in symbol_table:
-        add_error(f"Variable '{var_name}' is not declared")
+        add_error(f"Variable '{var_name}' is not declared", node)
         return False
-    if not symbol_table[var_name]['initialized']:
-        add_error(f"Variable '{var_name}' used before initialization")
+    if not symbol_table[var_name].initialized:
+        add_error(f"Variable '{var_name}' used before initialization", node)
         return False   
     return True
 
 
 # ============== REGLA 2: No se puede asignar a variables inmutables ==============
 
-def check_variable_mutable(var_name):
+def check_variable_mutable(var_name, node=None):
     """Verifica si se puede asignar a una variable (debe ser mutable)"""
+    symbol_table = _current_state.get().symbol_table
     if var_name not in symbol_table:
-        add_error(f"Variable '{var_name}' is not declared")
+        add_error(f"Variable '{var_name}' is not declared", node)
         return False
-    if not symbol_table[var_name]['mutable']:
-        add_error(f"Cannot assign to immutable variable '{var_name}'")
+    if not symbol_table[var_name].mutable:
+        add_error(f"Cannot assign to immutable variable '{var_name}'", node)
         return False
     return True
 
 # Tipos y literales auxiliares
 def is_unsigned_type(t):
     """Verifica si un tipo AST corresponde a un entero sin signo."""
-    if isinstance(t, str):
-        return t in unsigned_tokens
-    if isinstance(t, tuple) and len(t) > 1:
-        tag = t[0]
-        if tag in ("type_ref", "type_ref_mut"):
-            return is_unsigned_type(t[1])
-        if tag in ("type_array", "type_array_len"):
-            return is_unsigned_type(t[1])
-        if tag == "type_tuple":
-            return False
-        if isinstance(t[1], str):
-            return t[1] in unsigned_tokens
-    return False
+    return resolve_type(t).unsigned
 
 def is_negative_literal(expr):
     """Detecta si la expresión es un literal numérico negativo simple."""
-    if not isinstance(expr, tuple):
+    if not isinstance(expr, Node):
         return False
-    if expr[0] == "uminus" and isinstance(expr[1], tuple) and expr[1][0] == "num":
+    if expr.tag == "uminus" and isinstance(expr.expr, Node) and expr.expr.tag == "num":
         return True
-    if expr[0] == "num" and isinstance(expr[1], (int, float)) and expr[1] < 0:
+    if expr.tag == "num" and isinstance(expr.value, (int, float)) and expr.value < 0:
         return True
     return False
 
-def check_type_compatibility(declared_type, expr_type, var_name):
+def check_type_compatibility(declared_type, expr_type, var_name, node=None):
     """
     Verifica que el tipo de la expresión sea compatible con el tipo declarado.
     declared_type: tipo declarado (ej: 'num', 'bool', 'string')
     expr_type: tipo inferido de la expresión (ej: 'num', 'bool', 'string')
     var_name: nombre de la variable (para el mensaje de error)
+    node: nodo donde se ubica el error (opcional)
     """
-    if declared_type == "unknown" or expr_type == "unknown":
+    if declared_type is UNKNOWN or expr_type is UNKNOWN:
         return True  # No podemos verificar si alguno es desconocido
     
-    if declared_type != expr_type:
+    if declared_type is not expr_type:
         add_error(
             f"Type mismatch in variable '{var_name}': "
-            f"expected '{declared_type}', but got '{expr_type}'"
+            f"expected '{declared_type}', but got '{expr_type}'",
+            node
         )
         return False
     
@@ -109,432 +261,674 @@ def type_name_from_ast(t):
     Convierte el nodo de tipo del AST en un nombre sencillo: 'num', 'bool' o 'unknown'.
     Ajusta esto a cómo tu parser represente los tipos.
     """
-    if isinstance(t, str): 
-        return type_map.get(t, t)
-    if isinstance(t, tuple) and len(t) > 1:
-        tag = t[0]
-        if tag in ("type_ref", "type_ref_mut"):
-            return type_name_from_ast(t[1])
-        if tag == "type_array":
-            inner = type_name_from_ast(t[1])
-            return f"array<{inner}>"
-        if tag == "type_array_len":
-            inner = type_name_from_ast(t[1])
-            return f"array<{inner}>"
-        if tag == "type_tuple":
-            return "tuple"
-        if isinstance(t[1], str):
-            return type_map.get(t[1], "unknown")
-    return "unknown"
-
-def combine_arimethic_types(op, left_t, right_t):
+    return resolve_type(t).sem
+
+# ===== TIPOS DEL AST =====
+# Cada tipo escrito en el código (u8, [i32], &mut [u8; 4], (i32, bool)...)
+# se resuelve a un TypeTerm canónico: uno solo por estructura, armado con
+# los términos de sus partes. El término guarda ya calculadas las dos
+# preguntas que hace el análisis (el SemType y si es sin signo), así que
+# cada parte del tipo es una búsqueda en un diccionario y no un recorrido.
+# Igual que con los SemType, la tabla no los mantiene vivos: a un término lo
+# sostienen los nodos de tipo que lo tienen en `resolved` y los términos que
+# lo usan como parte, así que los `[T, N]` de un programa ya analizado no
+# quedan ocupando lugar.
+
+class TypeTerm:
+    """Tipo tal como se escribió. Se crean solo con _term(); hay uno por estructura."""
+    __slots__ = ('key', 'sem', 'unsigned', '__weakref__')
+
+    def __init__(self, key, sem, unsigned):
+        self.key = key            # (constructor, partes...): la estructura del tipo
+        self.sem = sem            # SemType que usan las reglas
+        self.unsigned = unsigned  # entero sin signo (también a través de & y [])
+
+    def __repr__(self):
+        return f"TypeTerm({self.key[0]}, {self.sem})"
+
+_TERMS = weakref.WeakValueDictionary()
+
+def _term(key, sem, unsigned):
+    """El término de esa estructura; se crea la primera vez."""
+    term = _TERMS.get(key)
+    if term is None:
+        term = _TERMS.setdefault(key, TypeTerm(key, sem, unsigned))
+    return term
+
+def _name_term(name):
+    # Nombre suelto (formato viejo): si no es conocido, el nombre es el tipo
+    term = _TERMS.get(("name", name))
+    if term is None:
+        term = _term(("name", name), type_map.get(name) or sem_type(name), name in unsigned_tokens)
+    return term
+
+def _base_term(name):
+    term = _TERMS.get(("type", name))
+    if term is None:
+        term = _term(("type", name), type_map.get(name, UNKNOWN), name in unsigned_tokens)
+    return term
+
+def _compose_term(node, part):
+    """Término de un tipo de una parte ([T], [T, N], &T, &mut T) a partir del de la parte."""
+    tag = node.tag
+    if tag == "type_array_len":
+        key = ("array_len", part, node.length)
+    else:
+        key = (tag, part)
+    term = _TERMS.get(key)
+    if term is None:
+        # Arrays: array<T>; referencias: el mismo tipo que apuntan
+        sem = part.sem if tag in ("type_ref", "type_ref_mut") else array_type(part.sem)
+        term = _term(key, sem, part.unsigned)
+    return term
+
+def _tuple_term(parts):
+    key = ("tuple",) + tuple(parts)
+    term = _TERMS.get(key)
+    return term if term is not None else _term(key, TUPLE, False)
+
+_UNKNOWN_TERM = TypeTerm(("unknown",), UNKNOWN, False)
+
+# Campo con la parte de cada tipo de una parte; las tuplas tienen `elems`
+_TYPE_PART = {
+    "type_array": "elem",
+    "type_array_len": "elem",
+    "type_ref": "target",
+    "type_ref_mut": "target",
+}
+
+# Clases de nodo con el slot `resolved` (ver astNodes)
+_TYPE_CLASSES = frozenset(cls for cls in astNodes.NODE_CLASSES if 'resolved' in cls.__slots__)
+
+def _known_term(t):
+    """
+    El término de t si sale sin recorrerlo: ya resuelto, un tipo base o un
+    nombre suelto. None si hay que recorrerlo.
+    """
+    term = getattr(t, "resolved", None)
+    if term is not None:
+        return term
+    if isinstance(t, str):
+        return _name_term(t)
+    if not isinstance(t, Node):
+        return _UNKNOWN_TERM
+    tag = t.tag
+    if tag == "type":
+        term = _base_term(t.name)
+    elif tag not in _TYPE_PART and tag != "type_tuple":
+        return _UNKNOWN_TERM
+    return term
+
+def resolve_type(t):
+    """
+    TypeTerm del tipo del AST (un nodo de tipo o un nombre suelto). Los
+    nodos de tipo los comparte el parser dentro de cada parseo (ver
+    syntaxAnalyzer._shared_type) y el término queda guardado en el nodo
+    (`resolved`), así que cada estructura se resuelve una vez por parseo y
+    después es leer un atributo.
+    """
+    term = _known_term(t)
+    if term is None:
+        field = _TYPE_PART.get(t.tag)
+        part = _known_term(getattr(t, field)) if field is not None else None
+        # Un nivel ([i32], &u8, ...): sin pila; si no, el recorrido completo
+        term = _compose_term(t, part) if part is not None else _resolve_nested(t)
+    if type(t) in _TYPE_CLASSES:
+        t.resolved = term
+    return term
+
+def _resolve_nested(t):
+    """resolve_type de un tipo anidado, con una pila propia en vez de recursión."""
+    # Pila de tareas: (nodo, None) = visitar; (nodo, n) = armar con los
+    # últimos n términos de `done`
+    done = []
+    stack = [(t, None)]
+    while stack:
+        node, count = stack.pop()
+        if count is None:
+            term = _known_term(node)
+            if term is not None:
+                done.append(term)
+            elif node.tag == "type_tuple":
+                stack.append((node, len(node.elems)))
+                stack.extend((part, None) for part in reversed(node.elems))
+            else:
+                stack.append((node, 1))
+                stack.append((getattr(node, _TYPE_PART[node.tag]), None))
+            continue
+        if node.tag == "type_tuple":
+            term = _tuple_term(done[len(done) - count:])
+            del done[len(done) - count:]
+        else:
+            term = _compose_term(node, done.pop())
+        if type(node) in _TYPE_CLASSES:
+            node.resolved = term
+        done.append(term)
+    return done[0]
+
+def combine_arimethic_types(op, left_t, right_t, node=None):
     """
     Combina operaciones ariméticas en los casos de booleanos
     """
-    if left_t == "bool" or right_t == "bool":
-        add_error(f"Invalid operands for arithmetic operator '{op}' (SEM-TYPE-MISMATCH: bool is not allowed here)")
-        return "unknown"
-    if left_t == "num" and right_t == "num":
-        return "num"
-    return "unknown"
-
-def combine_logic_types(left_t, right_t, op):
+    if left_t is BOOL or right_t is BOOL:
+        add_error(f"Invalid operands for arithmetic operator '{op}' (SEM-TYPE-MISMATCH: bool is not allowed here)", node)
+        return UNKNOWN
+    if left_t is NUM and right_t is NUM:
+        return NUM
+    return UNKNOWN
+
+def combine_logic_types(left_t, right_t, op, node=None):
     """
     Reglas para && y ||. Ambos deberían ser bool si se conocen.
     """
-    if left_t not in ("bool", "unknown"):
+    if left_t is not BOOL and left_t is not UNKNOWN:
         add_error(
-            f"Left operand of '{op}' should be boolean, got {left_t} (SEM-TYPE-MISMATCH)"
+            f"Left operand of '{op}' should be boolean, got {left_t} (SEM-TYPE-MISMATCH)",
+            node
         )
-    if right_t not in ("bool", "unknown"):
+    if right_t is not BOOL and right_t is not UNKNOWN:
         add_error(
-            f"Right operand of '{op}' should be boolean, got {right_t} (SEM-TYPE-MISMATCH)"
+            f"Right operand of '{op}' should be boolean, got {right_t} (SEM-TYPE-MISMATCH)",
+            node
         )
-    return "bool"
+    return BOOL
 
-def combine_rel_types(left_t, right_t, op):
+def combine_rel_types(left_t, right_t, op, node=None):
     """
     Reglas para ==, !=, <, >, <=, >=.
     Si ambos tipos son conocidos y distintos, marcamos error.
     """
-    if left_t != "unknown" and right_t != "unknown" and left_t != right_t:
+    if left_t is not UNKNOWN and right_t is not UNKNOWN and left_t is not right_t:
         add_error(
             f"Incompatible types for comparison '{op}': {left_t} and {right_t} "
-            f"(SEM-TYPE-MISMATCH)"
+            f"(SEM-TYPE-MISMATCH)",
+            node
         )
     # Comparaciones devuelven bool
-    return "bool"
+    return BOOL
+
+# ============== DESPACHO POR TIPO DE NODO ==============
+# Cada tipo de nodo tiene un solo handler, registrado en una tabla
+# {clase del nodo: handler} (las clases de astNodes y las vistas de la arena
+# de cada kind). Elegir el handler es una búsqueda en un diccionario y no una
+# cadena de comparaciones de etiquetas.
+#
+# Las hojas (variables, literales, números, `let x;`) son funciones que
+# devuelven su tipo. Los nodos con hijos son generadores: hacen `yield` de
+# cada hijo, reciben su tipo y al final devuelven (return) el del nodo.
+# Así el handler no decide cómo se recorren los hijos, y las mismas reglas
+# las corren dos recorridos:
+#
+#   _visit()  recursivo; es el normal. Pasado _MAX_DEPTH niveles sigue con
+#             _run(), así el código muy anidado no agota la pila de Python.
+#   _run()    con una pila explícita de los handlers en curso. Lo usan el
+#             código muy anidado y KindProfile, que mide cada paso.
+#
+# Una AstArena se recorre con las mismas tablas a través de sus vistas
+# (astArena.NodeView), que leen los campos de los arrays.
+
+class HandlerTable(dict):
+    """{clase de nodo: handler}; para cualquier otro valor (None, str...) da `default`."""
+    __slots__ = ('default',)
+
+    def __init__(self, handlers, default):
+        super().__init__(handlers)
+        self.default = default
+
+    def __missing__(self, key):
+        return self.default
+
+def _handler_table(handlers, default):
+    """Arma la tabla a partir de {etiqueta: handler}."""
+    table = {}
+    for tag, handler in handlers.items():
+        kind = astNodes.KIND_BY_TAG[tag]
+        table[astNodes.NODE_CLASSES[kind]] = handler
+        table[VIEW_CLASSES[kind]] = handler
+    return HandlerTable(table, default)
+
+_MAX_DEPTH = 200
+
+def _visit(node, state, depth=0):
+    """Analiza node (expresión o sentencia) y devuelve su tipo."""
+    leaves = LEAF_TYPES
+    leaf = leaves[type(node)]
+    if leaf is not None:
+        return leaf(node, state)
+    if depth > _MAX_DEPTH:
+        return _run(node, state)
+    steps = HANDLERS[type(node)](node, state)
+    send = steps.send
+    depth += 1
+    try:
+        child = send(None)
+        while True:
+            leaf = leaves[type(child)]
+            child = send(leaf(child, state) if leaf is not None else _visit(child, state, depth))
+    except StopIteration as done:
+        return done.value
+
+def _run(node, state):
+    """
+    Como _visit, con una pila explícita: la pila guarda los handlers en
+    curso y el hijo que pide el de arriba se empieza en el mismo loop. La
+    profundidad del código no gasta pila de Python.
+    """
+    leaves, handlers = LEAF_TYPES, HANDLERS
+    stack = []
+    while True:
+        leaf = leaves[type(node)]
+        if leaf is not None:
+            value = leaf(node, state)
+        else:
+            stack.append(handlers[type(node)](node, state))
+            value = None
+        # Devolver el tipo hacia arriba hasta que un handler pida otro hijo
+        while stack:
+            try:
+                node = stack[-1].send(value)
+                break
+            except StopIteration as done:
+                stack.pop()
+                value = done.value
+        else:
+            return value
+
+def _analyze(node, state):
+    """Analiza node con el recorrido que corresponde al estado."""
+    if state.profile is None:
+        return _visit(node, state)
+    return state.profile.run(node, state)
+
+def _enter_scope(state, body):
+    """Las sentencias de un bloque, en su propio scope (se usa con yield from)."""
+    if isinstance(body, list):
+        symbol_table = state.symbol_table
+        symbol_table.enter_scope()
+        for stmt in body:
+            yield stmt
+        symbol_table.exit_scope()
+
+def _statements(body):
+    """Las sentencias de un cuerpo cuyo scope ya está abierto."""
+    return body if isinstance(body, list) else ()
+
+def _declare_params(symbol_table, params):
+    # Registrar parámetros como variables inicializadas
+    for param in params:
+        if param.tag == "param":
+            symbol_table[param.name] = Symbol(mutable=False, initialized=True)
+
+
+class KindProfile:
+    """
+    Contador por tipo de nodo: cuántos nodos de cada tipo se analizaron y el
+    tiempo de sus pasos. Como los hijos son pasos aparte, es tiempo propio.
+    Se activa con SemanticSession(profile=True); sin él no se mide nada.
+    """
+    __slots__ = ('counts', 'times')
+
+    def __init__(self):
+        self.counts = [0] * len(astNodes.NODE_CLASSES)
+        self.times = [0.0] * len(astNodes.NODE_CLASSES)
+
+    def run(self, node, state):
+        """El loop de _run, midiendo cada paso."""
+        counts, times = self.counts, self.times
+        leaves, handlers = LEAF_TYPES, HANDLERS
+        clock = time.perf_counter
+        stack = []
+        while True:
+            kind = getattr(node, 'kind', -1)
+            start = clock()
+            leaf = leaves[type(node)]
+            if leaf is not None:
+                value = leaf(node, state)
+            else:
+                stack.append((handlers[type(node)](node, state), kind))
+                value = None
+            if kind >= 0:
+                counts[kind] += 1
+                times[kind] += clock() - start
+            while stack:
+                steps, kind = stack[-1]
+                start = clock()
+                try:
+                    node = steps.send(value)
+                    break
+                except StopIteration as done:
+                    stack.pop()
+                    value = done.value
+                finally:
+                    if kind >= 0:
+                        times[kind] += clock() - start
+            else:
+                return value
+
+    def report(self):
+        """Líneas de texto con los tipos de nodo, del que más tiempo llevó al que menos."""
+        rows = sorted((t, c, astNodes.NODE_CLASSES[k].tag)
+                      for k, (c, t) in enumerate(zip(self.counts, self.times)) if c)
+        lines = [f"  {'node':<22} {'count':>9} {'ms':>10}"]
+        for t, c, tag in reversed(rows):
+            lines.append(f"  {tag:<22} {c:>9} {t * 1000:>10.2f}")
+        return lines
 
 # ============== ANÁLISIS DE EXPRESIONES ==============
 
 def analyze_expression(expr):
     """Analiza una expresión y verifica uso de variables"""
-    if not isinstance(expr, tuple):
-        return
-    
-    expr_type = expr[0]
-    
-    # ===== VARIABLE (id) =====
-    if expr_type == "id":
-        var_name = expr[1]
-        if not check_variable_initialized(var_name): #Si es que la variable no ha sido inizializada
-            return "unknown"
-        return symbol_table.get(var_name, {}).get("type", "unknown")
-    
-    # ===== OPERACIÓN BINARIA (op): Analizar ambos lados =====
-    # Estructura esperada: ("op", operador, left, right). Left y right deberian ser "lit" y "BOOLEAN" para esto
-    elif expr_type == "op":
-        op, left, right = expr[1], expr[2], expr[3]
-        left_t = analyze_expression(left) or "unknown"
-        right_t = analyze_expression(right) or "unknown"
-        if op in ("+", "-", "*", "/", "%"):
-            return combine_arimethic_types(op, left_t, right_t)
-        return "unknown"
-
-    elif expr_type == "lit":
-        value = expr[1]
-        if isinstance(value, bool) or value in ("true", "false"):
-            return "bool"
-        if isinstance(value, (int, float)):
-            return "num"
-        if isinstance(value,str):
-            if len(value)==1: 
-                return "char"
-            return "string"
-        return "unknown"
-    elif expr_type == "bool":
-        return "bool"
-    elif expr_type == "uminus":
-        inner_t = analyze_expression(expr[1])
-        # Si es número, sigue siendo num (marcará negativo en el literal mismo)
-        return inner_t
-    elif expr_type == "not":
-        inner_t = analyze_expression(expr[1])
-        if inner_t not in ("bool", "unknown"):
-            add_error(f"Operand of '!' should be boolean, got {inner_t} (SEM-TYPE-MISMATCH)")
-        return "bool"
-    #Revisar bien estos 2 elifs de abajo
-    elif expr_type == "rel":
-        analyze_expression(expr[2]); analyze_expression(expr[3]); return "bool"
-    
-    elif expr_type == "logic":
-        analyze_expression(expr[2]); analyze_expression(expr[3]); return "bool"
-        
+    return _analyze(expr, _current_state.get())
 
-    # ===== LLAMADA A FUNCIÓN: Analizar argumentos =====
-    elif expr_type == "fn_call":
-        args = expr[2]
-        for arg in args:
-            analyze_expression(arg)
-        return "unknown"
+# ===== HOJAS: devuelven su tipo =====
 
-    elif expr_type == "hashmap_new":
-        return "hashmap"
-    
-    # Array: analizar elementos
-    elif expr_type == "array":
-        elements = expr[1]
-        elem_types = []
-        for elem in elements:
-            elem_types.append(analyze_expression(elem))
-        return "array"
-    
-    elif expr_type == "array_repeat":
-        analyze_expression(expr[1])
-        analyze_expression(("num", expr[2]))
-        return "array"
-    
-    # Indexación: analizar array e índice
-    elif expr_type == "index":
-        array_expr = expr[1]
-        index_expr = expr[2]
-        analyze_expression(array_expr)
-        analyze_expression(index_expr)
-    
-    # Referencia: analizar la expresión referenciada
-    elif expr_type in ("ref", "ref_mut"):
-        analyze_expression(expr[1])
-    
-    # Cast: analizar expresión a castear
-    elif expr_type == "cast":
-        analyze_expression(expr[1])
-    
-    # Closure/Lambda: analizar cuerpo
-    elif expr_type == "closure":
-        params = expr[1]
-        body = expr[3]
-        
-        # Guardar tabla de símbolos actual
-        old_table = symbol_table.copy()
-        
-        # Registrar parámetros como variables inicializadas
-        for param in params:
-            if param[0] == "param":
-                param_name = param[1]
-                symbol_table[param_name] = {
-                    'mutable': False,
-                    'initialized': True
-                }
-        
-        # Analizar cuerpo del closure
-        if body[0] == "expr_body":
-            analyze_expression(body[1])
-        elif body[0] == "block_body":
-            statements = body[1]
-            if isinstance(statements, list):
-                for stmt in statements:
-                    analyze_statement(stmt)
-            # Si hay expresión final
-            if len(body) > 2 and body[2]:
-                analyze_expression(body[2])
-        
-        # Restaurar tabla de símbolos
-        symbol_table.clear()
-        symbol_table.update(old_table)
-    
-    # Tupla: analizar elementos
-    elif expr_type == "tuple_literal":
-        elements = expr[1]
-        for elem in elements:
-            analyze_expression(elem)
-        return "tuple"
-
-    elif expr_type == "vec_macro":
-        elements = expr[2]
-        for elem in elements:
-            analyze_expression(elem)
-        return "vector"
-
-    elif expr_type == "range":
-        start_t = analyze_expression(expr[1])
-        end_t = analyze_expression(expr[2])
-        if start_t not in ("num", "unknown"):
-            add_error("Range start should be numeric")
-        if end_t not in ("num", "unknown"):
-            add_error("Range end should be numeric")
-        return "range"
-
-    # ===== LITERALES NUMÉRICOS =====
-    elif expr_type == "num":
-        return "num"
-    
+# ===== VARIABLE (id) =====
+def _id_type(expr, state):
+    if not check_variable_initialized(expr.name, expr): #Si es que la variable no ha sido inizializada
+        return UNKNOWN
+    return state.symbol_table[expr.name].type
+
+def _lit_type(expr, state):
+    value = expr.value
+    if isinstance(value, bool) or value in ("true", "false"):
+        return BOOL
+    if isinstance(value, (int, float)):
+        return NUM
+    if isinstance(value,str):
+        if len(value)==1: 
+            return CHAR
+        return STRING
+    return UNKNOWN
+
+# ===== LITERALES NUMÉRICOS =====
+def _num_type(expr, state):
+    return NUM
+
+def _hashmap_new_type(expr, state):
+    return HASHMAP
+
+def _none_type(expr, state):
+    return None
+
+# ===== OPERACIÓN BINARIA (op): Analizar ambos lados =====
+# Estructura esperada: ("op", operador, left, right). Left y right deberian ser "lit" y "BOOLEAN" para esto
+def _expr_op(expr, state):
+    left_t = yield expr.left
+    right_t = yield expr.right
+    op = expr.op
+    if op in ("+", "-", "*", "/", "%"):
+        return combine_arimethic_types(op, left_t or UNKNOWN, right_t or UNKNOWN, expr)
+    return UNKNOWN
 
+def _expr_uminus(expr, state):
+    # Si es número, sigue siendo num (marcará negativo en el literal mismo):
+    # el tipo es el de la expresión de adentro
+    return (yield expr.expr)
+
+def _expr_not(expr, state):
+    inner_t = yield expr.expr
+    if inner_t is not BOOL and inner_t is not UNKNOWN:
+        add_error(f"Operand of '!' should be boolean, got {inner_t} (SEM-TYPE-MISMATCH)", expr)
+    return BOOL
+
+#Revisar bien estos 2 de abajo (rel y logic)
+def _expr_rel_logic(expr, state):
+    yield expr.left
+    yield expr.right
+    return BOOL
+
+# Handler que analiza la lista `children` del nodo y da `result`
+def _expr_all(children, result):
+    def handler(expr, state):
+        for child in getattr(expr, children):
+            yield child
+        return result
+    return handler
+
+def _expr_array_repeat(expr, state):
+    # [valor; cantidad]: la cantidad es un número literal, no hay nada que analizar
+    yield expr.value
+    return ARRAY
+
+# Indexación: analizar array e índice
+def _expr_index(expr, state):
+    yield expr.target
+    yield expr.index
+    return None
+
+# Referencia y cast: analizar la expresión de adentro
+def _expr_inner(expr, state):
+    yield expr.expr
+    return None
+
+# Closure/Lambda: analizar cuerpo
+def _expr_closure(expr, state):
+    symbol_table = state.symbol_table
+    symbol_table.enter_scope()
+    _declare_params(symbol_table, expr.params)
+
+    # Analizar cuerpo del closure
+    body = expr.body
+    result = body.expr
+    if body.tag == "expr_body":
+        yield result
+    elif body.tag == "block_body":
+        for stmt in _statements(body.statements):
+            yield stmt
+        # Si hay expresión final
+        if result:
+            yield result
+    symbol_table.exit_scope()
+    return None
+
+def _expr_range(expr, state):
+    low, high = expr.low, expr.high
+    start_t = yield low
+    end_t = yield high
+    if start_t is not NUM and start_t is not UNKNOWN:
+        add_error("Range start should be numeric", low)
+    if end_t is not NUM and end_t is not UNKNOWN:
+        add_error("Range end should be numeric", high)
+    return RANGE
 
 # ============== ANÁLISIS DE STATEMENTS ==============
 
 def analyze_statement(stmt):
     """Analiza un statement y aplica las reglas semánticas"""
-    if not isinstance(stmt, tuple):
-        return
-    
-    stmt_type = stmt[0]
-    
-    # ===== DECLARACIONES LET =====
-    
-    if stmt_type == "let_decl":
-        # let x;
-        var_name = stmt[1]
-        symbol_table[var_name] = {
-            'mutable': False,
-            'initialized': False,
-            'type': "unknown"
-        }
-    
-    elif stmt_type == "let_assign":
-        # let x = expr;
-        var_name = stmt[1]
-        expr = stmt[2]
-        expr_t = analyze_expression(expr)
-        symbol_table[var_name] = {
-            'mutable': False,
-            'initialized': True,
-            'type': expr_t
-        }
-    
-    elif stmt_type == "let_mut_assign":
-        # let mut x = expr;
-        var_name = stmt[1]
-        expr = stmt[2]
-        expr_t = analyze_expression(expr)
-        symbol_table[var_name] = {
-            'mutable': True,
-            'initialized': True,
-            'type': expr_t
-        }
-    
-    elif stmt_type == "let_typed_decl":
-        # let x: T;
-        var_name = stmt[1]
-        tipo_ast = stmt[2]      # normalmente el parser pone aquí el tipo
-        tipo = type_name_from_ast(tipo_ast)
-        symbol_table[var_name] = {
-            'mutable': False,
-            'initialized': False,
-            'type': tipo
-        }
-    
-    if stmt_type == "let_typed_assign":
-        var_name = stmt[1]
-        tipo_ast = stmt[2]
-        expr = stmt[3]
+    _analyze(stmt, _current_state.get())
 
-        tipo = type_name_from_ast(tipo_ast)
-        expr_t = analyze_expression(expr)
+def _analyze_statements(statements, shifts=None):
+    """Analiza las sentencias de nivel superior en un solo recorrido."""
+    state = _current_state.get()
+    analyze = _visit if state.profile is None else state.profile.run
+    if shifts is None:
+        for stmt in statements:
+            analyze(stmt, state)
+    else:
+        # Antes de cada sentencia, su corrimiento de lexpos (ver add_error)
+        for stmt, shift in zip(statements, shifts):
+            state.shift = shift
+            analyze(stmt, state)
+        state.shift = 0
 
-        # NUEVA REGLA: Verificar compatibilidad de tipos
-        check_type_compatibility(tipo, expr_t, var_name)
+# ===== DECLARACIONES LET =====
 
-        if is_unsigned_type(tipo_ast) and is_negative_literal(expr):
-            add_error(f"Cannot assign negative literal to unsigned type in variable '{var_name}'")
+def _stmt_let_decl(stmt, state):
+    # let x;
+    state.symbol_table[stmt.name] = Symbol(mutable=False, initialized=False)
 
-        symbol_table[var_name] = {
-            'mutable': False,
-            'initialized': True,
-            'type': tipo if tipo != "unknown" else expr_t
-        }
-    
-    # ===== let mut x: T = expr; (CON VERIFICACIÓN DE TIPOS) =====
-    elif stmt_type == "let_mut_typed_assign":
-        var_name = stmt[1]
-        tipo_ast = stmt[2]
-        expr = stmt[3]
-
-        tipo = type_name_from_ast(tipo_ast)
-        expr_t = analyze_expression(expr)
-
-        # NUEVA REGLA: Verificar compatibilidad de tipos
-        check_type_compatibility(tipo, expr_t, var_name)
-
-        if is_unsigned_type(tipo_ast) and is_negative_literal(expr):
-            add_error(f"Cannot assign negative literal to unsigned type in variable '{var_name}'")
-
-        symbol_table[var_name] = {
-            'mutable': True,
-            'initialized': True,
-            'type': tipo if tipo != "unknown" else expr_t
-        }
-    
-    # ===== CONSTANTES =====
-    elif stmt_type == "const_decl":
-        const_name = stmt[1]
-        tipo_ast = stmt[2]
-        const_value = stmt[3]
-
-        tipo = type_name_from_ast(tipo_ast)
-        expr_t = analyze_expression(const_value)
-
-        # NUEVA REGLA: Verificar compatibilidad de tipos
-        check_type_compatibility(tipo, expr_t, const_name)
-
-        if is_unsigned_type(tipo_ast) and is_negative_literal(const_value):
-            add_error(f"Cannot assign negative literal to unsigned type in const '{const_name}'")
-
-        symbol_table[const_name] = {
-            'mutable': False,
-            'initialized': True,
-            'type': tipo or expr_t
-        }
-    
-    # ===== ASIGNACIÓN =====
-    
-    elif stmt_type == "assignment":
-        # x = expr;
-        var_name = stmt[1]
-        expr = stmt[2]
-        
-        # REGLA 2: Verificar que sea mutable
-        if check_variable_mutable(var_name):
-            # Marcar como inicializada
-            symbol_table[var_name]['initialized'] = True
-        
-        analyze_expression(expr)
-    
-    # ===== ESTRUCTURAS DE CONTROL =====
-    
-    elif stmt_type == "if":
-        # if condition { body }
-        condition = stmt[1]
-        body = stmt[2]
-        analyze_expression(condition)
-        if isinstance(body, list):
-            for s in body:
-                analyze_statement(s)
-
-    elif stmt_type == "if_else":
-        # if condition { body } else { body2 }
-        condition = stmt[1]
-        then_body = stmt[2]
-        else_body = stmt[3]
-        analyze_expression(condition)
-        if isinstance(then_body, list):
-            for s in then_body:
-                analyze_statement(s)
-        if isinstance(else_body, list):
-            for s in else_body:
-                analyze_statement(s)
-    
-    elif stmt_type == "while":
-        # while condition { body }
-        condition = stmt[1]
-        body = stmt[2]
-        analyze_expression(condition)
-        if isinstance(body, list):
-            for s in body:
-                analyze_statement(s)
-    
-    elif stmt_type == "for":
-        # for var in iterable { body }
-        var_name = stmt[1]
-        iterable = stmt[2]
-        body = stmt[3]
-        
-        # Variable del for está inicializada
-        symbol_table[var_name] = {
-            'mutable': False,
-            'initialized': True
-        }
-        
-        analyze_expression(iterable)
-        if isinstance(body, list):
-            for s in body:
-                analyze_statement(s)
-    
-    # ===== FUNCIONES =====
-    
-    elif stmt_type in ("fn", "fn_ret", "async_fn", "async_fn_ret"):
-        # fn nombre() { body }
-        if stmt_type in ("fn_ret", "async_fn_ret"):
-            body = stmt[3]
-        else:
-            body = stmt[2]
-        
-        # Analizar cuerpo (simplificado, sin scope separado)
-        if isinstance(body, list):
-            for s in body:
-                analyze_statement(s)
-    
-    elif stmt_type == "return":
-        # return expr;
-        expr = stmt[1]
-        analyze_expression(expr)
-    
-    # ===== OTROS =====
-    
-    elif stmt_type == "expr_stmt":
-        analyze_expression(stmt[1])
-    
-    elif stmt_type == "println_expr":
-        if len(stmt) > 1:
-            analyze_expression(stmt[1])
+def _stmt_let_assign(stmt, state):
+    # let x = expr;  /  let mut x = expr;
+    init_t = yield stmt.init
+    state.symbol_table[stmt.name] = Symbol(mutable=stmt.tag == "let_mut_assign", initialized=True, type=init_t)
+
+def _stmt_let_typed_decl(stmt, state):
+    # let x: T;
+    tipo = type_name_from_ast(stmt.type)      # normalmente el parser pone aquí el tipo
+    state.symbol_table[stmt.name] = Symbol(mutable=False, initialized=False, type=tipo)
+
+# ===== let x: T = expr;  /  let mut x: T = expr; (CON VERIFICACIÓN DE TIPOS) =====
+def _stmt_let_typed_assign(stmt, state):
+    init = stmt.init
+    expr_t = yield init
+    var_name = stmt.name
+    tipo_term = resolve_type(stmt.type)
+    tipo = tipo_term.sem
+
+    # NUEVA REGLA: Verificar compatibilidad de tipos
+    check_type_compatibility(tipo, expr_t, var_name, stmt)
+
+    if tipo_term.unsigned and is_negative_literal(init):
+        add_error(f"Cannot assign negative literal to unsigned type in variable '{var_name}'", init)
+
+    state.symbol_table[var_name] = Symbol(
+        mutable=stmt.tag == "let_mut_typed_assign",
+        initialized=True,
+        type=tipo if tipo is not UNKNOWN else expr_t
+    )
+
+# ===== CONSTANTES =====
+def _stmt_const_decl(stmt, state):
+    value = stmt.value
+    expr_t = yield value
+    const_name = stmt.name
+    tipo_term = resolve_type(stmt.type)
+    tipo = tipo_term.sem
+
+    # NUEVA REGLA: Verificar compatibilidad de tipos
+    check_type_compatibility(tipo, expr_t, const_name, stmt)
+
+    if tipo_term.unsigned and is_negative_literal(value):
+        add_error(f"Cannot assign negative literal to unsigned type in const '{const_name}'", value)
+
+    state.symbol_table[const_name] = Symbol(mutable=False, initialized=True, type=tipo or expr_t)
+
+# ===== ASIGNACIÓN =====
+
+def _stmt_assignment(stmt, state):
+    # x = expr;
+    # REGLA 2: Verificar que sea mutable
+    if check_variable_mutable(stmt.name, stmt):
+        # Marcar como inicializada
+        state.symbol_table[stmt.name].initialized = True
+    yield stmt.expr
+
+# ===== ESTRUCTURAS DE CONTROL =====
+
+def _stmt_if_while(stmt, state):
+    # if condition { body }  /  while condition { body }
+    yield stmt.cond
+    yield from _enter_scope(state, stmt.body)
+
+def _stmt_if_else(stmt, state):
+    # if condition { body } else { body2 }
+    yield stmt.cond
+    yield from _enter_scope(state, stmt.body)
+    yield from _enter_scope(state, stmt.else_body)
+
+def _stmt_for(stmt, state):
+    # for var in iterable { body }
+    # El iterable se analiza afuera; la variable vive en el scope del cuerpo
+    yield stmt.iterable
+    symbol_table = state.symbol_table
+    symbol_table.enter_scope()
+    # Variable del for está inicializada
+    symbol_table[stmt.var] = Symbol(mutable=False, initialized=True)
+    for child in _statements(stmt.body):
+        yield child
+    symbol_table.exit_scope()
+
+# ===== FUNCIONES =====
+
+def _stmt_fn(stmt, state):
+    # fn nombre(params) { body }  /  fn nombre(params) -> T { body }
+    symbol_table = state.symbol_table
+
+    # Scope de la función con sus parámetros
+    symbol_table.enter_scope()
+    _declare_params(symbol_table, stmt.params)
+
+    body = stmt.body
+    if isinstance(body, list):
+        for child in body:
+            yield child
+    elif isinstance(body, Node) and body.tag == "body":
+        # Statements y expresión final (retorno implícito)
+        for child in _statements(body.statements):
+            yield child
+        result = body.expr
+        if result is not None:
+            yield result
+    symbol_table.exit_scope()
+
+# ===== OTROS =====
+
+def _stmt_expr(stmt, state):
+    # return expr;  /  expr;  /  println!(expr);
+    yield stmt.expr
+
+_LEAVES = {
+    "id": _id_type,
+    "lit": _lit_type,
+    "num": _num_type,
+    "hashmap_new": _hashmap_new_type,
+    "let_decl": _stmt_let_decl,
+    "let_typed_decl": _stmt_let_typed_decl,
+}
+
+_COMPOSITES = {
+    # Expresiones
+    "op": _expr_op,
+    "uminus": _expr_uminus,
+    "not": _expr_not,
+    "rel": _expr_rel_logic,
+    "logic": _expr_rel_logic,
+    "fn_call": _expr_all('args', UNKNOWN),
+    "array": _expr_all('elements', ARRAY),
+    "array_repeat": _expr_array_repeat,
+    "index": _expr_index,
+    "ref": _expr_inner,
+    "ref_mut": _expr_inner,
+    "cast": _expr_inner,
+    "closure": _expr_closure,
+    "tuple_literal": _expr_all('elements', TUPLE),
+    "vec_macro": _expr_all('elements', VECTOR),
+    "range": _expr_range,
+    # Sentencias
+    "let_assign": _stmt_let_assign,
+    "let_mut_assign": _stmt_let_assign,
+    "let_typed_assign": _stmt_let_typed_assign,
+    "let_mut_typed_assign": _stmt_let_typed_assign,
+    "const_decl": _stmt_const_decl,
+    "assignment": _stmt_assignment,
+    "if": _stmt_if_while,
+    "while": _stmt_if_while,
+    "if_else": _stmt_if_else,
+    "for": _stmt_for,
+    "fn": _stmt_fn,
+    "fn_ret": _stmt_fn,
+    "async_fn": _stmt_fn,
+    "async_fn_ret": _stmt_fn,
+    "return": _stmt_expr,
+    "expr_stmt": _stmt_expr,
+    "println_expr": _stmt_expr,
+}
+
+# Tipo de cada hoja, None para los nodos con hijos. Cualquier otro valor
+# (None, un str, un nodo que no se analiza) es una hoja de tipo None.
+LEAF_TYPES = _handler_table({**_LEAVES, **dict.fromkeys(_COMPOSITES)}, _none_type)
+
+# Handler (generador) de cada nodo con hijos
+HANDLERS = _handler_table(_COMPOSITES, None)
 
 # ============== ANÁLISIS DE RETORNO DE FUNCIONES ==============
 def expression_type(expression):
     """
     Devuelve un tipo aproximado: 'num', 'bool', 'string'.
     """
-    if not isinstance(expression, tuple):
+    if not isinstance(expression, Node):
         return 'unknown'
-    tag = expression[0]
+    tag = expression.tag
 
     if tag in ('number', 'numero', 'init_lit'):
         return 'num'
@@ -545,10 +939,24 @@ def analyze_ast(ast):
     """Analiza el AST completo"""
     if ast is None:
         return
+
+    # AST en arena: las mismas reglas, sobre las vistas de sus sentencias
+    if isinstance(ast, AstArena):
+        _analyze_statements(ast.statements())
+        return
+
+    # ASTs armados con el formato viejo de tuplas se convierten a nodos
+    if isinstance(ast, tuple) or (isinstance(ast, list) and ast and isinstance(ast[0], tuple)):
+        ast = astNodes.from_tuple(ast)
     
     if isinstance(ast, list):
-        for statement in ast:
-            analyze_statement(statement)
+        state = _current_state.get()
+        shifts = state.shifts
+        if shifts is not None and len(shifts) == len(ast):
+            # Sentencias reutilizadas por el parseo incremental (ver add_error)
+            _analyze_statements(ast, shifts)
+        else:
+            _analyze_statements(ast)
     else:
         analyze_statement(ast)
 
@@ -557,6 +965,8 @@ def analyze_ast(ast):
 
 def generate_report(name):
     """Genera un reporte del análisis semántico"""
+    state = _current_state.get()
+    errors, symbol_table = state.errors, state.symbol_table
     report = []
     report.append("=" * 60)
     report.append("SEMANTIC ANALYSIS REPORT")
@@ -573,21 +983,30 @@ def generate_report(name):
         report.append("✅ NO SEMANTIC ERRORS")
         report.append("")
     
-    # Tabla de símbolos
+    # Tabla de símbolos: todos los declarados, también dentro de funciones y bloques
     report.append("-" * 60)
     report.append("SYMBOL TABLE")
     report.append("-" * 60)
     
-    if symbol_table:
-        for var_name, var_info in symbol_table.items():
-            mutable = "mutable" if var_info['mutable'] else "immutable"
-            initialized = "initialized" if var_info['initialized'] else "NOT initialized"
-            var_type = var_info.get('type', 'unknown')
-            report.append(f"  {var_name}: {mutable}, {initialized}, type={var_type}")
+    declared = symbol_table.declared
+    if declared:
+        for var_name, var_info in declared.items():
+            mutable = "mutable" if var_info.mutable else "immutable"
+            initialized = "initialized" if var_info.initialized else "NOT initialized"
+            report.append(f"  {var_name}: {mutable}, {initialized}, type={var_info.type}")
     else:
         report.append("  (empty)")
     
     report.append("")
+
+    # Tiempo por tipo de nodo (solo con SemanticSession(profile=True))
+    if state.profile is not None:
+        report.append("-" * 60)
+        report.append("PROFILE BY NODE KIND")
+        report.append("-" * 60)
+        report.extend(state.profile.report())
+        report.append("")
+
     report = "\n".join(report)
 
     # Guardar reporte
@@ -603,6 +1022,63 @@ def generate_report(name):
         log.write(report)
     return log_name
 
+# ============== SESIONES DE ANÁLISIS ==============
+
+class SemanticSession:
+    """
+    Un análisis completo e independiente: una SyntaxSession para el parseo
+    (lexer, parser y errores propios) y un SemanticState propio para las
+    tablas semánticas. Varias sesiones pueden correr a la vez en hilos o
+    tareas asyncio distintas sin mezclar sus errores. Se le puede pasar una
+    sesión sintáctica ya creada (por ejemplo una IncrementalSyntaxSession).
+    Con profile=True se cuenta cuántos nodos de cada tipo se analizan y el
+    tiempo que llevan (ver KindProfile); queda en `profile` y en el reporte.
+    """
+
+    def __init__(self, syntax=None, profile=False):
+        self.syntax = syntax if syntax is not None else SyntaxSession()
+        self.state = SemanticState()
+        if profile:
+            self.state.profile = KindProfile()
+
+    @property
+    def syntax_errors(self):
+        return self.syntax.errors
+
+    @property
+    def errors(self):
+        return self.state.errors
+
+    @property
+    def symbol_table(self):
+        return self.state.symbol_table
+
+    @property
+    def profile(self):
+        return self.state.profile
+
+    def _run(self, func, *args):
+        """Ejecuta func con el estado de esta sesión como estado en curso."""
+        token = _current_state.set(self.state)
+        try:
+            return func(*args)
+        finally:
+            _current_state.reset(token)
+
+    def parse(self, codigo, arena=None):
+        """Parsea el código (ver SyntaxSession.parse) y lo recuerda para ubicar los errores."""
+        ast = self.syntax.parse(codigo) if arena is None else self.syntax.parse(codigo, arena)
+        # Para ubicar los errores semánticos de este código (ver add_error)
+        self.state.lines = lexicalAnalyzer.LineIndex(codigo)
+        self.state.shifts = self.syntax.statement_shifts()
+        return ast
+
+    def analyze_ast(self, ast):
+        self._run(analyze_ast, ast)
+
+    def generate_report(self, name):
+        return self._run(generate_report, name)
+
 # ============== FUNCIÓN PRINCIPAL ==============
 def analyze_file(filename, autor):    
     if not os.path.exists(filename):
@@ -612,19 +1088,16 @@ def analyze_file(filename, autor):
     with open(filename, "r", encoding="utf-8") as f:
         code = f.read()
     
-    # Reiniciar todo
-    reset_analyzer()
-    PARSER_ERRORS.clear()
-    lexer.lineno = 1
+    session = SemanticSession()
     
     # Fase 1: Análisis sintáctico
     print("🔍 Phase 1: Syntactic Analysis...")
     try:
-        ast = parser.parse(code, lexer=lexer)
+        ast = session.parse(code)
         
-        if PARSER_ERRORS:
-            print(f"❌ Syntax errors found: {len(PARSER_ERRORS)}")
-            for error in PARSER_ERRORS:
+        if session.syntax_errors:
+            print(f"❌ Syntax errors found: {len(session.syntax_errors)}")
+            for error in session.syntax_errors:
                 print(f"  {error}")
             return False
         else:
@@ -635,34 +1108,32 @@ def analyze_file(filename, autor):
     
     # Fase 2: Análisis semántico
     print("🔍 Phase 2: Semantic Analysis...")
-    analyze_ast(ast)
+    session.analyze_ast(ast)
     
     # Generar reporte
-    log_name = generate_report(autor)
+    log_name = session.generate_report(autor)
     
     print(f"📄 Log generated at: {log_name}")
     
-    return len(errors) == 0
+    return len(session.errors) == 0
 
 # ========= FUNCIÓN PARA USAR EN LA INTERFAZ GRÁFICA =========
-def analizar_semantico(codigo: str, autor="EditorGUI"):
-    reset_analyzer()
-    PARSER_ERRORS.clear()
-    lexer.lineno = 1
+def analizar_semantico(codigo: str, autor="EditorGUI", syntax=None):
+    session = SemanticSession(syntax)
 
     try:
-        ast = parser.parse(codigo, lexer=lexer)
+        ast = session.parse(codigo)
     except Exception as e:
         return f"❌ Critical error in syntax analysis: {e}"
 
-    if PARSER_ERRORS:
+    if session.syntax_errors:
         texto = "❌ Syntax errors found:\n"
-        texto += "\n".join(f"  {e}" for e in PARSER_ERRORS)
+        texto += "\n".join(f"  {e}" for e in session.syntax_errors)
         return texto
 
-    analyze_ast(ast)
+    session.analyze_ast(ast)
 
-    log_path = generate_report(autor)
+    log_path = session.generate_report(autor)
 
     with open(log_path, "r", encoding="utf-8") as f:
         report = f.read()
@@ -5,15 +5,20 @@
 # funciones (con/sin retorno), return y CLOSURES/LAMBDAS.
 
 import argparse
+import copy
 import datetime
+import hashlib
 from pathlib import Path
-import ply.yacc as yacc
+from ply.lex import LexToken
 import os
+import threading
 
-# Traigo el lexer del Avance 1
+# Traigo el lexer del Avance 1 (se construye en el primer uso)
 import lexicalAnalyzer
 tokens = lexicalAnalyzer.tokens
-lexer  = lexicalAnalyzer.lexer
+
+# Los nodos del AST (clases con __slots__, ver astNodes.py)
+import astNodes
 
 # Precedencias básicas para quitar ambigüedades
 precedence = (
@@ -30,14 +35,86 @@ precedence = (
     ('right', 'UMINUS'),                             # unary minus
 )
 
-ERRORS = []  # acumulo errores de parseo
+ERRORS = []  # errores de parseo del parser compartido (get_parser()); ver SyntaxSession
+
+# Driver LR que usan las sesiones:
+#   "generated" -> el parser de generatedParser.py (ver parserGenerator.py),
+#                sin ply.yacc. Si el módulo no existe o quedó viejo respecto
+#                de la gramática se usa "dense".
+#   "dense"   -> LRParser.parseopt_dense: tablas de enteros compactadas
+#                (ply.yacc.DenseLRTable) indexadas con los códigos de tipo
+#                de lexicalAnalyzer (TOKEN_CODES), sin buscar strings.
+#   "fast"    -> LRParser.parseopt_notrack: tablas de diccionarios, sin ramas
+#                de debug ni tracking.
+#   "generic" -> LRParser.parse(), como antes.
+PARSE_DRIVER = "generated"
+
+# ---------------- Nodos del AST ----------------
+# Cada acción arma un nodo de astNodes y _span() le pone la posición (lexpos)
+# del primer y del último token de la regla, sacada de los tokens o de los
+# nodos hijos. No hace falta parsear con tracking=True.
+
+def _edge_pos(sym, last):
+    """lexpos del primer (o último) token de un símbolo de la regla; -1 si no se sabe."""
+    if isinstance(sym, LexToken):
+        return sym.lexpos
+    value = sym.value
+    while isinstance(value, list) and value:
+        value = value[-1] if last else value[0]
+    if isinstance(value, astNodes.Node):
+        return value.endlexpos if last else value.lexpos
+    return -1
+
+def _append(items, item):
+    """
+    Agrega al final de una lista que armó otra reducción y la devuelve. Esa
+    lista no la comparte nadie más, así que se modifica en el lugar: armar
+    una lista de N elementos cuesta O(N) y no O(N²) como con items + [item].
+    """
+    items.append(item)
+    return items
+
+def _span(p, node):
+    """Guarda en el nodo la posición del primer y del último token de la regla."""
+    symbols = p.slice
+    pos = -1
+    for i in range(1, len(symbols)):
+        pos = _edge_pos(symbols[i], False)
+        if pos >= 0:
+            break
+    node.lexpos = pos
+    for i in range(len(symbols) - 1, 0, -1):
+        pos = _edge_pos(symbols[i], True)
+        if pos >= 0:
+            break
+    node.endlexpos = pos
+    return node
 
 # ---------------- Programa ----------------
 
 def p_program(p):
     '''program : program statement
                | statement'''
-    p[0] = p[1] + [p[2]] if len(p) == 3 else [p[1]]
+    # La pila vacía indica una sentencia de nivel superior (no dentro de un bloque)
+    top_level = len(p.stack) == 1
+    arena = getattr(p.parser, 'arena', None) if top_level else None
+    if p[len(p) - 1] is None:
+        # Sentencia con error de sintaxis (ver p_statement_error): no entra al AST
+        p[0] = p[1] if len(p) == 3 else []
+        return
+    if arena is not None:
+        # Modo arena: la sentencia se copia a los arrays y sus nodos se liberan
+        arena.add_statement(p[len(p) - 1])
+        p[0] = arena
+    elif len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+    else:
+        p[0] = [p[1]]
+    # En modo incremental se anota dónde empieza cada sentencia de nivel superior
+    starts = getattr(p.parser, 'statement_starts', None)
+    if starts is not None and top_level:
+        starts.append(getattr(p[len(p) - 1], 'lexpos', -1))
 
 def p_program_opt(p):
     '''program_opt : program
@@ -52,16 +129,16 @@ def p_empty(p):
 # println!("texto");
 def p_println_string(p):
     'statement : PRINTLN NOT LPAREN STRING RPAREN SEMICOLON'
-    p[0] = ("println", p[4])
+    p[0] = _span(p, astNodes.Println(p[4]))
 
 # println!(expr);
 def p_println_expr(p):
     'statement : PRINTLN NOT LPAREN expression RPAREN SEMICOLON'
-    p[0] = ("println_expr", p[4])
+    p[0] = _span(p, astNodes.PrintlnExpr(p[4]))
 
 def p_println_format(p):
     '''statement : PRINTLN NOT LPAREN STRING COMMA argument_list RPAREN SEMICOLON'''    
-    p[0] = ("println_format", p[4], p[6])
+    p[0] = _span(p, astNodes.PrintlnFormat(p[4], p[6]))
 
 # ---------------- HashMap ----------------
 #Avance de hashmaps por Nicolás Sierra
@@ -69,16 +146,16 @@ def p_hashmap_insert(p):
     'expression : expression DOT IDENTIFIER LPAREN expression COMMA expression RPAREN'
 
     if p[3] == 'insert':
-        p[0] = ("hashmap_insert", p[1], p[5], p[7])
+        p[0] = _span(p, astNodes.HashmapInsert(p[1], p[5], p[7]))
     else:
-        p[0] = ("call", p[1], p[3], [p[5], p[7]])
+        p[0] = _span(p, astNodes.Call(p[1], p[3], [p[5], p[7]]))
 
 def p_hashmap_get(p):
     'expression : expression DOT IDENTIFIER LPAREN expression RPAREN'
     if p[3] == 'get':
-        p[0] = ("hashmap_get", p[1], p[5])
+        p[0] = _span(p, astNodes.HashmapGet(p[1], p[5]))
     else:
-        p[0] = ("call", p[1], p[3], [p[5]])
+        p[0] = _span(p, astNodes.Call(p[1], p[3], [p[5]]))
 
 # ---------------- Entrada por teclado ----------------
 # Acepto algo tipo: io::stdin().read_line(&mut nombre);
@@ -87,19 +164,19 @@ def p_path_call_noargs(p):
     'expression : IDENTIFIER DOUBLE_COLON IDENTIFIER LPAREN RPAREN'
     if p[1] == 'HashMap' and p[3] == 'new':
         #HashMap::new() 
-        p[0] = ("hashmap_new", [])
+        p[0] = _span(p, astNodes.HashmapNew([]))
     else:
         # ej: io::stdin()
-        p[0] = ("path_call", p[1], p[3], [])
+        p[0] = _span(p, astNodes.PathCall(p[1], p[3], []))
 
 def p_expr_stmt(p):
     'statement : expression SEMICOLON'
-    p[0] = ("expr_stmt", p[1])
+    p[0] = _span(p, astNodes.ExprStmt(p[1]))
 
 # Luego método encadenado con o sin argumentos: expr.metodo(args)
 def p_call_method(p):
     'expression : expression DOT IDENTIFIER LPAREN arguments_opt RPAREN'
-    p[0] = ("call", p[1], p[3], p[5])
+    p[0] = _span(p, astNodes.Call(p[1], p[3], p[5]))
 
 def p_arguments_opt(p):
     '''arguments_opt : argument_list
@@ -109,35 +186,37 @@ def p_arguments_opt(p):
 def p_argument_list(p):
     '''argument_list : argument_list COMMA expression
                         | expression'''
-    p[0] = p[1] + [p[3]] if len(p) == 4 else [p[1]]
+    p[0] = _append(p[1], p[3]) if len(p) == 4 else [p[1]]
 
 # ---------------- CLOSURES/LAMBDAS ----------------
 
-# Parámetros del closure
+# Parámetros del closure. La regla es recursiva por la derecha: cada
+# reducción agrega su parámetro al final de la lista ya armada, así que la
+# lista queda al revés y se da vuelta una vez en p_expression_closure*.
 def p_closure_params_empty(p):
     'closure_params : '
     p[0] = []
 
 def p_closure_params_single(p):
     'closure_params : IDENTIFIER'
-    p[0] = [("param", p[1], None)]
+    p[0] = [astNodes.Param(p[1], None, p.lexpos(1), p.lexpos(1))]
 
 def p_closure_params_single_typed(p):
     'closure_params : IDENTIFIER COLON type'
-    p[0] = [("param", p[1], p[3])]
+    p[0] = [astNodes.Param(p[1], p[3], p.lexpos(1), p.lexpos(2))]
 
 def p_closure_params_multiple(p):
     'closure_params : IDENTIFIER COMMA closure_params'
-    p[0] = [("param", p[1], None)] + p[3]
+    p[0] = _append(p[3], astNodes.Param(p[1], None, p.lexpos(1), p.lexpos(1)))
 
 def p_closure_params_multiple_typed(p):
     'closure_params : IDENTIFIER COLON type COMMA closure_params'
-    p[0] = [("param", p[1], p[3])] + p[5]
+    p[0] = _append(p[5], astNodes.Param(p[1], p[3], p.lexpos(1), p.lexpos(2)))
 
 # Cuerpo del closure: expresión simple (sin llaves)
 def p_closure_body_expr(p):
     'closure_body : expression'
-    p[0] = ("expr_body", p[1])
+    p[0] = _span(p, astNodes.ExprBody(p[1]))
 
 # Cuerpo del closure: bloque { expr } o { statements; expr }
 def p_closure_body_block(p):
@@ -147,25 +226,25 @@ def p_closure_body_block(p):
 # Contenido del bloque: puede ser solo expresión o statements + expresión
 def p_closure_block_content_expr(p):
     'closure_block_content : expression'
-    p[0] = ("block_body", [], p[1])  # sin statements previos
+    p[0] = _span(p, astNodes.BlockBody([], p[1]))  # sin statements previos
 
 def p_closure_block_content_stmts_expr(p):
     'closure_block_content : program expression'
-    p[0] = ("block_body", p[1], p[2])  # con statements previos
+    p[0] = _span(p, astNodes.BlockBody(p[1], p[2]))  # con statements previos
 
 def p_closure_block_content_stmts(p):
     'closure_block_content : program_opt'
-    p[0] = ("block_body", p[1], None)  # solo statements, sin expresión final
+    p[0] = _span(p, astNodes.BlockBody(p[1], None))  # solo statements, sin expresión final
 
 # Closure SIN tipo de retorno
 def p_expression_closure(p):
     'expression : CLOSURE_PIPE closure_params CLOSURE_PIPE closure_body'
-    p[0] = ("closure", p[2], None, p[4])
+    p[0] = _span(p, astNodes.Closure(p[2][::-1], None, p[4]))
 
 # Closure CON tipo de retorno
 def p_expression_closure_ret(p):
     'expression : CLOSURE_PIPE closure_params CLOSURE_PIPE ARROW type closure_body'
-    p[0] = ("closure", p[2], p[5], p[6])
+    p[0] = _span(p, astNodes.Closure(p[2][::-1], p[5], p[6]))
 
 # ---------------- Expresiones ----------------
 def p_exp_paren(p):
@@ -178,13 +257,13 @@ def p_exp_binary(p):
                  | expression TIMES expression
                  | expression DIVIDE expression
                  | expression MOD expression'''
-    p[0] = ("op", p[2], p[1], p[3])
+    p[0] = _span(p, astNodes.Op(p[2], p[1], p[3]))
 
 def p_exp_range(p):
     '''expression : expression RANGE expression
                   | expression RANGE_INCLUSIVE expression'''
     inclusive = (p[2] == '..=')
-    p[0] = ("range", p[1], p[3], inclusive)
+    p[0] = _span(p, astNodes.Range(p[1], p[3], inclusive))
 
 def p_exp_relational(p):
     '''expression : expression EQUAL_TO expression
@@ -193,50 +272,50 @@ def p_exp_relational(p):
                   | expression GREATER_THAN expression
                   | expression LESS_THAN_OR_EQUAL_TO expression
                   | expression GREATER_THAN_OR_EQUAL_TO expression'''
-    p[0] = ("rel", p[2], p[1], p[3])
+    p[0] = _span(p, astNodes.Rel(p[2], p[1], p[3]))
 
 def p_exp_logic(p):
     '''expression : expression CONJUNCTION expression
                   | expression DISJUNCTION expression'''
-    p[0] = ("logic", p[2], p[1], p[3])
+    p[0] = _span(p, astNodes.Logic(p[2], p[1], p[3]))
 
 def p_exp_unary_not(p):
     'expression : NOT expression'
-    p[0] = ("not", p[2])
+    p[0] = _span(p, astNodes.Not(p[2]))
 
 def p_exp_unary_minus(p):
     'expression : MINUS expression %prec UMINUS'
-    p[0] = ("uminus", p[2])
+    p[0] = _span(p, astNodes.Uminus(p[2]))
 
 def p_exp_literal_num(p):
     '''expression : INTEGER
                  | FLOAT'''
-    p[0] = ("num", p[1])
+    p[0] = astNodes.Num(p[1], p.lexpos(1), p.lexpos(1))
 
 def p_exp_literal_str_char_bool(p):
     '''expression : STRING
                  | CHAR
                  | BOOLEAN'''
-    p[0] = ("lit", p[1])
+    p[0] = astNodes.Lit(p[1], p.lexpos(1), p.lexpos(1))
 
 def p_exp_ident(p):
     'expression : IDENTIFIER'
-    p[0] = ("id", p[1])
+    p[0] = astNodes.Id(p[1], p.lexpos(1), p.lexpos(1))
 
 # &expr
 def p_ref_unary(p):
     'expression : BIT_AND expression'
-    p[0] = ("ref", p[2])
+    p[0] = _span(p, astNodes.Ref(p[2]))
 
 # &mut nombre
 def p_ref_mut_ident(p):
     'expression : BIT_AND MUT IDENTIFIER'
-    p[0] = ("ref_mut", ("id", p[3]))
+    p[0] = _span(p, astNodes.RefMut(astNodes.Id(p[3], p.lexpos(3), p.lexpos(3))))
 
 # cast: expr as TYPE
 def p_cast_as(p):
     'expression : expression AS type'
-    p[0] = ("cast", p[1], p[3])
+    p[0] = _span(p, astNodes.Cast(p[1], p[3]))
 
 # ---------------- Condiciones ----------------
 
@@ -244,32 +323,55 @@ def p_cast_as(p):
 # if simple para pruebas (usa expression en vez de condition)
 def p_if_simple(p):
     'statement : IF expression LBRACE program_opt RBRACE'
-    p[0] = ("if", p[2], p[4])
+    p[0] = _span(p, astNodes.If(p[2], p[4]))
 
 def p_if_else(p):
     'statement : IF expression LBRACE program_opt RBRACE ELSE LBRACE program_opt RBRACE'
-    p[0] = ("if_else", p[2], p[4], p[8])
+    p[0] = _span(p, astNodes.IfElse(p[2], p[4], p[8]))
 
 # ---------------- Asignación simple: identificador = expresión; ----------------
 def p_assignment(p):
     'statement : IDENTIFIER ASIGNED_TO expression SEMICOLON'
-    p[0] = ("assignment", p[1], p[3])
+    p[0] = _span(p, astNodes.Assignment(p[1], p[3]))
 
 # ---------------- Bucle while (usa expression) ----------------
 def p_while(p):
     'statement : WHILE expression LBRACE program_opt RBRACE'
-    p[0] = ("while", p[2], p[4])
+    p[0] = _span(p, astNodes.While(p[2], p[4]))
 
 # ---------------- Funciones async ----------------
 def p_function_with_return_async(p):
     'statement : ASYNC FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACE'
-    p[0] = ("async_fn_ret", p[3], p[5], p[8], p[10])
+    p[0] = _span(p, astNodes.AsyncFnRet(p[3], p[5], p[8], p[10]))
 
 def p_function_without_return_async(p):
     'statement : ASYNC FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACE'
-    p[0] = ("async_fn", p[3], p[5], p[8])
+    p[0] = _span(p, astNodes.AsyncFn(p[3], p[5], p[8]))
 
 # ---------------- Tipos (anotaciones) ----------------
+# Los nodos de tipo se comparten (hash-consing): dentro de un parseo cada
+# estructura de tipo (i32, [u8], &mut [i32, 4], ...) tiene un solo nodo y
+# semanticAnalyzer.resolve_type la resuelve una sola vez (ver
+# astNodes.Type.resolved). La tabla es `parser.type_nodes`, que arma la
+# sesión para cada parseo (ver SyntaxSession.parse); sin tabla cada tipo es
+# un nodo nuevo. Por eso no tienen posición (lexpos = -1): ningún error se
+# ubica en un tipo, y _span toma el fin de una regla que termina en un tipo
+# (cast, parámetros) del token anterior.
+
+def _shared_type(p, key, cls, *fields):
+    """
+    El nodo de tipo de esa estructura; se crea la primera vez. La clave lleva
+    los nodos de las partes, que se comparan por estructura (Node.__eq__) y
+    quedan vivos mientras viva la tabla.
+    """
+    nodes = getattr(p.parser, 'type_nodes', None)
+    if nodes is None:
+        return cls(*fields)
+    node = nodes.get(key)
+    if node is None:
+        node = nodes[key] = cls(*fields)
+    return node
+
 def p_type_base(p):
     '''type : TYPE_I32
             | TYPE_U8
@@ -282,27 +384,27 @@ def p_type_base(p):
             | TYPE_STR
             | TYPE_BOOL
             | TYPE_TUPLE'''
-    p[0] = ("type", p[1])
+    p[0] = _shared_type(p, p[1], astNodes.Type, p[1])
 
 # Arreglo/slice anidado: [T]
 def p_type_array_rec(p):
     'type : LBRACKET type RBRACKET'
-    p[0] = ("type_array", p[2])
+    p[0] = _shared_type(p, ("type_array", p[2]), astNodes.TypeArray, p[2])
 
 # Arreglo con longitud anotada: [T, N]
 def p_type_array_len(p):
     'type : LBRACKET type COMMA INTEGER RBRACKET'
-    p[0] = ("type_array_len", p[2], p[4])
+    p[0] = _shared_type(p, ("type_array_len", p[2], p[4]), astNodes.TypeArrayLen, p[2], p[4])
 
 # Referencia: &T
 def p_type_ref_rec(p):
     'type : BIT_AND type'
-    p[0] = ("type_ref", p[2])
+    p[0] = _shared_type(p, ("type_ref", p[2]), astNodes.TypeRef, p[2])
 
 # Referencia mutable: &mut T
 def p_type_ref_mut_rec(p):
     'type : BIT_AND MUT type'
-    p[0] = ("type_ref_mut", p[3])
+    p[0] = _shared_type(p, ("type_ref_mut", p[3]), astNodes.TypeRefMut, p[3])
 
 # ---------------- Declaraciones let ----------------
 def p_statement_let(p):
@@ -317,13 +419,14 @@ def p_let_decl(p):
     init   = p[5]
 
     if tipe and init:
-        p[0] = ("let_mut_typed_assign", ident, tipe, init[1]) if is_mut else ("let_typed_assign", ident, tipe, init[1])
+        node = astNodes.LetMutTypedAssign(ident, tipe, init.expr) if is_mut else astNodes.LetTypedAssign(ident, tipe, init.expr)
     elif tipe and not init:
-        p[0] = ("let_mut_typed_decl", ident, tipe) if is_mut else ("let_typed_decl", ident, tipe)
+        node = astNodes.LetMutTypedDecl(ident, tipe) if is_mut else astNodes.LetTypedDecl(ident, tipe)
     elif init and not tipe:
-        p[0] = ("let_mut_assign", ident, init[1]) if is_mut else ("let_assign", ident, init[1])
+        node = astNodes.LetMutAssign(ident, init.expr) if is_mut else astNodes.LetAssign(ident, init.expr)
     else:
-        p[0] = ("let_decl", ident)
+        node = astNodes.LetDecl(ident)
+    p[0] = _span(p, node)
 
 def p_maybe_mut(p):
     '''maybe_mut : MUT
@@ -338,37 +441,37 @@ def p_maybe_type(p):
 def p_maybe_init(p):
     '''maybe_init : ASIGNED_TO expression
                   | empty'''
-    p[0] = ("init", p[2]) if len(p) == 3 else None
+    p[0] = _span(p, astNodes.Init(p[2])) if len(p) == 3 else None
 
 # ---------------- Arrays / vectores / slices ----------------
 def p_element_list(p):
     '''element_list : element_list COMMA expression
                        | expression'''
-    p[0] = p[1] + [p[3]] if len(p) == 4 else [p[1]]
+    p[0] = _append(p[1], p[3]) if len(p) == 4 else [p[1]]
 
 def p_array_literal(p):
     'expression : LBRACKET element_list RBRACKET'
-    p[0] = ("array", p[2])
+    p[0] = _span(p, astNodes.Array(p[2]))
 
 def p_array_repeat(p):
     'expression : LBRACKET expression SEMICOLON INTEGER RBRACKET'
-    p[0] = ("array_repeat", p[2], p[4])
+    p[0] = _span(p, astNodes.ArrayRepeat(p[2], p[4]))
 
 def p_index(p):
     'expression : IDENTIFIER LBRACKET expression RBRACKET'
-    p[0] = ("index", ("id", p[1]), p[3])
+    p[0] = _span(p, astNodes.Index(astNodes.Id(p[1], p.lexpos(1), p.lexpos(1)), p[3]))
 
 def p_slice_open(p):
     'expression : IDENTIFIER LBRACKET INTEGER RANGE INTEGER RBRACKET'
-    p[0] = ("slice", ("id", p[1]), p[3], p[5], False)
+    p[0] = _span(p, astNodes.Slice(astNodes.Id(p[1], p.lexpos(1), p.lexpos(1)), p[3], p[5], False))
 
 def p_slice_inclusive(p):
     'expression : IDENTIFIER LBRACKET INTEGER RANGE_INCLUSIVE INTEGER RBRACKET'
-    p[0] = ("slice", ("id", p[1]), p[3], p[5], True)
+    p[0] = _span(p, astNodes.Slice(astNodes.Id(p[1], p.lexpos(1), p.lexpos(1)), p[3], p[5], True))
 
 def p_vec_macro(p):
     'expression : IDENTIFIER NOT LBRACKET element_list RBRACKET'
-    p[0] = ("vec_macro", p[1], p[4])
+    p[0] = _span(p, astNodes.VecMacro(p[1], p[4]))
 
 # ---------------- Declaraciones const ----------------
 def p_statement_const(p):
@@ -377,41 +480,44 @@ def p_statement_const(p):
 
 def p_const_decl(p):
     '''const_decl : CONST IDENTIFIER COLON type ASIGNED_TO expression SEMICOLON'''
-    p[0] = ("const_decl", p[2], p[4], p[6])
+    p[0] = _span(p, astNodes.ConstDecl(p[2], p[4], p[6]))
 
 # ---------------- Tuplas ----------------
 def p_type_tuple(p):
     '''type : LPAREN tuple_type_list RPAREN'''
-    p[0] = ("type_tuple", p[2])
+    elems = p[2][::-1]
+    p[0] = _shared_type(p, ("type_tuple",) + tuple(elems), astNodes.TypeTuple, elems)
 
+# Igual que closure_params: la lista se arma al revés (ver p_type_tuple)
 def p_tuple_type_list(p):
     '''tuple_type_list : type
                          | type COMMA tuple_type_list'''
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = [p[1]] + p[3]
+        p[0] = _append(p[3], p[1])
 
 def p_exp_tuple_literal(p):
     '''expression : LPAREN tuple_value_list RPAREN'''
-    p[0] = ("tuple_literal", p[2])
+    p[0] = _span(p, astNodes.TupleLiteral(p[2][::-1]))
 
+# La lista se arma al revés (ver p_exp_tuple_literal)
 def p_tuple_value_list(p):
     '''tuple_value_list : expression
                            | expression COMMA tuple_value_list'''
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = [p[1]] + p[3]
+        p[0] = _append(p[3], p[1])
 
 def p_exp_tuple_access(p):
     '''expression : expression DOT INTEGER'''
-    p[0] = ("tuple_access", p[1], p[3])
+    p[0] = _span(p, astNodes.TupleAccess(p[1], p[3]))
 
 # ---------------- Bucle for ----------------
 def p_for_loop(p):
     'statement : FOR IDENTIFIER IN expression LBRACE program_opt RBRACE'
-    p[0] = ("for", p[2], p[4], p[6])
+    p[0] = _span(p, astNodes.For(p[2], p[4], p[6]))
 
 # ---------------- Parámetros de funciones ----------------
 def p_param_list_opt(p):
@@ -422,11 +528,11 @@ def p_param_list_opt(p):
 def p_param_list(p):
     '''param_list : param_list COMMA param
                   | param'''
-    p[0] = p[1] + [p[3]] if len(p) == 4 else [p[1]]
+    p[0] = _append(p[1], p[3]) if len(p) == 4 else [p[1]]
 
 def p_param(p):
     '''param : IDENTIFIER COLON type'''
-    p[0] = ("param", p[1], p[3])
+    p[0] = _span(p, astNodes.Param(p[1], p[3]))
 
 # ---------------- Funciones y return ----------------
 def p_function_body_with_return(p):
@@ -434,15 +540,15 @@ def p_function_body_with_return(p):
                      | expression'''
     # Con statements previos + expresión final (retorno implícito)
     if len(p) == 3:
-        p[0] = ("body", p[1], p[2])  # statements + expr final
+        p[0] = _span(p, astNodes.Body(p[1], p[2]))  # statements + expr final
     # Solo expresión final (retorno implícito)
     else:
-        p[0] = ("body", [], p[1])    # expr final directamente
+        p[0] = _span(p, astNodes.Body([], p[1]))    # expr final directamente
 
 def p_function_body_statements(p):
     'function_body : program_opt'
     # Solo statements (sin retorno implícito)
-    p[0] = ("body", p[1], None)
+    p[0] = _span(p, astNodes.Body(p[1], None))
     
 def p_maybe_pub(p):
     '''maybe_pub : IDENTIFIER
@@ -459,50 +565,373 @@ def p_function_name_main(p):
 
 def p_function_with_return(p):
     'statement : maybe_pub FN function_name LPAREN param_list_opt RPAREN ARROW type LBRACE function_body RBRACE'
-    p[0] = ("fn_ret", p[3], p[5], p[8], p[10])
+    p[0] = _span(p, astNodes.FnRet(p[3], p[5], p[8], p[10]))
 
 def p_function_without_return(p):
     'statement : maybe_pub FN function_name LPAREN param_list_opt RPAREN LBRACE program_opt RBRACE'
-    p[0] = ("fn", p[3], p[5], p[7])
+    p[0] = _span(p, astNodes.Fn(p[3], p[5], p[8]))
 
 def p_return(p):
     'statement : RETURN expression SEMICOLON'
-    p[0] = ("return", p[2])
+    p[0] = _span(p, astNodes.Return(p[2]))
 
 def p_function_call(p):
     'expression : IDENTIFIER LPAREN arguments_opt RPAREN'
-    p[0] = ("fn_call", p[1], p[3])
+    p[0] = _span(p, astNodes.FnCall(p[1], p[3]))
 
 # ---------------- Errores ----------------
-def p_error(tok):
+# Recuperación en modo pánico: cuando aparece un error, el parser saca
+# estados de la pila hasta llegar al comienzo de una sentencia y descarta
+# tokens hasta sincronizar en:
+#   - un ';' que cierra la sentencia rota,
+#   - la '}' que cierra el bloque donde estaba (no se consume: cierra el bloque),
+#   - o una '{': el bloque que sigue a una cabecera rota (if, while, fn...) se
+#     parsea normalmente, así se reportan también los errores de adentro.
+# El salto nunca pasa de la '}' del bloque que contiene al error ni de
+# MAX_SKIPPED_TOKENS tokens: ahí el parser reintenta el token actual como
+# comienzo de una sentencia nueva. PLY calla los errores hasta desplazar 3
+# símbolos (contando el error); con errok(n) se sale del modo de recuperación
+# justo después de desplazar el primer token real que sigue al punto de
+# sincronización: un error en ese token es parte del mismo (no se reporta) y
+# los que vienen después son independientes. Las sentencias con error valen
+# None y p_program las deja fuera del AST.
+MAX_SKIPPED_TOKENS = 20
+
+def p_statement_error(p):
+    '''statement : error SEMICOLON
+                 | error_block program_opt RBRACE'''
+    if len(p) == 3:
+        # Al reducir ya se leyó el token que sigue al ';'
+        p.parser.errok(1)
+    p[0] = None
+
+def p_error_block(p):
+    'error_block : error LBRACE'
+    p.parser.errok(1)
+
+def p_program_opt_error(p):
+    '''program_opt : program error
+                   | error'''
+    # Se reduce con la '}' de lookahead: cuentan ella y el token siguiente
+    p.parser.errok(2)
+    p[0] = p[1] if len(p) == 3 else []
+
+def report_syntax_error(errors, tok):
+    """Arma el mensaje de error de sintaxis y lo agrega a la lista dada."""
     if tok:
         msg = f"[ERROR] Invalid syntax at '{tok.value}' (line {tok.lineno})"
     else:
         msg = "[ERROR] Unexpected end of file"
     print(msg)
-    ERRORS.append(msg)
+    errors.append(msg)
+
+def p_error(tok):
+    report_syntax_error(ERRORS, tok)
+
+# Construyo el parser en el primer uso, no al importar el módulo. Las tablas
+# LALR se guardan en parsetab.py junto con la firma de la gramática; mientras
+# la firma coincida se cargan directamente sin volver a generar los estados.
+_parser = None
+_parser_lock = threading.Lock()
+
+def get_parser():
+    """Devuelve el parser del módulo, construyéndolo en el primer uso."""
+    global _parser
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                import ply.yacc as yacc
+                parser = yacc.yacc(start='program', tabmodule='parsetab')
+                # Los terminales se numeran igual que TOKEN_NAMES, así el
+                # código de tipo de cada token es directamente su columna
+                parser.compile_dense(lexicalAnalyzer.TOKEN_NAMES)
+                parser.skip_limit = MAX_SKIPPED_TOKENS
+                _parser = parser
+    return _parser
+
+def grammar_signature():
+    """
+    Firma de la gramática: tokens, precedencia y las reglas (nombre y
+    docstring de cada p_*). generatedParser.py guarda la firma con la que
+    se generó; si ya no coincide, el módulo está viejo.
+    """
+    parts = [repr(tokens), repr(precedence)]
+    for name, value in sorted(globals().items()):
+        if name.startswith('p_') and name != 'p_error' and callable(value):
+            parts.append(f"{name}:{value.__doc__}")
+    return hashlib.md5("\n".join(parts).encode("utf-8")).hexdigest()
+
+_generated = None
+
+def get_generated_parser():
+    """
+    Devuelve el módulo generatedParser si existe y corresponde a la
+    gramática actual; si no, None.
+    """
+    global _generated
+    if _generated is None:
+        try:
+            import generatedParser
+        except ImportError:
+            generatedParser = None
+        if generatedParser is not None and generatedParser.GRAMMAR_SIGNATURE != grammar_signature():
+            generatedParser = None
+        _generated = generatedParser or False
+    return _generated or None
+
+# ---------------- Sesiones de análisis ----------------
+class SyntaxSession:
+    """
+    Un análisis sintáctico independiente. La sesión tiene su propio lexer
+    (vía lexicalAnalyzer.tokenizar), su propia copia del parser (con sus
+    pilas de estados y símbolos) y su propia lista de errores; las tablas
+    LR se comparten en modo solo lectura con el parser del módulo. Varias
+    sesiones pueden correr a la vez en hilos distintos.
+    """
+
+    def __init__(self, driver=None):
+        self.errors = []
+        self.lex_errors = []
+        self.driver = PARSE_DRIVER if driver is None else driver
+        generated = get_generated_parser() if self.driver == "generated" else None
+        if generated is not None:
+            self.parser = generated.Parser(self._p_error)
+            self.parser.skip_limit = MAX_SKIPPED_TOKENS
+        else:
+            if self.driver == "generated":
+                self.driver = "dense"
+            self.parser = copy.copy(get_parser())
+            self.parser.errorfunc = self._p_error
+
+    def _p_error(self, tok):
+        report_syntax_error(self.errors, tok)
+
+    def statement_shifts(self):
+        """
+        Cuánto hay que sumarle al lexpos de los nodos de cada sentencia de
+        nivel superior del último parse() para ubicarlos en el código actual;
+        None si las posiciones ya son exactas.
+        """
+        return None
+
+    def _run_parser(self, lexer):
+        if self.driver == "generated":
+            return self.parser.parse(lexer=lexer)
+        if self.driver == "dense":
+            return self.parser.parseopt_dense(lexer=lexer)
+        if self.driver == "fast":
+            return self.parser.parseopt_notrack(lexer=lexer)
+        return self.parser.parse(lexer=lexer)
+
+    def parse(self, codigo, arena=None):
+        """
+        Parsea el código y devuelve el AST (o None si no se pudo). Si se pasa
+        una arena (astArena.AstArena) cada sentencia de nivel superior se
+        guarda en ella apenas se reduce y se devuelve la arena.
+        """
+        tokens_stream = lexicalAnalyzer.tokenizar(codigo)
+        self.lex_errors = tokens_stream.errors
+        self.parser.arena = arena
+        # Tipos compartidos solo dentro de este parseo (ver _shared_type)
+        self.parser.type_nodes = {}
+        try:
+            return self._run_parser(tokens_stream.lexer())
+        finally:
+            self.parser.arena = None
+
+
+class IncrementalSyntaxSession(SyntaxSession):
+    """
+    Sesión para el editor: guarda las sentencias de nivel superior del último
+    parseo sin errores, con el rango de tokens de cada una. En el siguiente
+    parse() se reutilizan las sentencias del principio y del final cuyos
+    tokens no cambiaron (según la ventana que informa IncrementalLexer) y
+    solo se parsea la zona editada. Si esa zona tiene errores (o no hay
+    parseo anterior) se parsea todo, para que los mensajes sean los mismos
+    que con SyntaxSession.
+
+    Las sentencias reutilizadas del final conservan el lexpos del código en
+    que se parsearon; en vez de recorrerlas para corregirlo, se guarda cuánto
+    se corrió cada una (ver statement_shifts()). Como en TokenStream, las
+    sentencias desde `_gap` guardan rango y corrimiento contados desde el
+    final (restando la cantidad de tokens y el largo del código), que no
+    cambian al editar más arriba: así una edición no recorre todas las
+    sentencias que la siguen.
+    """
 
-# Construyo el parser
-parser = yacc.yacc(start='program')
+    def __init__(self, driver=None):
+        super().__init__(driver)
+        self.parser.statement_starts = None
+        self.lexer = lexicalAnalyzer.IncrementalLexer()
+        self.tokens = None       # TokenStream del último parseo sin errores
+        self.statements = []     # sentencias de nivel superior (subárboles)
+        self.spans = []          # (inicio, fin) en índices de token de cada sentencia
+        self.shifts = []         # corrimiento en caracteres del lexpos de cada sentencia
+        self.reused = 0          # sentencias reutilizadas en el último parse()
+        self._gap = 0            # desde acá spans y shifts van contados desde el final
+        self._size = (0, 0)      # (tokens, caracteres) del último parseo
+
+    def parse(self, codigo):
+        """Parsea el código reutilizando lo que se pueda del parseo anterior."""
+        self.errors = []
+        self.reused = 0
+        tokens_stream = self.lexer.update(codigo)
+        self.lex_errors = tokens_stream.errors
+
+        if self.tokens is not None:
+            result = self._reparse(tokens_stream)
+            if result is not None:
+                return result
+            self.errors = []
+
+        # Las sentencias reutilizadas comparten los tipos con las nuevas; en
+        # un parseo completo la tabla empieza de nuevo (ver _shared_type)
+        self.parser.type_nodes = {}
+        statements, spans = self._parse_range(tokens_stream, 0, len(tokens_stream))
+        self._remember(tokens_stream, statements, spans)
+        return statements
+
+    def _parse_range(self, tokens_stream, start, end):
+        """Parsea tokens[start:end] como un programa; devuelve (sentencias, rangos)."""
+        starts = self.parser.statement_starts = []
+        try:
+            statements = self._run_parser(tokens_stream.lexer(start, end))
+        finally:
+            self.parser.statement_starts = None
+        if (self.errors or not isinstance(statements, list)
+                or len(starts) != len(statements) or -1 in starts):
+            return statements, None
+
+        # Posición de inicio -> índice de token; cada sentencia termina donde
+        # empieza la siguiente
+        first = [tokens_stream.first_at(pos, start, end) for pos in starts]
+        spans = list(zip(first, first[1:] + [end]))
+        return statements, spans
+
+    def statement_shifts(self):
+        if self.tokens is None:
+            return None
+        chars = self._size[1]
+        return self.shifts[:self._gap] + [shift + chars for shift in self.shifts[self._gap:]]
+
+    def _remember(self, tokens_stream, statements, spans):
+        if spans is None or self.errors:
+            self.tokens = None
+            self.statements = []
+            self.spans = []
+            self.shifts = []
+        else:
+            self.tokens = tokens_stream
+            self.statements = statements
+            self.spans = spans
+            self.shifts = [0] * len(statements)
+        self._gap = len(self.statements)
+        self._size = (len(tokens_stream), len(tokens_stream.source))
+
+    def _move_gap(self, index):
+        """Sentencias antes de `index` con valores absolutos; las demás, desde el final."""
+        gap = self._gap
+        count, chars = self._size
+        if gap < index:
+            self.spans[gap:index] = [(s + count, e + count) for s, e in self.spans[gap:index]]
+            self.shifts[gap:index] = [shift + chars for shift in self.shifts[gap:index]]
+        elif index < gap:
+            self.spans[index:gap] = [(s - count, e - count) for s, e in self.spans[index:gap]]
+            self.shifts[index:gap] = [shift - chars for shift in self.shifts[index:gap]]
+        self._gap = index
+
+    def _span(self, k):
+        s, e = self.spans[k]
+        if k >= self._gap:
+            count = self._size[0]
+            return s + count, e + count
+        return s, e
+
+    def _reparse(self, new):
+        """Parseo incremental; devuelve None si hay que parsear todo."""
+        prefix, old_end, new_end = self.lexer.window
+        spans = self.spans
+        n = len(spans)
+
+        # Sentencias del principio: sus tokens y el token que las sigue
+        # (el lookahead con el que se redujeron) no cambiaron
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._span(mid)[1] < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        k = lo
+        # Sentencias del final: empiezan después de los tokens viejos cambiados
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._span(mid)[0] < old_end:
+                lo = mid + 1
+            else:
+                hi = mid
+        j = lo
+
+        delta = new_end - old_end
+        # Desde donde termina la última reutilizada: antes de la primera
+        # sentencia puede haber tokens que no arman ninguna (un ';' suelto)
+        start = self._span(k - 1)[1] if k else 0
+        end = (self._span(j)[0] if j < n else self._size[0]) + delta
+        if end < start:
+            return None
+
+        middle, middle_spans = [], []
+        if end > start:
+            middle, middle_spans = self._parse_range(new, start, end)
+            if middle_spans is None:
+                return None
+
+        statements = self.statements[:k] + middle + self.statements[j:]
+        if not statements:
+            return None
+        # Las del principio quedan absolutas y las del final, desde el final
+        if self._gap < k:
+            self._move_gap(k)
+        elif self._gap > j:
+            self._move_gap(j)
+        self.statements = statements
+        self.spans[k:j] = middle_spans
+        self.shifts[k:j] = [0] * len(middle)
+        self._gap = k + len(middle)
+        self._size = (len(new), len(new.source))
+        self.reused = k + n - j
+        return statements
+
+
+# Compatibilidad: `syntaxAnalyzer.parser` y `syntaxAnalyzer.lexer` siguen
+# funcionando como antes
+def __getattr__(name):
+    if name == 'parser':
+        return get_parser()
+    if name == 'lexer':
+        return lexicalAnalyzer.get_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # --------- Función para usar desde la interfaz gráfica ---------
-def analizar_sintactico(codigo: str) -> str:
+def analizar_sintactico(codigo: str, session=None) -> str:
     """
     Ejecuta el analizador sintáctico sobre el código recibido
     y devuelve un texto con el resultado o los errores encontrados.
-    Esta función la llama main.py.
+    Esta función la llama main.py, que pasa una IncrementalSyntaxSession
+    para no volver a parsear todo el archivo en cada click.
     """
-    ERRORS.clear()
-    lexer.lineno = 1
+    if session is None:
+        session = SyntaxSession()
 
     try:
-        parser.parse(codigo, lexer=lexer)
+        session.parse(codigo)
     except Exception as e:
-        ERRORS.append(f"[ERROR] Excepción del parser: {e}")
+        session.errors.append(f"[ERROR] Excepción del parser: {e}")
 
-    if ERRORS:
+    if session.errors:
         salida = ["Se encontraron errores sintácticos:"]
-        salida.extend(ERRORS)
+        salida.extend(session.errors)
         return "\n".join(salida)
     else:
         return "Análisis sintáctico completado. No se encontraron errores."
@@ -516,6 +945,8 @@ files = {
 }
 
 def analyze():
+    parser = get_parser()
+    lexer = lexicalAnalyzer.get_lexer()
     now = datetime.datetime.now()
     date = now.strftime("%d-%m-%Y")
     time = now.strftime("%Hh%M")
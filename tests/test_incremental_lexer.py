@@ -0,0 +1,63 @@
+# IncrementalLexer.update() tiene que dar lo mismo que tokenizar() sobre el
+# código completo, también después de varias ediciones.
+
+import random
+
+import pytest
+
+import lexicalAnalyzer
+
+# Caracteres que str.splitlines() toma como fin de línea y tokenizar() no
+SEPARADORES = ["\r", "\r\n", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x85", " ", " "]
+
+
+def tokens(stream):
+    return list(stream), list(stream.errors)
+
+
+@pytest.mark.parametrize("sep", SEPARADORES)
+def test_separadores_que_no_son_salto_de_linea(sep):
+    codigo = f'let s = "a{sep}b";\nlet c = 1;{sep}let d = 2;\n/* x{sep}y */ let e = s;\n'
+    assert tokens(lexicalAnalyzer.IncrementalLexer().update(codigo)) == tokens(lexicalAnalyzer.tokenizar(codigo))
+
+
+def test_char_con_salto_de_linea():
+    codigo = "let c = '\n';\nlet d = 1;\n"
+    assert tokens(lexicalAnalyzer.IncrementalLexer().update(codigo)) == tokens(lexicalAnalyzer.tokenizar(codigo))
+
+
+def test_ediciones_aleatorias():
+    piezas = list("let x = 1 + y; \"ab\" 'c' /* */ // \n\n") + SEPARADORES
+    rnd = random.Random(10)
+    for _ in range(300):
+        lexer = lexicalAnalyzer.IncrementalLexer()
+        codigo = "".join(rnd.choice(piezas) for _ in range(rnd.randrange(60)))
+        for _ in range(4):
+            assert tokens(lexer.update(codigo)) == tokens(lexicalAnalyzer.tokenizar(codigo)), repr(codigo)
+            i = rnd.randrange(len(codigo) + 1)
+            nuevo = "".join(rnd.choice(piezas) for _ in range(rnd.randrange(5)))
+            codigo = codigo[:i] + nuevo + codigo[i + rnd.randrange(3):]
+
+
+def test_ventana_y_tokens_sin_normalizar():
+    # Se lee token por token (sin pasar por starts/lines, que vuelven todo
+    # absoluto), así cada update() trabaja sobre el flujo que dejó el anterior
+    piezas = list("let x = 1 + y; \"ab\" /* */ // \n\n\n")
+    rnd = random.Random(11)
+    for _ in range(200):
+        lexer = lexicalAnalyzer.IncrementalLexer()
+        codigo = "".join(rnd.choice(piezas) for _ in range(rnd.randrange(80)))
+        antes = None
+        for _ in range(5):
+            stream = lexer.update(codigo)
+            esperado = lexicalAnalyzer.tokenizar(codigo)
+            actual = [(stream.type(i), stream.text(i), stream.line(i)) for i in range(len(stream))]
+            assert actual == [(esperado.type(i), esperado.text(i), esperado.lines[i]) for i in range(len(esperado))]
+            if antes is not None:
+                w0, w1, w2 = lexer.window
+                assert actual[:w0] == antes[:w0]
+                assert [(t, x) for t, x, _ in actual[w2:]] == [(t, x) for t, x, _ in antes[w1:]]
+            antes = actual
+            i = rnd.randrange(len(codigo) + 1)
+            nuevo = "".join(rnd.choice(piezas) for _ in range(rnd.randrange(6)))
+            codigo = codigo[:i] + nuevo + codigo[i + rnd.randrange(4):]
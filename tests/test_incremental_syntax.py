@@ -0,0 +1,70 @@
+# IncrementalSyntaxSession tiene que dar el mismo AST y los mismos errores
+# que SyntaxSession después de cada edición.
+
+import contextlib
+import io
+import random
+
+import astNodes
+import syntaxAnalyzer
+
+PROGRAMA = """fn suma(a: i32, b: i32) -> i32 {
+    a + b
+}
+
+let x = 1;
+let v = vec![1, 2, 3];
+
+fn main() {
+    let mut total = 0;
+    for i in 0..10 {
+        total = total + suma(i, x);
+    }
+    println!("{}", total);
+}
+"""
+
+PIEZAS = ["let q = 3;\n", "\n", "x = x + 1;\n", "fn f() { let z = w; }\n", ";", "}", "{", " "]
+
+
+def test_ediciones_aleatorias():
+    rnd = random.Random(7)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(40):
+            sesion = syntaxAnalyzer.IncrementalSyntaxSession()
+            codigo = PROGRAMA
+            for _ in range(8):
+                completo = syntaxAnalyzer.SyntaxSession()
+                esperado = completo.parse(codigo)
+                actual = sesion.parse(codigo)
+                assert astNodes.to_tuple(actual) == astNodes.to_tuple(esperado), repr(codigo)
+                assert sesion.errors == completo.errors
+                lineas = codigo.split("\n")
+                lineas.insert(rnd.randrange(len(lineas) + 1), rnd.choice(PIEZAS).rstrip("\n"))
+                codigo = "\n".join(lineas)
+
+
+def test_reutiliza_las_sentencias_fuera_de_la_edicion():
+    codigo = "".join(f"let a{i} = {i};\n" for i in range(50))
+    sesion = syntaxAnalyzer.IncrementalSyntaxSession()
+    with contextlib.redirect_stdout(io.StringIO()):
+        sesion.parse(codigo)
+        sesion.parse(codigo.replace("let a25 = 25;", "let a25 = 250;"))
+    assert sesion.reused == 49
+    # Las sentencias del final se corrieron un carácter
+    assert sesion.statement_shifts() == [0] * 26 + [1] * 24
+
+
+def _tipos_de_let(ast):
+    return [stmt.type for stmt in ast]
+
+
+def test_tipos_compartidos_solo_dentro_de_un_parseo():
+    codigo = "let a: (i32, [u8, 4]) = x;\nlet b: (i32, [u8, 4]) = y;\n"
+    with contextlib.redirect_stdout(io.StringIO()):
+        primero = _tipos_de_let(syntaxAnalyzer.SyntaxSession().parse(codigo))
+        segundo = _tipos_de_let(syntaxAnalyzer.SyntaxSession().parse(codigo))
+    assert primero[0] is primero[1]
+    # Otro parseo arma sus propios nodos: la tabla no sobrevive al parseo
+    assert primero[0] == segundo[0] and primero[0] is not segundo[0]
+    assert hash(primero[0]) == hash(segundo[0])
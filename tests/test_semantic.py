@@ -0,0 +1,57 @@
+# Análisis semántico a través de SemanticSession (sin escribir logs).
+
+import contextlib
+import gc
+import io
+
+import astArena
+import semanticAnalyzer
+
+
+def _analizar(codigo, arena=None, profile=False):
+    sesion = semanticAnalyzer.SemanticSession(profile=profile)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = sesion.parse(codigo, arena)
+        sesion.analyze_ast(ast)
+    return sesion
+
+
+def test_mismos_errores_en_todos_los_recorridos():
+    # Más anidado que _MAX_DEPTH: el recorrido recursivo sigue con la pila explícita
+    hondo = "(" * 300 + "true + x" + ")" * 300
+    codigo = f"let x = 1;\nfn f(a: i32) {{ let y = {hondo}; while !a {{ z = 2; }} }}\nlet w: u8 = -1;"
+    esperado = _analizar(codigo).errors
+    assert len(esperado) == 3
+    assert _analizar(codigo, profile=True).errors == esperado
+    assert _analizar(codigo, arena=astArena.AstArena()).errors == esperado
+
+
+def test_tipos_no_quedan_en_la_tabla_global():
+    _analizar("let a: [i32, 1] = [1];")
+    gc.collect()
+    antes = len(semanticAnalyzer._TERMS)
+    for n in range(200):
+        _analizar(f"let a: [i32, {n}] = [1];\nlet b: (u8, [&u8, {n}]) = (1, [2]);")
+    gc.collect()
+    assert len(semanticAnalyzer._TERMS) == antes
+
+
+def test_tipos_iguales_son_el_mismo_termino():
+    # Dos parseos tienen nodos distintos, pero mientras vivan comparten el término
+    primero = _analizar("let a: [u8, 3] = [1, 2, 3];").syntax.parse("let a: [u8, 3] = b;")
+    segundo = _analizar("let a: [u8, 3] = [1, 2, 3];").syntax.parse("let a: [u8, 3] = b;")
+    tipo = semanticAnalyzer.resolve_type(primero[0].type)
+    assert semanticAnalyzer.resolve_type(segundo[0].type) is tipo
+    assert tipo.unsigned and tipo.sem is semanticAnalyzer.array_type(semanticAnalyzer.NUM)
+
+
+def test_reporte_lista_los_simbolos_de_scopes_cerrados(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    codigo = "let total = 0;\nfn main() { let mut dato = 1; for i in 0..3 { let item = i; } }"
+    sesion = _analizar(codigo)
+    # Los scopes de main y del for ya se cerraron
+    assert list(sesion.symbol_table) == ["total"]
+    with open(sesion.generate_report("prueba"), encoding="utf-8") as log:
+        reporte = log.read()
+    for linea in ("total: immutable", "dato: mutable", "i: immutable", "item: immutable"):
+        assert f"  {linea}, initialized" in reporte
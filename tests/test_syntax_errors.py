@@ -0,0 +1,81 @@
+# Recuperación de errores de sintaxis: un solo parseo reporta cada error
+# independiente una vez, sin errores en cascada, con los tres drivers.
+
+import contextlib
+import io
+
+import pytest
+
+import syntaxAnalyzer
+
+DRIVERS = ["ply", "dense", "generated"]
+
+
+def parsear(codigo, driver, skip_limit=syntaxAnalyzer.MAX_SKIPPED_TOKENS):
+    sesion = syntaxAnalyzer.SyntaxSession(driver)
+    sesion.parser.skip_limit = skip_limit
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = sesion.parse(codigo)
+    return sesion.errors, ast
+
+
+@pytest.mark.parametrize("driver", DRIVERS)
+def test_varios_errores_independientes(driver):
+    codigo = (
+        "let a = ;\n"
+        "let b = 1 +;\n"
+        "fn f() { let c = ; let ok = 1; }\n"
+        "let d 5;\n"
+        "let e = 1;\n"
+    )
+    errores, ast = parsear(codigo, driver)
+    assert errores == [
+        "[ERROR] Invalid syntax at ';' (line 1)",
+        "[ERROR] Invalid syntax at ';' (line 2)",
+        "[ERROR] Invalid syntax at ';' (line 3)",
+        "[ERROR] Invalid syntax at '5' (line 4)",
+    ]
+    # Las sentencias sin errores siguen en el AST
+    assert len(ast) == 2
+
+
+@pytest.mark.parametrize("driver", DRIVERS)
+def test_errores_en_lineas_seguidas(driver):
+    errores, _ = parsear("fn f() { let a = 1 2; }\nlet = 3;\n", driver)
+    assert errores == [
+        "[ERROR] Invalid syntax at '2' (line 1)",
+        "[ERROR] Invalid syntax at '=' (line 2)",
+    ]
+
+
+@pytest.mark.parametrize("driver", DRIVERS)
+def test_sin_cascada_despues_de_sincronizar(driver):
+    # El ';' dentro de los paréntesis sincroniza; el ')' que sigue es parte
+    # del mismo error
+    errores, ast = parsear("let a = (1;);\nlet b = 2;\n", driver)
+    assert errores == ["[ERROR] Invalid syntax at ';' (line 1)"]
+    assert len(ast) == 1
+    assert parsear("let arr = [x; 3];\n", driver)[0] == []
+
+
+@pytest.mark.parametrize("driver", DRIVERS)
+def test_errores_dentro_de_un_bloque_con_cabecera_rota(driver):
+    errores, ast = parsear("if x > { let a = 1; let b = ; }\nlet c = 2;\n", driver)
+    assert errores == [
+        "[ERROR] Invalid syntax at '{' (line 1)",
+        "[ERROR] Invalid syntax at ';' (line 1)",
+    ]
+    assert len(ast) == 1
+
+
+@pytest.mark.parametrize("driver", DRIVERS)
+def test_el_salto_de_tokens_esta_acotado(driver):
+    basura = " ".join(["9"] * 100)
+    codigo = f"let a = 1 {basura};\nlet b = 2;\n"
+    # Sin límite todo hasta el ';' se descarta en silencio
+    errores, _ = parsear(codigo, driver, skip_limit=None)
+    assert len(errores) == 1
+    # Con límite el parser retoma cada MAX_SKIPPED_TOKENS tokens
+    errores, ast = parsear(codigo, driver)
+    assert len(errores) >= 100 // (syntaxAnalyzer.MAX_SKIPPED_TOKENS + 2)
+    assert len(ast) == 1